@@ -23,6 +23,50 @@ class Settings(BaseSettings):
     
     # KASI API
     kasi_api_key: str = ""
+    kasi_max_concurrency: int = 8          # 동시 KASI 호출 상한 (semaphore)
+    kasi_max_keepalive: int = 8            # keep-alive 커넥션 풀 크기
+    kasi_connect_timeout: float = 3.0
+    kasi_read_timeout: float = 8.0
+    kasi_deadline_seconds: float = 10.0    # 대기열 포함 호출당 총 시간
+    kasi_breaker_threshold: int = 5        # 연속 실패 N회 → 차단
+    kasi_breaker_cooldown_seconds: float = 30.0
+    kasi_cross_worker_lock: bool = True    # 같은 날짜 동시 miss → 워커 간 lock file로 KASI 1회
+    kasi_lock_dir: str = ""                # 비우면 {tmp}/sajuos_kasi_locks
+    kasi_lock_wait_seconds: float = 10.0   # 초과 시 lock 없이 진행
+    
+    # 만세력 테이블 (비우면 data/ganji_calendar_v1.bin)
+    calendar_table_path: str = ""
+    # 사주 전수 조회 테이블 (비우면 data/saju_lookup_v1.bin)
+    saju_lookup_path: str = ""
+
+    # KASI calendar 로컬 캐시 계층 (비우면 data/calendar_cache.sqlite3)
+    calendar_cache_sqlite_enabled: bool = True
+    calendar_cache_sqlite_path: str = ""
+    
+    # 룰카드 바이너리 스냅샷 (비우면 원본 경로 + ".snap", 원본보다 오래되면 원본에서 로드)
+    rulecards_snapshot_enabled: bool = True
+    rulecards_snapshot_path: str = ""
+    # 룰카드 전문검색 (FTS5 bm25, 질문/고민 → 후보 카드). 비우면 <원본>.<버전>.fts
+    rulecards_fts_enabled: bool = True
+    rulecards_fts_path: str = ""
+    # 룰카드 store 워커 공유: private(워커마다 로드) | preload(gunicorn --preload 마스터에서 1회 + gc.freeze)
+    rulecards_share_mode: str = "private"
+    # 룰카드 핫 리로드: 파일 감시 간격(0=끔), 관리자 토큰(비우면 reload API 비활성), 카드 수 급감 허용 하한
+    rulecards_watch_interval_seconds: float = 0.0
+    rulecards_admin_token: str = ""
+    rulecards_reload_min_ratio: float = 0.5
+    # 룰카드 유사 중복 클러스터: 해석 3-gram 추정 Jaccard 하한 (0=끔) - 섹션당 클러스터 1장
+    rulecards_dedup_threshold: float = 0.8
+    
+    # 블로킹 호출(supabase-py, ephem) 전용 스레드 풀 + 이벤트 루프 지연 모니터
+    blocking_pool_size: int = 16
+    loop_lag_interval_seconds: float = 0.5
+    loop_lag_threshold_seconds: float = 0.1   # 이 이상 막히면 stall로 집계
+
+    # /calculate/batch
+    calculate_batch_max_rows: int = 100000
+    calculate_batch_chunk_size: int = 500
+    calculate_batch_spool_bytes: int = 8 * 1024 * 1024  # 초과분은 임시파일로
     
     # Server
     host: str = "0.0.0.0"
@@ -87,6 +131,7 @@ class Settings(BaseSettings):
     # Cache
     cache_ttl_seconds: int = 86400
     cache_max_size: int = 10000
+    selection_cache_max_size: int = 4096  # preset 카드 선택 캐시 (feature tag 서명별, 0이면 끔)
     
     # CORS
     allowed_origins: str = "http://localhost:3000,https://sajuos.com,https://www.sajuos.com"
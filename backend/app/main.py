@@ -75,6 +75,16 @@ _safe_include_router("app.routers.interpret", "/api/v1", ["Interpret"], "interpr
 _safe_include_router("app.routers.reports", "/api/v1", ["Reports"], "reports") # ✅ 수정됨
 _safe_include_router("app.routers.debug", "/api/v1", ["Debug"], "debug")       # ✅ 수정됨
 _safe_include_router("app.routers.debug_engine", "/api/v1", ["Debug Engine"], "debug_engine")
+_safe_include_router("app.routers.admin", "/api/v1", ["Admin"], "admin")
+
+RULECARDS_DB_PATH = Path(__file__).parent.parent / "data" / "sajuos_master.db"
+
+# 🔥 preload 모드: import 시점(gunicorn --preload 마스터, fork 전)에 룰카드 1회 로드
+try:
+    from app.services.rulecards_shared import preload_rulecard_store
+    preload_rulecard_store(RULECARDS_DB_PATH)
+except Exception as e:
+    logger.warning(f"⚠️ RuleCards preload 실패: {e} → 워커별 로드")
 
 @app.on_event("startup")
 async def startup():
@@ -84,24 +94,51 @@ async def startup():
     logger.info(f"   BUILD_TIME: {BUILD_TIME}")
     logger.info(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
     
+    # 이벤트 루프 지연 모니터 (stall 집계 → /ready)
+    from app.services.blocking import loop_monitor
+    loop_monitor.start()
+    
     app.state.rulestore = None
     try:
-        from app.services.rulecards_store import RuleCardStore
-        base_dir = Path(__file__).parent.parent
-        db_path = base_dir / "data" / "sajuos_master.db"
+        from app.services.rulecards_registry import rulecard_registry
+        from app.services.rulecards_shared import attach_store, get_preloaded_store
         
-        if db_path.exists():
-            store = RuleCardStore.load_from_sqlite_master(str(db_path))
-            app.state.rulestore = store
+        rulecard_registry.bind_app_state(app.state)  # 핫 리로드 시 app.state.rulestore도 교체
+        store = get_preloaded_store()
+        if store is not None:
+            # preload 모드: 마스터가 로드·주입까지 마친 store를 그대로 사용 (COW 공유)
+            logger.info(f"✅ RuleCards preload store 사용: 총 {len(store.cards)}장 (pid={os.getpid()})")
+        elif RULECARDS_DB_PATH.exists():
+            from app.services.rulecards_snapshot import load_rulecard_store
+            # 스냅샷(sajuos_master.db.snap)이 최신이면 mmap 로드, 아니면 SQLite
+            store = load_rulecard_store(RULECARDS_DB_PATH)
             logger.info(f"✅ RuleCards master_db 로드 완료: 총 {len(store.cards)}장")
             
-            from app.services.match_module import match_module
-            match_module.store = store
-            match_module.loaded = True
-            logger.info(f"✅ Match 모듈에 RuleCards 주입 완료")
+            attach_store(store, RULECARDS_DB_PATH)
+            logger.info(f"✅ Match 모듈 / Scorer에 RuleCards 주입 완료")
+        
+        # 파일 감시 (rulecards_watch_interval_seconds > 0): 원본/스냅샷 변경 시 백그라운드 reload
+        from app.config import get_settings
+        rulecard_registry.start_watch(get_settings().rulecards_watch_interval_seconds)
     except Exception as e:
         logger.warning(f"⚠️ RuleCards 로드 실패: {e}")
 
+@app.on_event("shutdown")
+async def shutdown():
+    # KASI 공유 커넥션 풀 정리
+    try:
+        from app.services.kasi_api import kasi_http
+        await kasi_http.aclose()
+    except Exception as e:
+        logger.warning(f"⚠️ KASI 클라이언트 종료 실패: {e}")
+    
+    from app.services.rulecards_registry import rulecard_registry
+    await rulecard_registry.stop_watch()
+    
+    from app.services.blocking import blocking_executor, loop_monitor
+    await loop_monitor.stop()
+    blocking_executor.shutdown()
+
 @app.get("/ready")
 async def ready():
     checks = {
@@ -109,7 +146,19 @@ async def ready():
         "openai": bool(os.getenv("OPENAI_API_KEY")),
         "supabase": bool(os.getenv("SUPABASE_URL")),
     }
-    return {"status": "ready" if checks["rulecards"] else "partial", "checks": checks}
+    from app.services.blocking import blocking_executor, loop_monitor
+    from app.services.rulecards_registry import rulecard_registry
+    from app.services.rulecards_shared import memory_report
+    from app.services.selection_cache import card_selection_cache
+    return {
+        "status": "ready" if checks["rulecards"] else "partial",
+        "checks": checks,
+        "event_loop": loop_monitor.get_stats(),
+        "blocking_pool": blocking_executor.get_stats(),
+        "rulecards": rulecard_registry.info(),
+        "selection_cache": card_selection_cache.get_stats(),
+        "memory": memory_report(),
+    }
 
 @app.exception_handler(Exception)
 async def error_handler(request: Request, exc: Exception):
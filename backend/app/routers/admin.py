@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+Admin Router - 룰카드 핫 리로드
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- POST /admin/rulecards/reload: 새 store 백그라운드 로드 → 검증 → 원자적 교체
+  (X-Admin-Token == settings.rulecards_admin_token, 토큰 미설정이면 403)
+- GET  /admin/rulecards: 현재 버전 / 세대 / reload 통계
+워커마다 store를 따로 가지므로 멀티 워커 배포에서는 워커별로 호출하거나 파일 감시를 켠다.
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import hmac
+import logging
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query
+
+from app.config import get_settings
+from app.services.rulecards_registry import RuleCardReloadError, rulecard_registry
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+def _check_token(token: Optional[str]) -> None:
+    expected = get_settings().rulecards_admin_token
+    if not expected:
+        raise HTTPException(status_code=403, detail="admin API 비활성 (rulecards_admin_token 미설정)")
+    if not token or not hmac.compare_digest(token, expected):
+        raise HTTPException(status_code=401, detail="invalid admin token")
+
+
+@router.post("/rulecards/reload")
+async def reload_rulecards(
+    force: bool = Query(False, description="카드 수 급감 검증 무시"),
+    x_admin_token: Optional[str] = Header(None),
+) -> Dict[str, Any]:
+    """룰카드 다시 읽기 (진행 중인 요청/잡은 기존 버전 유지)"""
+    _check_token(x_admin_token)
+    try:
+        return await rulecard_registry.reload(reason="admin", force=force)
+    except RuleCardReloadError as e:
+        raise HTTPException(status_code=422, detail=f"reload 실패 (현재 버전 유지): {e}")
+
+
+@router.get("/rulecards")
+async def rulecards_info(x_admin_token: Optional[str] = Header(None)) -> Dict[str, Any]:
+    _check_token(x_admin_token)
+    return rulecard_registry.info()
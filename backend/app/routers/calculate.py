@@ -9,10 +9,17 @@ Source of Truth 우선순위:
 - API 실패시 자동 fallback (서비스 무중단)
 - 태양시 보정 ON/OFF 토글 지원
 - 🔥 P0: saju_summary (팩트 앵커) 포함
+- /calculate/batch: JSON 배열/NDJSON 업로드 → NDJSON 스트리밍 응답
 """
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional, List
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+from datetime import date
+from typing import Optional, List, Tuple, Union
+import json
 import logging
+import tempfile
 
 from app.models.schemas import (
     CalculateRequest,
@@ -24,11 +31,86 @@ from app.services.engine_v2 import CalculationError, EPHEM_AVAILABLE, SajuManage
 from app.services.saju_engine import saju_engine
 from app.services.saju_analyzer import get_saju_summary
 from app.services.cache import cache_service
+from app.services.batch_rows import iter_json_rows, RowParseError, BatchFormatError
+from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _build_calculate_response(
+    result,
+    year: int,
+    month: int,
+    day: int,
+    hour: Optional[int],
+    minute: int
+) -> dict:
+    """CalculationResult → /calculate 응답 딕셔너리 (saju_summary 포함, 배치와 공용)"""
+    birth_info = f"{year}년 {month}월 {day}일"
+    if hour is not None:
+        birth_info += f" {hour}시"
+        if minute > 0:
+            birth_info += f" {minute}분"
+    
+    # 경계 경고 메시지
+    boundary_warning = None
+    if result.quality.solar_term_boundary:
+        if result.quality.boundary_reason == "near_ipchun":
+            boundary_warning = (
+                f"⚠️ 입춘 경계일 근처입니다. "
+                f"출생시간에 따라 연주/월주가 달라질 수 있습니다."
+            )
+        elif result.quality.boundary_reason == "near_term_change":
+            boundary_warning = (
+                f"⚠️ 절기 경계일 근처입니다. "
+                f"출생시간에 따라 월주가 달라질 수 있습니다."
+            )
+    
+    response_data = {
+        "success": True,
+        "birth_info": birth_info,
+        "saju": result.saju.model_dump(),
+        "day_master": result.day_master,
+        "day_master_element": result.day_master_element,
+        "day_master_description": result.day_master_description,
+        "daeun": result.daeun.model_dump() if result.daeun else None,
+        "quality": result.quality.model_dump(),
+        # 레거시 호환
+        "is_boundary_date": result.quality.solar_term_boundary,
+        "boundary_warning": boundary_warning,
+        "calculation_method": result.quality.calculation_method
+    }
+    
+    # 🔥🔥🔥 P0: saju_summary (팩트 앵커) 생성 및 추가
+    try:
+        saju_pillars = {
+            "year_pillar": result.saju.year_pillar.ganji,
+            "month_pillar": result.saju.month_pillar.ganji,
+            "day_pillar": result.saju.day_pillar.ganji,
+            "hour_pillar": result.saju.hour_pillar.ganji if result.saju.hour_pillar else "",
+        }
+        summary = get_saju_summary(saju_pillars)
+        
+        # 월지 십성 추출 (position으로 찾기)
+        month_branch_ten_god = None
+        for tg_info in summary.get("ten_gods_list", []):
+            if tg_info.get("position") == "월지":
+                month_branch_ten_god = tg_info.get("ten_god")
+                break
+        
+        response_data["saju_summary"] = summary
+        response_data["month_branch_ten_god"] = month_branch_ten_god
+        response_data["gyeokguk"] = summary.get("primary_structure")
+        response_data["elements_present"] = summary.get("elements_present")
+        response_data["ten_gods_present"] = summary.get("ten_gods_present")
+    except Exception as e:
+        logger.warning(f"[Calculate] saju_summary 생성 실패: {e}")
+        # 실패해도 기본 응답은 반환
+    
+    return response_data
+
+
 @router.post(
     "/calculate",
     response_model=CalculateResponse,
@@ -96,69 +178,11 @@ async def calculate_saju(
             use_solar_time=use_solar_time
         )
         
-        # 응답 구성
-        birth_info = f"{year}년 {month}월 {day}일"
-        if hour is not None:
-            birth_info += f" {hour}시"
-            if minute > 0:
-                birth_info += f" {minute}분"
-        
-        # 경계 경고 메시지
-        boundary_warning = None
-        if result.quality.solar_term_boundary:
-            if result.quality.boundary_reason == "near_ipchun":
-                boundary_warning = (
-                    f"⚠️ 입춘 경계일 근처입니다. "
-                    f"출생시간에 따라 연주/월주가 달라질 수 있습니다."
-                )
-            elif result.quality.boundary_reason == "near_term_change":
-                boundary_warning = (
-                    f"⚠️ 절기 경계일 근처입니다. "
-                    f"출생시간에 따라 월주가 달라질 수 있습니다."
-                )
-        
-        response_data = {
-            "success": True,
-            "birth_info": birth_info,
-            "saju": result.saju.model_dump(),
-            "day_master": result.day_master,
-            "day_master_element": result.day_master_element,
-            "day_master_description": result.day_master_description,
-            "daeun": result.daeun.model_dump() if result.daeun else None,
-            "quality": result.quality.model_dump(),
-            # 레거시 호환
-            "is_boundary_date": result.quality.solar_term_boundary,
-            "boundary_warning": boundary_warning,
-            "calculation_method": result.quality.calculation_method
-        }
-        
-        # 🔥🔥🔥 P0: saju_summary (팩트 앵커) 생성 및 추가
-        try:
-            saju_pillars = {
-                "year_pillar": result.saju.year_pillar.ganji,
-                "month_pillar": result.saju.month_pillar.ganji,
-                "day_pillar": result.saju.day_pillar.ganji,
-                "hour_pillar": result.saju.hour_pillar.ganji if result.saju.hour_pillar else "",
-            }
-            summary = get_saju_summary(saju_pillars)
-            
-            # 월지 십성 추출 (position으로 찾기)
-            month_branch_ten_god = None
-            for tg_info in summary.get("ten_gods_list", []):
-                if tg_info.get("position") == "월지":
-                    month_branch_ten_god = tg_info.get("ten_god")
-                    break
-            
-            response_data["saju_summary"] = summary
-            response_data["month_branch_ten_god"] = month_branch_ten_god
-            response_data["gyeokguk"] = summary.get("primary_structure")
-            response_data["elements_present"] = summary.get("elements_present")
-            response_data["ten_gods_present"] = summary.get("ten_gods_present")
-            
-            logger.info(f"[Calculate] 팩트앵커 생성: day_master={summary.get('day_master')} | 월지십성={month_branch_ten_god} | 격국={summary.get('primary_structure')}")
-        except Exception as e:
-            logger.warning(f"[Calculate] saju_summary 생성 실패: {e}")
-            # 실패해도 기본 응답은 반환
+        response_data = _build_calculate_response(result, year, month, day, hour, minute)
+        logger.info(
+            f"[Calculate] 팩트앵커: day_master={result.day_master} | "
+            f"월지십성={response_data.get('month_branch_ten_god')} | 격국={response_data.get('gyeokguk')}"
+        )
         
         logger.info(f"Saju calculated: {year}-{month}-{day} | Source: {result.quality.calculation_method}")
         
@@ -186,6 +210,191 @@ async def calculate_saju(
         )
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 📦 배치 계산 (파트너 CSV 임포트용)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+BatchEntry = Tuple[int, Union[CalculateRequest, dict]]
+_END = object()
+
+
+def _batch_error(index: int, error_code: str, message: str) -> dict:
+    return {"index": index, "success": False, "error_code": error_code, "message": message}
+
+
+def _parse_batch_row(index: int, item) -> Union[CalculateRequest, dict]:
+    """행 → CalculateRequest, 실패 시 에러 딕셔너리"""
+    if isinstance(item, RowParseError):
+        return _batch_error(index, "INVALID_JSON", item.message)
+    if not isinstance(item, dict):
+        return _batch_error(index, "INVALID_ROW", "각 행은 JSON 객체여야 합니다.")
+    try:
+        req = CalculateRequest.model_validate(item)
+        date(req.birth_year, req.birth_month, req.birth_day)
+    except ValidationError as e:
+        return _batch_error(index, "INVALID_ROW", "; ".join(
+            f"{'.'.join(str(x) for x in err['loc'])}: {err['msg']}" for err in e.errors()
+        ))
+    except ValueError as e:
+        return _batch_error(index, "INVALID_DATE", str(e))
+    return req
+
+
+def _to_batch_row(req: CalculateRequest) -> dict:
+    return {
+        "year": req.birth_year,
+        "month": req.birth_month,
+        "day": req.birth_day,
+        "hour": req.birth_hour,
+        "minute": req.birth_minute,
+        "gender": req.gender.value if req.gender else None,
+        "timezone": req.timezone,
+    }
+
+
+def _ndjson(obj: dict) -> str:
+    return json.dumps(obj, ensure_ascii=False, default=str) + "\n"
+
+
+def _compute_batch_chunk(entries: List[BatchEntry], use_solar_time: bool) -> List[Optional[str]]:
+    """
+    청크 동기 계산 (스레드풀에서 실행)
+    
+    Returns:
+        entries와 같은 순서의 NDJSON 라인. 테이블 밖이라 비동기 경로가 필요한 행은 None
+    """
+    valid = [(i, req) for i, req in entries if isinstance(req, CalculateRequest)]
+    results = iter(saju_engine.calculate_batch([_to_batch_row(req) for _, req in valid], use_solar_time))
+    
+    lines: List[Optional[str]] = []
+    for index, req in entries:
+        if not isinstance(req, CalculateRequest):
+            lines.append(_ndjson(req))
+            continue
+        result = next(results)
+        if result is None:
+            lines.append(None)
+            continue
+        data = _build_calculate_response(
+            result, req.birth_year, req.birth_month, req.birth_day, req.birth_hour, req.birth_minute
+        )
+        lines.append(_ndjson({"index": index, **data}))
+    return lines
+
+
+async def _run_batch_chunk(entries: List[BatchEntry], use_solar_time: bool) -> str:
+    lines = await run_in_threadpool(_compute_batch_chunk, entries, use_solar_time)
+    
+    # 테이블 범위 밖 (거의 없음) → 기존 KASI/ephem 경로
+    for pos, line in enumerate(lines):
+        if line is not None:
+            continue
+        index, req = entries[pos]
+        try:
+            result = await saju_engine.calculate_async(
+                year=req.birth_year, month=req.birth_month, day=req.birth_day,
+                hour=req.birth_hour, minute=req.birth_minute,
+                gender=req.gender.value if req.gender else None,
+                timezone=req.timezone, use_solar_time=use_solar_time
+            )
+            data = _build_calculate_response(
+                result, req.birth_year, req.birth_month, req.birth_day, req.birth_hour, req.birth_minute
+            )
+            lines[pos] = _ndjson({"index": index, **data})
+        except Exception as e:
+            lines[pos] = _ndjson(_batch_error(index, "CALCULATION_ERROR", str(e)))
+    
+    return "".join(lines)
+
+
+async def _stream_batch(spool, use_solar_time: bool):
+    """업로드 행을 청크 단위로 계산하며 NDJSON으로 흘려보냄 (입력 순서 유지)"""
+    settings = get_settings()
+    chunk_size = max(1, settings.calculate_batch_chunk_size)
+    max_rows = settings.calculate_batch_max_rows
+    
+    entries: List[BatchEntry] = []
+    index = 0
+    ok_rows = 0
+    try:
+        rows = iter_json_rows(spool)
+        while True:
+            try:
+                item = next(rows, _END)
+            except BatchFormatError as e:
+                if entries:
+                    yield await _run_batch_chunk(entries, use_solar_time)
+                    entries = []
+                yield _ndjson(_batch_error(index, "INVALID_JSON", str(e)))
+                break
+            if item is _END:
+                break
+            if index >= max_rows:
+                yield _ndjson(_batch_error(index, "BATCH_TOO_LARGE", f"최대 {max_rows}행까지 처리합니다."))
+                break
+            
+            entry = _parse_batch_row(index, item)
+            ok_rows += isinstance(entry, CalculateRequest)
+            entries.append((index, entry))
+            index += 1
+            
+            if len(entries) >= chunk_size:
+                yield await _run_batch_chunk(entries, use_solar_time)
+                entries = []
+        
+        if entries:
+            yield await _run_batch_chunk(entries, use_solar_time)
+        logger.info(f"[CalculateBatch] 완료: rows={index} valid={ok_rows}")
+    finally:
+        spool.close()
+
+
+@router.post(
+    "/calculate/batch",
+    summary="사주 배치 계산 (NDJSON 스트리밍)",
+    description="""
+생년월일 행을 한 번에 업로드해 사주를 일괄 계산합니다.
+
+**입력:** `CalculateRequest` 객체의 JSON 배열, 또는 한 줄에 하나씩 NDJSON
+
+**출력:** `application/x-ndjson` - 행마다 `{"index": n, ...}` (입력 순서 유지)
+- 성공: `/calculate` 응답과 같은 필드 (saju, daeun, saju_summary ...)
+- 실패: `{"index": n, "success": false, "error_code", "message"}` (배치는 계속 진행)
+
+만세력 테이블로 청크 단위 동기 계산 → 행마다 코루틴/네트워크 호출 없음
+    """
+)
+async def calculate_saju_batch(
+    request: Request,
+    use_solar_time: bool = Query(True, description="태양시 보정 ON/OFF")
+):
+    """사주 배치 계산 API"""
+    if saju_engine is None:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "error_code": "ENGINE_NOT_READY",
+                "message": "사주 엔진이 초기화되지 않았습니다."
+            }
+        )
+    
+    # 본문은 스풀 파일로 받아둠 (일정 크기 이상은 디스크)
+    # StreamingResponse가 응답 중 receive()를 disconnect 감지에 쓰므로 본문은 응답 전에 다 읽어야 함
+    spool = tempfile.SpooledTemporaryFile(max_size=get_settings().calculate_batch_spool_bytes)
+    try:
+        async for chunk in request.stream():
+            spool.write(chunk)
+        spool.seek(0)
+    except Exception:
+        spool.close()
+        raise
+    
+    return StreamingResponse(
+        _stream_batch(spool, use_solar_time),
+        media_type="application/x-ndjson"
+    )
+
+
 @router.get(
     "/calculate/hour-options",
     response_model=List[HourOption],
@@ -295,5 +504,12 @@ async def compare_solar_time(
     summary="캐시 통계"
 )
 async def get_cache_stats():
-    """캐시 통계 조회"""
-    return cache_service.get_stats()
+    """캐시 통계 조회 (+ KASI 커넥션 풀/브레이커 상태)"""
+    from app.services.kasi_api import get_kasi_client, kasi_http
+    kasi_client = get_kasi_client()
+    return {
+        **cache_service.get_stats(),
+        "kasi_http": kasi_http.get_stats(),
+        "kasi_calendar": kasi_client.get_stats(),
+        "calendar_cache": kasi_client.cache.get_stats(),
+    }
@@ -146,16 +146,7 @@ async def debug_engine_with_survey(
         all_cards = []
         
         if rulestore and hasattr(rulestore, 'cards'):
-            all_cards = [
-                {
-                    "id": getattr(card, 'id', ''),
-                    "topic": getattr(card, 'topic', ''),
-                    "subtopic": getattr(card, 'subtopic', ''),
-                    "tags": getattr(card, 'tags', []),
-                    "priority": getattr(card, 'priority', 0),
-                }
-                for card in rulestore.cards
-            ]
+            all_cards = rulestore.cards
         
         logger.info(f"✅ 룰카드 로드: {len(all_cards)}장")
         
@@ -190,7 +181,7 @@ async def debug_engine_with_survey(
         
         # ━━━ STEP 4: 🔥 P0 설문 기반 스코어링 ━━━
         section_results = rulecard_scorer.score_all_sections(
-            all_cards=all_cards,
+            all_cards=rulestore,  # 로드 시 만든 tag_matrix 재사용
             feature_tags=feature_tags,
             survey_data=survey_data,
             section_ids=["exec", "money", "business"]  # 주요 3섹션만 테스트
@@ -160,12 +160,12 @@ async def get_rulecard(card_id: str, raw: Request):
                 "id": card.id,
                 "topic": card.topic,
                 "priority": card.priority,
-                "tags": card.tags,
+                "tags": list(card.tags),
                 "trigger": card.trigger,
-                "mechanism": card.mechanism or (card.content or {}).get("mechanism", ""),
-                "interpretation": card.interpretation or (card.content or {}).get("interpretation", ""),
-                "action": card.action or (card.content or {}).get("action", ""),
-                "cautions": card.cautions or (card.content or {}).get("cautions", []),
+                "mechanism": card.content_mechanism,
+                "interpretation": card.content_interpretation,
+                "action": card.content_action,
+                "cautions": card.content_cautions,
             }
     
     raise HTTPException(404, f"RuleCard not found: {card_id}")
@@ -29,8 +29,8 @@ from app.services.job_store import job_store, JobStatus
 from app.services.feature_tags import build_feature_tags, get_matching_tokens
 from app.services.feature_tags_no_time import build_feature_tags_no_time_from_pillars
 from app.services.preset_type2 import BUSINESS_OWNER_PRESET_V2
-from app.services.focus_boost import boost_preset_focus
-from app.services.rulecard_selector import select_cards_for_preset
+from app.services.selection_cache import card_selection_cache
+from app.services.rulecards_fts import card_query_text
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -75,7 +75,8 @@ def _get_rulecards_and_feature_tags(
     saju_data: dict, 
     store, 
     target_year: int,
-    survey_data: dict = None  # 🔥 P0: 설문 데이터 추가
+    survey_data: dict = None,  # 🔥 P0: 설문 데이터 추가
+    question: str = "",  # 질문/고민 → FTS 후보 카드
 ) -> tuple:
     """
     사주 데이터에서 RuleCards + FeatureTags 반환
@@ -110,9 +111,10 @@ def _get_rulecards_and_feature_tags(
     
     logger.info(f"[RuleCards] FeatureTags 생성: {len(feature_tags)}개 | day_master={features_dict.get('day_master')}")
     
-    # Preset 부스트 및 카드 선택
-    boosted = boost_preset_focus(BUSINESS_OWNER_PRESET_V2, feature_tags)
-    selection = select_cards_for_preset(store, boosted, feature_tags)
+    # Preset 부스트 및 카드 선택 (같은 태그 서명이면 캐시 - 부스트/선택 모두 건너뜀)
+    selection = card_selection_cache.select(
+        store, BUSINESS_OWNER_PRESET_V2, feature_tags, query=card_query_text(question, survey_data)
+    )
     
     # 모든 카드 수집
     all_cards = []
@@ -183,7 +185,7 @@ async def interpret_saju(
     if store and mode != "direct":
         try:
             rulecards, feature_tags, pool_count, features_dict = _get_rulecards_and_feature_tags(
-                saju_data, store, final_year, payload.survey_data
+                saju_data, store, final_year, payload.survey_data, payload.question
             )
             # 레거시 모드는 컨텍스트만 추가
         except Exception as e:
@@ -245,7 +247,7 @@ async def generate_premium_report(
     if store:
         try:
             rulecards, feature_tags, pool_count, features_dict = _get_rulecards_and_feature_tags(
-                saju_data, store, final_year, payload.survey_data
+                saju_data, store, final_year, payload.survey_data, payload.question
             )
         except Exception as e:
             logger.warning(f"[PremiumReport] RuleCards 로드 실패: {e}")
@@ -350,7 +352,7 @@ async def regenerate_single_section(
     if store:
         try:
             rulecards, feature_tags, pool_count, features_dict = _get_rulecards_and_feature_tags(
-                saju_data, store, final_year, payload.survey_data
+                saju_data, store, final_year, payload.survey_data, payload.question
             )
         except Exception as e:
             logger.warning(f"[RegenerateSection] RuleCards 로드 실패: {e}")
@@ -560,7 +562,7 @@ async def generate_report_async(
     if store:
         try:
             rulecards, feature_tags, _, features_dict = _get_rulecards_and_feature_tags(
-                saju_data, store, final_year, payload.survey_data
+                saju_data, store, final_year, payload.survey_data, payload.question
             )
         except Exception as e:
             logger.warning(f"[AsyncReport] RuleCards 로드 실패: {e}")
@@ -0,0 +1,148 @@
+"""
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📦 배치 업로드 행 파서 (JSON 배열 / NDJSON)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+파일 객체를 64KB씩 읽으며 행 단위로 yield → 업로드 크기와 무관하게 메모리 일정.
+
+- 첫 글자가 '[' 이면 JSON 배열: raw_decode로 원소를 하나씩 꺼냄
+- 그 외에는 NDJSON: 줄 단위 json.loads (깨진 줄은 RowParseError로 yield 후 계속)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import codecs
+import json
+import re
+from typing import Any, BinaryIO, Iterator, Union
+
+READ_SIZE = 64 * 1024
+
+_WS = re.compile(r"\s*")
+_JSON = json.JSONDecoder()
+
+
+class RowParseError:
+    """NDJSON 한 줄 파싱 실패 (배치는 계속 진행)"""
+
+    def __init__(self, message: str):
+        self.message = message
+
+
+class BatchFormatError(ValueError):
+    """JSON 배열 자체가 깨짐 (이후 행은 읽을 수 없음)"""
+    pass
+
+
+class _Reader:
+    """증분 UTF-8 디코딩 버퍼 - 소비한 앞부분은 리필할 때만 잘라냄 (행마다 slice 복사 방지)"""
+
+    def __init__(self, fp: BinaryIO):
+        self.fp = fp
+        self.decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> None:
+        data = self.fp.read(READ_SIZE)
+        if not data:
+            self.eof = True
+            text = self.decoder.decode(b"", final=True)
+        else:
+            text = self.decoder.decode(data)
+        self.buf = self.buf[self.pos:] + text
+        self.pos = 0
+
+    def skip_ws(self) -> None:
+        self.pos = _WS.match(self.buf, self.pos).end()
+
+
+def iter_json_rows(fp: BinaryIO) -> Iterator[Union[Any, RowParseError]]:
+    """
+    업로드 본문 → 행 iterator
+
+    Yields:
+        파싱된 JSON 값 (보통 dict) 또는 RowParseError
+    Raises:
+        BatchFormatError: JSON 배열이 중간에 깨졌을 때
+    """
+    r = _Reader(fp)
+
+    # 모드 판별 (첫 non-whitespace 문자)
+    while True:
+        r.skip_ws()
+        if r.pos < len(r.buf) or r.eof:
+            break
+        r.fill()
+    if r.pos >= len(r.buf):
+        return
+
+    if r.buf[r.pos] == "[":
+        r.pos += 1
+        yield from _iter_array(r)
+    else:
+        yield from _iter_ndjson(r)
+
+
+def _iter_array(r: _Reader) -> Iterator[Any]:
+    expect_value = True
+    while True:
+        r.skip_ws()
+        if r.pos >= len(r.buf):
+            if r.eof:
+                raise BatchFormatError("JSON 배열이 닫히지 않았습니다")
+            r.fill()
+            continue
+
+        ch = r.buf[r.pos]
+        if ch == "]":
+            return
+        if ch == ",":
+            if expect_value:
+                raise BatchFormatError("JSON 배열에 빈 원소가 있습니다")
+            r.pos += 1
+            expect_value = True
+            continue
+        if not expect_value:
+            raise BatchFormatError("JSON 배열 원소 사이에 ','가 없습니다")
+
+        try:
+            obj, end = _JSON.raw_decode(r.buf, r.pos)
+        except json.JSONDecodeError as e:
+            if r.eof:
+                raise BatchFormatError(f"잘못된 JSON 배열: {e.msg}")
+            r.fill()
+            continue
+
+        # 숫자/리터럴은 버퍼 끝에서 잘렸을 수 있음 → 구분자 확인 전까지 보류
+        if end >= len(r.buf) and not r.eof and r.buf[end - 1] not in "}]\"":
+            r.fill()
+            continue
+
+        r.pos = end
+        expect_value = False
+        yield obj
+
+
+def _iter_ndjson(r: _Reader) -> Iterator[Union[Any, RowParseError]]:
+    while True:
+        nl = r.buf.find("\n", r.pos)
+        if nl < 0:
+            if r.eof:
+                line = r.buf[r.pos:]
+                r.pos = len(r.buf)
+                if line.strip():
+                    yield _loads_line(line)
+                return
+            r.fill()
+            continue
+
+        line = r.buf[r.pos:nl]
+        r.pos = nl + 1
+        if line.strip():
+            yield _loads_line(line)
+
+
+def _loads_line(line: str) -> Union[Any, RowParseError]:
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as e:
+        return RowParseError(f"잘못된 JSON 행: {e.msg}")
@@ -0,0 +1,127 @@
+"""
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+🧵 블로킹 호출 실행 계층 + 이벤트 루프 지연 모니터
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+- run_blocking(fn, *args): 동기 함수(supabase-py execute, ephem 계산)를
+  전용 스레드 풀에서 실행 → 한 요청의 DB 저장이 워커 전체를 멈추지 않음
+- 풀 크기는 설정값으로 제한 (기본 스레드 풀/다른 to_thread 사용처와 분리)
+- LoopLagMonitor: interval마다 깨어나 예정 시각 대비 지연을 측정,
+  임계값 초과 시 경고 로그 + stall 카운트 (/ready 에서 확인)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import asyncio
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BlockingExecutor:
+    """크기 제한 스레드 풀 (lazy 생성, 종료 후 재사용 시 다시 생성)"""
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max(1, max_workers)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.stats = {"calls": 0, "errors": 0, "inflight": 0, "peak_inflight": 0}
+
+    def _ensure_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="blocking",
+                    )
+        return self._pool
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """fn(*args, **kwargs)를 풀에서 실행하고 결과를 await"""
+        loop = asyncio.get_running_loop()
+        call = functools.partial(fn, *args, **kwargs) if args or kwargs else fn
+        s = self.stats
+        s["calls"] += 1
+        s["inflight"] += 1
+        s["peak_inflight"] = max(s["peak_inflight"], s["inflight"])
+        try:
+            return await loop.run_in_executor(self._ensure_pool(), call)
+        except Exception:
+            s["errors"] += 1
+            raise
+        finally:
+            s["inflight"] -= 1
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "max_workers": self.max_workers}
+
+
+class LoopLagMonitor:
+    """
+    이벤트 루프 응답성 측정
+
+    asyncio.sleep(interval) 후 실제 경과 시간 - interval = 루프가 다른 작업에 막혀 있던 시간.
+    threshold 이상이면 stall로 집계하고 경고 로그.
+    """
+
+    def __init__(self, interval: float, threshold: float):
+        self.interval = interval
+        self.threshold = threshold
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {"samples": 0, "stalls": 0, "last_lag_ms": 0.0, "max_lag_ms": 0.0}
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def record(self, lag: float) -> None:
+        s = self.stats
+        lag_ms = round(lag * 1000, 1)
+        s["samples"] += 1
+        s["last_lag_ms"] = lag_ms
+        s["max_lag_ms"] = max(s["max_lag_ms"], lag_ms)
+        if lag >= self.threshold:
+            s["stalls"] += 1
+            logger.warning(f"[LoopLag] event loop stalled {lag_ms}ms (threshold {self.threshold * 1000:.0f}ms)")
+
+    async def _run(self) -> None:
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self.interval)
+            self.record(max(0.0, time.monotonic() - start - self.interval))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "running": self._task is not None and not self._task.done(),
+            "threshold_ms": self.threshold * 1000,
+        }
+
+
+_settings = get_settings()
+blocking_executor = BlockingExecutor(_settings.blocking_pool_size)
+loop_monitor = LoopLagMonitor(_settings.loop_lag_interval_seconds, _settings.loop_lag_threshold_seconds)
+
+run_blocking = blocking_executor.run
@@ -2,7 +2,8 @@
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 1️⃣ CALC 모듈 - 사주 8글자 계산 (KASI-only)
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-KASI API + calendar_cache로 년/월/일주 계산
+만세력 테이블(1900~2100)로 년/월/일주 O(1) 조회
+테이블 범위 밖이면 KASI API + calendar_cache
 시주 계산은 내부 로직 (시간 있을 경우)
 ephem 제거, KASI 결과만 사용
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -11,7 +12,8 @@ import logging
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, asdict
 
-from app.services.kasi_api import kasi_client
+from app.services.kasi_api import get_kasi_client
+from app.services.calendar_table import get_calendar_table
 from app.services.ganji import ganji_calc, CHEONGAN, JIJI, GAN_TO_ELEMENT, JI_TO_ELEMENT
 
 logger = logging.getLogger(__name__)
@@ -49,7 +51,7 @@ class SajuPillars:
 class CalcModule:
     """
     사주 8글자 계산 모듈 (KASI-only)
-    - KASI API + calendar_cache 사용 (년/월/일주)
+    - 만세력 테이블 우선, 범위 밖은 KASI API + calendar_cache (년/월/일주)
     - 시주: 내부 계산 (ganji_calc)
     - KASI 실패 시 에러 반환 (ephem fallback 제거)
     """
@@ -64,10 +66,13 @@ class CalcModule:
     ) -> SajuPillars:
         logger.info(f"[CalcModule] 사주 계산: {birth_year}-{birth_month:02d}-{birth_day:02d}")
         
-        # KASI API + 캐시로 년/월/일주 계산
-        year_pillar, month_pillar, day_pillar = await self._get_pillars_from_kasi(
-            birth_year, birth_month, birth_day
+        # 만세력 테이블 → (범위 밖) KASI API + 캐시로 년/월/일주 계산
+        pillars = self._get_pillars_from_table(
+            birth_year, birth_month, birth_day, birth_hour, birth_minute
         )
+        if pillars is None:
+            pillars = await self._get_pillars_from_kasi(birth_year, birth_month, birth_day)
+        year_pillar, month_pillar, day_pillar = pillars
         
         # 시주 계산 (시간 있을 경우)
         hour_pillar = None
@@ -87,7 +92,7 @@ class CalcModule:
         day: int
     ) -> tuple[PillarData, PillarData, PillarData]:
         """KASI API + 캐시로 년/월/일주 계산"""
-        ganji_data = await kasi_client.get_ganji_data(year, month, day)
+        ganji_data = await get_kasi_client().get_ganji_data(year, month, day)
         
         source = ganji_data.get("source", "unknown")
         logger.info(f"[CalcModule] KASI source={source}")
@@ -99,27 +104,37 @@ class CalcModule:
         if not year_ganji or not month_ganji or not day_ganji:
             raise RuntimeError(f"calendar unavailable for {year}-{month:02d}-{day:02d}")
         
-        # 간지 파싱
-        year_gan, year_ji = year_ganji[0], year_ganji[1]
-        month_gan, month_ji = month_ganji[0], month_ganji[1]
-        day_gan, day_ji = day_ganji[0], day_ganji[1]
+        return self._make_pillar(year_ganji), self._make_pillar(month_ganji), self._make_pillar(day_ganji)
+    
+    def _get_pillars_from_table(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        hour: Optional[int],
+        minute: int
+    ) -> Optional[tuple[PillarData, PillarData, PillarData]]:
+        """만세력 테이블로 년/월/일주 계산 (절입 시각 반영), 범위 밖이면 None"""
+        table = get_calendar_table()
+        if table is None or not table.covers(year, month, day):
+            return None
         
-        year_pillar = PillarData(
-            gan=year_gan, ji=year_ji, ganji=year_ganji,
-            gan_element=GAN_TO_ELEMENT[year_gan], ji_element=JI_TO_ELEMENT[year_ji],
-            gan_index=CHEONGAN.index(year_gan), ji_index=JIJI.index(year_ji)
+        ganji_data = table.get_ganji(year, month, day, hour, minute)
+        logger.info(f"[CalcModule] source={ganji_data['source']}")
+        return (
+            self._make_pillar(ganji_data["year_ganji"]),
+            self._make_pillar(ganji_data["month_ganji"]),
+            self._make_pillar(ganji_data["day_ganji"]),
         )
-        month_pillar = PillarData(
-            gan=month_gan, ji=month_ji, ganji=month_ganji,
-            gan_element=GAN_TO_ELEMENT[month_gan], ji_element=JI_TO_ELEMENT[month_ji],
-            gan_index=CHEONGAN.index(month_gan), ji_index=JIJI.index(month_ji)
-        )
-        day_pillar = PillarData(
-            gan=day_gan, ji=day_ji, ganji=day_ganji,
-            gan_element=GAN_TO_ELEMENT[day_gan], ji_element=JI_TO_ELEMENT[day_ji],
-            gan_index=CHEONGAN.index(day_gan), ji_index=JIJI.index(day_ji)
+    
+    @staticmethod
+    def _make_pillar(ganji: str) -> PillarData:
+        gan, ji = ganji[0], ganji[1]
+        return PillarData(
+            gan=gan, ji=ji, ganji=ganji,
+            gan_element=GAN_TO_ELEMENT[gan], ji_element=JI_TO_ELEMENT[ji],
+            gan_index=CHEONGAN.index(gan), ji_index=JIJI.index(ji)
         )
-        return year_pillar, month_pillar, day_pillar
     
     def _calculate_hour_pillar(self, day_gan_idx: int, hour: int, minute: int) -> PillarData:
         hour_gan, hour_ji, hour_gan_idx, hour_ji_idx = ganji_calc.calc_hour_ganji(day_gan_idx, hour, minute)
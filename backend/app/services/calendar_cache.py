@@ -0,0 +1,283 @@
+"""
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+🗂️ 계층형 calendar 캐시 (KASI 응답)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+조회 순서 (위에서 hit하면 아래로 내려가지 않음):
+
+1) memory   - cache_service.kasi_cache (프로세스 내 TTL/LRU)
+2) sqlite   - 로컬 WAL 파일 (재시작/같은 호스트 워커 간 공유)
+3) supabase - calendar_cache 테이블 (PostgREST, run_blocking 풀에서 실행)
+4) KASI     - 호출부(kasi_api)가 담당, 결과는 put()으로 전 계층 저장
+
+하위 계층 hit은 상위 계층으로 승격 → 같은 날짜 재요청은 프로세스 밖으로 안 나감.
+날짜별 음양력 값은 바뀌지 않으므로 무효화는 없음.
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.config import get_settings
+from app.services.blocking import run_blocking
+from app.services.cache import cache_service
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SQLITE_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "calendar_cache.sqlite3"
+
+TIERS = ("memory", "sqlite", "supabase")
+
+# (year, month, day, payload_norm, payload_raw, source)
+CalendarRow = Tuple[int, int, int, Dict[str, Any], Optional[Dict[str, Any]], str]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS calendar_cache (
+    sol_year    INTEGER NOT NULL,
+    sol_month   INTEGER NOT NULL,
+    sol_day     INTEGER NOT NULL,
+    payload     TEXT NOT NULL,
+    payload_raw TEXT,
+    source      TEXT,
+    fetched_at  TEXT,
+    PRIMARY KEY (sol_year, sol_month, sol_day)
+) WITHOUT ROWID
+"""
+
+_UPSERT = (
+    "INSERT OR REPLACE INTO calendar_cache "
+    "(sol_year, sol_month, sol_day, payload, payload_raw, source, fetched_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+class SqliteCalendarStore:
+    """로컬 SQLite(WAL) 계층 - 연결 1개를 lock으로 공유 (읽기는 수십 µs)"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=5.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def get(self, year: int, month: int, day: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, payload_raw FROM calendar_cache "
+                "WHERE sol_year = ? AND sol_month = ? AND sol_day = ?",
+                (year, month, day),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "payload": json.loads(row[0]),
+            "payload_raw": json.loads(row[1]) if row[1] else None,
+        }
+
+    def put_many(self, rows: Iterable[CalendarRow]) -> int:
+        """(year, month, day, payload_norm, payload_raw, source) 묶음 upsert - 트랜잭션 1회"""
+        now = datetime.now(timezone.utc).isoformat()
+        params = [
+            (y, m, d, json.dumps(norm, ensure_ascii=False),
+             json.dumps(raw, ensure_ascii=False) if raw is not None else None, source, now)
+            for y, m, d, norm, raw, source in rows
+        ]
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(_UPSERT, params)
+        return len(params)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM calendar_cache").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CalendarCache:
+    """
+    memory → sqlite → supabase 계층 캐시
+
+    get()/put()은 async: sqlite/supabase 계층은 run_blocking 풀에서, memory만 이벤트 루프에서 바로 처리.
+    행 형태는 supabase calendar_cache와 동일: {"payload": 정규화, "payload_raw": 원본}
+    """
+
+    def __init__(
+        self,
+        supabase_getter: Callable[[], Any],
+        sqlite_path: Optional[Path] = None,
+        use_sqlite: bool = True,
+    ):
+        self._get_supabase = supabase_getter
+        self.sqlite: Optional[SqliteCalendarStore] = None
+        if use_sqlite:
+            try:
+                self.sqlite = SqliteCalendarStore(sqlite_path or DEFAULT_SQLITE_PATH)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"[CalendarCache] sqlite tier disabled: {e}")
+        self.stats = {tier: {"hits": 0, "misses": 0} for tier in TIERS}
+        self.stats["writes"] = 0
+
+    # ========== 계층별 접근 ==========
+
+    def _memory_get(self, year: int, month: int, day: int) -> Optional[Dict[str, Any]]:
+        return cache_service.get_kasi(year, month, day)
+
+    def _memory_put(self, year: int, month: int, day: int, row: Dict[str, Any]) -> None:
+        cache_service.set_kasi(year, month, day, row)
+
+    def _sqlite_get(self, year: int, month: int, day: int) -> Optional[Dict[str, Any]]:
+        try:
+            return self.sqlite.get(year, month, day)
+        except sqlite3.Error as e:
+            logger.warning(f"[CalendarCache] sqlite read error: {e}")
+            return None
+
+    def _sqlite_put(self, rows) -> None:
+        try:
+            self.sqlite.put_many(rows)
+        except sqlite3.Error as e:
+            logger.warning(f"[CalendarCache] sqlite write error: {e}")
+
+    def _supabase_get(self, year: int, month: int, day: int) -> Optional[Dict[str, Any]]:
+        cached = self._get_supabase().get_calendar_cache(year, month, day)
+        if cached and cached.get("payload"):
+            return {"payload": cached["payload"], "payload_raw": cached.get("payload_raw")}
+        return None
+
+    def _hit(self, tier: str) -> None:
+        self.stats[tier]["hits"] += 1
+
+    def _miss(self, tier: str) -> None:
+        self.stats[tier]["misses"] += 1
+
+    # ========== 공개 API ==========
+
+    async def get(self, year: int, month: int, day: int, skip_memory: bool = False) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Returns:
+            (hit 계층 이름, {"payload", "payload_raw"}) 또는 None (전 계층 miss)
+        """
+        if not skip_memory:
+            row = self._memory_get(year, month, day)
+            if row is not None:
+                self._hit("memory")
+                return "memory", row
+            self._miss("memory")
+
+        if self.sqlite is not None:
+            row = await run_blocking(self._sqlite_get, year, month, day)
+            if row is not None:
+                self._hit("sqlite")
+                self._memory_put(year, month, day, row)
+                return "sqlite", row
+            self._miss("sqlite")
+
+        try:
+            row = await run_blocking(self._supabase_get, year, month, day)
+        except Exception as e:
+            logger.warning(f"[CalendarCache] supabase read error: {e}")
+            row = None
+        if row is None:
+            self._miss("supabase")
+            return None
+
+        self._hit("supabase")
+        self._memory_put(year, month, day, row)
+        if self.sqlite is not None:
+            await run_blocking(self._sqlite_put, [(year, month, day, row["payload"], row["payload_raw"], "supabase")])
+        return "supabase", row
+
+    async def put(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        payload_norm: Dict[str, Any],
+        payload_raw: Optional[Dict[str, Any]] = None,
+        source: str = "kasi",
+    ) -> None:
+        """KASI 결과를 전 계층에 저장 (supabase 실패는 무시)"""
+        row = {"payload": payload_norm, "payload_raw": payload_raw}
+        self._memory_put(year, month, day, row)
+        if self.sqlite is not None:
+            await run_blocking(self._sqlite_put, [(year, month, day, payload_norm, payload_raw, source)])
+        self.stats["writes"] += 1
+
+        def _upsert():
+            self._get_supabase().upsert_calendar_cache(
+                year, month, day,
+                payload_norm=payload_norm,
+                payload_raw=payload_raw,
+                source=source,
+            )
+
+        try:
+            await run_blocking(_upsert)
+        except Exception as e:
+            logger.warning(f"[CalendarCache] supabase upsert fail: {e}")
+
+    async def put_many(self, rows: List[CalendarRow], supabase: bool = True) -> Dict[str, Any]:
+        """
+        백필용 일괄 저장 - sqlite + supabase (memory는 건너뜀: 대량 적재로 LRU를 밀어내지 않도록)
+
+        Args:
+            rows: (year, month, day, payload_norm, payload_raw, source)
+        Returns:
+            {"rows": n, "sqlite": bool, "supabase": bool}
+        """
+        rows = list(rows)
+        out = {"rows": len(rows), "sqlite": False, "supabase": False}
+        if not rows:
+            out["sqlite"] = out["supabase"] = True
+            return out
+
+        if self.sqlite is not None:
+            try:
+                await run_blocking(self.sqlite.put_many, rows)
+                out["sqlite"] = True
+            except sqlite3.Error as e:
+                logger.warning(f"[CalendarCache] sqlite bulk write error: {e}")
+
+        if supabase:
+            payload = [
+                {
+                    "sol_year": y, "sol_month": m, "sol_day": d,
+                    "payload": norm, "payload_raw": raw, "source": source,
+                }
+                for y, m, d, norm, raw, source in rows
+            ]
+            try:
+                out["supabase"] = await run_blocking(
+                    lambda: self._get_supabase().upsert_calendar_cache_many(payload)
+                )
+            except Exception as e:
+                logger.warning(f"[CalendarCache] supabase bulk upsert fail: {e}")
+        self.stats["writes"] += len(rows)
+        return out
+
+    def get_stats(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        for tier in TIERS:
+            s = self.stats[tier]
+            total = s["hits"] + s["misses"]
+            out[tier] = {**s, "hit_rate": f"{(s['hits'] / total * 100) if total else 0:.1f}%"}
+        out["writes"] = self.stats["writes"]
+        out["sqlite_enabled"] = self.sqlite is not None
+        return out
+
+
+def make_calendar_cache(supabase_getter: Callable[[], Any]) -> CalendarCache:
+    """설정 기반 생성 (calendar_cache_sqlite_path 비우면 data/calendar_cache.sqlite3)"""
+    settings = get_settings()
+    path = Path(settings.calendar_cache_sqlite_path) if settings.calendar_cache_sqlite_path else None
+    return CalendarCache(supabase_getter, path, use_sqlite=settings.calendar_cache_sqlite_enabled)
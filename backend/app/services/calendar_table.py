@@ -0,0 +1,392 @@
+"""
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📅 만세력 테이블 (1900–2100, 오프라인 사전계산)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+요청마다 KASI getLunCalInfo + ephem.Sun()을 돌리던 경로를 대체.
+tools/build_calendar_table.py로 한 번 만든 고정폭 바이너리를 mmap으로 읽어
+날짜 → 년/월/일 간지, 음력, 윤달, 절입 시각을 O(1)로 조회한다.
+
+파일 레이아웃 (little-endian):
+- 헤더 (_HEADER)
+- 일 레코드 n_days × _DAY  : 00:00 KST 기준 년/월/일 60갑자 인덱스,
+                             당일 절기 인덱스(없으면 255), 음력 년/월/일, 플래그
+- 절입 시각 term_years × 24 × int64 : UTC epoch 초 (소한=0 ... 동지=23)
+
+당일에 "절(節)"이 들어 있으면 조회 시각이 절입 시각 이후일 때 월주(+입춘이면 년주)를
+한 칸 넘긴다. 60갑자 월주는 연두법상 해가 바뀌어도 연속이므로 +1이면 충분.
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import bisect
+import logging
+import mmap
+import os
+import struct
+import zlib
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# ============ 포맷 상수 ============
+
+MAGIC = b"SJCT"
+FORMAT_VERSION = 1
+
+FIRST_YEAR = 1900
+LAST_YEAR = 2100
+
+# magic, version, record_size, first_ordinal, n_days,
+# term_first_year, term_years, day_offset, term_offset, payload_crc32
+_HEADER = struct.Struct("<4sHHIIHHIII")
+# year_idx, month_idx, day_idx, term_idx, lunar_year, lunar_month, lunar_day, flags
+_DAY = struct.Struct("<BBBBHBBB")
+_TERM = struct.Struct("<q")
+
+NO_TERM = 255
+FLAG_LEAP_MONTH = 0x01
+FLAG_LUNAR_VALID = 0x02
+
+IPCHUN_TERM_IDX = 2
+KST = timezone(timedelta(hours=9))
+
+DEFAULT_TABLE_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "ganji_calendar_v1.bin"
+
+GAN = "갑을병정무기경신임계"
+JI = "자축인묘진사오미신유술해"
+
+# 2000-01-01 = 무오일 (60갑자 54번째) - engine_v2.SajuManager.ANCHOR와 동일
+_DAY_ANCHOR_ORDINAL = date(2000, 1, 1).toordinal()
+_DAY_ANCHOR_IDX = 54
+
+
+class CalendarTableError(Exception):
+    """만세력 테이블 로드/조회 오류"""
+    pass
+
+
+class CalendarDay(NamedTuple):
+    """일 레코드 (00:00 KST 기준)"""
+    year_idx: int       # 60갑자 인덱스
+    month_idx: int
+    day_idx: int
+    term_idx: Optional[int]  # 당일 절기 (소한=0 ... 동지=23), 없으면 None
+    lunar_year: int
+    lunar_month: int
+    lunar_day: int
+    is_leap_month: bool
+    lunar_valid: bool   # korean_lunar_calendar 범위(~2050-11-18) 밖이면 False
+
+
+def sexagenary(gan_idx: int, ji_idx: int) -> int:
+    """(천간, 지지) 인덱스 → 60갑자 인덱스"""
+    return (6 * gan_idx - 5 * ji_idx) % 60
+
+
+def ganji_str(idx60: int) -> str:
+    return GAN[idx60 % 10] + JI[idx60 % 12]
+
+
+def boundary_from_longitude(solar_longitude: float) -> Tuple[bool, Optional[str]]:
+    """절기 ±1.5° 경계 판정 (engine_v2 규칙과 동일)"""
+    for boundary in range(0, 360, 15):
+        diff = abs((solar_longitude - boundary + 180) % 360 - 180)
+        if diff <= 1.5:
+            return True, "near_ipchun" if boundary == 315 else "near_term_change"
+    return False, None
+
+
+# ============ 리더 ============
+
+class CalendarTable:
+    """
+    mmap 기반 만세력 리더
+
+    - 파일은 읽기 전용으로 매핑 → 워커 프로세스 간 페이지 캐시 공유
+    - 모든 조회는 struct.unpack_from 한 번 (O(1))
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, record_size, first_ordinal, n_days,
+         term_first_year, term_years, day_offset, term_offset, crc) = _HEADER.unpack_from(self._mm, 0)
+
+        if magic != MAGIC:
+            raise CalendarTableError(f"잘못된 매직: {magic!r}")
+        if version != FORMAT_VERSION:
+            raise CalendarTableError(f"지원하지 않는 버전: {version}")
+        if record_size != _DAY.size:
+            raise CalendarTableError(f"레코드 크기 불일치: {record_size}")
+        if zlib.crc32(self._mm[_HEADER.size:]) != crc:
+            raise CalendarTableError("체크섬 불일치 (파일 손상)")
+
+        self.version = version
+        self.first_ordinal = first_ordinal
+        self.n_days = n_days
+        self.term_first_year = term_first_year
+        self.term_years = term_years
+        self._day_offset = day_offset
+        self._term_offset = term_offset
+
+        self.first_date = date.fromordinal(first_ordinal)
+        self.last_date = date.fromordinal(first_ordinal + n_days - 1)
+
+    def close(self):
+        self._mm.close()
+
+    # ----- 범위 -----
+
+    def covers(self, year: int, month: int, day: int) -> bool:
+        ordinal = date(year, month, day).toordinal()
+        return 0 <= ordinal - self.first_ordinal < self.n_days
+
+    # ----- 일 레코드 -----
+
+    def get_day(self, year: int, month: int, day: int) -> CalendarDay:
+        pos = date(year, month, day).toordinal() - self.first_ordinal
+        if not 0 <= pos < self.n_days:
+            raise CalendarTableError(f"범위 밖 날짜: {year}-{month:02d}-{day:02d}")
+
+        (y_idx, m_idx, d_idx, term, l_year, l_month, l_day, flags) = _DAY.unpack_from(
+            self._mm, self._day_offset + pos * _DAY.size
+        )
+        return CalendarDay(
+            year_idx=y_idx,
+            month_idx=m_idx,
+            day_idx=d_idx,
+            term_idx=None if term == NO_TERM else term,
+            lunar_year=l_year,
+            lunar_month=l_month,
+            lunar_day=l_day,
+            is_leap_month=bool(flags & FLAG_LEAP_MONTH),
+            lunar_valid=bool(flags & FLAG_LUNAR_VALID),
+        )
+
+    # ----- 절입 시각 -----
+
+    def term_instant(self, year: int, term_idx: int) -> datetime:
+        """절입 시각 (UTC, tz-aware)"""
+        pos = (year - self.term_first_year) * 24 + term_idx
+        if not 0 <= pos < self.term_years * 24:
+            raise CalendarTableError(f"범위 밖 절기: {year}/{term_idx}")
+        (ts,) = _TERM.unpack_from(self._mm, self._term_offset + pos * _TERM.size)
+        return datetime.fromtimestamp(ts, tz=timezone.utc)
+
+    def _term_ts(self, pos: int) -> int:
+        return _TERM.unpack_from(self._mm, self._term_offset + pos * _TERM.size)[0]
+
+    def solar_longitude_at(self, dt_kst: datetime) -> Optional[float]:
+        """
+        절입 시각 사이 선형 보간으로 태양 황경 추정 (meta/경계 표시용)
+
+        절기 간격 15°를 ~15.2일에 나눠 보간 → 오차 0.05° 이하
+        """
+        ts = int(dt_kst.replace(tzinfo=KST).timestamp())
+        year = dt_kst.year
+        lo = max(0, (year - 1 - self.term_first_year) * 24)
+        hi = min(self.term_years * 24, (year + 2 - self.term_first_year) * 24)
+        instants = [self._term_ts(p) for p in range(lo, hi)]
+
+        i = bisect.bisect_right(instants, ts) - 1
+        if i < 0 or i + 1 >= len(instants):
+            return None
+
+        pos = lo + i
+        lon_start = (285 + 15 * (pos % 24)) % 360
+        frac = (ts - instants[i]) / (instants[i + 1] - instants[i])
+        return (lon_start + 15 * frac) % 360
+
+    # ----- 간지 조회 -----
+
+    def get_ganji(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        hour: Optional[int] = None,
+        minute: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        년/월/일 간지 조회 (시각 기준 절입 보정 포함)
+
+        Args:
+            hour: 절입 판정용 시각 (None이면 engine_v2와 같이 12시 기준)
+        """
+        rec = self.get_day(year, month, day)
+        calc_hour = hour if hour is not None else 12
+        local_dt = datetime(year, month, day, calc_hour, minute)
+
+        year_idx = rec.year_idx
+        month_idx = rec.month_idx
+        if rec.term_idx is not None and rec.term_idx % 2 == 0:
+            term_at = self.term_instant(year, rec.term_idx).astimezone(KST).replace(tzinfo=None)
+            if local_dt >= term_at:
+                month_idx = (month_idx + 1) % 60
+                if rec.term_idx == IPCHUN_TERM_IDX:
+                    year_idx = (year_idx + 1) % 60
+
+        solar_longitude = self.solar_longitude_at(local_dt)
+        is_boundary, boundary_reason = (
+            boundary_from_longitude(solar_longitude) if solar_longitude is not None else (False, None)
+        )
+
+        return {
+            "year_ganji": ganji_str(year_idx),
+            "month_ganji": ganji_str(month_idx),
+            "day_ganji": ganji_str(rec.day_idx),
+            "year_idx": year_idx,
+            "month_idx": month_idx,
+            "day_idx": rec.day_idx,
+            "lunar_year": rec.lunar_year if rec.lunar_valid else None,
+            "lunar_month": rec.lunar_month if rec.lunar_valid else None,
+            "lunar_day": rec.lunar_day if rec.lunar_valid else None,
+            "is_leap_month": rec.is_leap_month,
+            "solar_longitude": round(solar_longitude, 2) if solar_longitude is not None else None,
+            "is_boundary": is_boundary,
+            "boundary_reason": boundary_reason,
+            "source": "calendar_table",
+        }
+
+
+# ============ 빌더 (오프라인 전용) ============
+
+def _lunar_for(cal, solar: date) -> Tuple[int, int, int, int]:
+    """korean_lunar_calendar로 음력 변환 → (년, 월, 일, flags)"""
+    if not cal.setSolarDate(solar.year, solar.month, solar.day):
+        return 0, 0, 0, 0
+    flags = FLAG_LUNAR_VALID
+    if cal.isIntercalation:
+        flags |= FLAG_LEAP_MONTH
+    return cal.lunarYear, cal.lunarMonth, cal.lunarDay, flags
+
+
+def build_table(
+    out_path: Path,
+    first_year: int = FIRST_YEAR,
+    last_year: int = LAST_YEAR,
+) -> Dict[str, Any]:
+    """
+    만세력 테이블 생성 (ephem + korean_lunar_calendar 필요)
+
+    절입 시각: solar_terms.SolarTermIndex (겉보기 황경, KASI와 분 단위 일치)
+    """
+    from korean_lunar_calendar import KoreanLunarCalendar
+    from app.services.solar_terms import find_solar_term_instant, get_solar_term_index
+
+    # 1. 절입 시각 (앞뒤 1년 여유 - 1900-01-01의 월주 판정에 전년도 대설 필요)
+    term_first_year = first_year - 1
+    term_years = last_year - first_year + 3
+    index = get_solar_term_index()
+    term_ts: List[int] = []
+    for y in range(term_first_year, term_first_year + term_years):
+        for i in range(24):
+            if index is not None and index.first_year <= y <= index.last_year:
+                term_ts.append(index.instant_ts(y, i))
+            else:
+                term_ts.append(int(find_solar_term_instant(y, i).timestamp()))
+
+    # 절입 시각 → 당일(KST) 매핑
+    term_by_ordinal: Dict[int, int] = {}
+    for pos, ts in enumerate(term_ts):
+        kst_day = datetime.fromtimestamp(ts, tz=KST).date()
+        term_by_ordinal[kst_day.toordinal()] = pos % 24
+
+    # 2. 일 레코드
+    first_ordinal = date(first_year, 1, 1).toordinal()
+    last_ordinal = date(last_year, 12, 31).toordinal()
+    n_days = last_ordinal - first_ordinal + 1
+
+    # 00:00 KST 시점의 월/년 결정: 그 시각 "이전" 마지막 절
+    # (정확히 00:00에 든 절은 당일 절기로 남겨 조회 시 보정)
+    jeol_ts = [(ts, pos) for pos, ts in enumerate(term_ts) if pos % 2 == 0]
+    jeol_keys = [t for t, _ in jeol_ts]
+
+    lunar_cal = KoreanLunarCalendar()
+    days = bytearray()
+    for ordinal in range(first_ordinal, last_ordinal + 1):
+        d = date.fromordinal(ordinal)
+        midnight_ts = int(datetime(d.year, d.month, d.day, tzinfo=KST).timestamp())
+
+        k = bisect.bisect_left(jeol_keys, midnight_ts) - 1
+        _, pos = jeol_ts[k]
+        term_year = term_first_year + pos // 24
+        term_idx = pos % 24
+
+        # 절 → 월지 (소한=축, 입춘=인, ...): ji = (term_idx // 2 + 1) % 12
+        month_ji = (term_idx // 2 + 1) % 12
+        # 입춘(2) 이전이면 전년도 간지
+        saju_year = term_year if term_idx >= IPCHUN_TERM_IDX else term_year - 1
+        year_gan = (saju_year - 4) % 10
+        year_idx = (saju_year - 4) % 60
+        month_gan = ((year_gan % 5) * 2 + 2 + (month_ji - 2) % 12) % 10
+        month_idx = sexagenary(month_gan, month_ji)
+        day_idx = (_DAY_ANCHOR_IDX + ordinal - _DAY_ANCHOR_ORDINAL) % 60
+
+        l_year, l_month, l_day, flags = _lunar_for(lunar_cal, d)
+        days += _DAY.pack(
+            year_idx, month_idx, day_idx,
+            term_by_ordinal.get(ordinal, NO_TERM),
+            l_year, l_month, l_day, flags,
+        )
+
+    terms = b"".join(_TERM.pack(ts) for ts in term_ts)
+
+    day_offset = _HEADER.size
+    term_offset = day_offset + len(days)
+    payload = bytes(days) + terms
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, _DAY.size, first_ordinal, n_days,
+        term_first_year, term_years, day_offset, term_offset, zlib.crc32(payload),
+    )
+
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_path.with_suffix(out_path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(payload)
+    os.replace(tmp, out_path)
+
+    return {
+        "path": str(out_path),
+        "days": n_days,
+        "terms": len(term_ts),
+        "bytes": len(header) + len(payload),
+        "crc32": f"{zlib.crc32(payload):08x}",
+    }
+
+
+# ============ 싱글톤 ============
+
+_table: Optional[CalendarTable] = None
+_table_failed = False
+
+
+def get_calendar_table() -> Optional[CalendarTable]:
+    """
+    lazy 싱글톤 - 파일이 없거나 손상되면 None (호출부는 기존 KASI/ephem 경로로 fallback)
+    """
+    global _table, _table_failed
+    if _table is not None or _table_failed:
+        return _table
+
+    from app.config import get_settings
+    path = Path(get_settings().calendar_table_path or DEFAULT_TABLE_PATH)
+
+    try:
+        _table = CalendarTable(path)
+        logger.info(
+            f"[CalendarTable] 로드: {path.name} v{_table.version} "
+            f"({_table.first_date}~{_table.last_date}, {_table.n_days} days)"
+        )
+    except FileNotFoundError:
+        logger.warning(f"[CalendarTable] 파일 없음: {path} → KASI/ephem 사용")
+        _table_failed = True
+    except (CalendarTableError, ValueError, OSError) as e:
+        logger.error(f"[CalendarTable] 로드 실패: {e} → KASI/ephem 사용")
+        _table_failed = True
+    return _table
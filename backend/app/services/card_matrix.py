@@ -0,0 +1,156 @@
+"""
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+🧮 카드 × 용어 희소 행렬 (CSR) - 섹션 일괄 채점
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+카드마다 태그/트리거 루프를 돌던 채점을
+"행렬(카드 × 용어) @ 가중치(용어 × 섹션)" 한 번으로 처리.
+
+- indptr / indices / data: 표준 CSR 배열 (scipy 없이 numpy만)
+- dot(W): W의 열 = 섹션별 가중치 벡터 → (카드 × 섹션) 점수
+- top_k: argpartition으로 후보 축소 후 (점수 내림차순, 행 번호 오름차순)
+  → 기존 list.sort(reverse=True) (stable)와 같은 순서
+  groups(단계)를 주면 (단계 오름차순 → 점수 → 행 번호) - 경계 단계만 partition, 정렬은 k개 이하
+  채점기 / MatchModule / preset 선택기가 같은 함수로 순위를 매김 (후보가 많으면 O(n + k log k))
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+from typing import Dict, Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class CardMatrix:
+    """
+    행 = 카드, 열 = 용어(vocab)
+
+    binary=True  → 같은 용어가 여러 번 나와도 1 (태그 집합 매칭)
+    binary=False → 등장 횟수 (트리거 리스트의 중복까지 반영)
+    """
+
+    def __init__(self, rows: Sequence[Iterable[str]], binary: bool = True):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy 미설치")
+
+        vocab: Dict[str, int] = {}
+        indptr = [0]
+        indices: List[int] = []
+        data: List[float] = []
+
+        for terms in rows:
+            counts: Dict[int, int] = {}
+            for t in terms:
+                col = vocab.setdefault(t, len(vocab))
+                counts[col] = 1 if binary else counts.get(col, 0) + 1
+            for col in sorted(counts):
+                indices.append(col)
+                data.append(counts[col])
+            indptr.append(len(indices))
+
+        self.vocab = vocab
+        self.n_rows = len(indptr) - 1
+        self.n_cols = len(vocab)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.data = np.asarray(data, dtype=np.float64)
+
+    @classmethod
+    def from_arrays(cls, terms: List[str], indptr, indices, data) -> "CardMatrix":
+        """이미 만들어진 CSR 배열로 생성 (스냅샷 로드 - 배열 복사 없음)"""
+        m = cls.__new__(cls)
+        m.vocab = {t: col for col, t in enumerate(terms)}
+        m.n_rows = len(indptr) - 1
+        m.n_cols = len(terms)
+        m.indptr, m.indices, m.data = indptr, indices, data
+        return m
+
+    def terms(self) -> List[str]:
+        """열 번호 순 용어 목록"""
+        out = [""] * self.n_cols
+        for t, col in self.vocab.items():
+            out[col] = t
+        return out
+
+    def vector(self, weights: Dict[str, float]) -> "np.ndarray":
+        """{용어: 가중치} → 열 방향 dense 벡터 (vocab에 없는 용어는 무시)"""
+        v = np.zeros(self.n_cols, dtype=np.float64)
+        for t, w in weights.items():
+            col = self.vocab.get(t)
+            if col is not None:
+                v[col] += w
+        return v
+
+    def dot(self, weights: "np.ndarray", rows: Optional["np.ndarray"] = None) -> "np.ndarray":
+        """
+        (n_rows × n_cols) @ (n_cols × S) → (n_rows × S)
+        rows를 주면 그 행들만 계산 → (len(rows) × S) (역색인으로 후보를 좁힌 경우)
+
+        비어 있지 않은 행의 시작 위치로만 reduceat (빈 행은 0 유지)
+        """
+        if weights.ndim == 1:
+            return self.dot(weights[:, None], rows)[:, 0]
+        if rows is None:
+            starts, lens, pos = self.indptr[:-1], np.diff(self.indptr), None
+        else:
+            rows = np.asarray(rows, dtype=np.int64)
+            starts = self.indptr[rows]
+            lens = self.indptr[rows + 1] - starts
+            offsets = np.cumsum(lens) - lens
+            pos = np.repeat(starts - offsets, lens) + np.arange(int(lens.sum()))
+            starts = offsets
+
+        out = np.zeros((lens.shape[0], weights.shape[1]), dtype=np.float64)
+        nonempty = np.flatnonzero(lens)
+        if nonempty.size:
+            indices = self.indices if pos is None else self.indices[pos]
+            data = self.data if pos is None else self.data[pos]
+            contrib = data[:, None] * weights[indices]
+            out[nonempty] = np.add.reduceat(contrib, starts[nonempty], axis=0)
+        return out
+
+
+# 후보가 이보다 적으면 partition 없이 전체 lexsort가 더 빠름 (numpy 호출 비용 > 정렬 비용, 실측 2~4천 사이)
+_PARTITION_MIN = 2048
+
+
+def top_k(
+    scores: "np.ndarray",
+    k: int,
+    mask: Optional["np.ndarray"] = None,
+    groups: Optional["np.ndarray"] = None,
+) -> "np.ndarray":
+    """
+    점수 상위 k개 행 번호 (점수 내림차순, 동점은 행 번호 오름차순)
+
+    argpartition으로 k번째 점수를 구한 뒤 그 점수 이상인 행만 정렬
+    → 경계 동점도 stable sort와 같은 행이 선택됨
+
+    groups: 행별 0 이상 정수 단계 - 작은 단계가 점수와 무관하게 먼저
+    (np.lexsort((rows, -scores, groups))[:k]와 같은 결과)
+    """
+    cand = np.flatnonzero(mask) if mask is not None else np.arange(scores.shape[0])
+    if k <= 0 or cand.size == 0:
+        return cand[:0]
+    if groups is not None:
+        return _top_k_grouped(scores, k, cand, groups[cand])
+    s = scores[cand]
+    if cand.size > k:
+        kth = s[np.argpartition(-s, k - 1)[k - 1]]
+        keep = s >= kth
+        cand, s = cand[keep], s[keep]
+    order = np.lexsort((cand, -s))
+    return cand[order][:k]
+
+
+def _top_k_grouped(scores: "np.ndarray", k: int, cand: "np.ndarray", g: "np.ndarray") -> "np.ndarray":
+    """단계별 개수로 경계 단계를 찾고, 앞 단계는 통째로 / 경계 단계만 top_k"""
+    if cand.size <= max(k, _PARTITION_MIN):
+        return cand[np.lexsort((cand, -scores[cand], g))][:k]
+    filled = np.cumsum(np.bincount(g))
+    boundary = int(np.searchsorted(filled, k))  # 이 단계에서 k개에 도달 (후보 > k라 항상 있음)
+    head = cand[g < boundary]
+    order = np.lexsort((head, -scores[head], g[g < boundary]))
+    tail = cand[g == boundary]
+    return np.concatenate([head[order], tail[top_k(scores[tail], k - head.size)]])
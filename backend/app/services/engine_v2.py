@@ -2,15 +2,16 @@
 Saju Engine v3 - KASI API 통합 (Source of Truth)
 
 우선순위:
-1. KASI API (한국천문연구원) - Source of Truth
+0. 만세력 테이블 (1900~2100 사전계산, mmap O(1)) - 네트워크/ephem 없이 즉시
+1. KASI API (한국천문연구원) - Source of Truth (테이블 범위 밖)
 2. ephem (NASA JPL) - Fallback
 
 특징:
+- KASI 호출은 공유 커넥션 풀(kasi_http) 사용 - 브레이커 open이면 즉시 ephem
 - KASI API 실패시 자동으로 ephem fallback
 - 서비스 중단 없는 고가용성
 - 오늘 날짜 명시적 주입 (연도 착각 방지)
 """
-import math
 import re
 import logging
 from datetime import datetime, timedelta, timezone
@@ -18,6 +19,11 @@ from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 import httpx
 
+from app.services.blocking import run_blocking
+from app.services.calendar_table import get_calendar_table
+from app.services.kasi_api import kasi_http, KasiUnavailable, norm_ganji as _norm_ganji
+from app.services.solar_terms import apparent_solar_longitude, get_solar_term_index
+
 try:
     import ephem
     EPHEM_AVAILABLE = True
@@ -89,33 +95,7 @@ class CalculationError(Exception):
 
 
 # ============ 간지 정규화 (가짜 mismatch 방지) ============
-
-def _norm_ganji(x) -> str:
-    """
-    간지 문자열 정규화
-    - KASI: '무인(戊寅)' → '무인'
-    - ephem: '무인' → '무인'
-    - 괄호+한자, invisible chars 제거
-    """
-    s = str(x)
-    
-    # 1. 괄호와 그 안의 내용 제거: '무인(戊寅)' → '무인'
-    s = re.sub(r"\([^)]*\)", "", s)
-    
-    # 2. invisible chars 제거
-    s = s.replace("\u200b", "")  # zero-width space
-    s = s.replace("\ufeff", "")  # BOM
-    s = s.replace("\xa0", "")    # NBSP
-    
-    # 3. 모든 공백 제거
-    s = re.sub(r"\s+", "", s)
-    
-    # 4. 한글 간지만 추출 (2글자)
-    hangul_match = re.search(r"[가-힣]{2}", s)
-    if hangul_match:
-        return hangul_match.group(0)
-    
-    return s.strip()
+# kasi_api.norm_ganji 공유 (캐시 저장 경로와 같은 규칙)
 
 
 class SajuManager:
@@ -201,32 +181,32 @@ class SajuManager:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.get(self.KASI_LUNAR_URL, params=params)
-                resp.raise_for_status()
-                data = resp.json()
-                
-                items = (
-                    data.get("response", {})
-                    .get("body", {})
-                    .get("items", {})
-                    .get("item", {})
-                )
-                
-                if items:
-                    return {
-                        "year_ganji": items.get("lunSecha", ""),
-                        "month_ganji": items.get("lunWolgeon", ""),
-                        "day_ganji": items.get("lunIljin", ""),
-                        "lunar_year": items.get("lunYear", ""),
-                        "lunar_month": items.get("lunMonth", ""),
-                        "lunar_day": items.get("lunDay", ""),
-                        "is_leap": items.get("lunLeapmonth", "") == "윤"
-                    }
-                
-                logger.warning(f"KASI API returned empty for {year}-{month}-{day}")
-                return None
-                
+            data = await kasi_http.get_json(self.KASI_LUNAR_URL, params)
+            
+            items = (
+                data.get("response", {})
+                .get("body", {})
+                .get("items", {})
+                .get("item", {})
+            )
+            
+            if items:
+                return {
+                    "year_ganji": items.get("lunSecha", ""),
+                    "month_ganji": items.get("lunWolgeon", ""),
+                    "day_ganji": items.get("lunIljin", ""),
+                    "lunar_year": items.get("lunYear", ""),
+                    "lunar_month": items.get("lunMonth", ""),
+                    "lunar_day": items.get("lunDay", ""),
+                    "is_leap": items.get("lunLeapmonth", "") == "윤"
+                }
+            
+            logger.warning(f"KASI API returned empty for {year}-{month}-{day}")
+            return None
+            
+        except KasiUnavailable as e:
+            logger.warning(f"KASI API skipped for {year}-{month}-{day}: {e}")
+            return None
         except httpx.TimeoutException:
             logger.error(f"KASI API timeout for {year}-{month}-{day}")
             return None
@@ -254,31 +234,28 @@ class SajuManager:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.get(self.KASI_SOLAR_TERM_URL, params=params)
-                resp.raise_for_status()
-                data = resp.json()
-                
-                items = (
-                    data.get("response", {})
-                    .get("body", {})
-                    .get("items", {})
-                    .get("item", [])
-                )
-                
-                if items:
-                    if isinstance(items, dict):
-                        items = [items]
-                    return [
-                        {
-                            "name": item.get("dateName", ""),
-                            "date": str(item.get("locdate", "")),
-                        }
-                        for item in items
-                    ]
-                
-                return None
-                
+            data = await kasi_http.get_json(self.KASI_SOLAR_TERM_URL, params)
+            
+            items = (
+                data.get("response", {})
+                .get("body", {})
+                .get("items", {})
+                .get("item", [])
+            )
+            
+            if items:
+                if isinstance(items, dict):
+                    items = [items]
+                return [
+                    {
+                        "name": item.get("dateName", ""),
+                        "date": str(item.get("locdate", "")),
+                    }
+                    for item in items
+                ]
+            
+            return None
+            
         except Exception as e:
             logger.error(f"KASI Solar Terms API error: {e}")
             return None
@@ -293,20 +270,16 @@ class SajuManager:
         hour: int,
         minute: int = 0
     ) -> float:
-        """ephem으로 태양 황경 계산"""
-        if not EPHEM_AVAILABLE:
-            raise CalculationError("ephem 라이브러리 미설치")
-        
+        """태양 황경 (절입 시각 인덱스 보간, 범위 밖이면 ephem)"""
         dt_kst = datetime(year, month, day, hour, minute)
-        dt_utc = dt_kst - timedelta(hours=9)
         
-        sun = ephem.Sun()
-        observer = ephem.Observer()
-        observer.date = dt_utc
-        sun.compute(observer)
+        term_index = get_solar_term_index()
+        if term_index is not None and term_index.covers(dt_kst):
+            return term_index.solar_longitude(dt_kst)
         
-        ecliptic = ephem.Ecliptic(sun)
-        return math.degrees(ecliptic.lon)
+        if not EPHEM_AVAILABLE:
+            raise CalculationError("ephem 라이브러리 미설치")
+        return apparent_solar_longitude(dt_kst - timedelta(hours=9))
     
     def _ephem_calculate_ganji(
         self,
@@ -319,15 +292,22 @@ class SajuManager:
         # 태양 황경
         solar_lon = self._ephem_solar_longitude(year, month, day, hour)
         
-        # 월지 인덱스
-        normalized = (solar_lon + 45) % 360
-        term_idx = int(normalized / 30)
-        month_ji_idx = (term_idx + 2) % 12
-        
-        # 년주
-        cal_year = year
-        if month <= 2 and month_ji_idx <= 1:
-            cal_year = year - 1
+        birth_dt = datetime(year, month, day, hour)
+        term_index = get_solar_term_index()
+        if term_index is not None and term_index.covers(birth_dt):
+            # 월지 / 입춘 보정 연도: 절입 시각 bisect
+            month_ji_idx = term_index.month_ji_index(birth_dt)
+            cal_year = term_index.saju_year(birth_dt)
+        else:
+            # 월지 인덱스
+            normalized = (solar_lon + 45) % 360
+            term_idx = int(normalized / 30)
+            month_ji_idx = (term_idx + 2) % 12
+            
+            # 년주
+            cal_year = year
+            if month <= 2 and month_ji_idx <= 1:
+                cal_year = year - 1
         
         year_gan_idx = (cal_year - 4) % 10
         year_ji_idx = (cal_year - 4) % 12
@@ -356,28 +336,14 @@ class SajuManager:
     
     # ============ 통합 계산 ============
     
-    async def calculate(
+    async def _calculate_live(
         self,
         year: int,
         month: int,
         day: int,
-        hour: Optional[int] = None,
-        minute: int = 0,
-        use_solar_time: bool = True
-    ) -> Dict[str, Any]:
-        """
-        사주 계산 (KASI 우선, ephem Fallback)
-        
-        Args:
-            year, month, day: 양력 생년월일
-            hour: 출생 시 (0-23), None이면 시주 생략
-            minute: 출생 분
-            use_solar_time: 태양시 보정 적용 여부
-        
-        Returns:
-            사주 결과 딕셔너리
-        """
-        
+        hour: Optional[int]
+    ) -> Tuple[Dict[str, Any], str, float]:
+        """테이블 범위 밖 날짜: KASI 우선, ephem Fallback"""
         # 1. KASI API 시도
         kasi_data = await self._fetch_kasi_lunar(year, month, day)
         source = "kasi_api"
@@ -391,7 +357,7 @@ class SajuManager:
                     "KASI API 실패 및 ephem 미설치로 계산 불가"
                 )
             
-            ephem_data = self._ephem_calculate_ganji(year, month, day, hour or 12)
+            ephem_data = await run_blocking(self._ephem_calculate_ganji, year, month, day, hour or 12)
             
             kasi_data = {
                 "year_ganji": ephem_data["year_ganji"],
@@ -404,7 +370,7 @@ class SajuManager:
         else:
             # KASI 데이터 있으면 ephem으로 추가 정보만 계산
             if EPHEM_AVAILABLE:
-                ephem_data = self._ephem_calculate_ganji(year, month, day, hour or 12)
+                ephem_data = await run_blocking(self._ephem_calculate_ganji, year, month, day, hour or 12)
                 solar_longitude = ephem_data.get("solar_longitude", 0)
                 month_ji_idx = ephem_data.get("month_ji_idx", 0)
                 
@@ -423,6 +389,74 @@ class SajuManager:
                 solar_longitude = 0
                 month_ji_idx = 0
         
+        return kasi_data, source, solar_longitude
+    
+    async def calculate(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        hour: Optional[int] = None,
+        minute: int = 0,
+        use_solar_time: bool = True
+    ) -> Dict[str, Any]:
+        """
+        사주 계산 (만세력 테이블 → KASI → ephem Fallback)
+        
+        Args:
+            year, month, day: 양력 생년월일
+            hour: 출생 시 (0-23), None이면 시주 생략
+            minute: 출생 분
+            use_solar_time: 태양시 보정 적용 여부
+        
+        Returns:
+            사주 결과 딕셔너리
+        """
+        
+        # 0. 만세력 테이블 (범위 내면 KASI/ephem 호출 없음)
+        result = self.calculate_from_table(year, month, day, hour, minute, use_solar_time)
+        if result is not None:
+            return result
+        
+        kasi_data, source, solar_longitude = await self._calculate_live(year, month, day, hour)
+        return self._build_result(kasi_data, source, solar_longitude, hour, minute, use_solar_time)
+    
+    def calculate_from_table(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        hour: Optional[int] = None,
+        minute: int = 0,
+        use_solar_time: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        만세력 테이블만으로 동기 계산 (배치용 - 이벤트 루프/네트워크 불필요)
+        
+        Returns:
+            calculate()와 같은 결과 딕셔너리, 테이블 범위 밖이면 None
+        """
+        table = get_calendar_table()
+        if table is None or not table.covers(year, month, day):
+            return None
+        
+        table_data = table.get_ganji(year, month, day, hour, minute)
+        return self._build_result(
+            table_data, "calendar_table", table_data.get("solar_longitude") or 0,
+            hour, minute, use_solar_time
+        )
+    
+    def _build_result(
+        self,
+        kasi_data: Dict[str, Any],
+        source: str,
+        solar_longitude: float,
+        hour: Optional[int],
+        minute: int,
+        use_solar_time: bool
+    ) -> Dict[str, Any]:
+        """년/월/일 간지 → 결과 딕셔너리 (시주/경계 계산 포함)"""
+        
         # 3. 간지 파싱
         year_ganji = kasi_data["year_ganji"]
         month_ganji = kasi_data["month_ganji"]
@@ -437,7 +471,6 @@ class SajuManager:
         
         # 4. 시주 계산 (항상 내부 계산)
         hour_pillar = None
-        hour_range = None
         
         if hour is not None:
             adjusted_minute = hour * 60 + minute
@@ -452,27 +485,57 @@ class SajuManager:
             start_time_gan = (day_gan_idx % 5) * 2
             hour_gan_idx = (start_time_gan + hour_ji_idx) % 10
             
-            hour_pillar = self._make_pillar(hour_gan_idx, hour_ji_idx)
-            h_opt = HOUR_OPTIONS[hour_ji_idx]
-            hour_range = f"{h_opt['start']}~{h_opt['end']}"
+            hour_pillar = (hour_gan_idx, hour_ji_idx)
         
-        # 5. 경계일 확인
-        is_boundary = False
-        boundary_reason = None
-        if EPHEM_AVAILABLE and solar_longitude:
-            for boundary in range(0, 360, 15):
-                diff = abs((solar_longitude - boundary + 180) % 360 - 180)
-                if diff <= 1.5:
-                    is_boundary = True
-                    boundary_reason = "near_ipchun" if boundary == 315 else "near_term_change"
-                    break
+        # 5. 경계일 확인 (테이블은 반올림 전 황경으로 이미 판정)
+        if "is_boundary" in kasi_data:
+            is_boundary = kasi_data["is_boundary"]
+            boundary_reason = kasi_data.get("boundary_reason")
+        else:
+            is_boundary = False
+            boundary_reason = None
+            if solar_longitude:
+                for boundary in range(0, 360, 15):
+                    diff = abs((solar_longitude - boundary + 180) % 360 - 180)
+                    if diff <= 1.5:
+                        is_boundary = True
+                        boundary_reason = "near_ipchun" if boundary == 315 else "near_term_change"
+                        break
         
         # 6. 결과 반환
+        return self.assemble_result(
+            (year_gan_idx, year_ji_idx),
+            (month_gan_idx, month_ji_idx_parsed),
+            (day_gan_idx, day_ji_idx),
+            hour_pillar,
+            source, solar_longitude, is_boundary, boundary_reason, use_solar_time
+        )
+    
+    def assemble_result(
+        self,
+        year: Tuple[int, int],
+        month: Tuple[int, int],
+        day: Tuple[int, int],
+        hour: Optional[Tuple[int, int]],
+        source: str,
+        solar_longitude: float,
+        is_boundary: bool,
+        boundary_reason: Optional[str],
+        use_solar_time: bool,
+        today_kst: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """(천간, 지지) 인덱스 → 결과 딕셔너리 (calculate / 배치 공용)"""
+        day_gan_idx = day[0]
+        hour_range = None
+        if hour is not None:
+            h_opt = HOUR_OPTIONS[hour[1]]
+            hour_range = f"{h_opt['start']}~{h_opt['end']}"
+        
         return {
-            "year_pillar": self._make_pillar(year_gan_idx, year_ji_idx),
-            "month_pillar": self._make_pillar(month_gan_idx, month_ji_idx_parsed),
-            "day_pillar": self._make_pillar(day_gan_idx, day_ji_idx),
-            "hour_pillar": hour_pillar,
+            "year_pillar": self._make_pillar(*year),
+            "month_pillar": self._make_pillar(*month),
+            "day_pillar": self._make_pillar(*day),
+            "hour_pillar": self._make_pillar(*hour) if hour is not None else None,
             "hour_range": hour_range,
             "day_master": GAN[day_gan_idx],
             "day_master_element": GAN_TO_ELEMENT[GAN[day_gan_idx]],
@@ -485,7 +548,7 @@ class SajuManager:
                 "boundary_reason": boundary_reason,
                 "calculation_method": source,
                 "timezone": "Asia/Seoul",
-                "today_kst": self.get_today_string()
+                "today_kst": today_kst or self.get_today_string()
             }
         }
     
@@ -538,15 +601,11 @@ class ScientificSajuEngine:
     
     def _get_solar_longitude(self, year: int, month: int, day: int, hour: int, minute: int = 0) -> float:
         dt_kst = datetime(year, month, day, hour, minute)
-        dt_utc = dt_kst - timedelta(hours=9)
-        
-        sun = ephem.Sun()
-        observer = ephem.Observer()
-        observer.date = dt_utc
-        sun.compute(observer)
         
-        ecliptic = ephem.Ecliptic(sun)
-        return math.degrees(ecliptic.lon)
+        term_index = get_solar_term_index()
+        if term_index is not None and term_index.covers(dt_kst):
+            return term_index.solar_longitude(dt_kst)
+        return apparent_solar_longitude(dt_kst - timedelta(hours=9))
     
     def _get_solar_term_index(self, solar_longitude: float) -> Tuple[int, str]:
         deg = solar_longitude
@@ -578,14 +637,25 @@ class ScientificSajuEngine:
         """동기 계산 (ephem only - 기존 호환)"""
         try:
             calc_hour = hour if hour is not None else 12
-            solar_lon = self._get_solar_longitude(year, month, day, calc_hour, minute)
-            solar_idx, solar_term = self._get_solar_term_index(solar_lon)
-            is_boundary, boundary_reason = self._is_near_boundary(solar_lon)
+            birth_dt = datetime(year, month, day, calc_hour, minute)
+            term_index = get_solar_term_index()
             
-            cal_year = year
-            if month <= 2:
-                if solar_idx <= 1:
-                    cal_year = year - 1
+            if term_index is not None and term_index.covers(birth_dt):
+                # 절입 시각 인덱스 bisect (ephem 호출 없음)
+                solar_lon = term_index.solar_longitude(birth_dt)
+                solar_idx = term_index.month_ji_index(birth_dt)
+                solar_term = SOLAR_TERM_NAMES[solar_idx]
+                is_boundary, boundary_reason = term_index.near_boundary(birth_dt)
+                cal_year = term_index.saju_year(birth_dt)
+            else:
+                solar_lon = self._get_solar_longitude(year, month, day, calc_hour, minute)
+                solar_idx, solar_term = self._get_solar_term_index(solar_lon)
+                is_boundary, boundary_reason = self._is_near_boundary(solar_lon)
+                
+                cal_year = year
+                if month <= 2:
+                    if solar_idx <= 1:
+                        cal_year = year - 1
             
             year_gan_idx = (cal_year - 4) % 10
             year_ji_idx = (cal_year - 4) % 12
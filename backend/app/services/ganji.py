@@ -3,9 +3,16 @@
 - 천간(10개) × 지지(12개) = 60갑자
 - 연두법(월간 계산)
 - 일간 기준 시간 천간 계산
+- calculate_many: 날짜 배열 → 4기둥 인덱스 (NumPy 벡터화)
 """
 from datetime import date, datetime
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Dict, Any, Union, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 # 천간 (10개)
 CHEONGAN = ["갑", "을", "병", "정", "무", "기", "경", "신", "임", "계"]
@@ -247,5 +254,140 @@ def get_element(gan_or_ji: str, is_gan: bool = True) -> str:
     return JI_TO_ELEMENT.get(gan_or_ji, "")
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 🚀 벡터화 계산 (배치 임포트 / 길일 스캔 / 통계)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# 2000-01-01 = 무오일 (60갑자 54번째), 1970-01-01 기준 epoch day 10957
+# (engine_v2.SajuManager / calendar_table과 같은 기준 - calc_day_ganji의 갑진 기준과 다름)
+_DAY_ANCHOR_EPOCH_DAY = 10957
+_DAY_ANCHOR_IDX = 54
+
+_KST_OFFSET_SEC = 9 * 3600
+_IPCHUN_TERM_IDX = 2
+_BOUNDARY_FRACTION = 1.5 / 15
+
+_term_instants_np = None
+
+
+def _term_instants():
+    """SolarTermIndex 배열을 복사 없이 int64 ndarray로"""
+    global _term_instants_np
+    if _term_instants_np is None:
+        from app.services.solar_terms import get_solar_term_index
+        index = get_solar_term_index()
+        if index is None:
+            raise RuntimeError("절입 시각 인덱스 없음")
+        _term_instants_np = (index.first_year, np.frombuffer(index.instants, dtype=np.int64))
+    return _term_instants_np
+
+
+def calculate_many(
+    dates: Union[Sequence, "np.ndarray"],
+    hours: Optional[Union[Sequence, "np.ndarray"]] = None,
+    minutes: Optional[Union[Sequence, "np.ndarray"]] = None,
+    use_solar_time: Union[bool, Sequence, "np.ndarray"] = True
+) -> Dict[str, Any]:
+    """
+    날짜 배열 → 년/월/일/시주 인덱스 (컬럼형 dict)
+    
+    engine_v2.SajuManager(만세력 테이블 경로)와 같은 규칙:
+    - 일주: epoch-day 산술 (2000-01-01 = 무오)
+    - 월지/입춘 보정 연도: 절입 시각 배열 np.searchsorted (시각 미상이면 12시 기준)
+    - 월간: 연두법 시작 천간표, 시간: 일간별 자시 천간표 (모두 배열 연산)
+    - 시지: 보정 분 = 시*60+분 (-30 태양시), ((보정시+1)//2) % 12
+    
+    Args:
+        dates: date/datetime64/ISO 문자열 배열
+        hours: 0-23, 음수/None이면 시주 미상 (생략 시 전부 미상)
+        minutes: 0-59 (생략 시 0)
+        use_solar_time: 전체 또는 행별 태양시 보정 여부
+    
+    Returns:
+        {
+            "year_gan", "year_ji", "month_gan", "month_ji",
+            "day_gan", "day_ji", "hour_gan", "hour_ji": int8 배열 (시주 미상/무효 행 = -1),
+            "solar_longitude": float64, "is_boundary": bool, "near_ipchun": bool,
+            "valid": bool (절입 인덱스 범위 1850~2149 밖이면 False)
+        }
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("numpy 미설치")
+    
+    epoch_day = np.asarray(dates, dtype="datetime64[D]").astype(np.int64)
+    n = epoch_day.shape[0]
+    
+    if hours is None:
+        hour_arr = np.full(n, -1, dtype=np.int64)
+    else:
+        hour_arr = np.array([-1 if h is None else h for h in hours], dtype=np.int64) \
+            if not isinstance(hours, np.ndarray) else hours.astype(np.int64)
+    minute_arr = np.zeros(n, dtype=np.int64) if minutes is None else np.asarray(minutes, dtype=np.int64)
+    solar = np.broadcast_to(np.asarray(use_solar_time, dtype=bool), (n,))
+    has_hour = hour_arr >= 0
+    
+    # 1. 일주
+    day60 = (_DAY_ANCHOR_IDX + epoch_day - _DAY_ANCHOR_EPOCH_DAY) % 60
+    day_gan = day60 % 10
+    day_ji = day60 % 12
+    
+    # 2. 절입 위치 (KST 로컬 시각 → UTC epoch 초)
+    first_year, instants = _term_instants()
+    calc_hour = np.where(has_hour, hour_arr, 12)
+    ts = epoch_day * 86400 + calc_hour * 3600 + minute_arr * 60 - _KST_OFFSET_SEC
+    pos = np.searchsorted(instants, ts, side="right") - 1
+    valid = (pos >= 0) & (pos < instants.shape[0] - 1)
+    pos = np.clip(pos, 0, instants.shape[0] - 2)
+    
+    term_idx = pos % 24
+    term_year = first_year + pos // 24
+    
+    # 3. 년주 (입춘 전이면 전년도)
+    saju_year = term_year - (term_idx < _IPCHUN_TERM_IDX)
+    year_gan = (saju_year - 4) % 10
+    year_ji = (saju_year - 4) % 12
+    
+    # 4. 월주 (연두법: 갑기→병, 을경→무, 병신→경, 정임→임, 무계→갑)
+    month_ji = (term_idx // 2 + 1) % 12
+    month_start = np.array([2, 4, 6, 8, 0] * 2, dtype=np.int64)[year_gan]
+    month_gan = (month_start + (month_ji - 2) % 12) % 10
+    
+    # 5. 시주 (일간별 자시 천간: 갑기→갑, 을경→병, 병신→무, 정임→경, 무계→임)
+    adjusted = (hour_arr * 60 + minute_arr - np.where(solar, 30, 0)) % 1440
+    hour_ji = ((adjusted // 60 + 1) // 2) % 12
+    hour_start = np.array([0, 2, 4, 6, 8] * 2, dtype=np.int64)[day_gan]
+    hour_gan = (hour_start + hour_ji) % 10
+    hour_gan = np.where(has_hour & valid, hour_gan, -1)
+    hour_ji = np.where(has_hour & valid, hour_ji, -1)
+    
+    # 6. 황경 보간 / 경계 (±1.5° = 절기 구간의 10%)
+    start = instants[pos]
+    frac = (ts - start) / (instants[pos + 1] - start)
+    solar_longitude = (285 + 15 * term_idx + 15 * frac) % 360
+    near_prev = frac <= _BOUNDARY_FRACTION
+    near_next = frac >= 1 - _BOUNDARY_FRACTION
+    nearest_term = np.where(near_next, (term_idx + 1) % 24, term_idx)
+    is_boundary = (near_prev | near_next) & valid
+    near_ipchun = is_boundary & (nearest_term == _IPCHUN_TERM_IDX)
+    
+    def _col(a):
+        return np.where(valid, a, -1).astype(np.int8)
+    
+    return {
+        "year_gan": _col(year_gan),
+        "year_ji": _col(year_ji),
+        "month_gan": _col(month_gan),
+        "month_ji": _col(month_ji),
+        "day_gan": day_gan.astype(np.int8),
+        "day_ji": day_ji.astype(np.int8),
+        "hour_gan": hour_gan.astype(np.int8),
+        "hour_ji": hour_ji.astype(np.int8),
+        "solar_longitude": np.where(valid, solar_longitude, np.nan),
+        "is_boundary": is_boundary,
+        "near_ipchun": near_ipchun,
+        "valid": valid,
+    }
+
+
 # 싱글톤
 ganji_calc = GanjiCalculator()
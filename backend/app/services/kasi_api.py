@@ -3,25 +3,399 @@
 - ephem 제거, KASI 결과만 사용
 - calendar_cache: Supabase 캐싱 연동
 - 실패 시: 캐시 폴백 -> 캐시도 없으면 에러
+- kasi_http: 공유 keep-alive 커넥션 풀 + 동시성 제한 + 호출 데드라인 + 서킷 브레이커
+- 같은 날짜 동시 miss: single-flight(프로세스 내) + lock file(워커 간)로 KASI 1회
+- 캐시 계층: memory → sqlite(WAL) → supabase → KASI (calendar_cache.py)
 """
+import asyncio
+import os
+import re
+import tempfile
+import time
+import zlib
 import httpx
-from typing import Optional, Dict, Any
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Optional, Dict, Any, AsyncIterator, Awaitable, Callable, Hashable, Iterable, List, Tuple
 import logging
 
 from app.config import get_settings
+from app.services.calendar_cache import CalendarCache, CalendarRow, make_calendar_cache
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:  # Windows
+    FCNTL_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
+# ============ KASI item → 캐시 payload (일 단위 / 월 백필 공통) ============
+
+def norm_ganji(x) -> str:
+    """
+    간지 문자열 정규화
+    - KASI: '무인(戊寅)' → '무인'
+    - ephem: '무인' → '무인'
+    - 괄호+한자, invisible chars 제거
+    """
+    s = str(x)
+    
+    # 1. 괄호와 그 안의 내용 제거: '무인(戊寅)' → '무인'
+    s = re.sub(r"\([^)]*\)", "", s)
+    
+    # 2. invisible chars 제거
+    s = s.replace("\u200b", "")  # zero-width space
+    s = s.replace("\ufeff", "")  # BOM
+    s = s.replace("\xa0", "")    # NBSP
+    
+    # 3. 모든 공백 제거
+    s = re.sub(r"\s+", "", s)
+    
+    # 4. 한글 간지만 추출 (2글자)
+    hangul_match = re.search(r"[가-힣]{2}", s)
+    if hangul_match:
+        return hangul_match.group(0)
+    
+    return s.strip()
+
+
+def normalize_calendar_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """getLunCalInfo item 1개 → 캐시 payload (간지는 norm_ganji, 빈 값은 그대로 빈 문자열)"""
+    def ganji(key: str) -> str:
+        v = item.get(key, "")
+        return norm_ganji(v) if v else ""
+
+    return {
+        "year_ganji": ganji("lunSecha"),
+        "month_ganji": ganji("lunWolgeon"),
+        "day_ganji": ganji("lunIljin"),
+        "lunar_year": item.get("lunYear", ""),
+        "lunar_month": item.get("lunMonth", ""),
+        "lunar_day": item.get("lunDay", ""),
+        "is_leap_month": item.get("lunLeapmonth", "") == "윤",
+    }
+
+
+def calendar_raw(item: Dict[str, Any]) -> Dict[str, Any]:
+    """payload_raw 형태 통일: 일 단위 응답 구조 (response.body.items.item = 그날 item 1개)"""
+    return {"response": {"body": {"items": {"item": item}}}}
+
+
+class KasiUnavailable(RuntimeError):
+    """서킷 차단 중 / 데드라인 초과 - 호출부는 즉시 로컬 폴백"""
+    pass
+
+
+class CircuitBreaker:
+    """
+    연속 실패 기반 서킷 브레이커
+    
+    closed → (연속 실패 threshold회) → open → (cooldown 경과) → half_open
+    half_open에서 시험 호출 1건 성공하면 closed, 실패하면 다시 open
+    """
+    
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = max(1, threshold)
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self.trips = 0
+    
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return "half_open"
+        return "open"
+    
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._probing:
+            self._probing = True
+            return True
+        return False
+    
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+    
+    def abandon(self) -> None:
+        """시험 호출이 취소됨 (결과 없음) - 다음 호출이 다시 시험하도록"""
+        self._probing = False
+    
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._probing or self.failures >= self.threshold:
+            if self.opened_at is None or self._probing:
+                self.trips += 1
+            self.opened_at = time.monotonic()
+        self._probing = False
+
+
+class KasiHttp:
+    """
+    KASI 공유 HTTP 클라이언트 (앱 수명 동안 1개)
+    
+    - httpx.AsyncClient 재사용 → apis.data.go.kr TCP/DNS 재수립 없음
+    - asyncio.Semaphore로 동시 호출 상한
+    - 호출당 데드라인 (대기열 대기 + 요청 전체)
+      대기열에서 데드라인을 넘기면 로컬 혼잡 → queue_timeouts로만 집계, 브레이커에 넣지 않음
+    - 서킷 브레이커: KASI 장애 시 대기 없이 KasiUnavailable → 로컬 폴백
+    """
+    
+    def __init__(self):
+        settings = get_settings()
+        self.settings = settings
+        self.breaker = CircuitBreaker(
+            settings.kasi_breaker_threshold,
+            settings.kasi_breaker_cooldown_seconds
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stats = {"calls": 0, "ok": 0, "errors": 0, "timeouts": 0, "queue_timeouts": 0, "short_circuited": 0}
+    
+    def _ensure_client(self) -> httpx.AsyncClient:
+        """현재 이벤트 루프에 묶인 클라이언트 (루프가 바뀌면 새로 생성 - 테스트 클라이언트 대비)"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop or self._client.is_closed:
+            s = self.settings
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(s.kasi_read_timeout, connect=s.kasi_connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=s.kasi_max_concurrency,
+                    max_keepalive_connections=s.kasi_max_keepalive,
+                    keepalive_expiry=60.0,
+                ),
+            )
+            self._semaphore = asyncio.Semaphore(max(1, s.kasi_max_concurrency))
+            self._loop = loop
+        return self._client
+    
+    async def get_json(self, url: str, params: Dict[str, Any], deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        GET → JSON (데드라인/브레이커 적용)
+        
+        Raises:
+            KasiUnavailable: 브레이커 open 또는 데드라인 초과
+            httpx.HTTPError / ValueError: 그 외 실패 (브레이커 실패로 집계)
+        
+        세마포어를 먼저 잡고 남은 예산만 요청에 씀. 브레이커 실패는 KASI 탓인 경우만:
+        대기열에서 시간 초과, 또는 대기로 예산이 깎인 요청의 시간 초과는 로컬 혼잡으로 봄
+        """
+        if not self.breaker.allow():
+            self.stats["short_circuited"] += 1
+            raise KasiUnavailable("KASI circuit open")
+        
+        client = self._ensure_client()
+        self.stats["calls"] += 1
+        deadline = deadline if deadline is not None else self.settings.kasi_deadline_seconds
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        queued = self._semaphore.locked()  # 빈 자리가 있으면 acquire()는 양보 없이 바로 획득
+        
+        try:
+            if queued:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=deadline)
+            else:
+                await self._semaphore.acquire()
+        except asyncio.TimeoutError:
+            self.stats["queue_timeouts"] += 1
+            self.breaker.abandon()
+            raise KasiUnavailable(f"KASI queue wait {deadline}s exceeded (local)")
+        except asyncio.CancelledError:
+            self.breaker.abandon()
+            raise
+        
+        try:
+            remaining = deadline - (loop.time() - started)
+            data = await asyncio.wait_for(self._request(client, url, params), timeout=max(remaining, 0.0))
+        except asyncio.TimeoutError:
+            if queued:
+                self.stats["queue_timeouts"] += 1
+                self.breaker.abandon()
+                raise KasiUnavailable(f"KASI deadline {deadline}s exceeded after queue wait (local)")
+            self.stats["timeouts"] += 1
+            self.breaker.record_failure()
+            raise KasiUnavailable(f"KASI deadline {deadline}s exceeded")
+        except asyncio.CancelledError:
+            self.breaker.abandon()
+            raise
+        except Exception:
+            self.stats["errors"] += 1
+            self.breaker.record_failure()
+            raise
+        finally:
+            self._semaphore.release()
+        
+        self.stats["ok"] += 1
+        self.breaker.record_success()
+        return data
+    
+    @staticmethod
+    async def _request(client: httpx.AsyncClient, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        resp = await client.get(url, params=params)
+        resp.raise_for_status()
+        return resp.json()
+    
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            try:
+                await self._client.aclose()
+            except RuntimeError:
+                # 다른(이미 닫힌) 루프에서 만든 클라이언트
+                pass
+        self._client = None
+        self._loop = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "breaker_state": self.breaker.state,
+            "breaker_trips": self.breaker.trips,
+            "consecutive_failures": self.breaker.failures,
+            "max_concurrency": self.settings.kasi_max_concurrency,
+        }
+
+
+kasi_http = KasiHttp()
+
+
+class SingleFlight:
+    """
+    프로세스 내 single-flight: 같은 키의 동시 호출은 진행 중인 1건의 결과를 함께 기다림
+    
+    리더가 취소되면 대기자 중 하나가 리더를 이어받음 (결과 없이 끝나지 않도록)
+    """
+    
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.stats = {"leaders": 0, "coalesced": 0}
+    
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        while True:
+            fut = self._inflight.get(key)
+            if fut is None or fut.get_loop() is not loop:
+                break
+            self.stats["coalesced"] += 1
+            try:
+                return await asyncio.shield(fut)
+            except asyncio.CancelledError:
+                if not fut.cancelled():
+                    raise  # 대기자 자신이 취소됨
+                # 리더 취소 → 다시 시도
+        
+        fut = loop.create_future()
+        self._inflight[key] = fut
+        self.stats["leaders"] += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except BaseException as e:
+            fut.set_exception(e)
+            fut.exception()  # 대기자가 없어도 "never retrieved" 경고 방지
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            if self._inflight.get(key) is fut:
+                del self._inflight[key]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "inflight": len(self._inflight)}
+
+
+class WorkerLock:
+    """
+    워커(프로세스) 간 lock file - 같은 날짜의 KASI 호출을 워커 전체에서 1회로
+    
+    - 키를 STRIPES개 파일로 해시 분산 (날짜별 파일이 쌓이지 않도록)
+    - 대기는 LOCK_NB 폴링 + asyncio.sleep → 이벤트 루프를 막지 않음
+    - wait_seconds 초과/파일 오류 시 lock 없이 진행 (중복 호출 1건 < 요청 지연)
+    """
+    
+    STRIPES = 64
+    POLL_SECONDS = 0.05
+    
+    def __init__(self, lock_dir: Path, wait_seconds: float):
+        self.lock_dir = lock_dir
+        self.wait_seconds = wait_seconds
+        self.stats = {"acquired": 0, "waited": 0, "timeouts": 0, "errors": 0, "cache_after_wait": 0}
+    
+    def _path(self, key: str) -> Path:
+        return self.lock_dir / f"kasi-{zlib.crc32(key.encode()) % self.STRIPES:02d}.lock"
+    
+    @asynccontextmanager
+    async def hold(self, key: str):
+        """
+        yield 상태:
+            "free"    - 바로 획득
+            "waited"  - 다른 워커가 끝날 때까지 기다린 뒤 획득 (캐시 재확인 권장)
+            "timeout" / "error" - 미획득, 그대로 진행
+        """
+        try:
+            self.lock_dir.mkdir(parents=True, exist_ok=True)
+            fd = os.open(self._path(key), os.O_RDWR | os.O_CREAT, 0o644)
+        except OSError as e:
+            self.stats["errors"] += 1
+            logger.warning(f"[KASI] worker lock unavailable: {e}")
+            yield "error"
+            return
+        
+        state = None
+        contended = False
+        try:
+            deadline = time.monotonic() + self.wait_seconds
+            while state is None:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    state = "waited" if contended else "free"
+                except BlockingIOError:
+                    contended = True
+                    if time.monotonic() >= deadline:
+                        state = "timeout"
+                    else:
+                        await asyncio.sleep(self.POLL_SECONDS)
+            
+            if state == "timeout":
+                self.stats["timeouts"] += 1
+            else:
+                self.stats["acquired"] += 1
+                if state == "waited":
+                    self.stats["waited"] += 1
+            yield state
+        finally:
+            if state in ("free", "waited"):
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+
 class KasiApiClient:
     """KASI API 클라이언트 (KASI-only + calendar_cache)"""
     
     BASE_URL = "http://apis.data.go.kr/B090041/openapi/service/LrsrCldInfoService"
     
-    def __init__(self):
+    def __init__(self, cache: Optional[CalendarCache] = None):
         self.settings = get_settings()
         self.api_key = self.settings.kasi_api_key
         self._supabase = None
+        self.cache = cache if cache is not None else make_calendar_cache(self._get_supabase)
+        self._singleflight = SingleFlight()
+        self._worker_lock: Optional[WorkerLock] = None
+        if self.settings.kasi_cross_worker_lock and FCNTL_AVAILABLE:
+            lock_dir = self.settings.kasi_lock_dir or os.path.join(tempfile.gettempdir(), "sajuos_kasi_locks")
+            self._worker_lock = WorkerLock(Path(lock_dir), self.settings.kasi_lock_wait_seconds)
     
     def _get_supabase(self):
         """Lazy-init Supabase"""
@@ -35,9 +409,11 @@ class KasiApiClient:
         양력 날짜로 음양력 정보 조회 (캐시 우선) + 원본/정규화 동시 저장
 
         흐름:
-        1) 캐시 조회 (sol_year, sol_month, sol_day)
+        1) 캐시 조회 (sol_year, sol_month, sol_day) - memory → sqlite → supabase
            - hit: payload(정규화) 반환 + raw를 "raw" 키로 함께 제공
         2) miss: KASI(getLunCalInfo) 호출
+           - 같은 날짜 동시 miss는 single-flight로 1건만 진행 (나머지는 결과 공유)
+           - 워커 간 lock file 대기 후에는 캐시 재확인 (다른 워커가 이미 저장했을 수 있음)
            - 성공: payload_norm + payload_raw 동시 upsert 후 반환
         3) KASI 실패:
            - 캐시 있으면 캐시로 폴백
@@ -46,23 +422,61 @@ class KasiApiClient:
         ymd = f"{year}-{month:02d}-{day:02d}"
 
         # 1) 캐시 먼저 조회
-        try:
-            supabase = self._get_supabase()
-            cached = supabase.get_calendar_cache(year, month, day)
-            if cached and cached.get("payload"):
-                logger.info(f"[KASI] cache hit: {ymd}")
-                norm = cached.get("payload") or {}
-                raw = cached.get("payload_raw")
-                # 반환은 기존 하위호환 유지: 정규화 필드를 최상단에 두고 raw만 추가
-                payload = dict(norm)
-                if raw is not None:
-                    payload["raw"] = raw
-                payload["source"] = "cache"
-                return payload
-        except Exception as e:
-            logger.warning(f"[KASI] cache read error: {e}")
+        cached = await self._read_cache(year, month, day, "cache")
+        if cached is not None:
+            logger.debug(f"[KASI] cache hit: {ymd}")
+            return cached
+
+        # 2) 캐시 miss -> 같은 날짜 진행 중 호출에 합류
+        result = await self._singleflight.do(
+            (year, month, day),
+            lambda: self._fetch_coalesced(year, month, day)
+        )
+        return dict(result)  # 대기자끼리 같은 dict 공유 방지
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "singleflight": self._singleflight.get_stats(),
+            "worker_lock": self._worker_lock.stats if self._worker_lock else None,
+        }
+
+    async def _read_cache(
+        self, year: int, month: int, day: int, source: str, skip_memory: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """계층 캐시 조회 → 반환 형태(정규화 최상단 + raw) 또는 None"""
+        hit = await self.cache.get(year, month, day, skip_memory=skip_memory)
+        if hit is None:
+            return None
+        _tier, cached = hit
+        raw = cached.get("payload_raw")
+        # 반환은 기존 하위호환 유지: 정규화 필드를 최상단에 두고 raw만 추가
+        payload = dict(cached.get("payload") or {})
+        for key in ("year_ganji", "month_ganji", "day_ganji"):
+            if payload.get(key):
+                payload[key] = norm_ganji(payload[key])  # 공통 helper 이전에 저장된 행 ('무인(戊寅)')
+        if raw is not None:
+            payload["raw"] = raw
+        payload["source"] = source
+        return payload
+
+    async def _fetch_coalesced(self, year: int, month: int, day: int) -> Dict[str, Any]:
+        """single-flight 리더: 워커 간 lock → (대기했으면) 캐시 재확인 → KASI"""
+        if self._worker_lock is None:
+            return await self._fetch_from_kasi(year, month, day)
 
-        # 2) 캐시 miss -> KASI API 호출
+        async with self._worker_lock.hold(f"{year:04d}{month:02d}{day:02d}") as state:
+            if state == "waited":
+                # 다른 워커가 방금 저장 → 같은 호스트면 sqlite 계층에서 hit
+                cached = await self._read_cache(year, month, day, "cache", skip_memory=True)
+                if cached is not None:
+                    self._worker_lock.stats["cache_after_wait"] += 1
+                    logger.info(f"[KASI] cache filled by another worker: {year}-{month:02d}-{day:02d}")
+                    return cached
+            return await self._fetch_from_kasi(year, month, day)
+
+    async def _fetch_from_kasi(self, year: int, month: int, day: int) -> Dict[str, Any]:
+        """KASI 호출 + upsert (실패 시 캐시 폴백 → 에러)"""
+        ymd = f"{year}-{month:02d}-{day:02d}"
         logger.info(f"[KASI] cache miss, calling API: {ymd}")
 
         if not self.api_key:
@@ -78,74 +492,134 @@ class KasiApiClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=20.0) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-
-                payload_raw = response.json()  # ✅ 원본 JSON 통째 저장
-                item = (
-                    payload_raw.get("response", {})
-                    .get("body", {})
-                    .get("items", {})
-                    .get("item", {})
-                )
-
-                if not item:
-                    raise RuntimeError(f"KASI returned empty for {ymd}")
-
-                # ✅ 정규화(서비스에서 바로 쓰는 형태)
-                payload_norm = {
-                    "year_ganji": item.get("lunSecha", ""),
-                    "month_ganji": item.get("lunWolgeon", ""),
-                    "day_ganji": item.get("lunIljin", ""),
-                    "lunar_year": item.get("lunYear", ""),
-                    "lunar_month": item.get("lunMonth", ""),
-                    "lunar_day": item.get("lunDay", ""),
-                    "is_leap_month": item.get("lunLeapmonth", "") == "윤",
-                }
-
-                # 3) 성공이면 캐시 저장 (실패해도 본 흐름은 계속)
-                try:
-                    supabase = self._get_supabase()
-                    supabase.upsert_calendar_cache(
-                        year, month, day,
-                        payload_norm=payload_norm,
-                        payload_raw=payload_raw,
-                        source="kasi",
-                    )
-                    logger.info(f"[KASI] cache upsert success: {ymd}")
-                except Exception as e:
-                    logger.warning(f"[KASI] cache upsert fail: {e}")
+            payload_raw = await kasi_http.get_json(url, params)  # ✅ 원본 JSON 통째 저장
+            item = (
+                payload_raw.get("response", {})
+                .get("body", {})
+                .get("items", {})
+                .get("item", {})
+            )
+
+            if not item:
+                raise RuntimeError(f"KASI returned empty for {ymd}")
+
+            # ✅ 정규화(서비스에서 바로 쓰는 형태) - 월 백필과 같은 helper
+            payload_norm = normalize_calendar_item(item)
+
+            # 3) 성공이면 전 계층 캐시 저장 (실패해도 본 흐름은 계속)
+            await self.cache.put(year, month, day, payload_norm, payload_raw, source="kasi")
+            logger.info(f"[KASI] cache upsert success: {ymd}")
 
-                # 반환: 하위호환(정규화 필드 최상단) + raw 포함
-                out = dict(payload_norm)
-                out["raw"] = payload_raw
-                out["source"] = "kasi"
-                return out
+            # 반환: 하위호환(정규화 필드 최상단) + raw 포함
+            out = dict(payload_norm)
+            out["raw"] = payload_raw
+            out["source"] = "kasi"
+            return out
 
         except Exception as e:
             # 로그 폭주 방지: error 대신 warning 권장
             logger.warning(f"[KASI] API error: {e}")
 
             # 4) KASI 실패 -> 캐시 폴백
-            try:
-                supabase = self._get_supabase()
-                cached = supabase.get_calendar_cache(year, month, day)
-                if cached and cached.get("payload"):
-                    logger.info("[KASI] fallback to cache after API failure")
-                    norm = cached.get("payload") or {}
-                    raw = cached.get("payload_raw")
-                    payload = dict(norm)
-                    if raw is not None:
-                        payload["raw"] = raw
-                    payload["source"] = "cache_fallback"
-                    return payload
-            except Exception:
-                pass
+            cached = await self._read_cache(year, month, day, "cache_fallback", skip_memory=True)
+            if cached is not None:
+                logger.info("[KASI] fallback to cache after API failure")
+                return cached
 
             # 5) 캐시도 없으면 에러
             raise RuntimeError(f"calendar unavailable for {ymd}")
 
+    # ========== 월 단위 일괄 조회 (백필) ==========
+
+    async def fetch_month(self, year: int, month: int) -> List[CalendarRow]:
+        """
+        getLunCalInfo 월 단위 조회 (solDay 생략 → 해당 월 전체 item 목록)
+
+        Returns:
+            [(year, month, day, payload_norm, payload_raw, "kasi_month"), ...]
+            payload_norm / payload_raw는 일 단위 조회와 같은 형태
+            (normalize_calendar_item, calendar_raw - 응답 header만 없음)
+        Raises:
+            RuntimeError / KasiUnavailable / httpx.HTTPError
+        """
+        if not self.api_key:
+            raise RuntimeError("KASI API key not configured")
+
+        params = {
+            "serviceKey": self.api_key,
+            "solYear": str(year),
+            "solMonth": str(month).zfill(2),
+            "numOfRows": "31",
+            "_type": "json",
+        }
+        data = await kasi_http.get_json(f"{self.BASE_URL}/getLunCalInfo", params)
+        items = (
+            data.get("response", {})
+            .get("body", {})
+            .get("items", {})
+            .get("item", [])
+        )
+        if isinstance(items, dict):
+            items = [items]
+        if not items:
+            raise RuntimeError(f"KASI returned empty for {year}-{month:02d}")
+
+        rows: List[CalendarRow] = []
+        for item in items:
+            rows.append((
+                year, month, int(item.get("solDay")),
+                normalize_calendar_item(item), calendar_raw(item), "kasi_month",
+            ))
+        return rows
+
+    async def prefetch_months(
+        self,
+        months: Iterable[Tuple[int, int]],
+        concurrency: int = 4,
+        retries: int = 3,
+    ) -> AsyncIterator[Tuple[int, int, Optional[List[CalendarRow]]]]:
+        """
+        여러 달을 동시 concurrency개까지 조회 → 끝나는 순서대로 (year, month, rows) yield
+
+        실패(재시도 소진)한 달은 rows=None → 호출부가 체크포인트에 남기지 않으면 다음 실행에서 재시도.
+        KasiUnavailable(서킷 open)은 쿨다운만큼 기다렸다 재시도.
+        """
+        months = list(months)
+        todo: asyncio.Queue = asyncio.Queue()
+        for ym in months:
+            todo.put_nowait(ym)
+        done: asyncio.Queue = asyncio.Queue()
+
+        async def fetch_with_retry(year: int, month: int) -> Optional[List[CalendarRow]]:
+            for attempt in range(retries + 1):
+                try:
+                    return await self.fetch_month(year, month)
+                except KasiUnavailable:
+                    delay = self.settings.kasi_breaker_cooldown_seconds
+                except Exception as e:
+                    logger.warning(f"[KASI] month fetch fail {year}-{month:02d}: {e}")
+                    delay = 2 ** attempt
+                if attempt < retries:
+                    await asyncio.sleep(delay)
+            return None
+
+        async def worker():
+            while True:
+                try:
+                    year, month = todo.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await done.put((year, month, await fetch_with_retry(year, month)))
+
+        workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+        try:
+            for _ in range(len(months)):
+                yield await done.get()
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
     async def get_ganji_data(self, year: int, month: int, day: int) -> Dict[str, str]:
         """간지 데이터 통합 조회 (KASI-only + 캐시)"""
         lunar_info = await self.get_lunar_info_with_cache(year, month, day)
@@ -157,4 +631,16 @@ class KasiApiClient:
         }
 
 
-kasi_client = KasiApiClient()
+# ============ 싱글톤 ============
+
+_client: Optional[KasiApiClient] = None
+
+
+def get_kasi_client() -> KasiApiClient:
+    """
+    lazy 싱글톤 - 첫 사용 시 생성 (import만으로 calendar_cache sqlite 파일을 만들지 않음)
+    """
+    global _client
+    if _client is None:
+        _client = KasiApiClient()
+    return _client
@@ -9,14 +9,16 @@ matched_rule_ids, match_scores, fired_triggers 저장
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
 import logging
-import json
 import re
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
+import numpy as np
+
+from app.services.card_matrix import CardMatrix, top_k
 from app.services.derive_module import SajuFeatures
-from app.services.rulecards_store import RuleCardStore, RuleCard
+from app.services.rulecards_store import RuleCardStore, RuleCard, parse_trigger
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +32,18 @@ SECTION_CONFIG = {
     "APPL": {"priority": 5, "top_n": 5}
 }
 
+# 섹션 → 관련 토픽
+TOPIC_MAPPING = {
+    "ELEM": ["ELEMENTS", "ELEM"],
+    "TEN": ["TEN_GODS", "TEN"],
+    "STRU": ["STRUCTURE", "STRU"],
+    "SURV": ["GENERAL", "SURV"],
+    "APPL": ["GENERAL", "APPL", "CAREER", "WEALTH", "LOVE"]
+}
+
+YEAR_KEYWORDS = ["2026", "병오", "화", "타이밍"]
+GOAL_KEYWORDS = ["career", "business", "money", "wealth", "사업", "재물", "직업"]
+
 
 @dataclass
 class MatchedCard:
@@ -52,6 +66,18 @@ class SectionMatch:
     avg_score: float
 
 
+@dataclass
+class _TriggerIndex:
+    """store 1개에 대한 매칭 상수 (set_store 시 통째로 교체 → 매칭 중 교체돼도 섞이지 않음)"""
+    store: RuleCardStore
+    triggers: List[List[str]]
+    matrix: CardMatrix
+    term_rows: Dict[str, np.ndarray]
+    year_boost: np.ndarray
+    goal_boost: np.ndarray
+    topic_mask: Dict[str, np.ndarray]
+
+
 class MatchModule:
     """
     룰카드 매칭 엔진 MVP
@@ -62,11 +88,74 @@ class MatchModule:
     3. 점수화 (IDF + 우선순위)
     4. 섹션별 Top N 선택
     5. Raw JSON 생성 (matched_rule_ids, match_scores, fired_triggers)
+    
+    채점은 카드 × 트리거 CSR 행렬(set_store 시 1회 생성) @ 섹션별 키워드 가중치 열
+    → 5개 섹션을 행렬 곱 한 번으로 계산
+    트리거는 store 로드 시 파싱된 조건(card.conditions)을 사용하고,
+    후보 카드는 트리거 값/태그 역색인으로 좁힌 뒤 그 행만 계산
     """
     
     def __init__(self):
-        self.store: Optional[RuleCardStore] = None
-        self.loaded = False
+        self._index: Optional[_TriggerIndex] = None
+    
+    @property
+    def store(self) -> Optional[RuleCardStore]:
+        return self._index.store if self._index else None
+    
+    @property
+    def loaded(self) -> bool:
+        return self._index is not None
+    
+    @property
+    def _term_rows(self) -> Dict[str, np.ndarray]:
+        return self._index.term_rows if self._index else {}
+    
+    def set_store(self, store: RuleCardStore, index: Optional[_TriggerIndex] = None) -> None:
+        """
+        룰카드 저장소 주입 + 트리거 행렬 생성
+        
+        index를 주면 그대로 사용 (핫 리로드: 백그라운드에서 build_index 후 참조만 교체)
+        """
+        if index is None or index.store is not store:
+            index = self.build_index(store)
+        self._index = index
+    
+    def build_index(self, store: RuleCardStore) -> _TriggerIndex:
+        """
+        카드별 상수 성분을 미리 계산 (self 상태는 바꾸지 않음)
+        
+        - matrix: 카드 × 트리거 등장 횟수 (트리거 리스트 중복 포함)
+        - year_boost / goal_boost: 카드 트리거·본문만으로 정해지는 부스트 (키워드와 무관)
+        - topic_mask: 섹션별 관련 토픽 여부
+        - term_rows: 트리거 값/태그 → 카드 번호 (store.trigger_index의 키워드 조건 + 태그)
+        """
+        cards = store.cards
+        triggers = [self._extract_card_triggers(c) for c in cards]
+        matrix = CardMatrix(triggers, binary=False)
+        
+        term_rows: Dict[str, set] = {}
+        for (field, value), nos in store.trigger_index.items():
+            if isinstance(value, str) and "." not in field:
+                term_rows.setdefault(value, set()).update(nos.tolist())
+        for no, card in enumerate(cards):
+            for tag in card.tags or []:
+                term_rows.setdefault(tag, set()).add(no)
+        
+        boosts = [self._card_boosts(c, t) for c, t in zip(cards, triggers)]
+        topics = np.array([c.topic for c in cards], dtype=object)
+        logger.info(f"[MatchModule] 트리거 행렬: {len(cards)}장 × {matrix.n_cols}개 트리거")
+        return _TriggerIndex(
+            store=store,
+            triggers=triggers,
+            matrix=matrix,
+            term_rows={t: np.fromiter(sorted(nos), dtype=np.int64) for t, nos in term_rows.items()},
+            year_boost=np.array([b[0] for b in boosts], dtype=np.float64),
+            goal_boost=np.array([b[1] for b in boosts], dtype=np.float64),
+            topic_mask={
+                section_id: np.isin(topics, TOPIC_MAPPING.get(section_id, []))
+                for section_id in SECTION_CONFIG
+            },
+        )
     
     def load_rulecards(self, jsonl_path: str) -> None:
         """
@@ -78,9 +167,9 @@ class MatchModule:
         if not Path(jsonl_path).exists():
             raise FileNotFoundError(f"룰카드 파일 없음: {jsonl_path}")
         
-        self.store = RuleCardStore(jsonl_path)
-        self.store.load()
-        self.loaded = True
+        store = RuleCardStore(jsonl_path)
+        store.load()
+        self.set_store(store)
         
         logger.info(f"[MatchModule] 룰카드 로드 완료: {len(self.store.cards)}장")
     
@@ -102,12 +191,8 @@ class MatchModule:
         
         logger.info("[MatchModule] 전체 섹션 매칭 시작")
         
-        results = {}
-        
-        # 섹션별 매칭
-        for section_id, config in SECTION_CONFIG.items():
-            matches = self._match_section(section_id, config, features)
-            results[section_id] = matches
+        results = self._match_sections(list(SECTION_CONFIG), features)
+        for section_id, matches in results.items():
             logger.info(f"  - {section_id}: {len(matches.cards)}장, 평균점수: {matches.avg_score:.2f}")
         
         return results
@@ -123,63 +208,95 @@ class MatchModule:
         
         Args:
             section_id: 섹션 ID (ELEM, TEN, STRU 등)
-            config: 섹션 설정
+            config: 섹션 설정 (top_n은 SECTION_CONFIG 기준)
             features: 사주 특징
         
         Returns:
             SectionMatch: 매칭 결과
         """
-        top_n = config["top_n"]
+        return self._match_sections([section_id], features)[section_id]
+    
+    def _match_sections(
+        self,
+        section_ids: List[str],
+        features: SajuFeatures
+    ) -> Dict[str, SectionMatch]:
+        """
+        여러 섹션 일괄 매칭 (_match_triggers와 같은 점수)
         
-        # 1. 트리거 키워드 생성
-        trigger_keywords = self._generate_trigger_keywords(section_id, features)
+        트리거 t에 걸리는 키워드 수 hits[t] (부분 문자열 양방향)를 vocab 단위로 구하면
+        - 발화 횟수      = 행렬 @ hits
+        - IDF 합         = 행렬 @ (hits * idf)
+        - tag_match_score = IDF 합 / 발화 횟수
+        섹션마다 두 열 → 행렬 곱 한 번, 섹션별 Top N은 argpartition
+        """
+        idx = self._index  # 호출 동안 고정 (리로드로 교체돼도 이 store/행렬로 끝까지)
+        store = idx.store
+        m = idx.matrix
+        vocab = list(m.vocab)
+        idf = np.array([store.idf.get(t, 1.0) for t in vocab], dtype=np.float64)
+        
+        # 섹션별 키워드 → 걸리는 트리거 값 (vocab 단위 1회) → 역색인으로 후보 카드
+        columns, candidates = [], []
+        for section_id in section_ids:
+            keywords = self._generate_trigger_keywords(section_id, features)
+            hits = np.array(
+                [sum(1 for k in keywords if k in t or t in k) for t in vocab],
+                dtype=np.float64,
+            )
+            columns.append(hits)
+            columns.append(hits * idf)
+            candidates.extend(idx.term_rows[vocab[c]] for c in np.flatnonzero(hits))
         
-        # 2. 카드 필터링 및 점수화
-        scored_cards = []
+        rows = np.unique(np.concatenate(candidates)) if candidates else np.zeros(0, dtype=np.int64)
+        sums = m.dot(np.column_stack(columns), rows) if rows.size else np.zeros((0, 2 * len(section_ids)))
+        
+        cards = store.cards
+        priority = store.priorities[rows]
+        year_boost = idx.year_boost[rows]
+        goal_boost = idx.goal_boost[rows]
+        results = {}
         
-        for card in self.store.cards:
-            # 토픽 필터링 (섹션과 관련된 토픽만)
-            if not self._is_relevant_topic(section_id, card.topic):
-                continue
+        for j, section_id in enumerate(section_ids):
+            top_n = SECTION_CONFIG.get(section_id, {}).get("top_n", 5)
+            fired_count = sums[:, 2 * j]
+            fired = fired_count > 0
+            tag_match = np.divide(sums[:, 2 * j + 1], fired_count, out=np.zeros_like(fired_count), where=fired)
+            scores = priority * 1.0 + tag_match * 2.0 + year_boost * 0.5 + goal_boost * 0.3
+            topic_mask = idx.topic_mask.get(section_id)
+            relevant = topic_mask[rows] if topic_mask is not None else np.zeros(rows.size, dtype=bool)
+            mask = relevant & fired & (scores > 0)
+            hit_terms = {vocab[c] for c in np.flatnonzero(columns[2 * j])}
             
-            # 트리거 매칭 (개선된 스코어링)
-            fired_triggers, score, score_details = self._match_triggers(card, trigger_keywords)
+            matched_cards = []
+            for r in top_k(scores, top_n, mask):
+                card = cards[rows[r]]
+                final_score = float(scores[r])
+                matched_cards.append(MatchedCard(
+                    card_id=card.id,
+                    topic=card.topic,
+                    score=final_score,
+                    fired_triggers=list({t for t in idx.triggers[rows[r]] if t in hit_terms}),
+                    interpretation=card.interpretation or "",
+                    mechanism=card.mechanism,
+                    action=card.action,
+                    score_details={
+                        "base_score": card.priority,
+                        "tag_match_score": float(tag_match[r]),
+                        "year_boost": float(year_boost[r]),
+                        "goal_boost": float(goal_boost[r]),
+                        "final_score": final_score,
+                    }
+                ))
             
-            if score > 0:
-                scored_cards.append({
-                    "card": card,
-                    "score": score,
-                    "fired_triggers": fired_triggers,
-                    "score_details": score_details  # 🔥 점수 상세 저장
-                })
-        
-        # 3. 점수순 정렬 및 Top N 선택
-        scored_cards.sort(key=lambda x: x["score"], reverse=True)
-        top_cards = scored_cards[:top_n]
-        
-        # 4. MatchedCard 객체 생성
-        matched_cards = [
-            MatchedCard(
-                card_id=item["card"].id,
-                topic=item["card"].topic,
-                score=item["score"],
-                fired_triggers=item["fired_triggers"],
-                interpretation=item["card"].interpretation or "",
-                mechanism=item["card"].mechanism,
-                action=item["card"].action,
-                score_details=item.get("score_details")  # 🔥 점수 상세 추가
+            avg_score = sum(c.score for c in matched_cards) / len(matched_cards) if matched_cards else 0.0
+            results[section_id] = SectionMatch(
+                section_id=section_id,
+                cards=matched_cards,
+                avg_score=avg_score
             )
-            for item in top_cards
-        ]
         
-        # 5. 평균 점수 계산
-        avg_score = sum(c.score for c in matched_cards) / len(matched_cards) if matched_cards else 0.0
-        
-        return SectionMatch(
-            section_id=section_id,
-            cards=matched_cards,
-            avg_score=avg_score
-        )
+        return results
     
     def _generate_trigger_keywords(
         self,
@@ -295,16 +412,7 @@ class MatchModule:
         Returns:
             bool: 관련 있으면 True
         """
-        # 토픽 매핑
-        topic_mapping = {
-            "ELEM": ["ELEMENTS", "ELEM"],
-            "TEN": ["TEN_GODS", "TEN"],
-            "STRU": ["STRUCTURE", "STRU"],
-            "SURV": ["GENERAL", "SURV"],
-            "APPL": ["GENERAL", "APPL", "CAREER", "WEALTH", "LOVE"]
-        }
-        
-        return topic in topic_mapping.get(section_id, [])
+        return topic in TOPIC_MAPPING.get(section_id, [])
     
     def _match_triggers(
         self,
@@ -353,19 +461,8 @@ class MatchModule:
         tag_match_score = idf_score / len(fired_triggers) if fired_triggers else 0
         
         # 5. Year Boost: 2026년 관련 키워드
-        year_boost = 0.0
-        year_keywords = ["2026", "병오", "화", "타이밍"]
-        for keyword in year_keywords:
-            if any(keyword in t for t in card_triggers):
-                year_boost += 1.0
-        
         # 6. Goal Match: 비즈니스/커리어 관련 부스트
-        goal_boost = 0.0
-        goal_keywords = ["career", "business", "money", "wealth", "사업", "재물", "직업"]
-        card_text = f"{card.topic} {' '.join(card_triggers)} {card.interpretation or ''}"
-        for keyword in goal_keywords:
-            if keyword.lower() in card_text.lower():
-                goal_boost += 0.5
+        year_boost, goal_boost = self._card_boosts(card, card_triggers)
         
         # 7. 최종 점수 계산
         final_score = (
@@ -386,6 +483,21 @@ class MatchModule:
         
         return list(set(fired_triggers)), final_score, score_details
     
+    def _card_boosts(self, card: RuleCard, card_triggers: List[str]) -> tuple[float, float]:
+        """(year_boost, goal_boost) - 키워드와 무관한 카드 상수"""
+        year_boost = 0.0
+        for keyword in YEAR_KEYWORDS:
+            if any(keyword in t for t in card_triggers):
+                year_boost += 1.0
+        
+        goal_boost = 0.0
+        card_text = f"{card.topic} {' '.join(card_triggers)} {card.interpretation or ''}"
+        for keyword in GOAL_KEYWORDS:
+            if keyword.lower() in card_text.lower():
+                goal_boost += 0.5
+        
+        return year_boost, goal_boost
+    
     def _extract_card_triggers(self, card: RuleCard) -> List[str]:
         """
         카드에서 트리거 추출 (trigger/triggers 필드 통일)
@@ -396,28 +508,8 @@ class MatchModule:
         Returns:
             List[str]: 트리거 목록
         """
-        triggers = []
-        
-        # trigger 필드가 문자열일 경우
-        if isinstance(card.trigger, str):
-            try:
-                parsed = json.loads(card.trigger)
-                if isinstance(parsed, list):
-                    triggers.extend(parsed)
-                elif isinstance(parsed, dict):
-                    # dict인 경우 values 추출
-                    for v in parsed.values():
-                        if isinstance(v, list):
-                            triggers.extend(v)
-                        elif isinstance(v, str):
-                            triggers.append(v)
-            except:
-                # JSON 파싱 실패시 문자열 그대로 사용
-                triggers.append(card.trigger)
-        
-        # trigger 필드가 리스트일 경우
-        elif isinstance(card.trigger, list):
-            triggers.extend(card.trigger)
+        conditions = card.conditions if card.conditions is not None else parse_trigger(card.trigger)
+        triggers = [c.value for c in conditions if c.is_keyword]
         
         # tags도 트리거로 활용
         if card.tags:
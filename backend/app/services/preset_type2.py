@@ -24,3 +24,14 @@ BUSINESS_OWNER_PRESET_V2 = {
      "focusTags":["목표","성과","성취","관리","실행","계획","기회","확장","수익","효율성"]},
   ]
 }
+
+# 리포트 섹션 id(report_worker / supabase SECTION_ORDER) → preset 섹션 key (key 이름을 바꾸면 여기도 함께)
+SECTION_PRESET_KEYS = {
+  "exec": "EXEC_SUMMARY",
+  "money": "MONEY",
+  "business": "BUSINESS",
+  "team": "TEAM_RISK",
+  "health": "HEALTH_PERF",
+  "calendar": "CALENDAR",
+  "sprint": "SPRINT_90D",
+}
@@ -10,21 +10,34 @@ Features:
   - _ensure_dict(): Supabase JSON fields can arrive as strings
   - Physical forbidden-word rulecard filtering
   - Dynamic Truth Anchor injection
+  - RuleCardStore: 잡당 1회 preset 전 섹션 카드 선택 (IDF 점수 + 토픽 색인 + id 중복 제거),
+    섹션 결과에 사용한 카드 id 기록 (match_summary.rulecard_ids)
 """
 
 import json
 import logging
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
 
 from app.services.supabase_service import supabase_service
 from app.services.report_builder import premium_report_builder
 from app.services.truth_anchor import build_truth_anchor, forbidden_words_for_rulecards
 from app.services.email_service import EmailService
 from app.services.persona_classifier import classify_persona
+from app.services.blocking import run_blocking
+from app.services.preset_type2 import BUSINESS_OWNER_PRESET_V2, SECTION_PRESET_KEYS
+from app.services.rulecards_fts import card_query_text
+from app.services.feature_tags import build_feature_tags, get_matching_tokens
+from app.services.focus_boost import boost_preset_focus
+from app.services.rulecard_selector import select_card_nos_for_preset
+from app.services.rulecards_store import RuleCardStore, canon_tag
 
 logger = logging.getLogger(__name__)
 
+_NO_CARDS = np.zeros(0, dtype=np.int32)
+
 # 🔥 P0: 이메일 서비스 싱글톤
 email_service = EmailService()
 
@@ -123,6 +136,8 @@ class ReportWorker:
         input_json = _ensure_dict(job.get("input_json") or job.get("input_data") or {})
         survey_data = _ensure_dict(input_json.get("survey_data") or input_json.get("survey") or {})
         user_question = (input_json.get("user_question") or input_json.get("question") or "").strip()
+        card_query = card_query_text(user_question, survey_data)  # 기본값 채우기 전 (실제 입력만)
+        raw_survey = survey_data
         
         # 🔥 P0 FIX: survey_data 기본값 채우기 (거절/사과 방지)
         survey_data = _fill_survey_defaults(survey_data)
@@ -174,8 +189,17 @@ class ReportWorker:
         section_ids = [s for s in requested_sections if isinstance(s, str)] or list(self.DEFAULT_SECTION_IDS)
 
         # rulecards (physical forbidden-word blocking)
-        all_cards = self._get_all_cards(rulestore)
-        all_cards = self._filter_forbidden_rulecards(all_cards=all_cards, saju_data=saju_data)
+        rulecards_version = getattr(rulestore, "version", "") or None  # 잡 시작 시 버전 고정 (핫 리로드와 무관)
+        section_picks: Optional[Dict[str, List[int]]] = None
+        if isinstance(rulestore, RuleCardStore):
+            # store 경로: 카드 dict 전체 복사 없이 잡당 1회 선택 → 섹션은 카드 번호만 받음
+            all_cards: List[Dict[str, Any]] = []
+            section_picks = await run_blocking(
+                self._select_store_sections, rulestore, saju_data, raw_survey, card_query, section_ids
+            )
+        else:
+            all_cards = self._get_all_cards(rulestore)
+            all_cards = self._filter_forbidden_rulecards(all_cards=all_cards, saju_data=saju_data)
 
         # 진행률 업데이트 (🔥 status는 running만 사용 - DB constraint)
         await self.supabase.update_progress(job_id, 10, "running")
@@ -194,6 +218,10 @@ class ReportWorker:
                     all_cards=all_cards,
                     persona_id=persona_id,
                     user_name=user_name,  # 🔥 호칭 처리용
+                    rulecards_version=rulecards_version,
+                    rulestore=rulestore,
+                    card_query=card_query,
+                    card_nos=section_picks.get(section_id) if section_picks is not None else None,
                 )
                 completed_sections.append(section_id)
                 # 진행률 업데이트 (10~90%)
@@ -383,8 +411,21 @@ class ReportWorker:
         all_cards: List[Dict[str, Any]],
         persona_id: str = "standard",
         user_name: str = "",  # 🔥 호칭 처리용
+        rulecards_version: Optional[str] = None,
+        rulestore: Any = None,
+        card_query: str = "",
+        card_nos: Optional[List[int]] = None,
     ) -> None:
-        selected_cards = self._select_rulecards_for_section(all_cards=all_cards, section_id=section_id)
+        if card_nos is not None:
+            # store 경로: 잡 시작 시 고른 카드 (질문 FTS 후보·금지어 제외 포함)
+            selected_cards = [rulestore.cards[no].to_dict() for no in card_nos]
+        else:
+            if card_query and hasattr(rulestore, "search"):
+                # 질문/고민 → 섹션 토픽 안에서 FTS 후보를 앞에 (전 카드 스캔 없음)
+                query_cards = await run_blocking(self._search_rulecards, rulestore, card_query, section_id)
+                query_cards = self._filter_forbidden_rulecards(all_cards=query_cards, saju_data=saju_data)
+                all_cards = query_cards + all_cards
+            selected_cards = self._select_rulecards_for_section(all_cards=all_cards, section_id=section_id)
         
         # 🔥 Build truth anchor for this section (survey_data 포함)
         truth_anchor = build_truth_anchor(
@@ -407,34 +448,146 @@ class ReportWorker:
             user_name=user_name,
         )
 
+        if isinstance(result, dict):
+            summary = result.setdefault("match_summary", {})
+            summary["rulecards_version"] = rulecards_version
+            summary["rulecard_ids"] = [c.get("id") for c in selected_cards]  # 추적용 (어떤 카드로 썼는지)
+
         # 🔥 P0 FIX: save_section도 async
         await self.supabase.save_section(job_id=job_id, section_id=section_id, content_json=result)
         logger.info(f"[Worker] 섹션 저장 완료: {section_id} ({result.get('char_count', 0)}자) | persona={persona_id} | user={user_name or '귀하'}")
 
-    def _select_rulecards_for_section(self, all_cards: List[Dict[str, Any]], section_id: str, k: int = 24) -> List[Dict[str, Any]]:
+    def _search_rulecards(self, rulestore: Any, card_query: str, section_id: str, k: int = 12) -> List[Dict[str, Any]]:
+        """전문검색 후보 (bm25 순, 카드 dict) - 토픽은 preset 섹션(exec → EXEC_SUMMARY 등)의 perTopic"""
+        key = SECTION_PRESET_KEYS.get(section_id)
+        topics = [
+            tq["topic"]
+            for sec in BUSINESS_OWNER_PRESET_V2["sections"]
+            if sec["key"] == key
+            for tq in sec["perTopic"]
+        ]
+        hits = rulestore.search(card_query, topics=topics or None, k=k)
+        if hits:
+            logger.info(f"[Worker] 🔎 질문 후보 카드: {section_id} {len(hits)}장")
+        return [rulestore.cards[no].to_dict() for no, _ in hits]
+
+    def _select_store_sections(
+        self,
+        store: RuleCardStore,
+        saju_data: Dict[str, Any],
+        survey_data: Optional[Dict[str, Any]] = None,
+        card_query: str = "",
+        section_ids: Optional[List[str]] = None,
+    ) -> Dict[str, List[int]]:
+        """
+        잡당 1회: 사용자 feature tag → 요청 섹션별 카드 번호 (워커 섹션 id → 번호 목록)
+
+        select_card_nos_for_preset 공유 - store 역색인 IDF 점수, 토픽 번호 배열, id 집합 중복 제거
+        (섹션 간 같은 카드 없음), 유사 중복 클러스터, 질문 FTS. 금지어 카드는 exclude로 빠짐.
+        섹션 id → preset 섹션은 SECTION_PRESET_KEYS, 매핑 없는 섹션은 _fallback_card_nos (경고 로그).
+        """
+        section_ids = list(section_ids or self.DEFAULT_SECTION_IDS)
+        feature_tags = self._feature_tags(saju_data, survey_data)
+        exclude = self._forbidden_card_ids(store, saju_data)
+        t0 = time.perf_counter()
+
+        preset = boost_preset_focus(BUSINESS_OWNER_PRESET_V2, feature_tags)
+        wanted = {SECTION_PRESET_KEYS[sid] for sid in section_ids if sid in SECTION_PRESET_KEYS}
+        preset = {**preset, "sections": [sec for sec in preset["sections"] if sec["key"] in wanted]}
+        picks = select_card_nos_for_preset(store, preset, feature_tags, query=card_query, exclude=exclude)
+        nos_of = {key: list(nos) for key, _title, _meta, nos in picks}
+
+        used = set(exclude)
+        used.update(store.cards[no].id for nos in nos_of.values() for no in nos)
+        by_section: Dict[str, List[int]] = {}
+        for sid in section_ids:
+            key = SECTION_PRESET_KEYS.get(sid)
+            if key is not None:
+                by_section[sid] = nos_of.get(key, [])
+            elif sid not in by_section:
+                logger.warning(f"[Worker] ⚠️ preset 매핑 없는 섹션: {sid} → 섹션 태그 + priority 순으로 채움")
+                by_section[sid] = self._fallback_card_nos(store, sid, used)
+        logger.info(
+            f"[Worker] 🃏 룰카드 선택: {sum(len(v) for v in by_section.values())}장 / {len(by_section)}섹션 "
+            f"| tags={len(feature_tags)} 제외={len(exclude)} ({(time.perf_counter() - t0) * 1000:.1f}ms)"
+        )
+        return by_section
+
+    @staticmethod
+    def _fallback_card_nos(store: RuleCardStore, section_id: str, used: Set[str], k: int = 24) -> List[int]:
+        """preset에 없는 섹션: 섹션 id 태그 카드 먼저, 나머지는 priority 순 (used 제외, 고른 id는 used에 추가)"""
+        cards = store.cards
+        tagged = store.postings.get(canon_tag(section_id), _NO_CARDS)
+        ranked = np.argsort(-store.priorities, kind="stable")
+        out: List[int] = []
+        for no in np.concatenate([tagged, ranked[: k + len(used) + len(tagged)]]).tolist():
+            if len(out) >= k:
+                break
+            if cards[no].id not in used:
+                used.add(cards[no].id)
+                out.append(no)
+        return out
+
+    @staticmethod
+    def _feature_tags(saju_data: Dict[str, Any], survey_data: Optional[Dict[str, Any]] = None) -> List[str]:
+        """원국 기둥 + 설문 → 매칭 토큰 (interpret 경로와 같은 build_feature_tags 단일 소스)"""
+        pillars: Dict[str, Any] = {}
+        for key in ("year", "month", "day", "hour"):
+            ganji = str(saju_data.get(f"{key}_pillar") or "")
+            if len(ganji) >= 2:
+                pillars[key] = {"ganji": ganji, "gan": ganji[0], "ji": ganji[1]}
+        return get_matching_tokens(build_feature_tags(pillars, survey_data or None))
+
+    @staticmethod
+    def _forbidden_card_ids(store: RuleCardStore, saju_data: Dict[str, Any]) -> Set[str]:
+        """금지어가 들어간 카드 id (_filter_forbidden_rulecards와 같은 본문, 필터 꺼짐이면 빈 집합)"""
+        forbidden = set(forbidden_words_for_rulecards(saju_data))
+        if not forbidden:
+            return set()
+        ids = {
+            c.id for c in store.cards
+            if any(w in " ".join((c.topic or "", c.interpretation or "", c.action or "",
+                                  c.mechanism or "", str(list(c.tags)))) for w in forbidden)
+        }
+        if len(ids) >= len(store.cards):
+            logger.error("[Worker] ⚠️ 모든 룰카드가 금지어에 걸림! 필터 로직 점검 필요!")
+            return set()
+        logger.info(f"[Worker] 🔧 룰카드 필터 활성화 (금지어: {sorted(forbidden)}) → {len(ids)}장 제외")
+        return ids
+
+    def _select_rulecards_for_section(self, all_cards: List[Any], section_id: str, k: int = 24) -> List[Dict[str, Any]]:
+        """store가 아닌 카드 목록용: 섹션 태그 카드 먼저, 나머지로 k장까지 (카드 id 집합으로 중복 제거)"""
         if not all_cards:
             return []
 
         picked: List[Dict[str, Any]] = []
-        for c in all_cards:
+        seen: Set[Any] = set()
+
+        def take(c: Any) -> None:
             if not isinstance(c, dict):
-                continue
-            tags = c.get("section_tags") or c.get("tags") or []
+                if not hasattr(c, "to_dict"):
+                    return
+                key = c.id
+            else:
+                key = c.get("id") or id(c)
+            if key not in seen:
+                seen.add(key)
+                picked.append(c if isinstance(c, dict) else c.to_dict())
+
+        for c in all_cards:
+            tags = (c.get("section_tags") or c.get("tags") or []) if isinstance(c, dict) else getattr(c, "tags", ())
             if isinstance(tags, str):
                 tags = [tags]
             if section_id in tags:
-                picked.append(c)
+                take(c)
             if len(picked) >= k:
                 break
 
         # Fill up to k with remaining cards
-        if len(picked) < k:
-            for c in all_cards:
-                if not isinstance(c, dict) or c in picked:
-                    continue
-                picked.append(c)
-                if len(picked) >= k:
-                    break
+        for c in all_cards:
+            if len(picked) >= k:
+                break
+            take(c)
 
         return picked
 
@@ -0,0 +1,197 @@
+"""
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+🧬 룰카드 유사 중복 클러스터 (MinHash + LSH)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+트리거만 다르고 해석(interpretation)이 거의 같은 카드가 많아
+한 섹션에 같은 내용이 여러 번 들어가던 것 → store 생성 시 클러스터를 묶어 두고
+선택기/채점기가 섹션당 클러스터 1장만 고른다 (QualityGate의 사후 Jaccard 검사 전에 차단).
+
+- 해석 정규화(공백·기호 제거, 소문자) → 글자 3-gram (코드포인트 3개를 63비트 정수 1개로)
+  (mechanism/action까지 합치면 문장이 길어져 "~에서 갈등이 발생할 가능성" 같은 반복이 묻힘)
+- MinHash: 곱셈-시프트 해시 64개, 전 카드의 shingle을 한 배열로 → np.minimum.reduceat
+- LSH: 밴드(b × r)별 서명 행이 같은 카드끼리 후보 → 버킷 첫 카드와 추정 Jaccard ≥ threshold면 union
+- cluster_id = 클러스터에서 가장 작은 카드 번호 (단독 카드는 자기 번호) - 같은 입력이면 같은 결과
+
+threshold = settings.rulecards_dedup_threshold (0이면 끔 → cluster_id = 카드 번호).
+8.5k장 기준 수백 ms → 로드 / 스냅샷 생성 / tools/ingest_rulecards.py 적재마다 실행.
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import re
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+NUM_PERM = 64
+SHINGLE = 3
+_SEED = 20240611  # 고정 - 워커/프로세스마다 같은 클러스터
+_STRIP = re.compile(r"[\s\W_]+", re.UNICODE)
+_BANDINGS = ((32, 2), (16, 4), (8, 8), (4, 16))  # (밴드 수, 밴드당 행) - NUM_PERM 약수
+
+
+def card_text(card: Any) -> str:
+    """비교할 본문: 해석 (없으면 mechanism + action)"""
+    return card.interpretation or " ".join(x for x in (card.mechanism, card.action) if x)
+
+
+def _normalize(text: str) -> str:
+    return _STRIP.sub("", (text or "").lower())
+
+
+def _shingles(texts: Sequence[str]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """전 카드 글자 3-gram → (shingle 값 uint64, 소유 카드 번호) - 카드 경계를 넘는 3-gram 제외"""
+    norms = [_normalize(t) for t in texts]
+    lens = np.fromiter((len(s) for s in norms), dtype=np.int64, count=len(norms))
+    cp = np.frombuffer("".join(norms).encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+    owner = np.repeat(np.arange(len(norms), dtype=np.int64), lens)
+    if cp.size < SHINGLE:
+        return cp[:0], owner[:0]
+    # 코드포인트 < 2^21 → 3개를 겹치지 않게 이어 붙인 정수 (해시 충돌 없음)
+    sh = (cp[:-2] << np.uint64(42)) | (cp[1:-1] << np.uint64(21)) | cp[2:]
+    valid = owner[:-2] == owner[2:]
+    return sh[valid], owner[:-2][valid]
+
+
+def minhash_signatures(texts: Sequence[str], num_perm: int = NUM_PERM) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    카드별 MinHash 서명
+
+    Returns:
+        (서명 uint32 (카드 × num_perm), 서명 유효 여부 bool - 3글자 미만 본문은 False)
+    """
+    n = len(texts)
+    sh, owner = _shingles(texts)
+    sig = np.full((n, num_perm), np.iinfo(np.uint32).max, dtype=np.uint32)
+    has = np.zeros(n, dtype=bool)
+    if not sh.size:
+        return sig, has
+    order = np.argsort(owner, kind="stable")  # 이미 정렬돼 있으나 보장
+    sh, owner = sh[order], owner[order]
+    cards, starts = np.unique(owner, return_index=True)
+    has[cards] = True
+
+    rng = np.random.default_rng(_SEED)
+    a = rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) | np.uint64(1)  # 홀수
+    b = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for p in range(num_perm):
+            hv = ((a[p] * sh + b[p]) >> np.uint64(32)).astype(np.uint32)
+            sig[cards, p] = np.minimum.reduceat(hv, starts)
+    return sig, has
+
+
+def _banding(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """S-곡선 문턱 (1/b)^(1/r)이 threshold보다 0.1 이상 낮은 것 중 r이 가장 큰 밴딩 (재현율 우선, 검증으로 정밀도)"""
+    best = (num_perm // 2, 2)
+    for bands, rows in _BANDINGS:
+        if bands * rows == num_perm and (1.0 / bands) ** (1.0 / rows) <= threshold - 0.1:
+            best = (bands, rows)
+    return best
+
+
+class _UnionFind:
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> None:
+        rx, ry = self.find(x), self.find(y)
+        if rx != ry:
+            if rx < ry:
+                self.parent[ry] = rx
+            else:
+                self.parent[rx] = ry
+
+
+def find_clusters(texts: Sequence[str], threshold: float, num_perm: int = NUM_PERM) -> "np.ndarray":
+    """
+    본문 → 카드별 cluster_id (int32, 클러스터 최소 카드 번호)
+
+    threshold: 추정 Jaccard(3-gram) 하한, 0 이하면 클러스터링 안 함
+    """
+    n = len(texts)
+    ids = np.arange(n, dtype=np.int32)
+    if threshold <= 0 or n < 2:
+        return ids
+    sig, has = minhash_signatures(texts, num_perm)
+    rows_ok = np.flatnonzero(has)
+    bands, r = _banding(threshold, num_perm)
+    need = int(np.ceil(threshold * num_perm))  # 같은 서명 칸 수 하한
+
+    uf = _UnionFind(n)
+    checked = set()
+    for band in range(bands):
+        keys = np.ascontiguousarray(sig[rows_ok, band * r:(band + 1) * r])
+        _, inverse, counts = np.unique(keys, axis=0, return_inverse=True, return_counts=True)
+        inverse = inverse.reshape(-1)
+        multi = counts[inverse] > 1
+        if not multi.any():
+            continue
+        members = rows_ok[multi]
+        buckets = inverse[multi]
+        order = np.lexsort((members, buckets))
+        members, buckets = members[order], buckets[order]
+        firsts = np.r_[True, buckets[1:] != buckets[:-1]]
+        head = members[np.maximum.accumulate(np.where(firsts, np.arange(members.size), 0))]
+        pairs = [(h, m) for h, m in zip(head[~firsts].tolist(), members[~firsts].tolist()) if (h, m) not in checked]
+        if not pairs:
+            continue
+        checked.update(pairs)
+        hs, ms = np.array(pairs).T
+        same = (sig[hs] == sig[ms]).sum(axis=1)
+        for h, m in zip(hs[same >= need].tolist(), ms[same >= need].tolist()):
+            uf.union(h, m)
+    return np.fromiter((uf.find(i) for i in range(n)), dtype=np.int32, count=n)
+
+
+def cluster_sizes(cluster_ids: "np.ndarray") -> "np.ndarray":
+    """카드별 자기 클러스터 크기 (int32)"""
+    return np.bincount(cluster_ids, minlength=len(cluster_ids))[cluster_ids].astype(np.int32)
+
+
+def cluster_report(cluster_ids: "np.ndarray", cards: Sequence[Any] = (), top: int = 10) -> Dict[str, Any]:
+    """클러스터 크기 분포 + 큰 클러스터 (대표 카드 id / 토픽)"""
+    counts = np.bincount(cluster_ids, minlength=len(cluster_ids))
+    sizes = counts[counts > 0]
+    hist: Dict[str, int] = {}
+    for label, lo, hi in (("1", 1, 1), ("2", 2, 2), ("3-4", 3, 4), ("5-9", 5, 9), ("10+", 10, 1 << 30)):
+        hist[label] = int(((sizes >= lo) & (sizes <= hi)).sum())
+    big = np.argsort(-counts, kind="stable")[:top]
+    largest: List[Dict[str, Any]] = []
+    for cid in big.tolist():
+        if counts[cid] < 2:
+            break
+        entry: Dict[str, Any] = {"cluster_id": cid, "size": int(counts[cid])}
+        if cards:
+            members = np.flatnonzero(cluster_ids == cid)[:5].tolist()
+            entry["ids"] = [cards[no].id for no in members]
+            entry["topics"] = sorted({cards[no].topic for no in np.flatnonzero(cluster_ids == cid).tolist()})
+        largest.append(entry)
+    return {
+        "cards": int(len(cluster_ids)),
+        "clusters": int(sizes.size),
+        "duplicates": int(len(cluster_ids) - sizes.size),  # 클러스터 대표 외 카드 수
+        "size_histogram": hist,
+        "largest": largest,
+    }
+
+
+def first_per_cluster(rows: Iterable[int], cluster_of: Dict[int, int], limit: int) -> List[int]:
+    """점수 순 행 → 클러스터마다 첫 행만, limit개까지 (cluster_of에 없는 행은 단독 클러스터)"""
+    seen = set()
+    out: List[int] = []
+    for row in rows:
+        cid = cluster_of.get(row)
+        if cid is not None:
+            if cid in seen:
+                continue
+            seen.add(cid)
+        out.append(row)
+        if len(out) >= limit:
+            break
+    return out
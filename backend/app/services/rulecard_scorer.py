@@ -5,9 +5,16 @@ RuleCard Scorer v5 - P0 섹션 ID 정합 + 인터페이스 확정
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
 import logging
-from typing import Dict, Any, List, Optional, Set
+import weakref
+from typing import Dict, Any, List, Optional, Sequence, Set, Union
 from dataclasses import dataclass, field
 
+import numpy as np
+
+from app.services.card_matrix import CardMatrix, top_k
+from app.services.rulecard_dedup import first_per_cluster
+from app.services.rulecards_store import RuleCardStore
+
 logger = logging.getLogger(__name__)
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -36,46 +43,88 @@ ELEMENT_TOPICS = {
 }
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 카드 개념 비트마스크 - 카드마다 로드 시 1번 계산, 채점 때는 정수 AND 1번
+#   bit 0~4   : ELEMENT_TOPICS 오행 관련 용어 (topic + tags 부분 문자열 - 철벽 필터 규칙 그대로)
+#   bit 5~14  : 십성 (tags 부분 문자열 - "식신생재"도 식신)
+#   bit 15~20 : 지지 관계 (tags 정확 일치 - 한 글자라 부분 문자열이면 "종합"/"파트너"까지 걸림)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+TEN_GOD_NAMES = ["비견", "겁재", "식신", "상관", "편재", "정재", "편관", "정관", "편인", "정인"]
+BRANCH_RELATION_TAGS = {
+    "합": ["합", "육합", "삼합", "방합", "반합"],
+    "충": ["충", "상충", "충돌"],
+    "형": ["형", "상형", "자형", "형살"],
+    "파": ["파"],
+    "해": ["해"],
+    "원진": ["원진"],
+}
+
+ELEMENT_BITS = {e: 1 << i for i, e in enumerate(ELEMENT_TOPICS)}
+TEN_GOD_BITS = {g: 1 << (5 + i) for i, g in enumerate(TEN_GOD_NAMES)}
+RELATION_BITS = {r: 1 << (15 + i) for i, r in enumerate(BRANCH_RELATION_TAGS)}
+ALL_ELEMENTS_MASK = sum(ELEMENT_BITS.values())
+
+_ELEMENT_TERMS = [(ELEMENT_BITS[e], terms) for e, terms in ELEMENT_TOPICS.items()]
+_RELATION_TAG_BIT = {t: RELATION_BITS[r] for r, tags in BRANCH_RELATION_TAGS.items() for t in tags}
+_CHAR_ELEMENT_BIT = {ch: ELEMENT_BITS[e] for e, chars in ELEMENT_CHARS.items() for ch in chars}
+# 사용자 마스크용: feature tag 1개 → 비트 (십성 이름 / 관계 태그)
+_TAG_CONCEPT_BIT = {**TEN_GOD_BITS, **_RELATION_TAG_BIT}
+
+
+def concept_mask(topic: str, tags: Sequence[str]) -> int:
+    """카드 topic/tags → 개념 비트마스크"""
+    tag_text = " ".join(tags).lower()
+    card_text = f"{(topic or '').lower()} {tag_text}"
+    mask = 0
+    for bit, terms in _ELEMENT_TERMS:
+        if any(t in card_text for t in terms):
+            mask |= bit
+    for g, bit in TEN_GOD_BITS.items():
+        if g in tag_text:
+            mask |= bit
+    for t in tags:
+        mask |= _RELATION_TAG_BIT.get(t, 0)
+    return mask
+
+
+def present_element_mask(saju_data: dict) -> int:
+    """원국 4기둥 글자 → 존재하는 오행 비트"""
+    if not saju_data:
+        return 0
+    mask = 0
+    for key in ("year_pillar", "month_pillar", "day_pillar", "hour_pillar"):
+        for ch in saju_data.get(key, "") or "":
+            mask |= _CHAR_ELEMENT_BIT.get(ch, 0)
+    return mask
+
+
+def user_concept_mask(saju_data: Optional[dict], feature_tags: Sequence[str] = ()) -> int:
+    """사용자 마스크: 원국 오행 비트 | feature tag의 십성/관계 비트 (요청당 1번)"""
+    mask = present_element_mask(saju_data)
+    for t in feature_tags or ():
+        mask |= _TAG_CONCEPT_BIT.get(t, 0)
+    return mask
+
+
+def absent_element_mask(present: int) -> int:
+    """원국에 없는 오행 비트 - 원국 정보가 없으면(0) 필터링 안 함"""
+    present &= ALL_ELEMENTS_MASK
+    return (ALL_ELEMENTS_MASK & ~present) if present else 0
+
+
 def get_present_elements(saju_data: dict) -> set:
     """원국에 존재하는 오행 반환"""
-    if not saju_data:
-        return set()
-    
-    pillars = "".join([
-        saju_data.get("year_pillar", ""),
-        saju_data.get("month_pillar", ""),
-        saju_data.get("day_pillar", ""),
-        saju_data.get("hour_pillar", ""),
-    ])
-    
-    present = set()
-    for element, chars in ELEMENT_CHARS.items():
-        if any(ch in pillars for ch in chars):
-            present.add(element)
-    
-    return present
+    mask = present_element_mask(saju_data)
+    return {e for e, bit in ELEMENT_BITS.items() if mask & bit}
 
 
 def should_exclude_card(card: dict, present_elements: set) -> bool:
     """원국에 없는 오행 관련 카드인지 확인"""
-    if not present_elements:
+    present = sum(ELEMENT_BITS[e] for e in present_elements if e in ELEMENT_BITS)
+    absent = absent_element_mask(present)
+    if not absent:
         return False  # 원국 정보 없으면 필터링 안함
-    
-    topic = (card.get("topic") or "").lower()
-    tags = " ".join(card.get("tags") or []).lower()
-    card_text = f"{topic} {tags}"
-    
-    # 각 오행별로 체크
-    for element, topics in ELEMENT_TOPICS.items():
-        if element not in present_elements:
-            # 이 오행이 원국에 없으면, 관련 토픽 카드 제외
-            for t in topics:
-                if t in card_text:
-                    return True
-    
-    return False
-
-
+    return bool(concept_mask(card.get("topic") or "", card.get("tags") or []) & absent)
 
 
 # 설문 가중치 매핑
@@ -173,18 +222,90 @@ class SectionCards:
     total_cards: int = 0
 
 
+@dataclass
+class _CardBatch:
+    """채점용 카드 묶음 (행 번호 = 입력 카드 순서)"""
+    ids: List[str]
+    topics: List[str]
+    subtopics: List[str]
+    tags: List[Sequence[str]]   # RuleCard면 카드의 태그 tuple을 그대로 참조
+    matrix: CardMatrix
+    priority_score: Any   # np.ndarray: min(priority, 10) * 0.5
+    concept_masks: Any    # np.ndarray uint32: 카드별 concept_mask (오행 / 십성 / 지지 관계 비트)
+
+
+def _card_fields(card: Any):
+    """dict 카드 / RuleCard 공통 필드 (id, topic, subtopic, tags, priority)"""
+    if isinstance(card, dict):
+        return (
+            card.get("id", card.get("_id", "")),
+            card.get("topic", "GENERAL"),
+            card.get("subtopic", ""),
+            list(card.get("tags", []) or []),
+            float(card.get("priority", 0)),
+        )
+    return (card.id, card.topic or "GENERAL", card.subtopic, card.tags or (), float(card.priority or 0))
+
+
 class RuleCardScorer:
-    """P0: RuleCardScorer - score_cards_for_section 메서드 제공"""
+    """
+    P0: RuleCardScorer - score_cards_for_section / score_all_sections
+
+    카드 × 태그 CSR 행렬 한 번의 곱으로 여러 섹션을 동시에 채점.
+    RuleCardStore를 넘기면 로드 시 만든 store.tag_matrix를 재사용.
+    """
     
     def __init__(self, cards: List[Any] = None):
         self.cards = cards or []
+        # store별 채점 묶음 - 핫 리로드 중 이전 버전에 고정된 요청과 새 버전이 서로 덮어쓰지 않음
+        self._batches: "weakref.WeakKeyDictionary[RuleCardStore, _CardBatch]" = weakref.WeakKeyDictionary()
     
     def set_cards(self, cards: List[Any]):
         self.cards = cards
     
+    def set_store(self, store: RuleCardStore) -> None:
+        """store 채점 묶음을 미리 준비 (preload 모드: fork 전에 만들어 워커가 공유)"""
+        self._prepare(store)
+    
+    def _prepare(self, all_cards: Union[RuleCardStore, List[Any]]) -> _CardBatch:
+        if isinstance(all_cards, RuleCardStore):
+            batch = self._batches.get(all_cards)
+            if batch is not None and batch.matrix.n_rows == len(all_cards.cards):
+                return batch
+            cards, matrix = all_cards.cards, all_cards.tag_matrix
+        else:
+            cards, matrix = all_cards, None
+        
+        fields = [_card_fields(c) for c in cards]
+        if matrix is None:
+            matrix = CardMatrix([f[3] for f in fields])
+        
+        # 같은 (topic, tags) 조합은 1번만 계산
+        mask_of: Dict[Any, int] = {}
+        concept_masks = np.empty(len(fields), dtype=np.uint32)
+        for i, (_id, topic, _sub, tags, _p) in enumerate(fields):
+            key = (topic, tuple(tags))
+            mask = mask_of.get(key)
+            if mask is None:
+                mask = mask_of[key] = concept_mask(topic, tags)
+            concept_masks[i] = mask
+        
+        batch = _CardBatch(
+            ids=[f[0] for f in fields],
+            topics=[f[1] for f in fields],
+            subtopics=[f[2] for f in fields],
+            tags=[f[3] for f in fields],
+            matrix=matrix,
+            priority_score=np.minimum(np.array([f[4] for f in fields], dtype=np.float64), 10) * 0.5,
+            concept_masks=concept_masks,
+        )
+        if isinstance(all_cards, RuleCardStore):
+            self._batches[all_cards] = batch
+        return batch
+    
     def score_cards_for_section(
         self,
-        all_cards: List[Dict[str, Any]],
+        all_cards: Union[RuleCardStore, List[Dict[str, Any]]],
         section_id: str,
         feature_tags: List[str],
         survey_data: Optional[Dict] = None,
@@ -194,95 +315,122 @@ class RuleCardScorer:
         """
         섹션별 카드 스코어링 (P0 인터페이스)
         """
-        # P0: 섹션 ID 검증
-        if section_id not in ALLOWED_SECTION_IDS:
-            logger.warning(f"[Scorer] Invalid section_id: {section_id} - using default scoring")
+        return self.score_all_sections(
+            all_cards, feature_tags, survey_data,
+            section_ids=[section_id],
+            existing_topics=existing_topics,
+            saju_data=saju_data,
+        )[section_id]
+    
+    def score_all_sections(
+        self,
+        all_cards: Union[RuleCardStore, List[Dict[str, Any]]],
+        feature_tags: List[str],
+        survey_data: Optional[Dict] = None,
+        section_ids: Optional[List[str]] = None,
+        existing_topics: Set[str] = None,
+        saju_data: Optional[Dict] = None,
+        top_n: int = 20,
+    ) -> Dict[str, SectionCards]:
+        """
+        여러 섹션을 한 번에 채점
+        
+        가중치 열: [피처 태그, 설문 가중치, 섹션1 태그, 섹션2 태그, ...]
+        → tag_matrix @ W 한 번으로 모든 섹션의 trace 성분 계산, 섹션별 top-k는 argpartition
+        """
+        section_ids = list(section_ids or ALLOWED_SECTION_IDS)
+        for section_id in section_ids:
+            # P0: 섹션 ID 검증
+            if section_id not in ALLOWED_SECTION_IDS:
+                logger.warning(f"[Scorer] Invalid section_id: {section_id} - using default scoring")
         
         if existing_topics is None:
             existing_topics = set()
         
+        batch = self._prepare(all_cards)
+        total_pool = batch.matrix.n_rows
+        
         feature_set = set(feature_tags) if feature_tags else set()
         survey_weights = get_survey_tag_weights(survey_data)
-        section_tags = set(SECTION_WEIGHT_TAGS.get(section_id, []))
         
-        # 🔥 P0: 원국 철벽 필터링
-        present_elements = get_present_elements(saju_data) if saju_data else set()
-        filtered_cards = []
-        excluded_count = 0
+        m = batch.matrix
+        weights = np.column_stack(
+            [m.vector({t: 1.0 for t in feature_set}), m.vector(survey_weights)]
+            + [m.vector({t: 1.0 for t in SECTION_WEIGHT_TAGS.get(s, [])}) for s in section_ids]
+        )
+        counts = m.dot(weights)
         
-        for card in all_cards:
-            if present_elements and should_exclude_card(card, present_elements):
-                excluded_count += 1
-                continue
-            filtered_cards.append(card)
+        # 🔥 P0: 원국 철벽 필터링 (원국에 없는 오행 비트가 하나라도 걸리면 제외 - 카드당 AND 1번)
+        user_mask = user_concept_mask(saju_data, feature_tags or ())
+        absent = absent_element_mask(user_mask)
+        keep = np.ones(total_pool, dtype=bool)
+        if absent:
+            keep = (batch.concept_masks & np.uint32(absent)) == 0
+        excluded_count = int(total_pool - keep.sum())
+        filtered_pool = total_pool - excluded_count
         
         if excluded_count > 0:
             logger.info(f"[Scorer] 🔥 철벽 필터: {excluded_count}장 제외 (원국에 없는 오행)")
         
-        scored_cards = []
+        # 유사 중복 클러스터는 섹션당 1장 (store일 때만) - 건너뛸 수 있는 최대치만큼 더 뽑아 거름
+        cluster_of = all_cards.cluster_of if isinstance(all_cards, RuleCardStore) else {}
+        n_dup = len(cluster_of) - len(all_cards.cluster_size) if cluster_of else 0
         
-        for card in filtered_cards:
-            card_id = card.get("id", card.get("_id", ""))
-            topic = card.get("topic", "GENERAL")
-            subtopic = card.get("subtopic", "")
-            card_tags = set(card.get("tags", []))
-            priority = float(card.get("priority", 0))
-            
-            # 태그 매칭
-            matched = card_tags & feature_set
-            section_matched = card_tags & section_tags
+        tag_match_score = counts[:, 0] * 2.0
+        survey_score = counts[:, 1]
+        base_total = 1.0 + tag_match_score + survey_score + batch.priority_score
+        
+        results: Dict[str, SectionCards] = {}
+        for j, section_id in enumerate(section_ids):
+            section_boost = counts[:, 2 + j] * 3.0
+            final_scores = base_total + section_boost
             
-            # 점수 계산
-            trace = ScoreTrace()
-            trace.base_score = 1.0
-            trace.tag_match_score = len(matched) * 2.0
-            trace.priority_score = min(priority, 10) * 0.5
+            selected = []
+            sel_rows = top_k(final_scores, top_n + n_dup, keep)
+            if n_dup:
+                sel_rows = np.asarray(first_per_cluster(sel_rows.tolist(), cluster_of, top_n), dtype=np.intp)
+            for i in sel_rows:
+                trace = ScoreTrace(
+                    base_score=1.0,
+                    tag_match_score=float(tag_match_score[i]),
+                    survey_score=float(survey_score[i]),
+                    priority_score=float(batch.priority_score[i]),
+                    section_boost=float(section_boost[i]),
+                )
+                selected.append(ScoredCard(
+                    card_id=batch.ids[i],
+                    topic=batch.topics[i],
+                    subtopic=batch.subtopics[i],
+                    final_score=float(final_scores[i]),
+                    matched_tags=list(set(batch.tags[i]) & feature_set),
+                    score_trace=trace
+                ))
             
-            # 설문 가중치
-            for tag in card_tags:
-                if tag in survey_weights:
-                    trace.survey_score += survey_weights[tag]
+            avg_score = sum(c.final_score for c in selected) / len(selected) if selected else 0.0
             
-            # 섹션 부스트
-            trace.section_boost = len(section_matched) * 3.0
+            match_summary = {
+                "section_id": section_id,
+                "total_pool": total_pool,
+                "filtered_pool": filtered_pool,
+                "excluded_by_fact_check": excluded_count,
+                "selected_count": len(selected),
+                # 원국 오행 / 보유 십성·관계 중 하나라도 겹치는 선택 카드 수
+                "concept_matched": int(np.count_nonzero(batch.concept_masks[sel_rows] & np.uint32(user_mask))),
+                "top_tags": list(feature_set)[:10],
+                "survey_applied": bool(survey_data),
+                "rulecards_version": getattr(all_cards, "version", None),
+            }
             
-            final_score = trace.base_score + trace.tag_match_score + trace.survey_score + trace.priority_score + trace.section_boost
+            logger.info(f"[Scorer] section={section_id} | pool={total_pool} | selected={len(selected)} | avg_score={avg_score:.1f}")
             
-            scored_cards.append(ScoredCard(
-                card_id=card_id,
-                topic=topic,
-                subtopic=subtopic,
-                final_score=final_score,
-                matched_tags=list(matched),
-                score_trace=trace
-            ))
+            results[section_id] = SectionCards(
+                cards=selected,
+                match_summary=match_summary,
+                avg_score=avg_score,
+                total_cards=len(selected)
+            )
         
-        # 점수순 정렬
-        scored_cards.sort(key=lambda x: x.final_score, reverse=True)
-        
-        # 상위 20개 선택
-        selected = scored_cards[:20]
-        
-        avg_score = sum(c.final_score for c in selected) / len(selected) if selected else 0.0
-        
-        match_summary = {
-            "section_id": section_id,
-            "total_pool": len(all_cards),
-            "filtered_pool": len(filtered_cards),
-            "excluded_by_fact_check": excluded_count,
-            "selected_count": len(selected),
-            "top_tags": list(feature_set)[:10],
-            "survey_applied": bool(survey_data),
-        }
-        
-        logger.info(f"[Scorer] section={section_id} | pool={len(all_cards)} | selected={len(selected)} | avg_score={avg_score:.1f}")
-        
-        return SectionCards(
-            cards=selected,
-            match_summary=match_summary,
-            avg_score=avg_score,
-            total_cards=len(selected)
-        )
+        return results
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -1,18 +1,29 @@
 from __future__ import annotations
-from typing import Dict, List, Set, Tuple
+import weakref
+from itertools import repeat
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .card_matrix import top_k
 from .rulecards_store import RuleCardStore, RuleCard, canon_tag, explode_tag_tokens
 
-def score_card(store: RuleCardStore, card: RuleCard, user_tags: Set[str], focus_tags: Set[str]) -> Dict:
-    tokens = set()
-    for t in card.tags:
-        for x in explode_tag_tokens(t):
-            tokens.add(x)
+_EMPTY = np.zeros(0, dtype=np.int32)
+_QUERY_POOL = 200  # 질문 전문검색 후보 수 (preset 토픽 전체)
 
+_STAGE_NAMES = np.array(["s1", "s2", "s3", "s4"], dtype=object)
+_BASE_CACHE: "weakref.WeakKeyDictionary[RuleCardStore, Dict[FrozenSet[str], Tuple[np.ndarray, np.ndarray]]]" = weakref.WeakKeyDictionary()
+_BASE_CACHE_SIZE = 256
+
+# 섹션 선택 결과: (key, title, meta, 카드 번호)
+SectionPick = Tuple[str, str, Dict[str, Any], Tuple[int, ...]]
+
+def score_card(store: RuleCardStore, card: RuleCard, user_tags: Set[str], focus_tags: Set[str]) -> Dict:
     overlap = 0
     match_score = 0.0
     focus_hit = 0
 
-    for t in tokens:
+    for t in store.tokens_of(card):
         if t in user_tags:
             overlap += 1
             match_score += store.idf.get(t, 1.0)
@@ -22,69 +33,165 @@ def score_card(store: RuleCardStore, card: RuleCard, user_tags: Set[str], focus_
     total = match_score + (focus_hit * 0.35) + (card.priority * 0.25)
     return {"overlap": overlap, "matchScore": match_score, "focusHit": focus_hit, "total": total}
 
-def select_cards_for_preset(store: RuleCardStore, preset: Dict, feature_tags: List[str]) -> Dict:
-    used: Set[str] = set()
+def select_cards_for_preset(store: RuleCardStore, preset: Dict, feature_tags: List[str], query: str = "") -> Dict:
+    """섹션/토픽 쿼터별 카드 선택 → {"preset", "sections": [{"key", "title", "cards": [카드 dict], "meta"}]}"""
+    return expand_selection(store, preset["name"], select_card_nos_for_preset(store, preset, feature_tags, query))
+
+
+def expand_selection(store: RuleCardStore, preset_name: str, sections: List[SectionPick]) -> Dict:
+    """섹션별 카드 번호 → 응답 형태 (카드 dict / meta는 매번 새로 만듦)"""
+    cards = store.cards
+    return {
+        "preset": preset_name,
+        "sections": [
+            {
+                "key": key,
+                "title": title,
+                "cards": [cards[no].to_dict() for no in nos],
+                "meta": {**meta, "byStage": dict(meta["byStage"])},
+            }
+            for key, title, meta, nos in sections
+        ],
+    }
+
+
+def select_card_nos_for_preset(
+    store: RuleCardStore, preset: Dict, feature_tags: List[str], query: str = "",
+    exclude: Optional[Set[str]] = None,
+) -> List[SectionPick]:
+    """
+    섹션/토픽 쿼터별 카드 선택 → 섹션별 (key, title, meta, 카드 번호 tuple)
+    (store 역색인 + 번호 배열 기반 - 카드 객체는 고른 것만 접근)
+
+    - 사용자 토큰 점수는 섹션과 무관 → 요청당 1회 posting 누적
+    - 섹션 포커스 점수 + priority 항은 요청과 무관 → store·포커스별 캐시 (_section_base)
+    - 단계(s1 겹침≥2 → s2 겹침 1 → s3 포커스 → s4 나머지)를 순위 키 맨 앞에 두고
+      토픽 카드를 (단계, -total, topic 순위)로 top_k(groups=단계) → 단계별로 다시 거르던 것과 같은 순서
+      쿼터 + 이미 쓴 카드 수만큼만 뽑음 (토픽 전체 정렬 없음, s4는 priority 순 = topic_nos 순서 그대로)
+    - query(질문/고민)가 있으면 preset 토픽 안에서 FTS 1회 → 토픽 쿼터의 절반까지 bm25 순으로 먼저 채움 ("q")
+    - 유사 중복 클러스터(store.cluster_of)는 섹션당 1장 → 건너뛸 수 있는 최대치(대표 외 카드 수)만큼 후보를 더 봄
+    - exclude: 고르지 않을 카드 id (금지어 카드 등) - 이미 쓴 카드와 같이 취급
+    """
+    used: Set[str] = set(exclude) if exclude else set()
     user_tags: Set[str] = set()
     for t in feature_tags:
         for x in explode_tag_tokens(t):
             user_tags.add(x)
 
+    cards = store.cards
+    cluster_of = store.cluster_of
+    n_dup = len(cluster_of) - len(store.cluster_size)  # 클러스터 대표 외 카드 수
+    user_overlap, user_score = store.score_tokens(user_tags)
+    user_stage = np.where(user_overlap >= 2, 0, np.where(user_overlap >= 1, 1, 3)).astype(np.int8)
+    query_rank = _query_rank(store, preset, query) if query else None
+
     out_sections = []
     for sec in preset["sections"]:
-        focus = set(canon_tag(x) for x in sec["focusTags"])
-        sec_cards: List[RuleCard] = []
+        focus_stage, base = _section_base(store, sec["focusTags"])
+        total = user_score + base
+        stage = np.minimum(user_stage, focus_stage)
+
+        sec_nos: List[int] = []
+        sec_clusters: Set[int] = set()
         by_stage = {"s1":0,"s2":0,"s3":0,"s4":0}
+        if query_rank is not None:
+            by_stage["q"] = 0
 
         for tq in sec["perTopic"]:
             topic = tq["topic"]
             k = int(tq["k"])
 
-            pool = [c for c in store.by_topic.get(topic, []) if c.id not in used]
-
             # HEALTH 토픽이 부족하면 ELEMENTS에서 보충
-            if topic == "HEALTH" and len(pool) < k:
-                pool = [c for c in store.by_topic.get("ELEMENTS", []) if c.id not in used]
-
-            ranked: List[Tuple[RuleCard, Dict]] = []
-            for c in pool:
-                s = score_card(store, c, user_tags, focus)
-                ranked.append((c, s))
-            ranked.sort(key=lambda x: x[1]["total"], reverse=True)
-
-            s1 = [x for x in ranked if x[1]["overlap"] >= 2]        # 정밀
-            s2 = [x for x in ranked if x[1]["overlap"] >= 1]        # 완화
-            s3 = [x for x in ranked if x[1]["focusHit"] >= 1]       # 섹션 포커스
-            need = k
+            if topic == "HEALTH":
+                health = store.topic_nos.get(topic, _EMPTY)
+                if len(health) - len(used) < k:  # 사용된 카드를 다 빼도 충분하면 세지 않음
+                    available = sum(1 for no in health.tolist() if cards[no].id not in used)
+                    if available < k:
+                        topic = "ELEMENTS"
+
+            nos = store.topic_nos.get(topic, _EMPTY)
             got = 0
 
-            def pick(lst, stage):
+            def pick(ordered, stages, limit):
                 nonlocal got
-                for c, _s in lst:
-                    if got >= need: break
+                # 건너뛰는 카드는 used + 섹션에서 이미 고른 클러스터뿐 → 앞에서 limit + len(used) + n_dup개만 보면 충분
+                n = limit - got + len(used) + n_dup
+                names = repeat(stages) if isinstance(stages, str) else stages[:n].tolist()
+                for no, st in zip(ordered[:n].tolist(), names):
+                    if got >= limit: break
+                    c = cards[no]
                     if c.id in used: continue
+                    cid = cluster_of.get(no)
+                    if cid is not None:
+                        if cid in sec_clusters: continue
+                        sec_clusters.add(cid)
                     used.add(c.id)
-                    sec_cards.append(c)
-                    by_stage[stage] += 1
+                    sec_nos.append(no)
+                    by_stage[st] += 1
                     got += 1
 
-            pick(s1, "s1")
-            pick(s2, "s2")
-            pick(s3, "s3")
-            pick(ranked, "s4")
+            if query_rank is not None:
+                hits = nos[query_rank[nos] >= 0]
+                hits = hits[np.argsort(query_rank[hits], kind="stable")]
+                pick(hits, "q", min(k, (k + 1) // 2))  # 질문 전문검색
 
-        overlaps = [score_card(store, c, user_tags, focus)["overlap"] for c in sec_cards]
+            # s1~s3만 순위, s4(겹침·포커스 없음)는 total = priority 항뿐 → topic_nos 순서 그대로
+            sn = stage[nos]
+            order = top_k(total[nos], k - got + len(used) + n_dup, mask=sn < 3, groups=sn)
+            pick(nos[order], _STAGE_NAMES[sn[order]], k)
+            if got < k:
+                pick(nos[sn == 3], "s4", k)
+
+        overlaps = user_overlap[sec_nos].tolist() if sec_nos else []
         avg_overlap = round(sum(overlaps)/len(overlaps), 2) if overlaps else 0.0
 
-        out_sections.append({
-            "key": sec["key"],
-            "title": sec["title"],
-            "cards": [c.__dict__ for c in sec_cards],
-            "meta": {
+        out_sections.append((
+            sec["key"],
+            sec["title"],
+            {
                 "target": sec["totalTarget"],
-                "picked": len(sec_cards),
+                "picked": len(sec_nos),
                 "byStage": by_stage,
                 "avgOverlap": avg_overlap,
-            }
-        })
-
-    return {"preset": preset["name"], "sections": out_sections}
+            },
+            tuple(sec_nos),
+        ))
+
+    return out_sections
+
+
+def _section_base(store: RuleCardStore, focus_tags: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    섹션 포커스 → (포커스 단계 2/3, 포커스 × 0.35 + priority × 0.25) - 요청과 무관한 항
+
+    boost_preset_focus가 붙이는 포커스 조합은 몇 가지뿐이라 store별로 캐시 (버전 교체 시 store와 함께 사라짐)
+    """
+    focus = frozenset(canon_tag(x) for x in focus_tags)
+    cache = _BASE_CACHE.get(store)
+    if cache is None:
+        cache = _BASE_CACHE.setdefault(store, {})
+    hit = cache.get(focus)
+    if hit is None:
+        focus_hit = store.score_tokens(focus)[0]
+        hit = (
+            np.where(focus_hit > 0, 2, 3).astype(np.int8),
+            focus_hit * 0.35 + store.priorities * 0.25,
+        )
+        if len(cache) >= _BASE_CACHE_SIZE:
+            cache.clear()
+        cache[focus] = hit
+    return hit
+
+
+def _query_rank(store: RuleCardStore, preset: Dict, query: str) -> Optional[np.ndarray]:
+    """preset 토픽 전체에 FTS 1회 → 카드 번호별 bm25 순위 (-1 = 안 걸림), 결과 없으면 None"""
+    topics = {tq["topic"] for sec in preset["sections"] for tq in sec["perTopic"]}
+    if "HEALTH" in topics:
+        topics.add("ELEMENTS")
+    hits = store.search(query, topics=topics, k=_QUERY_POOL)
+    if not hits:
+        return None
+    rank = np.full(len(store.cards), -1, dtype=np.int32)
+    nos = np.array([no for no, _ in hits], dtype=np.int32)
+    rank[nos] = np.arange(len(nos), dtype=np.int32)
+    return rank
@@ -0,0 +1,203 @@
+"""
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+🔎 룰카드 전문검색 (SQLite FTS5 + bm25)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+사용자 질문 / 고민(painPoint) 같은 자유 문장 → 카드 후보 (전 카드 스캔 없이)
+
+색인 파일: <원본>.<버전>.fts (원본 없으면 임시 디렉터리, settings.rulecards_fts_path로 고정 가능)
+- rowid = store 카드 번호 → 결과를 바로 store.cards / 번호 배열에 연결
+- 버전 = store.content_hash() → 파일명에 포함 (없으면 생성: 임시 파일 → os.replace)
+  핫 리로드 후에도 이전 버전에 고정된 요청은 자기 버전 파일을 읽음 (직전 버전까지 보관)
+- master DB의 rule_cards_fts(tools/ingest_rulecards.py)는 rowid가 DB 행 번호라 store 카드 번호와 다르고
+  JSONL 원본에는 없으므로, master DB를 건드리지 않고 별도 파일로 만든다
+
+연결은 스레드(+pid)마다 1개 - sqlite3 연결은 스레드 간 공유 불가, fork 후 재사용 금지.
+연결마다 prepared statement 캐시(cached_statements): 토픽 수별 SQL 문자열을 고정해
+같은 모양의 질의는 다시 컴파일하지 않는다.
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import logging
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_STATEMENT_CACHE = 64
+_MAX_TERMS = 8
+
+_WORD = re.compile(r"[0-9A-Za-z가-힣]{2,}")
+# 질의 단어 끝 조사/어미 (긴 것 먼저) - 남은 길이 2자 이상일 때만 제거 후 접두 검색
+_SUFFIXES = sorted([
+    "으로는", "에서는", "에게는", "이라는", "인가요", "할까요", "일까요", "싶어요", "습니다",
+    "으로", "에서", "에게", "한테", "까지", "부터", "처럼", "보다", "이랑", "하고", "인데", "해요", "나요", "까요",
+    "은", "는", "이", "가", "을", "를", "에", "의", "도", "로", "와", "과", "만", "요",
+], key=len, reverse=True)
+_STOPWORDS = frozenset([
+    "어떻게", "어떤", "무엇", "언제", "올해", "내년", "제가", "저는", "저의", "나는", "그리고",
+    "하지만", "정말", "너무", "지금", "앞으로", "궁금", "궁금합니다", "알려", "주세요", "있을",
+    "없을", "좋을", "할지", "해야", "하는", "있는", "없는", "있어", "없어", "있나", "될까", "되나",
+    "해도", "할까", "같아", "같은",
+])
+
+
+_KEEP_VERSIONS = 2
+
+
+def default_fts_path(source_path: Optional[str], version: str) -> Path:
+    if source_path:
+        return Path(f"{source_path}.{version}.fts")
+    return Path(tempfile.gettempdir()) / f"rulecards-{version}.fts"
+
+
+def build_match_query(text: str) -> str:
+    """
+    자유 문장 → FTS5 MATCH 식 ("재물"* OR "투자"* ...), 쓸 단어가 없으면 ""
+
+    단어는 따옴표로 감싸 FTS 문법 문자(-, :, ^ 등)가 섞여도 오류가 나지 않게 함
+    """
+    terms: List[str] = []
+    for w in _WORD.findall(text or ""):
+        for suf in _SUFFIXES:
+            if w.endswith(suf) and len(w) - len(suf) >= 2:
+                w = w[: -len(suf)]
+                break
+        if w in _STOPWORDS or w in terms:
+            continue
+        terms.append(w)
+        if len(terms) >= _MAX_TERMS:
+            break
+    return " OR ".join(f'"{t}"*' for t in terms)
+
+
+def card_query_text(question: str = "", survey_data: Optional[Dict[str, Any]] = None) -> str:
+    """검색에 쓸 자유 문장: 사용자 질문 + 설문 고민(painPoint)"""
+    survey = survey_data or {}
+    parts = [question or "", survey.get("painPoint") or survey.get("pain_point") or ""]
+    return " ".join(str(p).strip() for p in parts if p and str(p).strip())
+
+
+@lru_cache(maxsize=32)
+def _search_sql(n_topics: int) -> str:
+    """토픽 수별 SQL (문자열이 같아야 연결의 statement 캐시가 재사용됨)"""
+    topic_filter = f" AND topic IN ({','.join('?' * n_topics)})" if n_topics else ""
+    return (
+        "SELECT rowid, bm25(rule_cards_fts, 0.0, 2.0, 1.0, 1.0, 0.5) AS score "
+        f"FROM rule_cards_fts WHERE rule_cards_fts MATCH ?{topic_filter} "
+        "ORDER BY score LIMIT ?"
+    )
+
+
+class RuleCardFTS:
+    """store 1개 버전의 FTS5 색인 파일 + 스레드별 읽기 연결"""
+
+    def __init__(self, path: Path, version: str):
+        self.path = Path(path)
+        self.version = version
+        self._local = threading.local()
+        self.stats = {"queries": 0, "connections": 0}
+
+    # ---------- 생성 ----------
+
+    @classmethod
+    def open_for(cls, store: Any, path: Optional[Path] = None) -> "RuleCardFTS":
+        """색인이 없거나 버전이 다르면 생성 후 열기"""
+        from app.config import get_settings
+        version = store.version or store.content_hash()
+        path = Path(path or get_settings().rulecards_fts_path or default_fts_path(store.path, version))
+        if _stored_version(path) != version:
+            _write_index(store, path, version)
+            if store.path and not get_settings().rulecards_fts_path:
+                _prune_old(Path(store.path), keep=path)
+        return cls(path, version)
+
+    # ---------- 조회 ----------
+
+    def _conn(self) -> sqlite3.Connection:
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is None or local.pid != os.getpid():
+            conn = sqlite3.connect(
+                f"file:{self.path}?mode=ro", uri=True,
+                cached_statements=_STATEMENT_CACHE,
+            )
+            local.conn, local.pid = conn, os.getpid()
+            self.stats["connections"] += 1
+        return conn
+
+    def search(self, query: str, topics: Optional[Sequence[str]] = None, k: int = 50) -> List[Tuple[int, float]]:
+        """
+        bm25 순 카드 번호
+
+        Args:
+            query: 자유 문장 (build_match_query로 변환)
+            topics: 이 토픽 카드만 (None/빈 값이면 전체)
+        Returns:
+            [(카드 번호, bm25 점수)] - 점수는 작을수록 관련도 높음
+        """
+        match = build_match_query(query)
+        if not match or k <= 0:
+            return []
+        topics = sorted(set(topics or ()))
+        self.stats["queries"] += 1
+        rows = self._conn().execute(_search_sql(len(topics)), [match, *topics, k]).fetchall()
+        return [(int(no), float(score)) for no, score in rows]
+
+
+def _stored_version(path: Path) -> Optional[str]:
+    if not path.exists():
+        return None
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        finally:
+            conn.close()
+        return row[0] if row else None
+    except sqlite3.Error:
+        return None
+
+
+def _write_index(store: Any, path: Path, version: str) -> None:
+    """카드 번호 = rowid로 색인 생성 → 임시 파일에 쓰고 교체 (다른 워커가 읽는 중이어도 안전)"""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.unlink(missing_ok=True)
+    conn = sqlite3.connect(str(tmp))
+    try:
+        conn.execute(
+            "CREATE VIRTUAL TABLE rule_cards_fts USING fts5("
+            "topic UNINDEXED, tags, mechanism, interpretation, action)"
+        )
+        conn.executemany(
+            "INSERT INTO rule_cards_fts (rowid, topic, tags, mechanism, interpretation, action) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            _rows(store.cards),
+        )
+        conn.execute("INSERT INTO rule_cards_fts (rule_cards_fts) VALUES ('optimize')")
+        conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute("INSERT INTO meta VALUES ('version', ?)", (version,))
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp, path)
+    logger.info(f"[RuleCardFTS] ✅ 색인 생성 {path.name}: {len(store.cards)}장 ({version})")
+
+
+def _prune_old(source: Path, keep: Path) -> None:
+    """같은 원본의 오래된 버전 색인 정리 (최근 _KEEP_VERSIONS개 유지)"""
+    olds = sorted(
+        (p for p in source.parent.glob(f"{source.name}.*.fts") if p != keep),
+        key=lambda p: p.stat().st_mtime_ns, reverse=True,
+    )
+    for p in olds[_KEEP_VERSIONS - 1:]:
+        p.unlink(missing_ok=True)
+
+
+def _rows(cards: Iterable[Any]):
+    for no, c in enumerate(cards):
+        yield (no, c.topic, " ".join(c.tags or ()), c.mechanism or "", c.interpretation or "", c.action or "")
@@ -0,0 +1,271 @@
+"""
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+🔄 룰카드 store 레지스트리 - 핫 리로드 (원자적 버전 교체)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+재배포 없이 룰카드 갱신:
+- 관리자 호출 (POST /api/v1/admin/rulecards/reload) 또는
+- 파일 감시 (rulecards_watch_interval_seconds > 0: 원본/스냅샷 (크기, mtime) 폴링)
+
+reload 순서:
+1. 백그라운드 스레드(blocking_executor)에서 새 RuleCardStore 로드 + 인덱스 생성
+2. 검증 (카드 수, 인덱스 행 수, 이전 대비 급감, 카드 선택이 예외 없이 도는지)
+3. MatchModule 트리거 인덱스 / RuleCardScorer 채점 묶음 / FTS 색인도 스레드에서 미리 생성
+4. 이벤트 루프에서 참조만 교체: match_module 인덱스 → app.state.rulestore → 레지스트리
+
+store 객체는 교체 후에도 수정하지 않으므로, 요청/잡이 시작할 때 잡은 참조
+(app.state.rulestore, report 잡의 rulestore 인자)는 끝날 때까지 같은 버전에 고정된다.
+버전 = store.content_hash() (같은 내용이면 교체하지 않음), 세대(generation)는 교체마다 +1.
+
+preload 모드에서 리로드한 새 버전은 워커마다 따로 로드된다 (COW 공유는 부팅 버전만).
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from app.services.rulecards_store import RuleCardStore
+
+logger = logging.getLogger(__name__)
+
+
+class RuleCardReloadError(Exception):
+    """새 store 검증 실패 (현재 버전 유지)"""
+    pass
+
+
+@dataclass(frozen=True)
+class ActiveRuleCards:
+    """현재 버전 (통째로 교체)"""
+    store: RuleCardStore
+    version: str
+    generation: int
+    loaded_at: float
+    source_path: Optional[str]
+
+
+def validate_store(store: RuleCardStore, previous: Optional[RuleCardStore] = None, min_ratio: float = 0.5) -> List[str]:
+    """교체 전 검증 → 문제 목록 (비어 있으면 통과)"""
+    problems: List[str] = []
+    n = len(store.cards)
+    if n == 0:
+        return ["카드 0장"]
+    if store.tag_matrix is None or store.tag_matrix.n_rows != n:
+        problems.append("tag_matrix 행 수 불일치")
+    if len(store.priorities) != n or len(store.topic_rank) != n or len(store.cluster_ids) != n:
+        problems.append("카드 열 길이 불일치")
+    if sum(len(nos) for nos in store.topic_nos.values()) != n:
+        problems.append("topic_nos 합계 불일치")
+    if previous is not None and n < len(previous.cards) * min_ratio:
+        problems.append(f"카드 수 급감: {len(previous.cards)} → {n} (force로 무시 가능)")
+    if problems:
+        return problems
+
+    try:
+        from app.services.preset_type2 import BUSINESS_OWNER_PRESET_V2
+        from app.services.rulecard_selector import select_cards_for_preset
+        select_cards_for_preset(store, BUSINESS_OWNER_PRESET_V2, sorted(store.postings)[:12])
+    except Exception as e:
+        problems.append(f"스모크 실패: {type(e).__name__}: {e}")
+    return problems
+
+
+def _fingerprint(path: Optional[Path]) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+        return st.st_size, st.st_mtime_ns
+    except (OSError, AttributeError):
+        return None
+
+
+class RuleCardRegistry:
+    """현재 룰카드 버전 보관 + reload / 파일 감시"""
+
+    def __init__(self):
+        self._active: Optional[ActiveRuleCards] = None
+        self._app_state: Any = None
+        self._reload_lock: Optional[asyncio.Lock] = None
+        self._watch_task: Optional[asyncio.Task] = None
+        self.stats: Dict[str, Any] = {
+            "reloads": 0, "unchanged": 0, "failures": 0,
+            "last_reload_at": None, "last_reason": None, "last_error": None,
+        }
+
+    @property
+    def store(self) -> Optional[RuleCardStore]:
+        active = self._active
+        return active.store if active else None
+
+    def bind_app_state(self, state: Any) -> None:
+        """교체 시 app.state.rulestore도 갱신 (라우터는 요청마다 이 참조를 1회 읽음)"""
+        self._app_state = state
+        if self._active is not None:
+            state.rulestore = self._active.store
+
+    # ---------- 설치 / 교체 ----------
+
+    def _prepare(self, store: RuleCardStore) -> Any:
+        """교체 전에 만들어 둘 것들 (스레드에서 실행 가능 - 공유 상태를 바꾸지 않음)"""
+        from app.services.match_module import match_module
+        from app.services.rulecard_scorer import rulecard_scorer
+        if not store.version:
+            store.version = store.content_hash()
+        rulecard_scorer.set_store(store)  # store별 캐시 - 현재 버전에 영향 없음
+        store.open_search()  # FTS 색인 (버전별 파일)
+        return match_module.build_index(store)
+
+    def _activate(self, store: RuleCardStore, match_index: Any, source_path: Optional[Union[str, Path]]) -> ActiveRuleCards:
+        """참조 교체만 (이벤트 루프 스레드)"""
+        from app.services.match_module import match_module
+        prev = self._active
+        match_module.set_store(store, match_index)
+        if self._app_state is not None:
+            self._app_state.rulestore = store
+        self._active = ActiveRuleCards(
+            store=store,
+            version=store.version,
+            generation=(prev.generation + 1) if prev else 1,
+            loaded_at=time.time(),
+            source_path=str(source_path) if source_path else (prev.source_path if prev else None),
+        )
+        return self._active
+
+    def install(self, store: RuleCardStore, source_path: Optional[Union[str, Path]] = None) -> ActiveRuleCards:
+        """부팅/preload용 동기 설치 (검증 없이 바로 교체)"""
+        active = self._activate(store, self._prepare(store), source_path)
+        logger.info(f"[RuleCardRegistry] ✅ v{active.generation} {active.version}: {len(store.cards)}장")
+        return active
+
+    async def reload(
+        self,
+        source_path: Optional[Union[str, Path]] = None,
+        reason: str = "admin",
+        force: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        새 store를 백그라운드에서 만들어 검증 후 교체
+
+        Returns:
+            {"status": "swapped" | "unchanged", "version", "generation", "cards", "elapsed_ms"}
+        Raises:
+            RuleCardReloadError: 로드/검증 실패 (현재 버전 유지)
+        """
+        from app.config import get_settings
+        from app.services.blocking import run_blocking
+        from app.services.rulecards_snapshot import load_rulecard_store
+
+        if self._reload_lock is None:
+            self._reload_lock = asyncio.Lock()
+        async with self._reload_lock:
+            prev = self._active
+            path = source_path or (prev.source_path if prev else None)
+            if not path:
+                raise RuleCardReloadError("원본 경로 없음")
+
+            t0 = time.perf_counter()
+            self.stats["last_reason"] = reason
+            min_ratio = get_settings().rulecards_reload_min_ratio
+
+            def build() -> Tuple[RuleCardStore, Any]:
+                store = load_rulecard_store(path)
+                store.version = store.content_hash()
+                if prev is not None and store.version == prev.version:
+                    return store, None
+                problems = validate_store(store, None if force or prev is None else prev.store, min_ratio)
+                if problems:
+                    raise RuleCardReloadError("; ".join(problems))
+                return store, self._prepare(store)
+
+            try:
+                store, match_index = await run_blocking(build)
+            except Exception as e:
+                self.stats["failures"] += 1
+                self.stats["last_error"] = str(e)[:300]
+                logger.error(f"[RuleCardRegistry] ❌ reload 실패 ({reason}): {e} → v{prev.generation if prev else 0} 유지")
+                if isinstance(e, RuleCardReloadError):
+                    raise
+                raise RuleCardReloadError(str(e)) from e
+
+            elapsed_ms = round((time.perf_counter() - t0) * 1000, 1)
+            self.stats["last_reload_at"] = time.time()
+            self.stats["last_error"] = None
+            if match_index is None:
+                self.stats["unchanged"] += 1
+                logger.info(f"[RuleCardRegistry] 변경 없음 ({reason}): {prev.version}")
+                return {"status": "unchanged", "version": prev.version, "generation": prev.generation,
+                        "cards": len(prev.store.cards), "elapsed_ms": elapsed_ms}
+
+            active = self._activate(store, match_index, path)
+            self.stats["reloads"] += 1
+            logger.info(
+                f"[RuleCardRegistry] 🔄 v{active.generation} {active.version} ({reason}): "
+                f"{len(prev.store.cards) if prev else 0} → {len(store.cards)}장 ({elapsed_ms}ms)"
+            )
+            return {"status": "swapped", "version": active.version, "generation": active.generation,
+                    "cards": len(store.cards), "elapsed_ms": elapsed_ms}
+
+    # ---------- 파일 감시 ----------
+
+    def start_watch(self, interval_seconds: float) -> None:
+        if interval_seconds <= 0 or self._watch_task is not None or self._active is None:
+            return
+        self._watch_task = asyncio.create_task(self._watch(interval_seconds))
+        logger.info(f"[RuleCardRegistry] 파일 감시 시작: {self._active.source_path} ({interval_seconds}s)")
+
+    async def stop_watch(self) -> None:
+        task, self._watch_task = self._watch_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def _watched_paths(self) -> List[Path]:
+        from app.config import get_settings
+        from app.services.rulecards_snapshot import default_snapshot_path
+        source = Path(self._active.source_path)
+        snap = get_settings().rulecards_snapshot_path or default_snapshot_path(source)
+        return [source, Path(snap)]
+
+    async def _watch(self, interval: float) -> None:
+        """(크기, mtime) 변화 → 다음 폴링에서도 같으면(쓰기 완료) reload"""
+        seen = [_fingerprint(p) for p in self._watched_paths()]
+        pending = None
+        while True:
+            await asyncio.sleep(interval)
+            now = [_fingerprint(p) for p in self._watched_paths()]
+            if now == seen:
+                pending = None
+                continue
+            if now != pending:
+                pending = now  # 아직 쓰는 중일 수 있음 - 한 번 더 확인
+                continue
+            seen, pending = now, None
+            try:
+                await self.reload(reason="file_watch")
+            except RuleCardReloadError:
+                pass  # stats에 기록됨, 현재 버전 유지
+
+    # ---------- 조회 ----------
+
+    def info(self) -> Dict[str, Any]:
+        active = self._active
+        if active is None:
+            return {"loaded": False, **self.stats}
+        return {
+            "loaded": True,
+            "version": active.version,
+            "generation": active.generation,
+            "cards": len(active.store.cards),
+            "source": active.store.source,
+            "duplicate_cards": len(active.store.cluster_of) - len(active.store.cluster_size),
+            "loaded_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(active.loaded_at)),
+            "watching": self._watch_task is not None,
+            **self.stats,
+        }
+
+
+rulecard_registry = RuleCardRegistry()
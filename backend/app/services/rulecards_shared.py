@@ -0,0 +1,111 @@
+"""
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+🤝 룰카드 store 워커 간 공유 (preload + gc.freeze)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+settings.rulecards_share_mode:
+- "private" (기본): 워커마다 startup에서 store 로드 - 메모리가 워커 수에 비례
+- "preload": app.main import 시점에 1회 로드 (gunicorn --preload면 fork 전 마스터)
+  → MatchModule / RuleCardScorer 준비까지 마친 뒤 gc.freeze()
+  → fork된 워커는 같은 물리 페이지를 읽기만 함 (copy-on-write)
+
+    gunicorn app.main:app --preload -w 4 -k uvicorn.workers.UvicornWorker --bind 0.0.0.0:$PORT
+
+fork 후 공유 페이지를 private으로 만드는 쓰기 두 가지:
+- 순환 GC가 객체 헤더에 쓰기 → gc.freeze()로 영구 세대에 옮겨 스캔 대상에서 제외
+- refcount 증감 → 요청 경로가 읽는 카드 번호 / priority 열은 numpy 배열 (RuleCardStore),
+  RuleCard 객체는 선택된 카드만 접근
+스냅샷(.snap)에서 로드하면 그 배열은 mmap 뷰라 private 모드에서도 페이지 캐시로 공유됨.
+
+memory_report(): /proc/self/smaps_rollup 기준 워커별 shared / private (/ready에 노출)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import gc
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from app.services.rulecards_store import RuleCardStore
+
+logger = logging.getLogger(__name__)
+
+SHARE_MODES = ("private", "preload")
+
+_preloaded: Optional[RuleCardStore] = None
+
+
+def share_mode() -> str:
+    from app.config import get_settings
+    mode = (get_settings().rulecards_share_mode or "private").strip().lower()
+    if mode not in SHARE_MODES:
+        logger.warning(f"[RuleCardShare] 알 수 없는 모드 {mode!r} → private")
+        return "private"
+    return mode
+
+
+def attach_store(store: RuleCardStore, source_path: Optional[Union[str, Path]] = None) -> None:
+    """store를 쓰는 싱글톤들에 주입 (행렬/채점 묶음을 여기서 미리 생성) → rulecard_registry 현재 버전"""
+    from app.services.rulecards_registry import rulecard_registry
+    rulecard_registry.install(store, source_path)
+
+
+def preload_rulecard_store(source_path: Union[str, Path]) -> Optional[RuleCardStore]:
+    """
+    preload 모드일 때만 store 로드 + 주입 + gc.freeze (app.main import 시 호출)
+
+    Returns:
+        로드한 store, private 모드이거나 원본이 없으면 None
+    """
+    global _preloaded
+    if share_mode() != "preload" or _preloaded is not None:
+        return _preloaded
+    if not Path(source_path).exists():
+        logger.warning(f"[RuleCardShare] 원본 없음: {source_path} → 워커별 로드")
+        return None
+
+    from app.services.rulecards_snapshot import load_rulecard_store
+
+    t0 = time.perf_counter()
+    store = load_rulecard_store(source_path)
+    attach_store(store, source_path)
+    gc.collect()
+    gc.freeze()  # 여기까지 만든 객체는 워커의 GC가 건드리지 않음
+    _preloaded = store
+    logger.info(
+        f"[RuleCardShare] ✅ preload pid={os.getpid()}: {len(store.cards)}장, "
+        f"frozen={gc.get_freeze_count()} ({(time.perf_counter() - t0) * 1000:.0f}ms)"
+    )
+    return store
+
+
+def get_preloaded_store() -> Optional[RuleCardStore]:
+    return _preloaded
+
+
+def memory_report() -> Dict[str, Any]:
+    """
+    현재 프로세스(워커) 메모리: shared = 다른 프로세스와 같이 매핑된 페이지, private = 이 워커만
+    pss = shared를 공유 프로세스 수로 나눠 더한 값 (워커 수만큼 더하면 실제 사용량)
+    """
+    report: Dict[str, Any] = {"pid": os.getpid(), "mode": share_mode()}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            kb = {}
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 3 and parts[2] == "kB":
+                    kb[parts[0].rstrip(":")] = int(parts[1])
+    except OSError:
+        report["available"] = False
+        return report
+
+    mb = lambda v: round(v / 1024, 1)
+    report.update({
+        "available": True,
+        "rss_mb": mb(kb.get("Rss", 0)),
+        "pss_mb": mb(kb.get("Pss", 0)),
+        "shared_mb": mb(kb.get("Shared_Clean", 0) + kb.get("Shared_Dirty", 0)),
+        "private_mb": mb(kb.get("Private_Clean", 0) + kb.get("Private_Dirty", 0)),
+    })
+    return report
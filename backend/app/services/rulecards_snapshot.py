@@ -0,0 +1,416 @@
+"""
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+📦 RuleCardStore 바이너리 스냅샷 (mmap 로드)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+SQLite/JSONL 로드는 매 부팅·매 워커마다 행 읽기 + JSON 컬럼 파싱 + 태그 정규화 +
+토픽 인덱스/IDF/역색인 재구축을 반복한다.
+tools/build_rulecards_snapshot.py가 완성된 store를 한 파일로 떠 두면
+워커는 mmap + np.frombuffer(복사 없음)로 배열을 붙이고 RuleCard 객체만 만든다.
+store의 카드 번호 열(postings/topic_nos/trigger_index/priorities)은 mmap 뷰 그대로
+→ 같은 파일을 여는 워커끼리 페이지 캐시를 공유 (읽기 전용, 복사·refcount 쓰기 없음).
+
+파일 구조:
+- 헤더 <4sHHIQqII: 매직, 버전, 배열 수, 카드 수, 원본 크기, 원본 mtime_ns, 본문 crc32, source 문자열
+- 디렉터리: 배열마다 <QQ (파일 오프셋, 바이트 수) - _ARRAYS 순서 고정
+- 본문: 8바이트 정렬된 열(column) 배열들
+  · 문자열 테이블: utf-8 blob 1개 + 문자 오프셋 (decode 1회 후 슬라이스)
+  · 카드 열: id/topic/priority/본문 필드 (문자열 번호, -1 = None)
+  · 가변 길이(태그, 주의사항, 트리거 조건, by_topic, postings): ptr + 값 (CSR 형태)
+  · idf, tag_matrix(CSR), trigger_index((field, value) → 카드 번호)
+  · cluster_ids(유사 중복 클러스터) + 계산 당시 threshold - 설정과 다르면 로드 시 재계산
+
+원본 (크기, mtime_ns)가 헤더와 다르면 SnapshotStale → 호출부가 원본에서 로드.
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import gc
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from app.services.card_matrix import CardMatrix
+from app.services.rulecards_store import RuleCard, RuleCardStore, TriggerCond
+
+logger = logging.getLogger(__name__)
+
+
+# ============ 포맷 상수 ============
+
+MAGIC = b"RCSS"
+FORMAT_VERSION = 3  # v2: 카드 번호 열 int32 (store 배열을 mmap 뷰로 그대로 사용), v3: cluster_ids
+
+_HEADER = struct.Struct("<4sHHIQqII")
+_ENTRY = struct.Struct("<QQ")
+
+_ARRAYS: List[Tuple[str, str]] = [
+    ("str_offs", "<i8"), ("str_blob", "u1"),
+    ("card_id", "<u4"), ("card_topic", "<u4"), ("card_priority", "<f8"),
+    ("card_mechanism", "<i4"), ("card_interpretation", "<i4"), ("card_action", "<i4"),
+    ("card_subtopic", "<i4"), ("card_trigger", "<i4"), ("card_trigger_kind", "u1"),
+    ("tag_ptr", "<i8"), ("tag_str", "<u4"),
+    ("caut_ptr", "<i8"), ("caut_str", "<u4"),
+    ("cond_ptr", "<i8"), ("cond_field", "<u4"), ("cond_op", "u1"), ("cond_kind", "u1"), ("cond_val", "<f8"),
+    ("topic_str", "<u4"), ("topic_ptr", "<i8"), ("topic_nos", "<i4"),
+    ("idf_tok", "<u4"), ("idf_val", "<f8"),
+    ("post_tok", "<u4"), ("post_ptr", "<i8"), ("post_nos", "<i4"),
+    ("tm_terms", "<u4"), ("tm_indptr", "<i8"), ("tm_indices", "<i4"), ("tm_data", "<f8"),
+    ("ti_field", "<u4"), ("ti_kind", "u1"), ("ti_val", "<f8"), ("ti_ptr", "<i8"), ("ti_nos", "<i4"),
+    ("cluster_ids", "<i4"), ("dedup_threshold", "<f8"),
+]
+
+_OPS = ("eq", "in", "is")
+KIND_STR, KIND_BOOL, KIND_INT, KIND_FLOAT = 0, 1, 2, 3
+TRIGGER_NONE, TRIGGER_STR, TRIGGER_JSON = 0, 1, 2
+
+
+class SnapshotError(Exception):
+    """스냅샷 파일 오류 (손상/버전 불일치)"""
+    pass
+
+
+class SnapshotStale(SnapshotError):
+    """원본이 스냅샷 생성 이후 바뀜"""
+    pass
+
+
+def default_snapshot_path(source_path: Union[str, Path]) -> Path:
+    return Path(f"{source_path}.snap")
+
+
+def _fingerprint(source_path: Optional[Union[str, Path]]) -> Tuple[int, int]:
+    if not source_path:
+        return 0, 0
+    st = os.stat(source_path)
+    return st.st_size, st.st_mtime_ns
+
+
+# ============ 쓰기 (빌드 단계) ============
+
+class _StringTable:
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.items: List[str] = []
+
+    def add(self, s: str) -> int:
+        i = self.index.get(s)
+        if i is None:
+            i = self.index[s] = len(self.items)
+            self.items.append(s)
+        return i
+
+    def opt(self, s: Optional[str]) -> int:
+        return -1 if s is None else self.add(str(s))
+
+
+def _encode_value(st: _StringTable, v: Any) -> Tuple[int, float]:
+    """트리거 값 → (종류, float 칸) - 문자열은 문자열 번호"""
+    if isinstance(v, bool):
+        return KIND_BOOL, float(v)
+    if isinstance(v, int):
+        return KIND_INT, float(v)
+    if isinstance(v, float):
+        return KIND_FLOAT, v
+    return KIND_STR, float(st.add(str(v)))
+
+
+def write_snapshot(store: RuleCardStore, out_path: Union[str, Path], source_path: Optional[Union[str, Path]] = None) -> Dict[str, Any]:
+    """완성된 store → 스냅샷 파일 (tmp에 쓰고 교체)"""
+    if store.tag_matrix is None:
+        raise SnapshotError("tag_matrix 없음 (numpy 필요)")
+
+    st = _StringTable()
+    cols: Dict[str, list] = {name: [] for name, _ in _ARRAYS}
+    for name in ("tag_ptr", "caut_ptr", "cond_ptr", "topic_ptr", "post_ptr", "ti_ptr"):
+        cols[name].append(0)
+
+    for c in store.cards:
+        cols["card_id"].append(st.add(c.id))
+        cols["card_topic"].append(st.add(c.topic))
+        cols["card_priority"].append(float(c.priority))
+        cols["card_mechanism"].append(st.opt(c.mechanism))
+        cols["card_interpretation"].append(st.opt(c.interpretation))
+        cols["card_action"].append(st.opt(c.action))
+        cols["card_subtopic"].append(st.opt(c.subtopic or None))
+
+        if c.trigger is None:
+            cols["card_trigger"].append(-1)
+            cols["card_trigger_kind"].append(TRIGGER_NONE)
+        elif isinstance(c.trigger, str):
+            cols["card_trigger"].append(st.add(c.trigger))
+            cols["card_trigger_kind"].append(TRIGGER_STR)
+        else:
+            cols["card_trigger"].append(st.add(json.dumps(c.trigger, ensure_ascii=False)))
+            cols["card_trigger_kind"].append(TRIGGER_JSON)
+
+        cols["tag_str"].extend(st.add(t) for t in c.tags)
+        cols["tag_ptr"].append(len(cols["tag_str"]))
+        cols["caut_str"].extend(st.add(str(x)) for x in (c.cautions or []))
+        cols["caut_ptr"].append(len(cols["caut_str"]))
+
+        for cond in c.conditions or ():
+            kind, val = _encode_value(st, cond.value)
+            cols["cond_field"].append(st.add(cond.field))
+            cols["cond_op"].append(_OPS.index(cond.op))
+            cols["cond_kind"].append(kind)
+            cols["cond_val"].append(val)
+        cols["cond_ptr"].append(len(cols["cond_field"]))
+
+    for topic, nos in store.topic_nos.items():
+        cols["topic_str"].append(st.add(topic))
+        cols["topic_nos"].extend(nos.tolist())
+        cols["topic_ptr"].append(len(cols["topic_nos"]))
+
+    for tok, w in store.idf.items():
+        cols["idf_tok"].append(st.add(tok))
+        cols["idf_val"].append(w)
+
+    for tok, nos in store.postings.items():
+        cols["post_tok"].append(st.add(tok))
+        cols["post_nos"].extend(nos.tolist())
+        cols["post_ptr"].append(len(cols["post_nos"]))
+
+    for (fld, value), nos in store.trigger_index.items():
+        kind, val = _encode_value(st, value)
+        cols["ti_field"].append(st.add(fld))
+        cols["ti_kind"].append(kind)
+        cols["ti_val"].append(val)
+        cols["ti_nos"].extend(nos.tolist())
+        cols["ti_ptr"].append(len(cols["ti_nos"]))
+
+    cols["cluster_ids"] = store.cluster_ids.tolist()
+    cols["dedup_threshold"] = [store.dedup_threshold]
+
+    m = store.tag_matrix
+    cols["tm_terms"] = [st.add(t) for t in m.terms()]
+    source_idx = st.add(store.source)
+
+    text = "".join(st.items)
+    offs = [0]
+    for s in st.items:
+        offs.append(offs[-1] + len(s))
+    cols["str_offs"] = offs
+
+    arrays = []
+    for name, dtype in _ARRAYS:
+        if name == "str_blob":
+            arrays.append(np.frombuffer(text.encode("utf-8"), dtype=np.uint8))
+        elif name in ("tm_indptr", "tm_indices", "tm_data"):
+            arrays.append(np.ascontiguousarray(getattr(m, name[3:]), dtype=dtype))
+        else:
+            arrays.append(np.asarray(cols[name], dtype=dtype))
+
+    # 디렉터리 + 8바이트 정렬 본문
+    body_start = _HEADER.size + _ENTRY.size * len(_ARRAYS)
+    pos = body_start
+    entries, chunks = [], []
+    for arr in arrays:
+        pad = (-pos) % 8
+        chunks.append(b"\0" * pad)
+        pos += pad
+        raw = arr.tobytes()
+        entries.append((pos, len(raw)))
+        chunks.append(raw)
+        pos += len(raw)
+    body = b"".join(chunks)
+
+    size, mtime_ns = _fingerprint(source_path)
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, len(_ARRAYS), len(store.cards),
+        size, mtime_ns, zlib.crc32(body), source_idx,
+    )
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_path.with_suffix(out_path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(header)
+        for off, nbytes in entries:
+            f.write(_ENTRY.pack(off, nbytes))
+        f.write(body)
+    tmp.replace(out_path)
+
+    return {"path": str(out_path), "cards": len(store.cards), "strings": len(st.items), "bytes": out_path.stat().st_size}
+
+
+# ============ 읽기 (부팅) ============
+
+def read_snapshot(path: Union[str, Path], source_path: Optional[Union[str, Path]] = None) -> RuleCardStore:
+    """
+    스냅샷 → RuleCardStore
+
+    Raises:
+        SnapshotStale: source_path의 (크기, mtime)가 빌드 당시와 다름
+        SnapshotError: 매직/버전/체크섬 불일치
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        (magic, version, n_arrays, n_cards,
+         src_size, src_mtime_ns, crc, source_idx) = _HEADER.unpack_from(mm, 0)
+    except struct.error:
+        raise SnapshotError("헤더 손상")
+    if magic != MAGIC:
+        raise SnapshotError(f"잘못된 매직: {magic!r}")
+    if version != FORMAT_VERSION or n_arrays != len(_ARRAYS):
+        raise SnapshotError(f"지원하지 않는 버전: {version}")
+    if source_path and (src_size, src_mtime_ns) != _fingerprint(source_path):
+        raise SnapshotStale(f"원본 변경됨: {source_path}")
+
+    body_start = _HEADER.size + _ENTRY.size * n_arrays
+    if zlib.crc32(memoryview(mm)[body_start:]) != crc:
+        raise SnapshotError("체크섬 불일치 (파일 손상)")
+
+    a: Dict[str, np.ndarray] = {}
+    for i, (name, dtype) in enumerate(_ARRAYS):
+        off, nbytes = _ENTRY.unpack_from(mm, _HEADER.size + i * _ENTRY.size)
+        dt = np.dtype(dtype)
+        a[name] = np.frombuffer(mm, dtype=dt, count=nbytes // dt.itemsize, offset=off)
+
+    # 객체 수만 개를 만드는 동안 순환 GC 정지 (순환 참조 없는 객체 - GC 패스가 로드 시간의 ~40%)
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        store = _build_store(a, source_idx, str(source_path or path))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    store._snapshot_mmap = mm  # 번호 열 / tag_matrix 배열이 mmap 버퍼를 참조
+    return store
+
+
+def _build_store(a: Dict[str, "np.ndarray"], source_idx: int, store_path: str) -> RuleCardStore:
+    """배열 → RuleCard 객체 + store 인덱스 (파싱/정규화/IDF 재계산 없음)"""
+    text = a["str_blob"].tobytes().decode("utf-8")
+    offs = a["str_offs"].tolist()
+    S = [text[offs[i]:offs[i + 1]] for i in range(len(offs) - 1)]
+
+    def opt(i: int) -> Optional[str]:
+        return None if i < 0 else S[i]
+
+    tag_ptr, tag_str = a["tag_ptr"].tolist(), a["tag_str"].tolist()
+    caut_ptr, caut_str = a["caut_ptr"].tolist(), a["caut_str"].tolist()
+    cond_ptr = a["cond_ptr"].tolist()
+    cond_field, cond_op = a["cond_field"].tolist(), a["cond_op"].tolist()
+    cond_kind, cond_val = a["cond_kind"].tolist(), a["cond_val"].tolist()
+
+    def value(kind: int, val: float) -> Any:
+        if kind == KIND_STR:
+            return S[int(val)]
+        if kind == KIND_BOOL:
+            return bool(val)
+        return int(val) if kind == KIND_INT else val
+
+    make_cond = TriggerCond._make
+    conds = [
+        make_cond((S[fld], _OPS[op], value(kind, val)))
+        for fld, op, kind, val in zip(cond_field, cond_op, cond_kind, cond_val)
+    ]
+
+    cards: List[RuleCard] = []
+    columns = zip(
+        a["card_id"].tolist(), a["card_topic"].tolist(), a["card_priority"].tolist(),
+        a["card_mechanism"].tolist(), a["card_interpretation"].tolist(), a["card_action"].tolist(),
+        a["card_subtopic"].tolist(), a["card_trigger"].tolist(), a["card_trigger_kind"].tolist(),
+    )
+    for no, (cid, topic, prio, mech, interp, action, sub, trig, trig_kind) in enumerate(columns):
+        if trig_kind == TRIGGER_JSON:
+            trigger: Any = json.loads(S[trig])
+        else:
+            trigger = opt(trig)
+        cards.append(RuleCard(
+            id=S[cid],
+            topic=S[topic],
+            tags=[S[j] for j in tag_str[tag_ptr[no]:tag_ptr[no + 1]]],
+            priority=prio,
+            trigger=trigger,
+            mechanism=opt(mech),
+            interpretation=opt(interp),
+            action=opt(action),
+            cautions=[S[j] for j in caut_str[caut_ptr[no]:caut_ptr[no + 1]]],
+            meta={"subtopic": S[sub]} if sub >= 0 else None,
+            conditions=tuple(conds[cond_ptr[no]:cond_ptr[no + 1]]),
+        ))
+
+    store = RuleCardStore(path=store_path)
+    store.cards = cards
+    store.source = S[source_idx]
+    store.card_no = {c.id: no for no, c in enumerate(cards)}
+
+    # 카드 번호/priority 열은 mmap 뷰 그대로 (복사 없음 - 워커 간 페이지 캐시 공유)
+    store.priorities = a["card_priority"]
+    topic_ptr, topic_nos = a["topic_ptr"].tolist(), a["topic_nos"]
+    store.topic_rank = np.zeros(len(cards), dtype=np.int32)
+    for i, t in enumerate(a["topic_str"].tolist()):
+        nos = topic_nos[topic_ptr[i]:topic_ptr[i + 1]]
+        store.topic_nos[S[t]] = nos
+        store.by_topic[S[t]] = [cards[no] for no in nos.tolist()]
+        store.topic_rank[nos] = np.arange(len(nos), dtype=np.int32)
+
+    store.idf = dict(zip((S[t] for t in a["idf_tok"].tolist()), a["idf_val"].tolist()))
+
+    post_ptr, post_nos = a["post_ptr"].tolist(), a["post_nos"]
+    store.postings = {
+        S[t]: post_nos[post_ptr[i]:post_ptr[i + 1]]
+        for i, t in enumerate(a["post_tok"].tolist())
+    }
+
+    store.tag_matrix = CardMatrix.from_arrays(
+        [S[t] for t in a["tm_terms"].tolist()], a["tm_indptr"], a["tm_indices"], a["tm_data"],
+    )
+    ti_ptr, ti_nos = a["ti_ptr"].tolist(), a["ti_nos"]
+    ti_keys = zip(a["ti_field"].tolist(), a["ti_kind"].tolist(), a["ti_val"].tolist())
+    store.trigger_index = {
+        (S[fld], value(kind, val)): ti_nos[ti_ptr[i]:ti_ptr[i + 1]]
+        for i, (fld, kind, val) in enumerate(ti_keys)
+    }
+
+    from app.config import get_settings
+    threshold = get_settings().rulecards_dedup_threshold
+    if float(a["dedup_threshold"][0]) == threshold:
+        store.set_clusters(a["cluster_ids"], threshold)
+    else:
+        store.build_clusters(threshold)  # 스냅샷 생성 후 threshold 변경
+    return store
+
+
+def load_rulecard_store(source_path: Union[str, Path]) -> RuleCardStore:
+    """
+    부팅용 로더: 스냅샷이 최신이면 mmap 로드, 아니면 원본(SQLite/JSONL)에서 로드
+
+    원본 경로 확장자 .db → load_from_sqlite_master, 그 외 → JSONL
+    """
+    from app.config import get_settings
+    settings = get_settings()
+    source_path = Path(source_path)
+
+    if settings.rulecards_snapshot_enabled:
+        snap = Path(settings.rulecards_snapshot_path or default_snapshot_path(source_path))
+        if snap.exists():
+            t0 = time.perf_counter()
+            try:
+                store = read_snapshot(snap, source_path)
+                logger.info(
+                    f"[RuleCardSnapshot] ✅ {snap.name}: {len(store.cards)}장 "
+                    f"({(time.perf_counter() - t0) * 1000:.1f}ms)"
+                )
+                return store
+            except SnapshotStale as e:
+                logger.warning(f"[RuleCardSnapshot] {e} → 원본 로드 (tools/build_rulecards_snapshot.py 재실행 필요)")
+            except (SnapshotError, OSError, ValueError) as e:
+                logger.error(f"[RuleCardSnapshot] 로드 실패: {e} → 원본 로드")
+
+    t0 = time.perf_counter()
+    if source_path.suffix == ".db":
+        store = RuleCardStore.load_from_sqlite_master(str(source_path))
+    else:
+        store = RuleCardStore(str(source_path))
+        store.load()
+    logger.info(f"[RuleCardSnapshot] 원본 로드 {source_path.name}: {(time.perf_counter() - t0) * 1000:.1f}ms")
+    return store
@@ -1,53 +1,182 @@
 ﻿from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Dict, List, Set, Optional, Any
-import json, os, math, logging, sqlite3
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Set, Optional, Any, Tuple
+import hashlib, json, os, math, logging, sqlite3, sys, threading
 from pathlib import Path
 
+import numpy as np
+
+from .card_matrix import CardMatrix
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _int_array(nos: List[int]) -> "np.ndarray":
+    """카드 번호 목록 → int32 배열 (공유 페이지에 Python int 객체를 두지 않음)"""
+    return np.asarray(nos, dtype=np.int32)
+
+
+class TriggerCond(NamedTuple):
+    """
+    파싱된 트리거 조건 1개
+
+    op:
+    - "eq": 문자열/숫자 값        {"month": "인월"}        → ("month", "eq", "인월")
+    - "in": 리스트 원소           {"elements": ["목","금"]} → ("elements", "in", "목"), ...
+    - "is": 불리언                {"exists": true}          → ("exists", "is", True)
+    중첩 dict는 "상위.하위" 필드로 펼침 ({"presence": {"겁제": true}} → ("presence.겁제", "is", True)).
+    리스트 트리거는 field "", JSON이 아닌 문자열은 ("", "eq", 원문).
+    """
+    field: str
+    op: str
+    value: Any
+
+    @property
+    def is_keyword(self) -> bool:
+        """MatchModule 키워드 매칭 대상 (최상위 문자열 값 / 리스트 원소)"""
+        return self.op in ("eq", "in") and isinstance(self.value, str) and "." not in self.field
+
+
+def _flatten_trigger(prefix: str, obj: Dict[str, Any], out: List[TriggerCond]) -> None:
+    for k, v in obj.items():
+        f = f"{prefix}.{k}" if prefix else str(k)
+        if isinstance(v, dict):
+            _flatten_trigger(f, v, out)
+        elif isinstance(v, list):
+            out.extend(TriggerCond(f, "in", x) for x in v if x is not None and not isinstance(x, (dict, list)))
+        elif isinstance(v, bool):
+            out.append(TriggerCond(f, "is", v))
+        elif v is not None:
+            out.append(TriggerCond(f, "eq", v))
+
+
+def parse_trigger(raw: Any) -> Tuple[TriggerCond, ...]:
+    """trigger 원본 (dict / list / JSON 문자열) → 조건 튜플 (로드 시 1회)"""
+    if raw is None or raw == "" or raw == {}:
+        return ()
+    if isinstance(raw, str):
+        try:
+            raw = json.loads(raw)
+        except Exception:
+            return (TriggerCond("", "eq", raw),)
+    out: List[TriggerCond] = []
+    if isinstance(raw, dict):
+        _flatten_trigger("", raw, out)
+    elif isinstance(raw, list):
+        out.extend(TriggerCond("", "in", x) for x in raw if x is not None and not isinstance(x, (dict, list)))
+    elif isinstance(raw, str):
+        out.append(TriggerCond("", "eq", raw))
+    return tuple(out)
+
+
 class RuleCard:
     """
-    RuleCard 데이터클래스
-    - content dict 기반 접근을 위한 property 포함
+    RuleCard (__slots__ - 카드당 __dict__ / content dict / meta dict 없음)
+
+    - 본문(mechanism/interpretation/action/cautions)은 속성에 1벌만 보관,
+      content는 요청 시 만드는 읽기 전용 뷰 (생성자의 content=는 빈 필드 보충용)
+    - tags / cautions는 tuple, 태그 문자열은 sys.intern → 같은 태그는 카드 간 공유
+    - meta는 비어 있지 않을 때만 보관 (subtopic)
     """
-    id: str
-    topic: str
-    tags: List[str]
-    priority: float = 0.0
-    trigger: Optional[str] = None
-    mechanism: Optional[str] = None
-    interpretation: Optional[str] = None
-    action: Optional[str] = None
-    cautions: Optional[List[str]] = None
-    content: Dict[str, Any] = field(default_factory=dict)
-    meta: Dict[str, Any] = field(default_factory=dict)
+    __slots__ = (
+        "id", "topic", "tags", "priority", "trigger",
+        "mechanism", "interpretation", "action", "cautions",
+        "conditions", "_meta",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        topic: str,
+        tags: Iterable[str],
+        priority: float = 0.0,
+        trigger: Any = None,
+        mechanism: Optional[str] = None,
+        interpretation: Optional[str] = None,
+        action: Optional[str] = None,
+        cautions: Optional[Iterable[str]] = None,
+        content: Optional[Dict[str, Any]] = None,
+        meta: Optional[Dict[str, Any]] = None,
+        conditions: Optional[Tuple[TriggerCond, ...]] = None,  # None이면 store 인덱싱 시 trigger에서 파싱
+    ):
+        if content:
+            mechanism = mechanism or content.get("mechanism", mechanism)
+            interpretation = interpretation or content.get("interpretation", interpretation)
+            action = action or content.get("action", action)
+            cautions = cautions or content.get("cautions", cautions)
+        if cautions is not None and not isinstance(cautions, (list, tuple)):
+            cautions = [cautions] if cautions else []
+
+        self.id = id
+        self.topic = sys.intern(topic) if isinstance(topic, str) else topic
+        self.tags = tuple(sys.intern(t) if isinstance(t, str) else t for t in tags or ())
+        self.priority = priority
+        self.trigger = trigger
+        self.mechanism = mechanism
+        self.interpretation = interpretation
+        self.action = action
+        self.cautions = tuple(cautions) if cautions is not None else None
+        self.conditions = conditions
+        self._meta = dict(meta) if meta else None
+
+    @property
+    def content(self) -> Dict[str, Any]:
+        return {
+            "interpretation": self.interpretation or "",
+            "mechanism": self.mechanism or "",
+            "action": self.action or "",
+            "cautions": list(self.cautions or ()),
+        }
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        return self._meta if self._meta is not None else {}
 
     # property로 content dict 접근 지원 (getattr 대응)
     @property
     def content_mechanism(self) -> str:
-        return self.mechanism or (self.content or {}).get("mechanism", "") or ""
+        return self.mechanism or ""
 
     @property
     def content_interpretation(self) -> str:
-        return self.interpretation or (self.content or {}).get("interpretation", "") or ""
+        return self.interpretation or ""
 
     @property
     def content_action(self) -> str:
-        return self.action or (self.content or {}).get("action", "") or ""
+        return self.action or ""
 
     @property
     def content_cautions(self) -> List[str]:
-        if self.cautions:
-            return self.cautions if isinstance(self.cautions, list) else [self.cautions]
-        v = (self.content or {}).get("cautions", [])
-        return v if isinstance(v, list) else ([v] if v else [])
+        return list(self.cautions or ())
 
     @property
     def subtopic(self) -> str:
-        return (self.meta or {}).get("subtopic", "") or ""
+        return (self._meta or {}).get("subtopic", "") or ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """기존 dataclass __dict__와 같은 키 (선택 결과 / 디버그 JSON) - conditions(파싱된 트리거)는 내부용이라 제외"""
+        return {
+            "id": self.id,
+            "topic": self.topic,
+            "tags": list(self.tags),
+            "priority": self.priority,
+            "trigger": self.trigger,
+            "mechanism": self.mechanism,
+            "interpretation": self.interpretation,
+            "action": self.action,
+            "cautions": list(self.cautions) if self.cautions is not None else None,
+            "content": self.content,
+            "meta": dict(self.meta),
+        }
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, RuleCard):
+            return NotImplemented
+        return all(getattr(self, k) == getattr(other, k) for k in self.__slots__)
+
+    __hash__ = None  # dataclass(eq=True)와 같이 unhashable
+
+    def __repr__(self) -> str:
+        return f"RuleCard(id={self.id!r}, topic={self.topic!r}, tags={list(self.tags)!r}, priority={self.priority!r})"
 
 
 TAG_NORMALIZE = {
@@ -82,18 +211,47 @@ def safe_priority(p) -> float:
 
 
 class RuleCardStore:
-    """JSONL/SQLite 룰카드 로드 + 토픽 인덱스 + IDF"""
+    """
+    JSONL/SQLite 룰카드 로드 + 토픽 인덱스 + IDF + 태그 역색인
+
+    역색인 (카드 번호 = self.cards 인덱스):
+    - postings[token]: 토큰(태그를 explode_tag_tokens로 편 것)을 가진 카드 번호 오름차순
+    - topic_rank[no]: by_topic[card.topic] 안에서의 순위 (priority 내림차순)
+    - topic_nos[topic]: by_topic[topic]과 같은 순서의 카드 번호
+    - priorities[no]: 카드 priority 열
+    - tag_matrix: 카드 × 원본 태그 CSR (RuleCardScorer 섹션 일괄 채점, numpy 없으면 None)
+    - trigger_index[(field, value)]: 해당 트리거 조건을 가진 카드 번호
+      예: ("day_master", "병화"), ("month", "인월"), ("exists", True)
+
+    카드 번호 목록/열은 전부 int32/float64 numpy 배열 (스냅샷 로드 시 mmap 뷰).
+    요청 경로는 이 배열만 읽고 RuleCard 객체는 선택된 카드만 건드림
+    → 워커 간 공유 페이지(preload fork / mmap)에 refcount 쓰기가 생기지 않음.
+    """
 
     def __init__(self, path: str = None, cards: List[RuleCard] = None):
         self.path = path
         self.cards: List[RuleCard] = cards or []
         self.by_topic: Dict[str, List[RuleCard]] = {}
         self.idf: Dict[str, float] = {}
+        self.postings: Dict[str, "np.ndarray"] = {}
+        self.card_no: Dict[str, int] = {}
+        self.topic_rank: "np.ndarray" = _int_array([])
+        self.topic_nos: Dict[str, "np.ndarray"] = {}
+        self.priorities: "np.ndarray" = np.zeros(0)
+        self.tag_matrix: Optional[CardMatrix] = None
+        self.trigger_index: Dict[Tuple[str, Any], "np.ndarray"] = {}
+        # 유사 중복 클러스터 (rulecard_dedup): 카드별 cluster_id, 2장 이상 클러스터 카드만 dict로
+        self.cluster_ids: "np.ndarray" = _int_array([])
+        self.cluster_of: Dict[int, int] = {}
+        self.cluster_size: Dict[int, int] = {}
+        self.dedup_threshold: float = 0.0
         self.source: str = "unknown"
+        self.version: str = ""  # content_hash() - RuleCardRegistry가 설치 시 채움
+        self._fts: Any = None  # RuleCardFTS (첫 search에서 생성), False = 사용 불가
+        self._fts_lock = threading.Lock()
         
         if cards:
-            self.by_topic = self._build_topic_index(cards)
-            self.idf = self._build_idf(cards)
+            self._build_indexes(cards)
 
     @classmethod
     def load_from_sqlite_master(cls, db_path: str) -> "RuleCardStore":
@@ -149,26 +307,17 @@ class RuleCardStore:
             except:
                 cautions = []
 
-            # content dict 구성
-            content = {
-                "interpretation": r["interpretation"] or "",
-                "mechanism": r["mechanism"] or "",
-                "action": r["action"] or "",
-                "cautions": cautions,
-            }
-
             cards.append(RuleCard(
                 id=r["id"],
                 topic=r["topic"] or "GENERAL",
                 priority=safe_priority(r["priority"]),
-                trigger=json.dumps(trigger_obj) if trigger_obj else None,
+                trigger=r["trigger_json"] if trigger_obj else None,  # 원문 그대로 (재직렬화 없음)
+                conditions=parse_trigger(trigger_obj),
                 tags=[canon_tag(x) for x in tags if x],
                 mechanism=r["mechanism"] or "",
                 interpretation=r["interpretation"] or "",
                 action=r["action"] or "",
                 cautions=cautions,
-                content=content,
-                meta={"trigger": trigger_obj},
             ))
 
         store = cls(path=db_path, cards=cards)
@@ -225,34 +374,166 @@ class RuleCardStore:
                 if not isinstance(cautions, list):
                     cautions = [cautions] if cautions else []
 
-                content = {
-                    "interpretation": obj.get("interpretation", ""),
-                    "mechanism": obj.get("mechanism", ""),
-                    "action": obj.get("action", ""),
-                    "cautions": cautions,
-                }
-
                 cards.append(RuleCard(
                     id=obj["id"],
                     topic=obj["topic"],
                     tags=[canon_tag(x) for x in tags],
                     priority=safe_priority(obj.get("priority", 0)),
                     trigger=obj.get("trigger"),
+                    conditions=parse_trigger(obj.get("trigger")),
                     mechanism=obj.get("mechanism"),
                     interpretation=obj.get("interpretation"),
                     action=obj.get("action"),
                     cautions=cautions,
-                    content=content,
-                    meta={},
                 ))
 
         self.cards = cards
-        self.by_topic = self._build_topic_index(cards)
-        self.idf = self._build_idf(cards)
+        self._build_indexes(cards)
         self.source = "jsonl"
         logger.info(f"[RuleCardStore] ✅ JSONL 로드: {len(cards)}장 (스킵: {skipped})")
         print(f"✅ RuleCards loaded from jsonl: {len(cards)}")
 
+    def _build_indexes(self, cards: List[RuleCard]) -> None:
+        self.card_no = {c.id: no for no, c in enumerate(cards)}
+        self.by_topic = self._build_topic_index(cards)
+        no_of = {id(c): no for no, c in enumerate(cards)}  # id 중복 카드도 구분
+        self.topic_rank = _int_array([0] * len(cards))
+        self.topic_nos = {}
+        for topic, pool in self.by_topic.items():
+            nos = _int_array([no_of[id(c)] for c in pool])
+            self.topic_rank[nos] = np.arange(len(nos), dtype=np.int32)
+            self.topic_nos[topic] = nos
+        self.priorities = np.array([c.priority for c in cards], dtype=np.float64)
+
+        postings: Dict[str, List[int]] = {}
+        for no, c in enumerate(cards):
+            for t in self.tokens_of(c):
+                postings.setdefault(t, []).append(no)  # no 오름차순으로 쌓임
+        self.postings = {t: _int_array(nos) for t, nos in postings.items()}
+        self.idf = self._build_idf(cards)
+        self.tag_matrix = CardMatrix([c.tags for c in cards])
+        self._build_trigger_index(cards)
+        self.build_clusters()
+
+    def build_clusters(self, threshold: Optional[float] = None) -> None:
+        """해석 MinHash/LSH로 유사 중복 클러스터 계산 (threshold 생략 시 설정값)"""
+        from app.config import get_settings
+        from app.services.rulecard_dedup import card_text, find_clusters
+        if threshold is None:
+            threshold = get_settings().rulecards_dedup_threshold
+        ids = find_clusters([card_text(c) for c in self.cards], threshold)
+        self.set_clusters(ids, threshold)
+
+    def set_clusters(self, cluster_ids: "np.ndarray", threshold: float) -> None:
+        """cluster_ids 설치 + 요청 경로용 dict (중복 카드만 - 보통 수십 장)"""
+        self.cluster_ids = cluster_ids
+        self.dedup_threshold = float(threshold)
+        counts = np.bincount(cluster_ids, minlength=len(cluster_ids)) if len(cluster_ids) else cluster_ids
+        multi = np.flatnonzero(counts[cluster_ids] > 1) if len(cluster_ids) else cluster_ids
+        self.cluster_of = dict(zip(multi.tolist(), cluster_ids[multi].tolist()))
+        self.cluster_size = {cid: int(counts[cid]) for cid in set(self.cluster_of.values())}
+
+    def _build_trigger_index(self, cards: List[RuleCard]) -> None:
+        trigger_index: Dict[Tuple[str, Any], List[int]] = {}
+        for no, c in enumerate(cards):
+            if c.conditions is None:
+                c.conditions = parse_trigger(c.trigger)
+            for cond in c.conditions:
+                plist = trigger_index.setdefault((cond.field, cond.value), [])
+                if not plist or plist[-1] != no:  # 같은 카드의 중복 조건은 1회
+                    plist.append(no)
+        self.trigger_index = {k: _int_array(nos) for k, nos in trigger_index.items()}
+
+    def cards_with_trigger(self, field: str, value: Any) -> List[RuleCard]:
+        """트리거 조건 field == value (리스트면 원소 포함) 카드 - 해시 1회 조회"""
+        nos = self.trigger_index.get((field, value))
+        return [] if nos is None else [self.cards[no] for no in nos.tolist()]
+
+    @staticmethod
+    def tokens_of(card: RuleCard) -> FrozenSet[str]:
+        """카드 태그 → 매칭 토큰 집합 (선택된 카드에만 쓰므로 저장하지 않고 계산)"""
+        return frozenset(x for t in card.tags for x in explode_tag_tokens(t))
+
+    def score_tokens(self, tokens: Iterable[str]) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        주어진 토큰의 posting만 모아 카드별 누적 (dense, 길이 = 카드 수)
+
+        Returns:
+            (겹친 토큰 수 int64, 겹친 토큰 IDF 합 float64)
+        """
+        n = len(self.cards)
+        lists, weights = [], []
+        for t in set(tokens):
+            plist = self.postings.get(t)
+            if plist is None or not len(plist):
+                continue
+            lists.append(plist)
+            weights.append(np.full(len(plist), self.idf.get(t, 1.0)))
+        if not lists:
+            return np.zeros(n, dtype=np.int64), np.zeros(n, dtype=np.float64)
+        nos = np.concatenate(lists)
+        return (
+            np.bincount(nos, minlength=n),
+            np.bincount(nos, weights=np.concatenate(weights), minlength=n),
+        )
+
+    def accumulate(self, tokens: Iterable[str]) -> Dict[int, List[float]]:
+        """
+        sparse accumulator - 주어진 토큰의 posting만 순회
+
+        Returns:
+            {카드 번호: [겹친 토큰 수, 겹친 토큰 IDF 합]} (겹침 없는 카드는 없음)
+        """
+        overlap, score = self.score_tokens(tokens)
+        hit = np.flatnonzero(overlap)
+        return {
+            no: [o, w]
+            for no, o, w in zip(hit.tolist(), overlap[hit].tolist(), score[hit].tolist())
+        }
+
+    def search(self, query: str, topics: Optional[Iterable[str]] = None, k: int = 50) -> List[Tuple[int, float]]:
+        """
+        자유 문장 전문검색 (FTS5 bm25) → [(카드 번호, 점수)], 점수 작을수록 관련도 높음
+
+        FTS5가 없거나 꺼져 있으면 [] (호출부는 기존 태그 선택만 사용)
+        """
+        if not query or not self.open_search():
+            return []
+        try:
+            return self._fts.search(query, topics=list(topics) if topics else None, k=k)
+        except sqlite3.Error as e:
+            logger.warning(f"[RuleCardStore] FTS 검색 실패: {e}")
+            return []
+
+    def open_search(self) -> bool:
+        """FTS 색인 열기 (없거나 버전이 다르면 생성, 1회) → 사용 가능 여부"""
+        if self._fts is None:
+            with self._fts_lock:
+                if self._fts is None:
+                    self._fts = self._open_fts()
+        return bool(self._fts)
+
+    def _open_fts(self) -> Any:
+        from app.config import get_settings
+        if not get_settings().rulecards_fts_enabled or not self.cards:
+            return False
+        try:
+            from app.services.rulecards_fts import RuleCardFTS
+            return RuleCardFTS.open_for(self)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"[RuleCardStore] FTS 색인 사용 불가: {e} → 전문검색 끔")
+            return False
+
+    def content_hash(self) -> str:
+        """카드 내용 해시 12자 (로드 경로와 무관 - 스냅샷/원본이 같은 값)"""
+        h = hashlib.sha1()
+        for c in self.cards:
+            h.update(repr((
+                c.id, c.topic, c.priority, c.tags, c.trigger,
+                c.mechanism, c.interpretation, c.action, c.cautions, c.subtopic,
+            )).encode("utf-8"))
+        return h.hexdigest()[:12]
+
     def _build_topic_index(self, cards: List[RuleCard]) -> Dict[str, List[RuleCard]]:
         m: Dict[str, List[RuleCard]] = {}
         for c in cards:
@@ -262,15 +543,9 @@ class RuleCardStore:
         return m
 
     def _build_idf(self, cards: List[RuleCard]) -> Dict[str, float]:
-        df: Dict[str, int] = {}
+        """df = posting 길이 (_build_indexes에서 postings 먼저 생성)"""
         N = len(cards)
-        for c in cards:
-            token_set: Set[str] = set()
-            for t in c.tags:
-                for x in explode_tag_tokens(t):
-                    token_set.add(x)
-            for t in token_set:
-                df[t] = df.get(t, 0) + 1
+        df = {t: len(plist) for t, plist in self.postings.items()}
 
         idf: Dict[str, float] = {}
         for t, d in df.items():
@@ -6,6 +6,7 @@
 - 🔥 대운 간지 리스트 생성 (월주 기준)
 """
 import logging
+from datetime import date
 from typing import Optional, List
 from dataclasses import dataclass
 
@@ -22,6 +23,8 @@ from app.services.engine_v2 import (
     JI_TO_ELEMENT,
     DAY_MASTER_DESC
 )
+from app.services.ganji import calculate_many, NUMPY_AVAILABLE
+from app.services.saju_lookup import LookupHit, get_saju_lookup
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -75,6 +78,26 @@ def calc_daeun_pillars(month_ganji: str, direction: str, count: int = 10) -> Lis
     return out
 
 
+_PILLARS: List[Pillar] = []
+
+
+def _pillars_by_index() -> List[Pillar]:
+    """60갑자 인덱스 → Pillar 원본 (한 번 만들어 둠 - 응답에는 model_copy()로 넘김)"""
+    if not _PILLARS:
+        for idx in range(60):
+            gan, ji = GAN[idx % 10], JI[idx % 12]
+            _PILLARS.append(Pillar(
+                gan=gan,
+                ji=ji,
+                ganji=gan + ji,
+                gan_element=GAN_TO_ELEMENT[gan],
+                ji_element=JI_TO_ELEMENT[ji],
+                gan_index=idx % 10,
+                ji_index=idx % 12
+            ))
+    return _PILLARS
+
+
 @dataclass
 class CalculationResult:
     """계산 결과"""
@@ -131,7 +154,12 @@ class SajuEngine:
         use_solar_time: bool = True,
         current_age: Optional[int] = None
     ) -> CalculationResult:
-        """비동기 사주 계산 (KASI → ephem fallback)"""
+        """비동기 사주 계산 (전수 조회 테이블 → KASI → ephem fallback)"""
+        lookup = get_saju_lookup()
+        hit = lookup.lookup(year, month, day, hour, minute, use_solar_time) if lookup else None
+        if hit is not None:
+            return self._from_lookup(hit, hour, gender, timezone, current_age)
+        
         result = await self.manager.calculate(
             year=year, month=month, day=day,
             hour=hour, minute=minute,
@@ -139,6 +167,75 @@ class SajuEngine:
         )
         return self._to_calculation_result(result, hour, gender, timezone, current_age)
     
+    def calculate_batch(
+        self,
+        rows: List[dict],
+        use_solar_time: bool = True
+    ) -> List[Optional[CalculationResult]]:
+        """
+        배치 동기 계산 (ganji.calculate_many 벡터화 → 행별 결과 조립)
+        
+        Args:
+            rows: {"year", "month", "day", "hour", "minute", "gender", "timezone"} 리스트
+        
+        Returns:
+            입력 순서 그대로의 결과 리스트. 절입 인덱스 범위 밖 행은 None
+            (호출부에서 calculate_async로 개별 처리)
+        """
+        if not rows:
+            return []
+        if not NUMPY_AVAILABLE:
+            return [self._calculate_row_from_table(row, use_solar_time) for row in rows]
+        
+        cols = calculate_many(
+            [date(row["year"], row["month"], row["day"]) for row in rows],
+            [row.get("hour") for row in rows],
+            [row.get("minute", 0) for row in rows],
+            use_solar_time
+        )
+        c = {k: v.tolist() for k, v in cols.items()}
+        today = self.manager.get_today_string()
+        
+        results: List[Optional[CalculationResult]] = []
+        for i, row in enumerate(rows):
+            if not c["valid"][i]:
+                results.append(self._calculate_row_from_table(row, use_solar_time))
+                continue
+            
+            hour = row.get("hour")
+            if c["near_ipchun"][i]:
+                boundary_reason = "near_ipchun"
+            elif c["is_boundary"][i]:
+                boundary_reason = "near_term_change"
+            else:
+                boundary_reason = None
+            
+            # 만세력 테이블과 같은 절입 데이터 → 출처 표기도 동일
+            result = self.manager.assemble_result(
+                (c["year_gan"][i], c["year_ji"][i]),
+                (c["month_gan"][i], c["month_ji"][i]),
+                (c["day_gan"][i], c["day_ji"][i]),
+                (c["hour_gan"][i], c["hour_ji"][i]) if hour is not None else None,
+                "calendar_table", round(c["solar_longitude"][i], 2),
+                c["is_boundary"][i], boundary_reason, use_solar_time, today
+            )
+            results.append(self._to_calculation_result(
+                result, hour, row.get("gender"), row.get("timezone", "Asia/Seoul")
+            ))
+        return results
+    
+    def _calculate_row_from_table(self, row: dict, use_solar_time: bool) -> Optional[CalculationResult]:
+        result = self.manager.calculate_from_table(
+            row["year"], row["month"], row["day"],
+            row.get("hour"), row.get("minute", 0),
+            use_solar_time
+        )
+        if result is None:
+            return None
+        return self._to_calculation_result(
+            result, row.get("hour"), row.get("gender"), row.get("timezone", "Asia/Seoul")
+        )
+    
     def _to_calculation_result(
         self,
         result: dict,
@@ -188,6 +285,49 @@ class SajuEngine:
             quality=quality
         )
     
+    def _from_lookup(
+        self,
+        hit: LookupHit,
+        hour: Optional[int],
+        gender: Optional[str],
+        timezone: str,
+        current_age: Optional[int] = None
+    ) -> CalculationResult:
+        """조회 테이블 슬롯 → CalculationResult (원국은 미리 만든 Pillar 복사본, 대운만 계산)"""
+        # Pillar는 가변 모델 → 응답마다 얕은 복사 (호출부/미들웨어가 고쳐도 다른 응답에 번지지 않음)
+        pillars = _pillars_by_index()
+        day = pillars[hit.day_idx].model_copy()
+        month = pillars[hit.month_idx].model_copy()
+        
+        saju = SajuWonGuk(
+            year_pillar=pillars[hit.year_idx].model_copy(),
+            month_pillar=month,
+            day_pillar=day,
+            hour_pillar=pillars[hit.hour_idx].model_copy() if hit.hour_idx is not None and hour is not None else None
+        )
+        quality = QualityInfo(
+            has_birth_time=hour is not None,
+            solar_term_boundary=hit.is_boundary,
+            boundary_reason=hit.boundary_reason,
+            timezone=timezone,
+            calculation_method="calendar_table"  # 만세력 테이블에서 생성 → 출처 표기 동일
+        )
+        daeun = self._calc_daeun(
+            year_gan_idx=hit.year_idx % 10,
+            gender=gender,
+            month_pillar=month.ganji,
+            current_age=current_age
+        )
+        
+        return CalculationResult(
+            saju=saju,
+            day_master=day.gan,
+            day_master_element=GAN_TO_ELEMENT[day.gan],
+            day_master_description=DAY_MASTER_DESC[day.gan],
+            daeun=daeun,
+            quality=quality
+        )
+    
     def _to_pillar(self, pillar_data: dict) -> Pillar:
         """딕셔너리 → Pillar 객체 변환"""
         return Pillar(
@@ -0,0 +1,279 @@
+"""
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+🔎 사주 전수 조회 테이블 (날짜 × 시지 × 태양시 보정)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+날짜와 태양시 설정이 같으면 원국은 시지 12개 + "시간 모름" 13가지뿐.
+1900–2100 전체(약 7.3만 일 × 25 슬롯)를 tools/build_saju_lookup.py로 미리 계산해
+SajuEngine.calculate_async를 "슬롯 4바이트 조회 + 대운(성별/나이)"으로 만든다.
+
+슬롯 (하루 25개):
+- 0                     : 시간 모름 (12:00 기준 절입/경계 판정)
+- 1 + solar*12 + 시지   : solar=태양시 보정(-30분) 여부, 시지 0(자)~11(해)
+
+레코드 <BBBB: 년주 60갑자, 월주 60갑자, 시주 60갑자(255=없음), 플래그
+- FLAG_BOUNDARY / FLAG_NEAR_IPCHUN: 절기 경계 표시 (QualityInfo)
+- FLAG_SPLIT: 해당 시지 구간 안에서 절입/경계가 바뀜 → 분 단위 경로로 계산
+일주는 날짜만으로 정해지므로 헤더의 첫날 일주 + 경과일로 계산.
+
+본문은 zlib 압축 (대부분의 날은 25슬롯이 같은 패턴) → 로드 시 1회 해제.
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import logging
+import struct
+import zlib
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# ============ 포맷 상수 ============
+
+MAGIC = b"SJLU"
+FORMAT_VERSION = 1
+
+# magic, version, slots_per_day, first_ordinal, n_days, first_day_idx, raw_crc32, raw_len
+_HEADER = struct.Struct("<4sHHIIHII")
+_SLOT = struct.Struct("<BBBB")
+
+SLOTS_PER_DAY = 25
+NO_HOUR_SLOT = 0
+NO_HOUR = 255
+
+FLAG_BOUNDARY = 0x01
+FLAG_NEAR_IPCHUN = 0x02
+FLAG_SPLIT = 0x04
+
+DEFAULT_LOOKUP_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "saju_lookup_v1.bin"
+
+
+class SajuLookupError(Exception):
+    """조회 테이블 파일 오류"""
+    pass
+
+
+class LookupHit(NamedTuple):
+    """조회 결과 (60갑자 인덱스)"""
+    year_idx: int
+    month_idx: int
+    day_idx: int
+    hour_idx: Optional[int]
+    is_boundary: bool
+    boundary_reason: Optional[str]
+
+
+def hour_branch(hour: int, minute: int, use_solar_time: bool) -> int:
+    """engine_v2._build_result와 같은 시지 판정 (태양시면 -30분, 자정 넘김은 같은 날로)"""
+    adjusted = hour * 60 + minute
+    if use_solar_time:
+        adjusted = (adjusted - 30) % 1440
+    return ((adjusted // 60 + 1) // 2) % 12
+
+
+def slot_for(hour: Optional[int], minute: int, use_solar_time: bool) -> int:
+    if hour is None:
+        return NO_HOUR_SLOT
+    return 1 + (12 if use_solar_time else 0) + hour_branch(hour, minute, use_solar_time)
+
+
+def _slot_windows() -> List[Tuple[int, int]]:
+    """슬롯별 (가장 이른, 가장 늦은) 시계 분 - 시지 구간이 자정을 걸쳐도 같은 날짜 안에서"""
+    windows = [(720, 720)] * SLOTS_PER_DAY
+    for solar in (False, True):
+        seen: Dict[int, List[int]] = {}
+        for m in range(1440):
+            seen.setdefault(slot_for(m // 60, m % 60, solar), []).append(m)
+        for slot, minutes in seen.items():
+            windows[slot] = (minutes[0], minutes[-1])
+    return windows
+
+
+# ============ 런타임 리더 ============
+
+class SajuLookupTable:
+    """압축 해제된 슬롯 배열 (프로세스당 ~7MB, 조회는 unpack_from 1회)"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        blob = self.path.read_bytes()
+
+        (magic, version, slots, first_ordinal, n_days,
+         first_day_idx, crc, raw_len) = _HEADER.unpack_from(blob, 0)
+
+        if magic != MAGIC:
+            raise SajuLookupError(f"잘못된 매직: {magic!r}")
+        if version != FORMAT_VERSION:
+            raise SajuLookupError(f"지원하지 않는 버전: {version}")
+        if slots != SLOTS_PER_DAY:
+            raise SajuLookupError(f"슬롯 수 불일치: {slots}")
+
+        try:
+            body = zlib.decompress(blob[_HEADER.size:])
+        except zlib.error as e:
+            raise SajuLookupError(f"압축 해제 실패: {e}")
+        if len(body) != raw_len or len(body) != n_days * slots * _SLOT.size or zlib.crc32(body) != crc:
+            raise SajuLookupError("체크섬 불일치 (파일 손상)")
+
+        self.version = version
+        self.first_ordinal = first_ordinal
+        self.n_days = n_days
+        self.first_day_idx = first_day_idx
+        self.first_date = date.fromordinal(first_ordinal)
+        self.last_date = date.fromordinal(first_ordinal + n_days - 1)
+        self._body = body
+
+    def covers(self, year: int, month: int, day: int) -> bool:
+        return 0 <= date(year, month, day).toordinal() - self.first_ordinal < self.n_days
+
+    def lookup(
+        self,
+        year: int,
+        month: int,
+        day: int,
+        hour: Optional[int] = None,
+        minute: int = 0,
+        use_solar_time: bool = True,
+    ) -> Optional[LookupHit]:
+        """
+        Returns:
+            LookupHit, 범위 밖이거나 시지 구간 안에서 절입이 바뀌는 슬롯(FLAG_SPLIT)이면 None
+        """
+        pos = date(year, month, day).toordinal() - self.first_ordinal
+        if not 0 <= pos < self.n_days:
+            return None
+
+        slot = slot_for(hour, minute, use_solar_time)
+        y_idx, m_idx, h_idx, flags = _SLOT.unpack_from(
+            self._body, (pos * SLOTS_PER_DAY + slot) * _SLOT.size
+        )
+        if flags & FLAG_SPLIT:
+            return None
+
+        if flags & FLAG_NEAR_IPCHUN:
+            reason = "near_ipchun"
+        elif flags & FLAG_BOUNDARY:
+            reason = "near_term_change"
+        else:
+            reason = None
+
+        return LookupHit(
+            year_idx=y_idx,
+            month_idx=m_idx,
+            day_idx=(self.first_day_idx + pos) % 60,
+            hour_idx=None if h_idx == NO_HOUR else h_idx,
+            is_boundary=bool(flags & FLAG_BOUNDARY),
+            boundary_reason=reason,
+        )
+
+
+# ============ 빌더 (오프라인 전용) ============
+
+def build_lookup(out_path: Path, first_year: Optional[int] = None, last_year: Optional[int] = None) -> Dict[str, Any]:
+    """
+    만세력 테이블(get_calendar_table)로 전 슬롯 계산 → out_path
+
+    하루에 절입 전환·경계 진입/이탈은 각각 최대 1회이므로
+    시지 구간의 처음/끝 분 값이 같으면 구간 전체가 같다.
+    """
+    from app.services.calendar_table import get_calendar_table, sexagenary
+
+    table = get_calendar_table()
+    if table is None:
+        raise SajuLookupError("만세력 테이블 없음 - tools/build_calendar_table.py 먼저 실행")
+
+    first = date(first_year, 1, 1) if first_year else table.first_date
+    last = date(last_year, 12, 31) if last_year else table.last_date
+    first_ordinal = max(first.toordinal(), table.first_date.toordinal())
+    last_ordinal = min(last.toordinal(), table.last_date.toordinal())
+    n_days = last_ordinal - first_ordinal + 1
+
+    first_d = date.fromordinal(first_ordinal)
+    first_day_idx = table.get_day(first_d.year, first_d.month, first_d.day).day_idx
+
+    windows = _slot_windows()
+    body = bytearray(n_days * SLOTS_PER_DAY * _SLOT.size)
+    split_slots = 0
+
+    for pos in range(n_days):
+        d = date.fromordinal(first_ordinal + pos)
+        cache: Dict[int, Tuple[int, int, int]] = {}
+
+        def at(minute_of_day: int) -> Tuple[int, int, int]:
+            if minute_of_day not in cache:
+                r = table.get_ganji(d.year, d.month, d.day, minute_of_day // 60, minute_of_day % 60)
+                flags = 0
+                if r["is_boundary"]:
+                    flags |= FLAG_BOUNDARY
+                    if r["boundary_reason"] == "near_ipchun":
+                        flags |= FLAG_NEAR_IPCHUN
+                cache[minute_of_day] = (r["year_idx"], r["month_idx"], flags)
+            return cache[minute_of_day]
+
+        uniform = at(0) == at(1439)
+        day_gan = (first_day_idx + pos) % 60 % 10
+
+        for slot in range(SLOTS_PER_DAY):
+            start, end = windows[slot]
+            if slot == NO_HOUR_SLOT:
+                y_idx, m_idx, flags = at(720)
+                h_idx = NO_HOUR
+            else:
+                y_idx, m_idx, flags = at(0) if uniform else at(start)
+                if not uniform and at(end) != (y_idx, m_idx, flags):
+                    flags |= FLAG_SPLIT
+                    split_slots += 1
+                branch = (slot - 1) % 12
+                h_idx = sexagenary(((day_gan % 5) * 2 + branch) % 10, branch)
+            _SLOT.pack_into(body, (pos * SLOTS_PER_DAY + slot) * _SLOT.size, y_idx, m_idx, h_idx, flags)
+
+    raw = bytes(body)
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, SLOTS_PER_DAY, first_ordinal, n_days,
+        first_day_idx, zlib.crc32(raw), len(raw),
+    )
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = out_path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(zlib.compress(raw, 9))
+    tmp.replace(out_path)
+
+    return {
+        "path": str(out_path),
+        "days": n_days,
+        "slots": n_days * SLOTS_PER_DAY,
+        "split_slots": split_slots,
+        "bytes": out_path.stat().st_size,
+        "raw_bytes": len(raw),
+    }
+
+
+# ============ 싱글톤 ============
+
+_lookup: Optional[SajuLookupTable] = None
+_lookup_failed = False
+
+
+def get_saju_lookup() -> Optional[SajuLookupTable]:
+    """lazy 싱글톤 - 파일이 없거나 손상되면 None (호출부는 SajuManager 경로로 fallback)"""
+    global _lookup, _lookup_failed
+    if _lookup is not None or _lookup_failed:
+        return _lookup
+
+    from app.config import get_settings
+    path = Path(get_settings().saju_lookup_path or DEFAULT_LOOKUP_PATH)
+
+    try:
+        _lookup = SajuLookupTable(path)
+        logger.info(
+            f"[SajuLookup] 로드: {path.name} v{_lookup.version} "
+            f"({_lookup.first_date}~{_lookup.last_date}, {_lookup.n_days} days)"
+        )
+    except FileNotFoundError:
+        logger.warning(f"[SajuLookup] 파일 없음: {path} → SajuManager 사용")
+        _lookup_failed = True
+    except (SajuLookupError, ValueError, OSError, struct.error) as e:
+        logger.error(f"[SajuLookup] 로드 실패: {e} → SajuManager 사용")
+        _lookup_failed = True
+    return _lookup
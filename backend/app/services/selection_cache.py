@@ -0,0 +1,101 @@
+"""
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+🗂️ preset 카드 선택 캐시 (feature tag 서명 → 섹션별 카드 번호)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+boost_preset_focus + select_cards_for_preset 결과는 입력만으로 정해진다:
+- feature tag 집합 (기둥 + 설문에서 파생 - 설문 가중치는 태그로 반영됨)
+- preset 이름, store 버전 (content_hash - 핫 리로드 시 자연히 다른 키)
+- 질문 전문검색 식 (build_match_query - 없으면 "")
+같은 기둥/설문 조합이 많아 서명이 반복됨 → 두 함수를 건너뛰고 카드 번호만 다시 펼침.
+
+값은 섹션별 (key, title, meta, 카드 번호 tuple)만 - 카드 dict는 꺼낼 때마다 새로 만듦 (expand_selection)
+(호출부가 수정해도 캐시에 영향 없음). LRU, settings.selection_cache_max_size (0이면 끔)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+import hashlib
+import json
+import logging
+import threading
+import weakref
+from typing import Any, Dict, Iterable, List, Optional
+
+from cachetools import LRUCache
+
+from app.config import get_settings
+from app.services.focus_boost import boost_preset_focus
+from app.services.rulecard_selector import SectionPick, expand_selection, select_card_nos_for_preset
+from app.services.rulecards_fts import build_match_query
+from app.services.rulecards_store import RuleCardStore
+
+logger = logging.getLogger(__name__)
+
+# 레지스트리 밖에서 만든 store(version 빈 값)의 content_hash - store는 건드리지 않고 여기에만 기억
+_HASHES: "weakref.WeakKeyDictionary[RuleCardStore, str]" = weakref.WeakKeyDictionary()
+
+
+def _store_version(store: RuleCardStore) -> str:
+    if store.version:
+        return store.version
+    version = _HASHES.get(store)
+    if version is None:
+        version = _HASHES[store] = store.content_hash()
+    return version
+
+
+def selection_signature(store: RuleCardStore, preset_name: str, feature_tags: Iterable[str], query: str = "") -> str:
+    """선택 결과를 결정하는 입력의 안정 해시 (태그 순서/중복 무관)"""
+    key = [_store_version(store), preset_name, sorted(set(feature_tags)), build_match_query(query) if query else ""]
+    return hashlib.md5(json.dumps(key, ensure_ascii=False).encode()).hexdigest()
+
+
+class CardSelectionCache:
+    """서명 → 섹션별 카드 번호 (LRU)"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._cache: LRUCache = LRUCache(maxsize=max(max_size, 1))
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def select(
+        self,
+        store: RuleCardStore,
+        preset: Dict[str, Any],
+        feature_tags: List[str],
+        query: str = "",
+    ) -> Dict[str, Any]:
+        """select_cards_for_preset(store, boost_preset_focus(preset, tags), tags, query)와 같은 결과"""
+        if self.max_size <= 0:
+            return expand_selection(store, preset["name"], self._select(store, preset, feature_tags, query))
+
+        sig = selection_signature(store, preset["name"], feature_tags, query)
+        with self._lock:
+            sections: Optional[List[SectionPick]] = self._cache.get(sig)
+            self.stats["hits" if sections is not None else "misses"] += 1
+        if sections is None:
+            sections = self._select(store, preset, feature_tags, query)
+            with self._lock:
+                if sig not in self._cache and len(self._cache) >= self._cache.maxsize:
+                    self.stats["evictions"] += 1
+                self._cache[sig] = sections
+        return expand_selection(store, preset["name"], sections)
+
+    @staticmethod
+    def _select(store: RuleCardStore, preset: Dict[str, Any], feature_tags: List[str], query: str) -> List[SectionPick]:
+        return select_card_nos_for_preset(store, boost_preset_focus(preset, feature_tags), feature_tags, query)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": f"{(self.stats['hits'] / total * 100) if total else 0:.1f}%",
+            "size": len(self._cache),
+            "max_size": self.max_size,
+        }
+
+
+card_selection_cache = CardSelectionCache(get_settings().selection_cache_max_size)
@@ -2,11 +2,28 @@
 24절기 데이터 및 절입 시각 판정
 - 월주 계산의 핵심: 어느 절기 구간인지 판단
 - 입춘 기준 연주 보정
+- 절입 시각 인덱스 (1850~2149, 300년): ephem으로 한 번 만든 정렬 배열에 bisect
 """
-from datetime import datetime, date
-from typing import Tuple, Optional, Dict, List
+import bisect
+import logging
+import math
+import struct
+import sys
+import zlib
+from array import array
+from datetime import datetime, date, timedelta, timezone
+from pathlib import Path
+from typing import Tuple, Optional
 from dataclasses import dataclass
 
+try:
+    import ephem
+    EPHEM_AVAILABLE = True
+except ImportError:
+    EPHEM_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class SolarTermInfo:
@@ -37,110 +54,237 @@ SOLAR_TERMS_ENTRY = [
     SolarTermInfo("소한", 11, 1, 6),   # 축월 시작
 ]
 
-# 2020-2030년 정밀 절기 시각 (KST 기준)
-# 형식: (년, 월, 일, 시, 분)
-# 출처: 한국천문연구원 데이터 기반
-SOLAR_TERMS_PRECISE: Dict[int, List[Tuple[int, int, int, int, int]]] = {
-    2024: [
-        (2024, 2, 4, 17, 27),   # 입춘
-        (2024, 3, 5, 11, 23),   # 경칩
-        (2024, 4, 4, 16, 2),    # 청명
-        (2024, 5, 5, 9, 10),    # 입하
-        (2024, 6, 5, 13, 10),   # 망종
-        (2024, 7, 6, 23, 20),   # 소서
-        (2024, 8, 7, 9, 9),     # 입추
-        (2024, 9, 7, 12, 11),   # 백로
-        (2024, 10, 8, 3, 0),    # 한로
-        (2024, 11, 7, 7, 20),   # 입동
-        (2024, 12, 7, 0, 17),   # 대설
-        (2025, 1, 5, 11, 33),   # 소한 (다음해 1월이지만 2024년 데이터에 포함)
-    ],
-    2025: [
-        (2025, 2, 3, 23, 10),   # 입춘
-        (2025, 3, 5, 17, 7),    # 경칩
-        (2025, 4, 4, 21, 48),   # 청명
-        (2025, 5, 5, 14, 57),   # 입하
-        (2025, 6, 5, 18, 56),   # 망종
-        (2025, 7, 7, 5, 5),     # 소서
-        (2025, 8, 7, 14, 51),   # 입추
-        (2025, 9, 7, 17, 52),   # 백로
-        (2025, 10, 8, 8, 41),   # 한로
-        (2025, 11, 7, 13, 4),   # 입동
-        (2025, 12, 7, 6, 5),    # 대설
-        (2026, 1, 5, 17, 23),   # 소한
-    ],
-    2026: [
-        (2026, 2, 4, 4, 52),
-        (2026, 3, 5, 22, 59),
-        (2026, 4, 5, 3, 39),
-        (2026, 5, 5, 20, 49),
-        (2026, 6, 6, 0, 48),
-        (2026, 7, 7, 10, 57),
-        (2026, 8, 7, 20, 42),
-        (2026, 9, 7, 23, 41),
-        (2026, 10, 8, 14, 29),
-        (2026, 11, 7, 18, 52),
-        (2026, 12, 7, 11, 52),
-        (2027, 1, 5, 23, 10),
-    ],
-    # 과거 년도 (회귀 테스트용)
-    1978: [
-        (1978, 2, 4, 7, 27),    # 입춘
-        (1978, 3, 6, 1, 23),    # 경칩
-        (1978, 4, 5, 5, 59),    # 청명
-        (1978, 5, 5, 23, 8),    # 입하
-        (1978, 6, 6, 3, 10),    # 망종
-        (1978, 7, 7, 13, 23),   # 소서
-        (1978, 8, 7, 22, 55),   # 입추
-        (1978, 9, 8, 1, 38),    # 백로
-        (1978, 10, 8, 16, 15),  # 한로
-        (1978, 11, 7, 20, 24),  # 입동
-        (1978, 12, 7, 13, 17),  # 대설
-        (1979, 1, 6, 0, 32),    # 소한
-    ],
-    1996: [
-        (1996, 2, 4, 15, 8),
-        (1996, 3, 5, 9, 2),
-        (1996, 4, 4, 13, 43),
-        (1996, 5, 5, 6, 53),
-        (1996, 6, 5, 10, 54),
-        (1996, 7, 6, 21, 7),
-        (1996, 8, 7, 6, 54),
-        (1996, 9, 7, 9, 55),
-        (1996, 10, 8, 0, 45),
-        (1996, 11, 7, 4, 59),
-        (1996, 12, 6, 21, 55),
-        (1997, 1, 5, 9, 8),
-    ],
-    1990: [
-        (1990, 2, 4, 10, 15),
-        (1990, 3, 6, 4, 11),
-        (1990, 4, 5, 8, 43),
-        (1990, 5, 6, 1, 44),
-        (1990, 6, 6, 5, 47),
-        (1990, 7, 7, 16, 8),
-        (1990, 8, 8, 1, 55),
-        (1990, 9, 8, 4, 54),
-        (1990, 10, 8, 19, 36),
-        (1990, 11, 7, 23, 52),
-        (1990, 12, 7, 16, 47),
-        (1991, 1, 6, 3, 56),
-    ],
-    2000: [
-        (2000, 2, 4, 20, 14),
-        (2000, 3, 5, 14, 7),
-        (2000, 4, 4, 18, 32),
-        (2000, 5, 5, 11, 31),
-        (2000, 6, 5, 15, 29),
-        (2000, 7, 7, 1, 41),
-        (2000, 8, 7, 11, 29),
-        (2000, 9, 7, 14, 27),
-        (2000, 10, 8, 5, 12),
-        (2000, 11, 7, 9, 24),
-        (2000, 12, 7, 2, 14),
-        (2001, 1, 5, 13, 21),
-    ],
-}
+# 24절기 전체 (양력 연도 내 순서: 소한=0 ... 동지=23)
+# 황경 = (285 + 15 * i) % 360, 짝수 인덱스가 월을 여는 "절(節)"
+SOLAR_TERM_NAMES_24 = [
+    "소한", "대한", "입춘", "우수", "경칩", "춘분",
+    "청명", "곡우", "입하", "소만", "망종", "하지",
+    "소서", "대서", "입추", "처서", "백로", "추분",
+    "한로", "상강", "입동", "소설", "대설", "동지",
+]
+
+# 절기 i의 대략적 날짜 (소한 ≈ 1월 5일 + 15.2일 간격)
+_TERM_MEAN_SPACING_DAYS = 365.2422 / 24
+
+
+def solar_term_longitude(term_idx: int) -> int:
+    """절기 인덱스(소한=0) → 태양 황경(도)"""
+    return (285 + 15 * term_idx) % 360
+
+
+def apparent_solar_longitude(dt_utc: datetime) -> float:
+    """
+    태양 겉보기 황경 (그 날짜의 황도 기준, 도)
+
+    ephem.Ecliptic(sun) 기본값은 J2000 황도라 세차만큼(1900년 기준 ~1.4°) 어긋남
+    → 겉보기 적경/적위(g_ra, g_dec)를 당일 epoch로 변환해야 KASI 절입 시각과 분 단위 일치
+    """
+    if not EPHEM_AVAILABLE:
+        raise RuntimeError("ephem 라이브러리 미설치")
+
+    d = ephem.Date(dt_utc.replace(tzinfo=None))
+    sun = ephem.Sun(d)
+    ecl = ephem.Ecliptic(ephem.Equatorial(sun.g_ra, sun.g_dec, epoch=d))
+    return math.degrees(ecl.lon)
+
+
+def find_solar_term_instant(year: int, term_idx: int) -> datetime:
+    """
+    절입 시각 계산 (UTC, tz-aware, 초 단위)
+
+    Args:
+        year: 양력 연도
+        term_idx: 0=소한 ... 23=동지
+
+    Returns:
+        태양 황경이 solar_term_longitude(term_idx)에 도달하는 순간 (UTC)
+    """
+    target = solar_term_longitude(term_idx)
+    guess = datetime(year, 1, 5, 12) - timedelta(hours=9) + timedelta(days=term_idx * _TERM_MEAN_SPACING_DAYS)
+    d = ephem.Date(guess)
+
+    # 평균 각속도(360/365.2422 °/일)로 나눈 뉴턴 반복 - 5~6회면 1초 이내 수렴
+    for _ in range(30):
+        diff = (target - apparent_solar_longitude(ephem.Date(d).datetime()) + 180) % 360 - 180
+        d = ephem.Date(d + diff * 365.2422 / 360)
+        if abs(diff) < 1e-6:
+            break
+
+    instant = ephem.Date(d).datetime().replace(tzinfo=timezone.utc)
+    return (instant + timedelta(microseconds=500_000)).replace(microsecond=0)
+
+
+# ============ 절입 시각 인덱스 (bisect) ============
+
+INDEX_FIRST_YEAR = 1850
+INDEX_LAST_YEAR = 2149
+
+_INDEX_MAGIC = b"SJST"
+_INDEX_VERSION = 1
+# magic, version, first_year, n_years, payload_crc32
+_INDEX_HEADER = struct.Struct("<4sHHHI")
+
+DEFAULT_INDEX_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "solar_terms_1850_2149.bin"
+
+_KST = timezone(timedelta(hours=9))
+_IPCHUN_TERM_IDX = 2
+# 1.5° 경계 = 절기 구간(15°)의 10%
+_BOUNDARY_FRACTION = 1.5 / 15
+
+
+class SolarTermIndex:
+    """
+    24절기 절입 시각 정렬 배열 (UTC epoch 초, 소한=0 순서로 연속)
+
+    pos = (year - first_year) * 24 + term_idx
+    → bisect_right(instants, ts) - 1 이 "그 시각에 이미 들어온 마지막 절기"
+
+    월지/입춘 보정 연도/경계 판정이 모두 bisect 한 번 + 산술로 끝남 (ephem 호출 없음)
+    """
+
+    def __init__(self, first_year: int, instants: array):
+        if len(instants) % 24:
+            raise ValueError("절기 배열 길이가 24의 배수가 아님")
+        self.first_year = first_year
+        self.n_years = len(instants) // 24
+        self.last_year = first_year + self.n_years - 1
+        self._instants = instants
+
+    # ----- 생성/저장/로드 -----
+
+    @classmethod
+    def build(cls, first_year: int = INDEX_FIRST_YEAR, last_year: int = INDEX_LAST_YEAR) -> "SolarTermIndex":
+        """ephem으로 전 구간 절입 시각 계산 (300년 ≈ 1~2초)"""
+        instants = array("q", (
+            int(find_solar_term_instant(y, i).timestamp())
+            for y in range(first_year, last_year + 1)
+            for i in range(24)
+        ))
+        return cls(first_year, instants)
+
+    @classmethod
+    def load(cls, path: Path) -> "SolarTermIndex":
+        data = Path(path).read_bytes()
+        magic, version, first_year, n_years, crc = _INDEX_HEADER.unpack_from(data, 0)
+        payload = data[_INDEX_HEADER.size:]
+        if magic != _INDEX_MAGIC or version != _INDEX_VERSION:
+            raise ValueError(f"절기 인덱스 포맷 불일치: {magic!r} v{version}")
+        if zlib.crc32(payload) != crc or len(payload) != n_years * 24 * 8:
+            raise ValueError("절기 인덱스 체크섬 불일치")
+
+        instants = array("q")
+        instants.frombytes(payload)
+        if sys.byteorder != "little":
+            instants.byteswap()
+        return cls(first_year, instants)
+
+    def save(self, path: Path) -> None:
+        instants = array("q", self._instants)
+        if sys.byteorder != "little":
+            instants.byteswap()
+        payload = instants.tobytes()
+        header = _INDEX_HEADER.pack(_INDEX_MAGIC, _INDEX_VERSION, self.first_year, self.n_years, zlib.crc32(payload))
+        Path(path).write_bytes(header + payload)
+
+    @property
+    def instants(self) -> array:
+        """정렬된 절입 시각 배열 (읽기 전용으로 취급 - numpy 벡터화용)"""
+        return self._instants
+
+    # ----- 기본 조회 -----
+
+    def covers(self, dt_kst: datetime) -> bool:
+        """앞뒤 절기가 모두 있는 구간인지"""
+        pos = self._locate(dt_kst)
+        return 0 <= pos < len(self._instants) - 1
+
+    def instant(self, year: int, term_idx: int) -> datetime:
+        """절입 시각 (UTC, tz-aware)"""
+        return datetime.fromtimestamp(self.instant_ts(year, term_idx), tz=timezone.utc)
+
+    def instant_ts(self, year: int, term_idx: int) -> int:
+        pos = (year - self.first_year) * 24 + term_idx
+        if not 0 <= pos < len(self._instants):
+            raise ValueError(f"절기 인덱스 범위 밖: {year}/{term_idx}")
+        return self._instants[pos]
+
+    def _locate(self, dt_kst: datetime) -> int:
+        """naive KST 시각 → 마지막으로 들어온 절기의 pos (범위 앞이면 -1)"""
+        ts = dt_kst.replace(tzinfo=_KST).timestamp()
+        return bisect.bisect_right(self._instants, ts) - 1
+
+    def _frac(self, pos: int, dt_kst: datetime) -> float:
+        """pos 절기 ~ 다음 절기 사이 진행률 (0~1)"""
+        ts = dt_kst.replace(tzinfo=_KST).timestamp()
+        start = self._instants[pos]
+        return (ts - start) / (self._instants[pos + 1] - start)
+
+    # ----- 사주용 API -----
+
+    def month_ji_index(self, dt_kst: datetime) -> int:
+        """월지 인덱스 (0=자, 1=축, 2=인 ...) - 마지막 "절(짝수 term)" 기준"""
+        term_idx = self._locate(dt_kst) % 24
+        return (term_idx // 2 + 1) % 12
+
+    def saju_year(self, dt_kst: datetime) -> int:
+        """입춘 보정 연도"""
+        pos = self._locate(dt_kst)
+        year = self.first_year + pos // 24
+        return year if pos % 24 >= _IPCHUN_TERM_IDX else year - 1
+
+    def solar_longitude(self, dt_kst: datetime) -> float:
+        """태양 황경 (절입 시각 사이 선형 보간, 오차 0.05° 이하)"""
+        pos = self._locate(dt_kst)
+        return (solar_term_longitude(pos % 24) + 15 * self._frac(pos, dt_kst)) % 360
+
+    def near_boundary(self, dt_kst: datetime) -> Tuple[bool, Optional[str]]:
+        """
+        절기 ±1.5° 이내 여부 (engine_v2 경계 규칙과 동일)
+
+        Returns:
+            (경계여부, "near_ipchun" | "near_term_change" | None)
+        """
+        pos = self._locate(dt_kst)
+        frac = self._frac(pos, dt_kst)
+        if frac <= _BOUNDARY_FRACTION:
+            nearest = pos
+        elif frac >= 1 - _BOUNDARY_FRACTION:
+            nearest = pos + 1
+        else:
+            return False, None
+        return True, "near_ipchun" if nearest % 24 == _IPCHUN_TERM_IDX else "near_term_change"
+
+    def nearest_jeol(self, dt_kst: datetime) -> Tuple[int, float]:
+        """가장 가까운 "절"의 (term_idx, 시간차 초)"""
+        ts = dt_kst.replace(tzinfo=_KST).timestamp()
+        pos = self._locate(dt_kst)
+        prev_jeol = pos - (pos % 2)
+        candidates = [p for p in (prev_jeol, prev_jeol + 2) if 0 <= p < len(self._instants)]
+        best = min(candidates, key=lambda p: abs(ts - self._instants[p]))
+        return best % 24, abs(ts - self._instants[best])
+
+
+_term_index: Optional[SolarTermIndex] = None
+
+
+def get_solar_term_index() -> Optional[SolarTermIndex]:
+    """
+    lazy 싱글톤 - data/solar_terms_1850_2149.bin 로드
+    파일이 없으면 ephem으로 즉석 생성 (1~2초), ephem도 없으면 None
+    """
+    global _term_index
+    if _term_index is not None:
+        return _term_index
+
+    try:
+        _term_index = SolarTermIndex.load(DEFAULT_INDEX_PATH)
+    except (OSError, ValueError, struct.error) as e:
+        if not EPHEM_AVAILABLE:
+            logger.error(f"[SolarTermIndex] 로드 실패 + ephem 없음: {e}")
+            return None
+        logger.warning(f"[SolarTermIndex] 로드 실패({e}) → ephem으로 생성")
+        _term_index = SolarTermIndex.build()
+    return _term_index
 
 
 class SolarTermsEngine:
@@ -160,7 +304,8 @@ class SolarTermsEngine:
         month: int,
         day: int,
         hour: int = 0,
-        minute: int = 0
+        minute: int = 0,
+        threshold_hours: int = 48
     ) -> Tuple[int, int, bool, Optional[str]]:
         """
         절기 기준 월지 인덱스 계산
@@ -173,77 +318,26 @@ class SolarTermsEngine:
             (월지인덱스, 입춘보정연도, 경계여부, 경계사유)
             - 월지인덱스: 0=인(寅), 1=묘(卯), ..., 11=축(丑)
             - 입춘보정연도: 입춘 전이면 year-1, 아니면 year
-            - 경계여부: 절기 ±48시간 이내면 True
+            - 경계여부: 절기 ±threshold_hours 이내면 True
             - 경계사유: "near_ipchun" | "near_term_change" | None
         """
         birth_dt = datetime(year, month, day, hour, minute)
         
-        # 1. 정밀 데이터가 있는 연도인지 확인
-        if year in SOLAR_TERMS_PRECISE:
-            return self._calc_with_precise_data(birth_dt, year)
-        
-        # 2. 정밀 데이터가 없으면 근사 계산 (경계 표시 필수)
-        return self._calc_with_approx_data(birth_dt, year)
-    
-    def _calc_with_precise_data(
-        self,
-        birth_dt: datetime,
-        year: int
-    ) -> Tuple[int, int, bool, Optional[str]]:
-        """정밀 절기 데이터 기반 계산"""
-        
-        terms = SOLAR_TERMS_PRECISE.get(year, [])
-        
-        # 입춘 시각 확인 (첫 번째 절기)
-        ipchun = terms[0]
-        ipchun_dt = datetime(*ipchun)
-        
-        # 입춘 보정 연도
-        if birth_dt < ipchun_dt:
-            adjusted_year = year - 1
-            # 전년도 절기 데이터 사용
-            prev_terms = SOLAR_TERMS_PRECISE.get(year - 1, [])
-            if prev_terms:
-                terms = prev_terms
-            else:
-                # 전년도 데이터 없으면 근사 계산
-                return self._calc_with_approx_data(birth_dt, year - 1, is_pre_ipchun=True)
-        else:
-            adjusted_year = year
-        
-        # 월지 인덱스 결정
-        month_idx = 11  # 기본값 (축월)
-        is_boundary = False
-        boundary_reason = None
-        
-        for i, term_data in enumerate(terms):
-            term_dt = datetime(*term_data)
-            
-            # 경계 체크 (±48시간)
-            time_diff = abs((birth_dt - term_dt).total_seconds())
-            if time_diff <= 48 * 3600:
-                is_boundary = True
-                if i == 0:
-                    boundary_reason = "near_ipchun"
-                else:
-                    boundary_reason = "near_term_change"
+        # 1. 절입 시각 인덱스 (1850~2149)
+        index = get_solar_term_index()
+        if index is not None and index.covers(birth_dt):
+            month_idx = (index.month_ji_index(birth_dt) - 2) % 12
+            adjusted_year = index.saju_year(birth_dt)
             
-            # 해당 절기 이전인지 확인
-            if birth_dt < term_dt:
-                # 이전 월지
-                if i == 0:
-                    month_idx = 11  # 축월 (입춘 전)
-                else:
-                    month_idx = i - 1
-                break
-            else:
-                month_idx = i
-        
-        # 12번째(소한) 이후면 축월
-        if month_idx >= 12:
-            month_idx = 11
+            term_idx, diff_sec = index.nearest_jeol(birth_dt)
+            is_boundary = diff_sec <= threshold_hours * 3600
+            boundary_reason = None
+            if is_boundary:
+                boundary_reason = "near_ipchun" if term_idx == _IPCHUN_TERM_IDX else "near_term_change"
+            return month_idx, adjusted_year, is_boundary, boundary_reason
         
-        return month_idx, adjusted_year, is_boundary, boundary_reason
+        # 2. 인덱스 범위 밖이면 근사 계산 (경계 표시 필수)
+        return self._calc_with_approx_data(birth_dt, year)
     
     def _calc_with_approx_data(
         self,
@@ -251,7 +345,7 @@ class SolarTermsEngine:
         year: int,
         is_pre_ipchun: bool = False
     ) -> Tuple[int, int, bool, Optional[str]]:
-        """근사 절기 데이터 기반 계산 (정밀 데이터 없는 연도)"""
+        """근사 절기 데이터 기반 계산 (인덱스 범위 밖 연도)"""
         
         # 근사 입춘: 2월 4일
         approx_ipchun = datetime(year, 2, 4, 0, 0)
@@ -295,7 +389,7 @@ class SolarTermsEngine:
     ) -> Tuple[bool, Optional[str]]:
         """절기 경계 근처인지 확인"""
         _, _, is_boundary, reason = self.get_solar_term_month_index(
-            year, month, day, hour, minute
+            year, month, day, hour, minute, threshold_hours
         )
         return is_boundary, reason
 
@@ -5,6 +5,8 @@ P0 핵심:
 1) save_section()에서 content, markdown, body_markdown 모두 저장
 2) sanitize_report_content()로 RC-xxxx, 근거: 제거
 3) char_count, confidence, error도 저장
+
+async 메서드의 supabase-py 호출(.execute)은 run_blocking으로 스레드 풀에서 실행
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 """
 import os
@@ -14,6 +16,8 @@ import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
+from app.services.blocking import run_blocking
+
 logger = logging.getLogger(__name__)
 
 
@@ -134,6 +138,26 @@ class SupabaseService:
         except Exception:
             # 저장 실패는 무시(서비스 본 흐름 방해 X)
             pass
+
+    def upsert_calendar_cache_many(self, rows: List[Dict[str, Any]], chunk_size: int = 500) -> bool:
+        """
+        calendar_cache 일괄 upsert (백필용)
+        - rows: {sol_year, sol_month, sol_day, payload, payload_raw, source}
+        - chunk_size행씩 PostgREST 요청 1회
+        - returns: 전부 성공 여부 (백필 체크포인트 판단용 - 예외는 삼킴)
+        """
+        try:
+            client = self._get_client()
+            for i in range(0, len(rows), chunk_size):
+                (
+                    client.table("calendar_cache")
+                    .upsert(rows[i:i + chunk_size], on_conflict="sol_year,sol_month,sol_day")
+                    .execute()
+                )
+            return True
+        except Exception as e:
+            logger.warning(f"[Supabase] calendar_cache bulk upsert fail: {e}")
+            return False
     
     async def create_job(self, email: str, name: str = "", input_data: Dict = None, target_year: int = 2026) -> Dict:
         """Job 생성"""
@@ -149,7 +173,7 @@ class SupabaseService:
             "public_token": public_token
         }
         
-        result = client.table("report_jobs").insert(data).execute()
+        result = await run_blocking(client.table("report_jobs").insert(data).execute)
         
         if not result.data:
             raise RuntimeError("Job 생성 실패")
@@ -161,13 +185,13 @@ class SupabaseService:
     async def get_job(self, job_id: str) -> Optional[Dict]:
         """Job 조회"""
         client = self._get_client()
-        result = client.table("report_jobs").select("*").eq("id", job_id).execute()
+        result = await run_blocking(client.table("report_jobs").select("*").eq("id", job_id).execute)
         return result.data[0] if result.data else None
     
     async def get_job_by_token(self, token: str) -> Optional[Dict]:
         """토큰으로 Job 조회"""
         client = self._get_client()
-        result = client.table("report_jobs").select("*").eq("public_token", token).execute()
+        result = await run_blocking(client.table("report_jobs").select("*").eq("public_token", token).execute)
         return result.data[0] if result.data else None
     
     async def verify_job_token(self, job_id: str, token: str) -> tuple[bool, Optional[Dict]]:
@@ -176,7 +200,9 @@ class SupabaseService:
             return False, None
         
         client = self._get_client()
-        result = client.table("report_jobs").select("*").eq("id", job_id).eq("public_token", token).execute()
+        result = await run_blocking(
+            client.table("report_jobs").select("*").eq("id", job_id).eq("public_token", token).execute
+        )
         
         if not result.data:
             logger.warning(f"[Supabase] 토큰 검증 실패: job={job_id}")
@@ -198,11 +224,11 @@ class SupabaseService:
         
         client = self._get_client()
         try:
-            client.table("report_jobs").update({
+            await run_blocking(client.table("report_jobs").update({
                 "status": status,
                 "progress": progress,
                 "current_step": status
-            }).eq("id", job_id).execute()
+            }).eq("id", job_id).execute)
         except Exception as e:
             logger.error(f"[Supabase] update_progress 실패: {e}")
     
@@ -236,17 +262,17 @@ class SupabaseService:
         else:
             logger.warning(f"[Supabase] ⚠️ saju_json이 NULL입니다!")
         
-        client.table("report_jobs").update(data).eq("id", job_id).execute()
+        await run_blocking(client.table("report_jobs").update(data).eq("id", job_id).execute)
         logger.info(f"[Supabase] ✅ Job 완료: {job_id}")
     
     async def fail_job(self, job_id: str, error: str):
         """Job 실패"""
         client = self._get_client()
-        client.table("report_jobs").update({
+        await run_blocking(client.table("report_jobs").update({
             "status": "failed",
             "current_step": "failed",
             "error": error[:500]
-        }).eq("id", job_id).execute()
+        }).eq("id", job_id).execute)
         logger.error(f"[Supabase] ❌ Job 실패: {job_id}")
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -267,24 +293,24 @@ class SupabaseService:
         
         try:
             # 1차: persona 매칭
-            res = (client.table("master_samples")
-                   .select("persona_id, section_id, title, body_markdown")
-                   .eq("persona_id", persona_id)
-                   .eq("section_id", section_id)
-                   .limit(1)
-                   .execute())
+            res = await run_blocking(client.table("master_samples")
+                                     .select("persona_id, section_id, title, body_markdown")
+                                     .eq("persona_id", persona_id)
+                                     .eq("section_id", section_id)
+                                     .limit(1)
+                                     .execute)
             
             if res.data:
                 logger.info(f"[Supabase] 마스터샘플 조회 (persona={persona_id}): {section_id}")
                 return res.data[0]
             
             # 2차: standard로 폴백
-            res2 = (client.table("master_samples")
-                    .select("persona_id, section_id, title, body_markdown")
-                    .eq("persona_id", "standard")
-                    .eq("section_id", section_id)
-                    .limit(1)
-                    .execute())
+            res2 = await run_blocking(client.table("master_samples")
+                                      .select("persona_id, section_id, title, body_markdown")
+                                      .eq("persona_id", "standard")
+                                      .eq("section_id", section_id)
+                                      .limit(1)
+                                      .execute)
             
             if res2.data:
                 logger.info(f"[Supabase] 마스터샘플 조회 (fallback=standard): {section_id}")
@@ -310,11 +336,11 @@ class SupabaseService:
         client = self._get_client()
         
         try:
-            res = (client.table("master_samples")
-                   .select("persona_id, section_id, title, body_markdown")
-                   .eq("persona_id", persona_id)
-                   .order("section_id")
-                   .execute())
+            res = await run_blocking(client.table("master_samples")
+                                     .select("persona_id, section_id, title, body_markdown")
+                                     .eq("persona_id", persona_id)
+                                     .order("section_id")
+                                     .execute)
             
             return res.data if res.data else []
             
@@ -336,8 +362,8 @@ class SupabaseService:
         # 🔥🔥🔥 P0-C: 저장 시작 로깅
         logger.info(f"[Supabase:save_section] 시작 | job_id={job_id} | section_id={section_id}")
 
-        existing = client.table("report_sections").select("id").eq(
-            "job_id", job_id).eq("section_id", section_id).execute()
+        existing = await run_blocking(client.table("report_sections").select("id").eq(
+            "job_id", job_id).eq("section_id", section_id).execute)
 
         data = {
             "job_id": job_id,
@@ -395,11 +421,11 @@ class SupabaseService:
 
         try:
             if existing.data:
-                result = client.table("report_sections").update(data).eq(
-                    "job_id", job_id).eq("section_id", section_id).execute()
+                result = await run_blocking(client.table("report_sections").update(data).eq(
+                    "job_id", job_id).eq("section_id", section_id).execute)
                 logger.info(f"[Supabase:save_section] ✅ UPDATE 완료: section={section_id} | char_count={data.get('char_count', 0)}")
             else:
-                result = client.table("report_sections").insert(data).execute()
+                result = await run_blocking(client.table("report_sections").insert(data).execute)
                 logger.info(f"[Supabase:save_section] ✅ INSERT 완료: section={section_id} | char_count={data.get('char_count', 0)}")
             
             # 🔥🔥🔥 P0-C: 저장 결과 검증
@@ -410,7 +436,7 @@ class SupabaseService:
     async def get_sections(self, job_id: str) -> List[Dict]:
         """섹션 조회"""
         client = self._get_client()
-        result = client.table("report_sections").select("*").eq("job_id", job_id).execute()
+        result = await run_blocking(client.table("report_sections").select("*").eq("job_id", job_id).execute)
         return result.data or []
     
     async def get_sections_ordered(self, job_id: str) -> List[Dict]:
@@ -437,15 +463,15 @@ class SupabaseService:
         client = self._get_client()
         for spec in specs:
             try:
-                existing = client.table("report_sections").select("id").eq(
-                    "job_id", job_id).eq("section_id", spec["id"]).execute()
+                existing = await run_blocking(client.table("report_sections").select("id").eq(
+                    "job_id", job_id).eq("section_id", spec["id"]).execute)
                 if not existing.data:
-                    client.table("report_sections").insert({
+                    await run_blocking(client.table("report_sections").insert({
                         "job_id": job_id,
                         "section_id": spec["id"],
                         "status": "pending",
                         "progress": 0
-                    }).execute()
+                    }).execute)
             except Exception as e:
                 logger.warning(f"섹션 초기화 스킵: {spec['id']} | {e}")
     
@@ -455,15 +481,15 @@ class SupabaseService:
         data = {"status": status}
         if error:
             data["error"] = error[:500]
-        client.table("report_sections").update(data).eq(
-            "job_id", job_id).eq("section_id", section_id).execute()
+        await run_blocking(client.table("report_sections").update(data).eq(
+            "job_id", job_id).eq("section_id", section_id).execute)
     
     async def get_jobs_by_status(self, status: str, limit: int = 50) -> List[Dict]:
         """상태별 Job 조회"""
         try:
             client = self._get_client()
-            result = client.table("report_jobs").select("*").eq(
-                "status", status).order("created_at", desc=True).limit(limit).execute()
+            result = await run_blocking(client.table("report_jobs").select("*").eq(
+                "status", status).order("created_at", desc=True).limit(limit).execute)
             return result.data or []
         except:
             return []
@@ -471,14 +497,14 @@ class SupabaseService:
     async def fix_null_tokens(self) -> int:
         """기존 NULL 토큰 수정"""
         client = self._get_client()
-        result = client.table("report_jobs").select("id").is_("public_token", "null").execute()
+        result = await run_blocking(client.table("report_jobs").select("id").is_("public_token", "null").execute)
         
         fixed = 0
         for job in (result.data or []):
             new_token = secrets.token_hex(16)
-            client.table("report_jobs").update({
+            await run_blocking(client.table("report_jobs").update({
                 "public_token": new_token
-            }).eq("id", job["id"]).execute()
+            }).eq("id", job["id"]).execute)
             fixed += 1
         
         return fixed
@@ -0,0 +1,45 @@
+"""
+블로킹 실행 계층 / 이벤트 루프 지연 모니터 테스트
+"""
+import asyncio
+import time
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.blocking import BlockingExecutor, LoopLagMonitor
+
+
+class TestBlocking:
+    """run_blocking → 루프 응답성 유지"""
+
+    def test_offloaded_call_keeps_loop_responsive(self):
+        executor = BlockingExecutor(2)
+        monitor = LoopLagMonitor(interval=0.01, threshold=0.1)
+
+        async def run():
+            monitor.start()
+            result = await executor.run(lambda: time.sleep(0.3) or "done")
+            await monitor.stop()
+            return result
+
+        assert asyncio.run(run()) == "done"
+        assert monitor.stats["samples"] > 5
+        assert monitor.stats["stalls"] == 0
+        assert executor.get_stats()["calls"] == 1
+        executor.shutdown()
+
+    def test_monitor_counts_stall(self):
+        monitor = LoopLagMonitor(interval=0.01, threshold=0.1)
+
+        async def run():
+            monitor.start()
+            await asyncio.sleep(0.02)
+            time.sleep(0.2)  # 루프 직접 차단
+            await asyncio.sleep(0.05)
+            await monitor.stop()
+
+        asyncio.run(run())
+        assert monitor.stats["stalls"] == 1
+        assert monitor.stats["max_lag_ms"] >= 150
@@ -0,0 +1,54 @@
+"""
+/calculate/batch 엔드포인트 테스트
+"""
+import json
+import pytest
+from pathlib import Path
+from fastapi.testclient import TestClient
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.main import app
+
+client = TestClient(app)
+
+
+def _rows(response):
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+class TestCalculateBatch:
+    """/calculate/batch API 테스트"""
+
+    def test_json_array(self):
+        body = [
+            {"birth_year": 1978, "birth_month": 5, "birth_day": 16, "birth_hour": 11, "gender": "male"},
+            {"birth_year": 2000, "birth_month": 1, "birth_day": 1},
+        ]
+        rows = _rows(client.post("/api/v1/calculate/batch", content=json.dumps(body)))
+        assert [r["index"] for r in rows] == [0, 1]
+        assert rows[0]["saju"]["day_pillar"]["ganji"] == "무인"
+        assert rows[0]["daeun"] is not None
+        assert rows[0]["saju_summary"]["day_master"] == "무"
+        assert rows[1]["saju"]["year_pillar"]["ganji"] == "기묘"
+
+    def test_matches_single_calculate(self):
+        body = {"birth_year": 1990, "birth_month": 3, "birth_day": 5, "birth_hour": 23, "birth_minute": 40, "gender": "female"}
+        single = client.post("/api/v1/calculate", json=body).json()
+        batch = _rows(client.post("/api/v1/calculate/batch", content=json.dumps(body)))[0]
+        for key in ("saju", "daeun", "quality", "saju_summary", "gyeokguk"):
+            assert batch[key] == single[key]
+
+    def test_ndjson_row_errors_keep_going(self):
+        body = "\n".join([
+            json.dumps({"birth_year": 1978, "birth_month": 5, "birth_day": 16}),
+            "{broken",
+            json.dumps({"birth_year": 2001, "birth_month": 2, "birth_day": 30}),
+            json.dumps({"birth_year": 1850, "birth_month": 1, "birth_day": 1}),
+            json.dumps({"birth_year": 1996, "birth_month": 2, "birth_day": 4}),
+        ])
+        rows = _rows(client.post("/api/v1/calculate/batch", content=body))
+        assert [r["success"] for r in rows] == [True, False, False, False, True]
+        assert [r.get("error_code") for r in rows[1:4]] == ["INVALID_JSON", "INVALID_DATE", "INVALID_ROW"]
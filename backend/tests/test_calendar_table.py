@@ -0,0 +1,166 @@
+"""
+만세력 테이블 테스트
+"""
+import asyncio
+import pytest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.calendar_table import get_calendar_table
+from app.services.engine_v2 import SajuManager
+
+
+table = get_calendar_table()
+
+
+@pytest.mark.skipif(table is None, reason="data/ganji_calendar_v1.bin 없음")
+class TestCalendarTable:
+    """테이블 조회"""
+
+    def test_range(self):
+        assert str(table.first_date) == "1900-01-01"
+        assert str(table.last_date) == "2100-12-31"
+        assert not table.covers(1899, 12, 31)
+
+    def test_regression_1978(self):
+        """verify_result.json 기준"""
+        r = table.get_ganji(1978, 5, 16, 11, 0)
+        assert (r["year_ganji"], r["month_ganji"], r["day_ganji"]) == ("무오", "정사", "무인")
+
+    def test_anchor_2000(self):
+        r = table.get_ganji(2000, 1, 1, 12, 0)
+        assert (r["year_ganji"], r["month_ganji"], r["day_ganji"]) == ("기묘", "병자", "무오")
+        assert (r["lunar_year"], r["lunar_month"], r["lunar_day"]) == (1999, 11, 25)
+
+    def test_ipchun_instant(self):
+        """2024 입춘 17:27 KST (KASI) 전후로 년/월주 전환"""
+        before = table.get_ganji(2024, 2, 4, 17, 0)
+        after = table.get_ganji(2024, 2, 4, 17, 30)
+        assert (before["year_ganji"], before["month_ganji"]) == ("계묘", "을축")
+        assert (after["year_ganji"], after["month_ganji"]) == ("갑진", "병인")
+        assert after["boundary_reason"] == "near_ipchun"
+
+    def test_lunar_out_of_range(self):
+        """korean_lunar_calendar 범위 밖은 음력 None"""
+        r = table.get_ganji(2080, 6, 1)
+        assert r["lunar_year"] is None
+        assert r["day_ganji"]
+
+
+@pytest.mark.skipif(table is None, reason="data/ganji_calendar_v1.bin 없음")
+class TestSajuManagerWithTable:
+    """SajuManager 경로"""
+
+    def test_no_network(self):
+        manager = SajuManager(kasi_api_key="dummy")
+        result = asyncio.run(manager.calculate(1978, 5, 16, 11, 0, use_solar_time=True))
+        assert result["meta"]["source"] == "calendar_table"
+        assert result["hour_pillar"]["ganji"] == "정사"
+
+
+class TestSolarTermIndex:
+    """절입 시각 인덱스 (bisect)"""
+
+    def test_range_and_instant(self):
+        from datetime import timedelta
+        from app.services.solar_terms import get_solar_term_index
+
+        index = get_solar_term_index()
+        assert (index.first_year, index.last_year) == (1850, 2149)
+        # 2024 입춘 KASI 17:27 KST
+        kst = index.instant(2024, 2) + timedelta(hours=9)
+        assert (kst.month, kst.day, kst.hour, kst.minute) == (2, 4, 17, 26)
+
+    def test_month_year_boundary(self):
+        from datetime import datetime
+        from app.services.solar_terms import get_solar_term_index
+
+        index = get_solar_term_index()
+        before, after = datetime(2024, 2, 4, 17, 0), datetime(2024, 2, 4, 17, 30)
+        assert (index.saju_year(before), index.month_ji_index(before)) == (2023, 1)
+        assert (index.saju_year(after), index.month_ji_index(after)) == (2024, 2)
+        assert index.near_boundary(after) == (True, "near_ipchun")
+        assert index.near_boundary(datetime(2024, 2, 12)) == (False, None)
+
+    def test_solar_terms_engine(self):
+        from app.services.solar_terms import solar_terms_engine
+
+        assert solar_terms_engine.get_solar_term_month_index(1978, 5, 16, 11) == (3, 1978, False, None)
+
+
+class TestCalculateMany:
+    """NumPy 벡터화 간지 계산"""
+
+    def test_matches_table(self):
+        from datetime import date
+        from app.services.ganji import calculate_many, NUMPY_AVAILABLE
+        from app.services.engine_v2 import GAN, JI
+
+        if not NUMPY_AVAILABLE:
+            pytest.skip("numpy 없음")
+
+        cols = calculate_many(
+            [date(1978, 5, 16), date(2000, 1, 1), date(2024, 2, 4), date(2024, 2, 4)],
+            [11, None, 17, 17],
+            [0, 0, 0, 30],
+        )
+
+        def ganji(kind, i):
+            return GAN[cols[f"{kind}_gan"][i]] + JI[cols[f"{kind}_ji"][i]]
+
+        assert [ganji(k, 0) for k in ("year", "month", "day", "hour")] == ["무오", "정사", "무인", "정사"]
+        assert [ganji(k, 1) for k in ("year", "month", "day")] == ["기묘", "병자", "무오"]
+        assert cols["hour_ji"][1] == -1
+        assert (ganji("year", 2), ganji("year", 3)) == ("계묘", "갑진")
+        assert cols["near_ipchun"][3]
+        assert cols["valid"].all()
+
+
+class TestSajuLookup:
+    """전수 조회 테이블 (날짜 × 시지 × 태양시)"""
+
+    def test_lookup_and_split(self):
+        from app.services.calendar_table import ganji_str
+        from app.services.saju_lookup import get_saju_lookup
+
+        lookup = get_saju_lookup()
+        if lookup is None:
+            pytest.skip("data/saju_lookup_v1.bin 없음")
+
+        hit = lookup.lookup(1978, 5, 16, 11, 0, True)
+        assert [ganji_str(i) for i in (hit.year_idx, hit.month_idx, hit.day_idx, hit.hour_idx)] == \
+            ["무오", "정사", "무인", "정사"]
+        assert lookup.lookup(1978, 5, 16, None).hour_idx is None
+        # 2024 입춘 17:27 → 유시(17~19) 구간 안에서 년/월주 전환 → 분 단위 경로로
+        assert lookup.lookup(2024, 2, 4, 17, 30, False) is None
+        assert lookup.lookup(2024, 2, 4, 20, 0, False).boundary_reason == "near_ipchun"
+
+    def test_calculate_async_uses_lookup(self, monkeypatch):
+        from app.services.saju_engine import SajuEngine, _pillars_by_index
+        from app.services.saju_lookup import get_saju_lookup
+
+        if get_saju_lookup() is None:
+            pytest.skip("data/saju_lookup_v1.bin 없음")
+
+        hits = []
+        orig = SajuEngine._from_lookup
+        def spy(self, *args, **kwargs):
+            hits.append(args[0])
+            return orig(self, *args, **kwargs)
+        monkeypatch.setattr(SajuEngine, "_from_lookup", spy)
+
+        engine = SajuEngine()
+        result = asyncio.run(engine.calculate_async(1978, 5, 16, 11, 0, gender="male", current_age=45))
+        again = asyncio.run(engine.calculate_async(1978, 5, 16, 11, 0, gender="male", current_age=45))
+        assert len(hits) == 2  # 조회 경로
+        assert result.saju.day_pillar == _pillars_by_index()[14]  # 무인
+        # 응답마다 복사본 - 한 응답을 고쳐도 원본/다른 응답은 그대로
+        assert result.saju.day_pillar is not _pillars_by_index()[14]
+        result.saju.day_pillar.ganji = "변경"
+        assert again.saju.day_pillar.ganji == "무인"
+        assert _pillars_by_index()[14].ganji == "무인"
+        assert result.saju.hour_pillar.ganji == "정사"
+        assert result.daeun.direction == "forward"
+        assert result.daeun.current_daeun == result.daeun.daeun_list[4]
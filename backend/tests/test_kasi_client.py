@@ -0,0 +1,240 @@
+"""
+KASI 클라이언트 테스트 (네트워크 없이 MockTransport)
+"""
+import asyncio
+import pytest
+from pathlib import Path
+
+import httpx
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.cache import cache_service
+from app.services.calendar_cache import CalendarCache
+from app.services import kasi_api
+from app.services.kasi_api import (
+    FCNTL_AVAILABLE, KasiApiClient, KasiHttp, KasiUnavailable, SingleFlight, WorkerLock,
+)
+
+
+def _mock_http(handler) -> KasiHttp:
+    http = KasiHttp()
+    http._ensure_client = lambda: http._client
+    http._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    http._semaphore = asyncio.Semaphore(2)
+    return http
+
+
+class TestKasiHttp:
+    """공유 커넥션 풀 / 서킷 브레이커"""
+
+    def test_breaker_short_circuits(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        async def run():
+            http = _mock_http(handler)
+            http.breaker.threshold = 2
+            results = []
+            for _ in range(4):
+                try:
+                    await http.get_json("http://kasi.test/x", {})
+                except KasiUnavailable:
+                    results.append("open")
+                except httpx.HTTPStatusError:
+                    results.append("error")
+            return http, results
+
+        http, results = asyncio.run(run())
+        assert results == ["error", "error", "open", "open"]
+        assert len(calls) == 2
+        assert http.get_stats()["breaker_state"] == "open"
+
+    def test_deadline(self):
+        async def slow(request):
+            await asyncio.sleep(1)
+            return httpx.Response(200, json={})
+
+        async def run():
+            http = _mock_http(slow)
+            with pytest.raises(KasiUnavailable):
+                await http.get_json("http://kasi.test/x", {}, deadline=0.05)
+            return http
+
+        http = asyncio.run(run())
+        assert http.get_stats()["timeouts"] == 1
+
+    def test_queue_timeouts_keep_breaker_closed(self):
+        """동시성 1 + 느리지만 정상인 KASI + 대기열 폭주 → 로컬 시간 초과만, 브레이커는 closed"""
+        async def slow_ok(request):
+            await asyncio.sleep(0.03)
+            return httpx.Response(200, json={"ok": True})
+
+        async def call(http):
+            try:
+                return await http.get_json("http://kasi.test/x", {}, deadline=0.1)
+            except KasiUnavailable:
+                return None
+
+        async def run():
+            http = _mock_http(slow_ok)
+            http._semaphore = asyncio.Semaphore(1)
+            http.breaker.threshold = 2
+            results = await asyncio.gather(*(call(http) for _ in range(10)))
+            after = await call(http)
+            return http, results, after
+
+        http, results, after = asyncio.run(run())
+        stats = http.get_stats()
+        assert results[0] == {"ok": True} and None in results
+        assert stats["queue_timeouts"] == results.count(None)
+        assert (stats["timeouts"], stats["breaker_state"], stats["consecutive_failures"]) == (0, "closed", 0)
+        assert after == {"ok": True}
+
+
+class TestCoalescing:
+    """같은 날짜 동시 miss → 1회 호출"""
+
+    def test_singleflight(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"day_ganji": "무오"}
+
+        async def run():
+            sf = SingleFlight()
+            results = await asyncio.gather(*[sf.do((2000, 1, 1), fetch) for _ in range(10)])
+            return sf, results
+
+        sf, results = asyncio.run(run())
+        assert len(calls) == 1
+        assert all(r == {"day_ganji": "무오"} for r in results)
+        assert sf.get_stats() == {"leaders": 1, "coalesced": 9, "inflight": 0}
+
+    @pytest.mark.skipif(not FCNTL_AVAILABLE, reason="fcntl 없음 (Windows)")
+    def test_worker_lock(self, tmp_path):
+        # 워커 2개 = WorkerLock 인스턴스 2개 (각자 파일을 엶)
+        a, b = WorkerLock(tmp_path, 2.0), WorkerLock(tmp_path, 2.0)
+        states = []
+
+        async def worker(lock, delay):
+            await asyncio.sleep(delay)
+            async with lock.hold("20000101") as state:
+                states.append(state)
+                await asyncio.sleep(0.1)
+
+        async def run():
+            await asyncio.gather(worker(a, 0), worker(b, 0.02))
+
+        asyncio.run(run())
+        assert states == ["free", "waited"]
+        assert b.stats["waited"] == 1
+
+
+class _FakeSupabase:
+    def __init__(self):
+        self.rows = {}
+        self.reads = 0
+
+    def get_calendar_cache(self, y, m, d):
+        self.reads += 1
+        return self.rows.get((y, m, d))
+
+    def upsert_calendar_cache(self, y, m, d, payload_norm, payload_raw=None, source="kasi"):
+        self.rows[(y, m, d)] = {"payload": payload_norm, "payload_raw": payload_raw}
+
+
+class TestCalendarCache:
+    """memory → sqlite → supabase 계층"""
+
+    def test_tiers_and_promotion(self, tmp_path):
+        cache_service.kasi_cache.clear()
+        sb = _FakeSupabase()
+        sb.rows[(1999, 3, 3)] = {"payload": {"day_ganji": "갑자"}, "payload_raw": None}
+        cache = CalendarCache(lambda: sb, tmp_path / "cal.sqlite3")
+
+        async def run():
+            first = await cache.get(1999, 3, 3)
+            second = await cache.get(1999, 3, 3)
+            await cache.put(1999, 3, 4, {"day_ganji": "을축"}, {"raw": 1})
+            cache_service.kasi_cache.clear()  # 재시작 흉내
+            third = await cache.get(1999, 3, 4)
+            missing = await cache.get(1999, 3, 5)
+            return first, second, third, missing
+
+        first, second, third, missing = asyncio.run(run())
+        assert first[0] == "supabase" and second[0] == "memory"
+        assert third == ("sqlite", {"payload": {"day_ganji": "을축"}, "payload_raw": {"raw": 1}})
+        assert missing is None
+        assert sb.rows[(1999, 3, 4)]["payload"] == {"day_ganji": "을축"}
+        assert sb.reads == 2  # 1999-03-03 최초 1회 + 1999-03-05 miss
+        stats = cache.get_stats()
+        assert stats["memory"]["hits"] == 1 and stats["sqlite"]["hits"] == 1
+        assert stats["supabase"] == {"hits": 1, "misses": 1, "hit_rate": "50.0%"}
+        cache_service.kasi_cache.clear()
+
+
+class TestMonthPrefetch:
+    """월 단위 백필 조회"""
+
+    def test_prefetch_months(self, monkeypatch, tmp_path):
+        requested = []
+
+        async def fake_get_json(url, params, deadline=None):
+            y, m = int(params["solYear"]), int(params["solMonth"])
+            requested.append((y, m))
+            if (y, m) == (2000, 3):
+                raise RuntimeError("boom")
+            items = [
+                {"solDay": f"{d:02d}", "lunSecha": "경진(庚辰)", "lunWolgeon": "무인(戊寅)",
+                 "lunIljin": "갑자(甲子)", "lunYear": "2000", "lunMonth": "01", "lunDay": "01",
+                 "lunLeapmonth": "평"}
+                for d in (1, 2)
+            ]
+            return {"response": {"body": {"items": {"item": items}}}}
+
+        monkeypatch.setattr(kasi_api.kasi_http, "get_json", fake_get_json)
+        client = KasiApiClient(cache=CalendarCache(_FakeSupabase, tmp_path / "cal.sqlite3"))
+        client.api_key = "dummy"
+
+        async def run():
+            return [r async for r in client.prefetch_months([(2000, 1), (2000, 2), (2000, 3)], 2, retries=0)]
+
+        results = {(y, m): rows for y, m, rows in asyncio.run(run())}
+        assert results[(2000, 3)] is None
+        rows = results[(2000, 1)]
+        assert [r[2] for r in rows] == [1, 2]
+        assert rows[0][3]["year_ganji"] == "경진"
+        assert rows[0][3]["day_ganji"] == "갑자"
+        assert not rows[0][3]["is_leap_month"]
+        assert rows[0][4]["response"]["body"]["items"]["item"]["solDay"] == "01"
+        assert sorted(requested) == [(2000, 1), (2000, 2), (2000, 3)]
+
+    def test_day_fetch_matches_month_rows(self, monkeypatch, tmp_path):
+        item = {"solDay": "05", "lunSecha": "경진(庚辰)", "lunWolgeon": "무인(戊寅)", "lunIljin": "갑자(甲子)",
+                "lunYear": "2000", "lunMonth": "01", "lunDay": "01", "lunLeapmonth": "평"}
+
+        async def fake_get_json(url, params, deadline=None):
+            one = "solDay" in params
+            return {"response": {"body": {"items": {"item": item if one else [item]}}}}
+
+        monkeypatch.setattr(kasi_api.kasi_http, "get_json", fake_get_json)
+        cache_service.kasi_cache.clear()
+        sb = _FakeSupabase()
+        client = KasiApiClient(cache=CalendarCache(lambda: sb, tmp_path / "cal.sqlite3"))
+        client.api_key = "dummy"
+
+        async def run():
+            return await client._fetch_from_kasi(2000, 1, 5), await client.fetch_month(2000, 1)
+
+        day, month_rows = asyncio.run(run())
+        assert day["month_ganji"] == "무인"
+        assert sb.rows[(2000, 1, 5)]["payload"] == month_rows[0][3]
+        assert sb.rows[(2000, 1, 5)]["payload_raw"] == month_rows[0][4]
+        cache_service.kasi_cache.clear()
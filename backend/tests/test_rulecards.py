@@ -0,0 +1,479 @@
+"""
+RuleCardStore 역색인 / 카드 선택 테스트
+"""
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.rulecards_store import RuleCard, RuleCardStore, TriggerCond, parse_trigger
+from app.services.rulecard_selector import score_card, select_cards_for_preset
+
+
+def _store():
+    return RuleCardStore(cards=[
+        RuleCard(id="W1", topic="WEALTH", tags=["정재", "편재"], priority=1.0),
+        RuleCard(id="W2", topic="WEALTH", tags=["정재", "식신생재"], priority=3.0),
+        RuleCard(id="W3", topic="WEALTH", tags=["겁재"], priority=5.0),
+        RuleCard(id="C1", topic="CAREER", tags=["정관"], priority=2.0),
+        RuleCard(id="C2", topic="CAREER", tags=["편관"], priority=4.0),
+    ])
+
+
+class TestRuleCardIndex:
+    """posting 누적 = 카드 전수 채점"""
+
+    def test_accumulate_matches_score_card(self):
+        store = _store()
+        user = {"정재", "편재", "편관"}
+        acc = store.accumulate(user)
+
+        for no, card in enumerate(store.cards):
+            s = score_card(store, card, user, set())
+            if s["overlap"] == 0:
+                assert no not in acc
+            else:
+                assert acc[no][0] == s["overlap"]
+                assert abs(acc[no][1] - s["matchScore"]) < 1e-9
+
+        assert store.postings["정재"].tolist() == [0, 1]
+        assert [store.cards[no].id for no in store.topic_nos["WEALTH"]] == ["W3", "W2", "W1"]
+        assert store.topic_rank.tolist() == [2, 1, 0, 1, 0]
+
+    def test_trigger_parsed_once_and_indexed(self):
+        raw = {"month": "인월", "day_master": "병화", "elements": ["목", "금"],
+               "exists": True, "presence": {"겁제": True}}
+        assert parse_trigger(raw) == (
+            TriggerCond("month", "eq", "인월"),
+            TriggerCond("day_master", "eq", "병화"),
+            TriggerCond("elements", "in", "목"),
+            TriggerCond("elements", "in", "금"),
+            TriggerCond("exists", "is", True),
+            TriggerCond("presence.겁제", "is", True),
+        )
+        assert parse_trigger('{"month": "인월"}') == (TriggerCond("month", "eq", "인월"),)
+        assert parse_trigger("자유 문장") == (TriggerCond("", "eq", "자유 문장"),)
+
+        store = RuleCardStore(cards=[
+            RuleCard(id="A", topic="STRUCTURE", tags=["인월"], trigger=raw),
+            RuleCard(id="B", topic="STRUCTURE", tags=["병화"], trigger='{"day_master": "병화"}'),
+            RuleCard(id="C", topic="GENERAL", tags=["목"], trigger=["목"]),
+        ])
+        assert [c.id for c in store.cards_with_trigger("day_master", "병화")] == ["A", "B"]
+        assert [c.id for c in store.cards_with_trigger("month", "인월")] == ["A"]
+        assert [c.id for c in store.cards_with_trigger("exists", True)] == ["A"]
+
+        from app.services.match_module import MatchModule
+        mm = MatchModule()
+        mm.set_store(store)
+        assert mm._extract_card_triggers(store.cards[0]) == ["인월", "병화", "목", "금", "인월"]
+        assert mm._term_rows["병화"].tolist() == [0, 1]
+
+    def test_select_orders_by_overlap_then_priority(self):
+        store = _store()
+        preset = {
+            "name": "t",
+            "sections": [{
+                "key": "s", "title": "S", "totalTarget": 4,
+                "focusTags": ["편관"],
+                "perTopic": [{"topic": "WEALTH", "k": 3}, {"topic": "CAREER", "k": 1}],
+            }],
+        }
+        result = select_cards_for_preset(store, preset, ["정재", "편재"])
+        sec = result["sections"][0]
+
+        assert [c["id"] for c in sec["cards"]] == ["W1", "W2", "W3", "C2"]
+        assert sec["meta"]["byStage"] == {"s1": 1, "s2": 1, "s3": 1, "s4": 1}
+
+
+class TestRuleCardCompact:
+    """slots 카드 - 본문 1벌, 태그 공유, content/meta 호환"""
+
+    def test_single_copy_and_compat_views(self):
+        a = RuleCard(id="A", topic="WEALTH", tags=["정" + "재"], mechanism="m",
+                     content={"action": "act", "cautions": "주의"}, meta={"subtopic": "투자"})
+        b = RuleCard(id="B", topic="WEALTH", tags=["".join(["정", "재"])])
+
+        assert not hasattr(a, "__dict__")
+        assert a.tags[0] is b.tags[0]
+        assert a.content == {"interpretation": "", "mechanism": "m", "action": "act", "cautions": ["주의"]}
+        assert a.content_action == "act" and a.content_cautions == ["주의"]
+        assert a.subtopic == "투자" and b.meta == {}
+        assert a.to_dict()["tags"] == ["정재"]
+        assert set(a.to_dict()) == {"id", "topic", "tags", "priority", "trigger", "mechanism",
+                                    "interpretation", "action", "cautions", "content", "meta"}
+        assert RuleCard(id="B", topic="WEALTH", tags=["정재"]) == b
+
+
+class TestCardMatrix:
+    """CSR 일괄 채점 = 카드별 루프"""
+
+    def test_dot_and_top_k_order(self):
+        import numpy as np
+        from app.services.card_matrix import CardMatrix, top_k
+
+        m = CardMatrix([["a", "b", "a"], [], ["b"], ["c", "a"]], binary=False)
+        w = np.column_stack([m.vector({"a": 1.0}), m.vector({"b": 2.0, "c": 0.5})])
+        out = m.dot(w)
+
+        assert out.tolist() == [[2.0, 2.0], [0.0, 0.0], [0.0, 2.0], [1.0, 0.5]]
+        assert m.dot(w, rows=np.array([3, 1, 0])).tolist() == [[1.0, 0.5], [0.0, 0.0], [2.0, 2.0]]
+        # 동점(행 0, 2)은 행 번호 순 - stable sort와 같음
+        assert top_k(out[:, 1], 2).tolist() == [0, 2]
+        assert top_k(out[:, 0], 3, mask=out[:, 0] > 0).tolist() == [0, 3]
+
+    def test_top_k_groups_matches_lexsort(self):
+        import numpy as np
+        from app.services import card_matrix
+        from app.services.card_matrix import top_k
+
+        rng = np.random.default_rng(0)
+        scores = rng.integers(0, 4, 300).astype(float)
+        groups = rng.integers(0, 4, 300)
+        mask = groups < 3
+        rows = np.flatnonzero(mask)
+        expected = rows[np.lexsort((rows, -scores[rows], groups[rows]))]
+
+        for partition_min in (card_matrix._PARTITION_MIN, 0):  # 전체 정렬 / partition 경로
+            card_matrix._PARTITION_MIN, saved = partition_min, card_matrix._PARTITION_MIN
+            try:
+                for k in (0, 1, 7, 50, 400):
+                    assert top_k(scores, k, mask=mask, groups=groups).tolist() == expected[:k].tolist()
+            finally:
+                card_matrix._PARTITION_MIN = saved
+
+    def test_score_all_sections_matches_single_section(self):
+        from app.services.rulecard_scorer import RuleCardScorer
+
+        store = _store()
+        dict_cards = [
+            {"id": c.id, "topic": c.topic, "tags": c.tags, "priority": c.priority}
+            for c in store.cards
+        ]
+        survey = {"industry": "커머스", "painPoint": "funding"}
+        scorer = RuleCardScorer()
+
+        batch = scorer.score_all_sections(store, ["정재"], survey, section_ids=["money", "team"])
+        for section_id in ("money", "team"):
+            single = scorer.score_cards_for_section(dict_cards, section_id, ["정재"], survey)
+            assert [c.card_id for c in batch[section_id].cards] == [c.card_id for c in single.cards]
+            assert [c.final_score for c in batch[section_id].cards] == [c.final_score for c in single.cards]
+
+        money = batch["money"].cards
+        assert money[0].card_id == "W1"   # 정재+편재: 피처 1 + 설문 2 + 섹션 2
+        assert money[0].score_trace.to_dict()["total"] == money[0].final_score
+
+    def test_concept_mask_exclusion(self):
+        from app.services.rulecard_scorer import (
+            ELEMENT_BITS, RELATION_BITS, TEN_GOD_BITS, RuleCardScorer,
+            concept_mask, get_present_elements, should_exclude_card,
+        )
+
+        mask = concept_mask("WEALTH", ["재물", "식신생재", "충돌", "종합"])
+        assert mask & ELEMENT_BITS["water"] and mask & ELEMENT_BITS["fire"]
+        assert mask & TEN_GOD_BITS["식신"] and mask & RELATION_BITS["충"]
+        assert not mask & RELATION_BITS["합"]   # 관계는 태그 정확 일치 ("종합" 아님)
+
+        # 수(水) 없는 원국: 임/계/해/자 없음 → 재성 카드 제외
+        saju = {"year_pillar": "갑인", "month_pillar": "병오", "day_pillar": "경신", "hour_pillar": "무술"}
+        assert get_present_elements(saju) == {"wood", "fire", "metal", "earth"}
+        assert should_exclude_card({"topic": "WEALTH", "tags": ["정재"]}, get_present_elements(saju))
+        assert not should_exclude_card({"topic": "WEALTH", "tags": ["정재"]}, set())
+
+        out = RuleCardScorer().score_cards_for_section(_store(), "money", ["정재"], saju_data=saju)
+        assert {c.card_id for c in out.cards} == {"W3", "C1", "C2"}   # 겁재는 토(土) - 원국에 있음
+        assert out.match_summary["excluded_by_fact_check"] == 2
+
+
+class TestRuleCardSnapshot:
+    """스냅샷 왕복 = 원본 로드, 원본 변경 시 stale"""
+
+    def test_round_trip_and_stale(self, tmp_path):
+        import os
+        import shutil
+        import pytest
+        from app.services.rulecards_snapshot import (
+            SnapshotError, SnapshotStale, read_snapshot, write_snapshot,
+        )
+
+        source = tmp_path / "rulecards.jsonl"
+        shutil.copy(Path(__file__).parent.parent / "data" / "rulecards.jsonl", source)
+        store = RuleCardStore(str(source))
+        store.load()
+        snap = tmp_path / "rulecards.jsonl.snap"
+        write_snapshot(store, snap, source)
+
+        loaded = read_snapshot(snap, source)
+        assert [c.to_dict() for c in loaded.cards] == [c.to_dict() for c in store.cards]
+        assert loaded.idf == store.idf
+        for name in ("postings", "topic_nos", "trigger_index"):
+            a, b = getattr(loaded, name), getattr(store, name)
+            assert {k: v.tolist() for k, v in a.items()} == {k: v.tolist() for k, v in b.items()}
+        assert loaded.priorities.tolist() == store.priorities.tolist()
+        assert loaded.cluster_ids.tolist() == store.cluster_ids.tolist()
+        assert loaded.cluster_of == store.cluster_of
+        assert not loaded.postings["목"].flags.writeable  # mmap 뷰 (읽기 전용)
+        assert loaded.source == "jsonl"
+        assert loaded.tag_matrix.dot(loaded.tag_matrix.vector({"목": 1.0})).tolist() == \
+            store.tag_matrix.dot(store.tag_matrix.vector({"목": 1.0})).tolist()
+
+        st = os.stat(source)
+        os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        with pytest.raises(SnapshotStale):
+            read_snapshot(snap, source)
+
+        data = bytearray(snap.read_bytes())
+        data[-1] ^= 0xFF
+        snap.write_bytes(bytes(data))
+        with pytest.raises(SnapshotError):
+            read_snapshot(snap)
+
+
+class TestRuleCardIngest:
+    """JSON 폴더 증분 적재 - 바뀐 파일 / 카드만 반영, FTS 동기화"""
+
+    def test_incremental_upsert(self, tmp_path):
+        import json
+        import sqlite3
+        sys.path.insert(0, str(Path(__file__).parent.parent / "tools"))
+        from ingest_rulecards import ingest
+
+        def card(rid, text):
+            return {"id": rid, "topic": "WEALTH", "tags": ["정재"], "interpretation": text}
+
+        def write(path, cards):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps({"title": path.stem, "rulecards": cards}, ensure_ascii=False), encoding="utf-8")
+
+        src = tmp_path / "cards"
+        a, b = src / "관성" / "a.json", src / "재성" / "b.json"   # 경로 순: a가 A1 소유
+        write(a, [card("A1", "현금 흐름"), card("A2", "투자 시기")])
+        write(b, [card("B1", "승진 운"), card("A1", "중복 id")])
+        db = tmp_path / "m.db"
+
+        first = ingest(src, db, base=tmp_path)
+        assert first["관성"].inserted == 2 and first["재성"].inserted == 1 and first["재성"].duplicate == 1
+        assert sum(s.skipped for s in ingest(src, db, base=tmp_path).values()) == 2
+
+        write(a, [card("A1", "현금 흐름"), card("A2", "부동산 매수")])
+        b.unlink()
+        again = ingest(src, db, base=tmp_path)
+        assert (again["관성"].updated, again["관성"].unchanged, again["재성"].deleted) == (1, 1, 1)
+
+        con = sqlite3.connect(str(db))
+        ids = lambda q: [r[0] for r in con.execute("SELECT id FROM rule_cards_fts WHERE rule_cards_fts MATCH ?", (q,))]
+        assert ids("부동산") == ["A2"] and ids("투자") == [] and ids("승진") == []
+        assert con.execute("SELECT source_path FROM rule_cards WHERE id = 'A1'").fetchone()[0] == "cards/관성/a.json"
+
+        # 소유 파일이 중복 id를 빼거나 지워지면 양보했던 파일에서 다시 채움 (증분 = --full)
+        owner = lambda: con.execute("SELECT source_path, interpretation FROM rule_cards WHERE id = 'A1'").fetchall()
+        write(b, [card("B1", "승진 운"), card("A1", "중복 id")])
+        assert ingest(src, db, base=tmp_path)["재성"].duplicate == 1
+        write(a, [card("A2", "부동산 매수")])
+        dropped = ingest(src, db, base=tmp_path)
+        assert (dropped["관성"].deleted, dropped["재성"].restored, dropped["재성"].inserted) == (1, 1, 1)
+        assert owner() == [("cards/재성/b.json", "중복 id")]
+        assert ids("중복") == ["A1"]
+        full = ingest(src, db, base=tmp_path, full=True)
+        assert not any(s.inserted or s.updated or s.deleted for s in full.values())
+
+        write(a, [card("A1", "현금 흐름"), card("A2", "부동산 매수")])
+        assert ingest(src, db, base=tmp_path)["관성"].duplicate == 1   # 이제 b가 소유
+        b.unlink()
+        removed = ingest(src, db, base=tmp_path)
+        assert (removed["재성"].deleted, removed["관성"].restored, removed["관성"].inserted) == (2, 1, 1)
+        assert owner() == [("cards/관성/a.json", "현금 흐름")]
+        full = ingest(src, db, base=tmp_path, full=True)
+        assert not any(s.inserted or s.updated or s.deleted for s in full.values())
+
+
+class TestRuleCardDedup:
+    """유사 중복 클러스터 - 섹션당 클러스터 1장"""
+
+    TEXT = "재물 흐름이 막혀 지출 관리가 필요한 시기이며 거래 관계에서 갈등이 발생할 가능성이 있음"
+
+    def _store(self):
+        return RuleCardStore(cards=[
+            RuleCard(id="D1", topic="WEALTH", tags=["정재"], priority=5.0, interpretation=self.TEXT),
+            RuleCard(id="D2", topic="WEALTH", tags=["정재"], priority=4.0, interpretation=self.TEXT + " 등"),
+            RuleCard(id="D3", topic="WEALTH", tags=["정재"], priority=3.0, interpretation="투자보다 현금 보유가 유리"),
+            RuleCard(id="C1", topic="CAREER", tags=["정관"], priority=5.0, interpretation=self.TEXT + "!"),
+            RuleCard(id="C2", topic="CAREER", tags=["정관"], priority=1.0, interpretation="승진 기회가 보임"),
+        ])
+
+    def test_clusters_and_one_per_section(self):
+        from app.services.rulecard_dedup import cluster_report, find_clusters
+        from app.services.rulecard_scorer import RuleCardScorer
+
+        store = self._store()
+        assert store.cluster_ids.tolist() == [0, 0, 2, 0, 4]
+        assert store.cluster_of == {0: 0, 1: 0, 3: 0} and store.cluster_size == {0: 3}
+        assert find_clusters([c.interpretation for c in store.cards], 0).tolist() == [0, 1, 2, 3, 4]
+        report = cluster_report(store.cluster_ids, store.cards)
+        assert (report["clusters"], report["duplicates"]) == (3, 2)
+        assert report["size_histogram"]["3-4"] == 1 and report["largest"][0]["topics"] == ["CAREER", "WEALTH"]
+
+        preset = {
+            "name": "t",
+            "sections": [{
+                "key": "s", "title": "S", "totalTarget": 3, "focusTags": [],
+                "perTopic": [{"topic": "WEALTH", "k": 2}, {"topic": "CAREER", "k": 1}],
+            }],
+        }
+        sec = select_cards_for_preset(store, preset, ["정재", "정관"])["sections"][0]
+        assert [c["id"] for c in sec["cards"]] == ["D1", "D3", "C2"]
+
+        picked = RuleCardScorer().score_all_sections(store, ["정재", "정관"], None, top_n=3)
+        for cards in picked.values():
+            assert len(cards.cards) == 3
+            assert sum(c.card_id in ("D1", "D2", "C1") for c in cards.cards) == 1
+
+
+class TestReportWorkerSelection:
+    """프리미엄 리포트 섹션 선택 - store 색인 경로, 섹션 간 id 중복 없음"""
+
+    def test_store_sections_and_legacy_list(self):
+        from app.services.report_worker import ReportWorker
+        from app.services.rulecard_selector import select_card_nos_for_preset
+
+        store = _store()
+        worker = ReportWorker()
+        saju = {"year_pillar": "갑자", "month_pillar": "병인", "day_pillar": "무오"}
+        by_section = worker._select_store_sections(store, saju, {})
+
+        assert list(by_section) == worker.DEFAULT_SECTION_IDS
+        ids = [store.cards[no].id for nos in by_section.values() for no in nos]
+        assert sorted(ids) == sorted(c.id for c in store.cards) and len(set(ids)) == len(ids)
+
+        from app.services.preset_type2 import BUSINESS_OWNER_PRESET_V2, SECTION_PRESET_KEYS
+        assert set(SECTION_PRESET_KEYS) == set(worker.DEFAULT_SECTION_IDS)
+        assert set(SECTION_PRESET_KEYS.values()) == {sec["key"] for sec in BUSINESS_OWNER_PRESET_V2["sections"]}
+
+        # 요청한 섹션만, preset에 없는 섹션도 빈 선택 없이 (priority 순, 앞 섹션 카드 제외)
+        picked = worker._select_store_sections(store, saju, {}, section_ids=["money", "extra"])
+        assert list(picked) == ["money", "extra"]
+        money = [store.cards[no].id for no in picked["money"]]
+        extra = [store.cards[no].id for no in picked["extra"]]
+        assert money and extra and not set(money) & set(extra)
+        assert sorted(money + extra) == sorted(c.id for c in store.cards)
+
+        preset = {"name": "t", "sections": [{
+            "key": "s", "title": "S", "totalTarget": 3, "focusTags": [],
+            "perTopic": [{"topic": "WEALTH", "k": 3}],
+        }]}
+        nos = select_card_nos_for_preset(store, preset, ["정재"], exclude={"W1"})[0][3]
+        assert [store.cards[no].id for no in nos] == ["W2", "W3"]
+
+        legacy = worker._select_rulecards_for_section(list(store.cards) + [store.cards[0]], "x", k=10)
+        assert [c["id"] for c in legacy] == ["W1", "W2", "W3", "C1", "C2"]
+
+
+class TestRuleCardShare:
+    """워커 공유 모드 / 메모리 리포트"""
+
+    def test_private_mode_skips_preload_and_reports_memory(self, tmp_path):
+        from app.services.rulecards_shared import memory_report, preload_rulecard_store
+
+        assert preload_rulecard_store(tmp_path / "missing.db") is None  # 기본 private
+        report = memory_report()
+        assert report["mode"] == "private"
+        if report["available"]:
+            assert report["rss_mb"] >= report["private_mb"] > 0
+
+
+class TestRuleCardRegistry:
+    """핫 리로드 - 검증 후 원자적 교체, 기존 참조는 이전 버전 유지"""
+
+    def test_reload_swaps_version_and_keeps_pinned_store(self, tmp_path):
+        import asyncio
+        import json
+        import types
+        import pytest
+        from app.services.match_module import match_module
+        from app.services.rulecards_registry import RuleCardReloadError, RuleCardRegistry
+
+        source = tmp_path / "rulecards.jsonl"
+        lines = (Path(__file__).parent.parent / "data" / "rulecards.jsonl").read_text(encoding="utf-8").splitlines()
+        source.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        first = RuleCardStore(str(source))
+        first.load()
+
+        registry = RuleCardRegistry()
+        state = types.SimpleNamespace(rulestore=None)
+        registry.bind_app_state(state)
+        registry.install(first, source)
+        pinned = state.rulestore  # 진행 중인 요청/잡이 잡아 둔 참조
+        v1 = registry.info()["version"]
+        assert pinned is first and match_module.store is first and v1 == first.content_hash()
+
+        assert asyncio.run(registry.reload())["status"] == "unchanged"
+
+        card = json.loads(lines[0])
+        card["priority"] = card.get("priority", 0) + 7
+        source.write_text("\n".join([json.dumps(card, ensure_ascii=False)] + lines[1:]) + "\n", encoding="utf-8")
+        out = asyncio.run(registry.reload())
+        assert out["status"] == "swapped" and out["generation"] == 2 and out["version"] != v1
+        assert state.rulestore is match_module.store is registry.store is not first
+        assert pinned.version == v1 and pinned.cards[0].priority != state.rulestore.cards[0].priority
+
+        source.write_text("\n".join(lines[:1]) + "\n", encoding="utf-8")  # 카드 급감 → 거부
+        with pytest.raises(RuleCardReloadError):
+            asyncio.run(registry.reload())
+        assert registry.info()["version"] == out["version"] and registry.stats["failures"] == 1
+        assert asyncio.run(registry.reload(force=True))["cards"] == 1
+
+
+class TestRuleCardSearch:
+    """질문 전문검색 (FTS5 bm25) → 후보 카드"""
+
+    def test_search_topics_and_query_stage(self, tmp_path):
+        from app.services.rulecards_fts import build_match_query
+
+        assert build_match_query("동업자와 갈등이 있어요") == '"동업자"* OR "갈등"*'
+        assert build_match_query("올해 어떻게?") == ""
+
+        store = RuleCardStore(path=str(tmp_path / "cards.jsonl"), cards=[
+            RuleCard(id="W1", topic="WEALTH", tags=["정재"], priority=9.0, interpretation="꾸준한 수입"),
+            RuleCard(id="W2", topic="WEALTH", tags=["편재"], priority=1.0, interpretation="동업자와 돈 문제로 갈등"),
+            RuleCard(id="W3", topic="WEALTH", tags=["겁재"], priority=2.0, interpretation="동업자 계약 점검"),
+            RuleCard(id="R1", topic="RELATION", tags=["갈등"], priority=1.0, interpretation="동업자 관계"),
+        ])
+        hits = store.search("동업자와 갈등이 있어요", topics=["WEALTH"])
+        assert [store.cards[no].id for no, _ in hits] == ["W2", "W3"]
+        assert store.search("동업자", topics=["RELATION"], k=1)[0][0] == 3
+        assert list(tmp_path.glob("cards.jsonl.*.fts"))
+
+        preset = {"name": "t", "sections": [{
+            "key": "s", "title": "S", "totalTarget": 4, "focusTags": [],
+            "perTopic": [{"topic": "WEALTH", "k": 3}],
+        }]}
+        plain = select_cards_for_preset(store, preset, ["정재"])["sections"][0]
+        asked = select_cards_for_preset(store, preset, ["정재"], query="동업자 갈등")["sections"][0]
+        assert [c["id"] for c in plain["cards"]] == ["W1", "W3", "W2"]
+        assert [c["id"] for c in asked["cards"]] == ["W2", "W3", "W1"]  # 쿼터 절반(2장)까지 질문 후보 먼저
+        assert asked["meta"]["byStage"] == {"s1": 0, "s2": 1, "s3": 0, "s4": 0, "q": 2}
+
+
+class TestSelectionCache:
+    """태그 서명 캐시 = 매번 선택한 결과"""
+
+    def test_hit_returns_same_selection(self):
+        from app.services.focus_boost import boost_preset_focus
+        from app.services.preset_type2 import BUSINESS_OWNER_PRESET_V2
+        from app.services.selection_cache import CardSelectionCache
+
+        store = _store()
+        cache = CardSelectionCache(max_size=2)
+        tags = ["정재", "편관", "편재"]
+        expected = select_cards_for_preset(store, boost_preset_focus(BUSINESS_OWNER_PRESET_V2, tags), tags)
+
+        first = cache.select(store, BUSINESS_OWNER_PRESET_V2, tags)
+        first["sections"][0]["cards"].clear()  # 호출부 수정이 캐시에 남지 않음
+        again = cache.select(store, BUSINESS_OWNER_PRESET_V2, ["편재", "정재", "편관", "정재"])
+        assert again == expected
+        assert cache.stats == {"hits": 1, "misses": 1, "evictions": 0}
+        assert store.version == ""  # 서명 계산이 store를 바꾸지 않음
+
+        cache.select(store, BUSINESS_OWNER_PRESET_V2, ["겁재"])
+        cache.select(store, BUSINESS_OWNER_PRESET_V2, ["정관"])
+        assert cache.get_stats()["evictions"] == 1 and cache.get_stats()["size"] == 2
@@ -0,0 +1,120 @@
+# backfill_calendar_cache.py
+"""
+KASI getLunCalInfo 월 단위 조회 → calendar_cache(Supabase) + 로컬 sqlite 계층 일괄 적재
+
+사용:
+    cd backend
+    python tools/backfill_calendar_cache.py                          # 1930-01 ~ 2030-12
+    python tools/backfill_calendar_cache.py --start 1990-01 --end 1999-12 --concurrency 2
+    python tools/backfill_calendar_cache.py --local-only             # Supabase 없이 sqlite만
+
+중단 후 같은 명령을 다시 실행하면 체크포인트(--checkpoint)에 기록된 달은 건너뜀.
+달은 batch가 저장된 뒤에만 완료로 기록됨 → 중간에 죽어도 누락 없음.
+
+필요: KASI_API_KEY, (Supabase 적재 시) SUPABASE_URL / SUPABASE_SERVICE_ROLE_KEY
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.kasi_api import get_kasi_client, kasi_http  # noqa: E402
+
+DEFAULT_CHECKPOINT = Path(__file__).resolve().parent.parent / "data" / "backfill_calendar_cache.checkpoint.json"
+
+
+def parse_month(s: str):
+    y, m = s.split("-")
+    return int(y), int(m)
+
+
+def month_range(start, end):
+    y, m = start
+    while (y, m) <= end:
+        yield y, m
+        y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+
+
+def load_checkpoint(path: Path) -> set:
+    if not path.exists():
+        return set()
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {tuple(ym) for ym in data.get("done", [])}
+
+
+def save_checkpoint(path: Path, done: set) -> None:
+    """tmp 파일에 쓰고 교체 → 저장 중 중단돼도 이전 체크포인트 유지"""
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"done": sorted(done)}), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+async def backfill(args) -> int:
+    kasi_client = get_kasi_client()
+    checkpoint = Path(args.checkpoint)
+    done = load_checkpoint(checkpoint)
+    months = [ym for ym in month_range(parse_month(args.start), parse_month(args.end)) if ym not in done]
+    print(f"📅 {len(months)} months to fetch ({len(done)} already done)")
+
+    buffer, pending = [], []
+    failed = 0
+    t0 = time.time()
+
+    async def flush():
+        nonlocal failed
+        if not pending:
+            return
+        result = await kasi_client.cache.put_many(buffer, supabase=not args.local_only)
+        ok = result["sqlite"] or kasi_client.cache.sqlite is None
+        if not args.local_only:
+            ok = ok and result["supabase"]
+        if ok:
+            done.update(pending)
+            save_checkpoint(checkpoint, done)
+        else:
+            failed += len(pending)
+            print(f"  ❌ batch save failed ({len(pending)} months) - 다음 실행에서 재시도")
+        print(f"  💾 {result['rows']} rows, {len(done)} months done ({time.time() - t0:.0f}s)")
+        buffer.clear()
+        pending.clear()
+
+    async for year, month, rows in kasi_client.prefetch_months(months, args.concurrency, args.retries):
+        if rows is None:
+            failed += 1
+            print(f"  ❌ {year}-{month:02d} fetch failed")
+            continue
+        buffer.extend(rows)
+        pending.append((year, month))
+        if len(buffer) >= args.batch_rows:
+            await flush()
+    await flush()
+    await kasi_http.aclose()
+
+    print("✅ backfill complete" if failed == 0 else f"⚠️ {failed} months failed - 같은 명령으로 재실행")
+    return 1 if failed else 0
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--start", default="1930-01")
+    ap.add_argument("--end", default="2030-12")
+    ap.add_argument("--concurrency", type=int, default=4)
+    ap.add_argument("--retries", type=int, default=3)
+    ap.add_argument("--batch-rows", type=int, default=1000, help="이 행 수마다 저장 + 체크포인트")
+    ap.add_argument("--checkpoint", default=str(DEFAULT_CHECKPOINT))
+    ap.add_argument("--local-only", action="store_true", help="Supabase 적재 생략 (sqlite만)")
+    args = ap.parse_args()
+
+    if not get_kasi_client().api_key:
+        print("❌ KASI_API_KEY 없음")
+        sys.exit(2)
+    sys.exit(asyncio.run(backfill(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# bench_report_selection.py
+"""
+프리미엄 리포트(report_worker) 섹션 카드 선택 벤치마크: 이전 목록 스캔 vs store 색인 선택
+
+사용:
+    cd backend
+    python tools/bench_report_selection.py                          # data/sajuos_master.db
+    python tools/bench_report_selection.py --source data/rulecards.jsonl --charts 200
+
+모드 (무작위 원국 N개 × DEFAULT_SECTION_IDS 7섹션):
+- list  : 이전 방식 - 카드 dict 목록을 섹션마다 훑고 `c in picked`(리스트 비교)로 중복 확인
+          (RuleCard 목록이면 전부 건너뛰어 빈 선택이 되므로 to_dict() 목록으로 측정)
+- store : _select_store_sections - 잡당 1회 IDF 점수 + 토픽 번호 배열 + id 집합 → 섹션별 번호
+          (섹션당 시간 = 잡 1회 / 섹션 수, 카드 dict는 고른 것만 생성)
+
+store 선택이 섹션 간 같은 카드를 고르면 종료 코드 1.
+"""
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.feature_tags import CHEONGAN, JIJI  # noqa: E402
+from app.services.report_worker import ReportWorker  # noqa: E402
+from app.services.rulecards_snapshot import load_rulecard_store  # noqa: E402
+
+DEFAULT_SOURCE = Path(__file__).resolve().parent.parent / "data" / "sajuos_master.db"
+
+
+def random_chart(rng: random.Random) -> dict:
+    keys = ["year_pillar", "month_pillar", "day_pillar", "hour_pillar"]
+    return {k: rng.choice(CHEONGAN) + rng.choice(JIJI) for k in keys[: rng.choice([3, 4])]}
+
+
+def list_select(all_cards, section_id: str, k: int = 24):
+    """이전 _select_rulecards_for_section (dict 목록, 리스트 멤버십)"""
+    picked = []
+    for c in all_cards:
+        tags = c.get("section_tags") or c.get("tags") or []
+        if section_id in tags:
+            picked.append(c)
+        if len(picked) >= k:
+            break
+    if len(picked) < k:
+        for c in all_cards:
+            if c in picked:
+                continue
+            picked.append(c)
+            if len(picked) >= k:
+                break
+    return picked
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--source", default=str(DEFAULT_SOURCE))
+    ap.add_argument("--charts", type=int, default=50)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+    logging.disable(logging.INFO)
+
+    store = load_rulecard_store(args.source)
+    worker = ReportWorker()
+    sections = worker.DEFAULT_SECTION_IDS
+    t0 = time.perf_counter()
+    dict_cards = [c.to_dict() for c in store.cards]
+    to_dict_ms = (time.perf_counter() - t0) * 1000
+
+    rng = random.Random(args.seed)
+    charts = [random_chart(rng) for _ in range(args.charts)]
+    print(f"cards={len(store.cards)} sections={len(sections)} charts={len(charts)} to_dict(전체)={to_dict_ms:.1f}ms")
+
+    timings = {"list": 0.0, "store": 0.0}
+    picked = {"list": 0, "store": 0}
+    repeated = 0
+    for saju in charts:
+        t0 = time.perf_counter()
+        for sid in sections:
+            picked["list"] += len(list_select(dict_cards, sid))
+        timings["list"] += time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        by_section = worker._select_store_sections(store, saju, {})
+        cards = [[store.cards[no].to_dict() for no in nos] for nos in by_section.values()]
+        timings["store"] += time.perf_counter() - t0
+
+        ids = [c["id"] for sec in cards for c in sec]
+        picked["store"] += len(ids)
+        repeated += len(ids) - len(set(ids))
+
+    n = len(charts) * len(sections)
+    for mode, sec in timings.items():
+        print(f"{mode:>6}: {sec / n * 1000:8.3f} ms/섹션  (카드 {picked[mode] / n:.1f}장/섹션)")
+    print(f"speedup list → store: {timings['list'] / max(timings['store'], 1e-9):.1f}x")
+    if repeated:
+        print(f"❌ 섹션 간 중복 카드 {repeated}건")
+        return 1
+    print("✅ 섹션 간 중복 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,298 @@
+# bench_rulecards_memory.py
+"""
+룰카드 store의 워커당 RSS 비교 (모드마다 새 프로세스)
+
+사용:
+    cd backend
+    python tools/bench_rulecards_memory.py                          # data/sajuos_master.db
+    python tools/bench_rulecards_memory.py --source data/rulecards.jsonl
+    python tools/bench_rulecards_memory.py --workers 4              # 워커별 shared / private (fork)
+
+모드:
+- legacy   : 이전 RuleCard (dataclass + content/meta dict + 재직렬화 trigger, 태그 intern 없음)
+- slots    : 현재 RuleCard (__slots__, 본문 1벌, 태그 intern) - 원본 로드
+- snapshot : 현재 RuleCard - <원본>.snap 로드 (없으면 건너뜀)
+
+RSS 증가분 = store 로드 후 RSS - import 직후 RSS (gc.collect 후 /proc/self/statm)
+
+--workers N: rulecards_share_mode별로 N개 워커를 fork → 카드 선택 요청을 돌린 뒤
+워커마다 memory_report() (smaps_rollup의 shared / private / pss)
+- private : 워커가 각자 로드 (uvicorn --workers와 같은 구성)
+- preload : 부모가 로드 + 주입 + gc.freeze 후 fork (gunicorn --preload와 같은 구성)
+"""
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.rulecards_store import (  # noqa: E402
+    RuleCardStore, canon_tag, parse_trigger, safe_priority,
+)
+
+DEFAULT_SOURCE = Path(__file__).resolve().parent.parent / "data" / "sajuos_master.db"
+MODES = ("legacy", "slots", "snapshot")
+
+
+def rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # 최대치 (Linux 외 근사)
+
+
+# ============ 이전 표현 (비교용) ============
+
+@dataclass
+class LegacyRuleCard:
+    id: str
+    topic: str
+    tags: List[str]
+    priority: float = 0.0
+    trigger: Optional[str] = None
+    mechanism: Optional[str] = None
+    interpretation: Optional[str] = None
+    action: Optional[str] = None
+    cautions: Optional[List[str]] = None
+    content: Dict[str, Any] = field(default_factory=dict)
+    meta: Dict[str, Any] = field(default_factory=dict)
+    conditions: Optional[tuple] = None
+
+
+def load_legacy_cards(source: Path) -> List[LegacyRuleCard]:
+    """이전 로더와 같은 객체 구성 (카드마다 content/meta dict, 태그 문자열 개별 생성)"""
+    cards: List[LegacyRuleCard] = []
+    if source.suffix == ".db":
+        import sqlite3
+        conn = sqlite3.connect(str(source))
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute(
+            "SELECT id, topic, priority, trigger_json, tags_json, "
+            "interpretation, mechanism, action, cautions_json FROM rule_cards"
+        ).fetchall()
+        conn.close()
+        for r in rows:
+            trigger_obj = json.loads(r["trigger_json"] or "{}")
+            kw = trigger_obj.get("keywords", []) if isinstance(trigger_obj, dict) else []
+            tags = json.loads(r["tags_json"] or "[]") or [str(x).strip() for x in kw] or [r["topic"] or "GENERAL"]
+            cautions = json.loads(r["cautions_json"] or "[]")
+            cards.append(LegacyRuleCard(
+                id=r["id"],
+                topic=r["topic"] or "GENERAL",
+                priority=safe_priority(r["priority"]),
+                trigger=json.dumps(trigger_obj) if trigger_obj else None,
+                conditions=parse_trigger(trigger_obj),
+                tags=[canon_tag(x) for x in tags if x],
+                mechanism=r["mechanism"] or "",
+                interpretation=r["interpretation"] or "",
+                action=r["action"] or "",
+                cautions=cautions,
+                content={
+                    "interpretation": r["interpretation"] or "",
+                    "mechanism": r["mechanism"] or "",
+                    "action": r["action"] or "",
+                    "cautions": cautions,
+                },
+                meta={},
+            ))
+        return cards
+
+    with open(source, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            obj = json.loads(line)
+            cautions = obj.get("cautions", [])
+            cards.append(LegacyRuleCard(
+                id=obj["id"],
+                topic=obj["topic"],
+                tags=[canon_tag(x) for x in obj.get("tags") or [obj["topic"]]],
+                priority=safe_priority(obj.get("priority", 0)),
+                trigger=obj.get("trigger"),
+                conditions=parse_trigger(obj.get("trigger")),
+                mechanism=obj.get("mechanism"),
+                interpretation=obj.get("interpretation"),
+                action=obj.get("action"),
+                cautions=cautions,
+                content={
+                    "interpretation": obj.get("interpretation", ""),
+                    "mechanism": obj.get("mechanism", ""),
+                    "action": obj.get("action", ""),
+                    "cautions": cautions,
+                },
+                meta={},
+            ))
+    return cards
+
+
+# ============ 측정 ============
+
+def measure(mode: str, source: Path) -> Dict[str, Any]:
+    """현재 프로세스에서 1개 모드 측정 (자식 프로세스에서 호출)"""
+    gc.collect()
+    before = rss_bytes()
+
+    if mode == "legacy":
+        store = RuleCardStore(path=str(source), cards=load_legacy_cards(source))
+    elif mode == "snapshot":
+        from app.services.rulecards_snapshot import default_snapshot_path, read_snapshot
+        store = read_snapshot(default_snapshot_path(source), source)
+    elif source.suffix == ".db":
+        store = RuleCardStore.load_from_sqlite_master(str(source))
+    else:
+        store = RuleCardStore(str(source))
+        store.load()
+
+    gc.collect()
+    delta = rss_bytes() - before
+    return {
+        "mode": mode,
+        "cards": len(store.cards),
+        "rss_mb": round((before + delta) / 1048576, 1),
+        "delta_mb": round(delta / 1048576, 1),
+        "bytes_per_card": delta // max(len(store.cards), 1),
+    }
+
+
+def _load_and_attach(source: Path) -> RuleCardStore:
+    from app.services.rulecards_shared import attach_store
+    from app.services.rulecards_snapshot import load_rulecard_store
+    store = load_rulecard_store(source)
+    attach_store(store)
+    return store
+
+
+def _workload(store: RuleCardStore, requests: int, seed: int) -> None:
+    """요청 흉내: 무작위 태그로 preset 카드 선택 + 섹션 채점"""
+    import random
+    from app.services.focus_boost import boost_preset_focus
+    from app.services.preset_type2 import BUSINESS_OWNER_PRESET_V2
+    from app.services.rulecard_scorer import rulecard_scorer
+    from app.services.rulecard_selector import select_cards_for_preset
+
+    rng = random.Random(seed)
+    vocab = sorted(store.postings)
+    for _ in range(requests):
+        tags = rng.sample(vocab, min(12, len(vocab)))
+        select_cards_for_preset(store, boost_preset_focus(BUSINESS_OWNER_PRESET_V2, tags), tags)
+        rulecard_scorer.score_all_sections(store, tags, {}, section_ids=["money", "team"])
+
+
+def run_workers(mode: str, source: Path, workers: int, requests: int) -> List[Dict[str, Any]]:
+    """mode별로 워커 fork → 요청 처리 → 모든 워커가 살아 있는 동안 memory_report 수집"""
+    from app.services.rulecards_shared import memory_report
+
+    if mode == "preload":
+        store = _load_and_attach(source)
+        gc.collect()
+        gc.freeze()
+
+    release_r, release_w = os.pipe()
+    children = []
+    for i in range(workers):
+        rep_r, rep_w = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # 워커
+            os.close(release_w)
+            os.close(rep_r)
+            try:
+                if mode == "private":
+                    store = _load_and_attach(source)
+                _workload(store, requests, seed=i)
+                gc.collect()
+                report = {**memory_report(), "mode": mode}
+                os.write(rep_w, json.dumps(report).encode())
+                os.close(rep_w)
+                os.read(release_r, 1)  # 다른 워커가 측정을 끝낼 때까지 공유 상태 유지
+            finally:
+                os._exit(0)
+        os.close(rep_w)
+        children.append((pid, rep_r))
+
+    reports = []
+    for pid, rep_r in children:
+        with os.fdopen(rep_r) as f:
+            reports.append(json.loads(f.read()))
+    os.close(release_w)
+    os.close(release_r)
+    for pid, _ in children:
+        os.waitpid(pid, 0)
+    if mode == "preload":
+        gc.unfreeze()
+    return reports
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--source", default=str(DEFAULT_SOURCE))
+    ap.add_argument("--workers", type=int, default=0, help="N>0이면 워커별 shared/private 측정")
+    ap.add_argument("--requests", type=int, default=50, help="워커당 선택 요청 수 (--workers)")
+    ap.add_argument("--share-mode", choices=("private", "preload"), help=argparse.SUPPRESS)
+    ap.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    source = Path(args.source)
+    if args.share_mode:
+        import contextlib
+        with contextlib.redirect_stdout(sys.stderr):
+            reports = run_workers(args.share_mode, source, args.workers, args.requests)
+        print(json.dumps(reports))
+        return
+    if args.child:
+        import contextlib
+        with contextlib.redirect_stdout(sys.stderr):  # 로더의 print는 결과 JSON과 분리
+            result = measure(args.child, source)
+        print(json.dumps(result))
+        return
+
+    if not source.exists():
+        print(f"❌ 원본 없음: {source}")
+        sys.exit(2)
+
+    if args.workers > 0:
+        print(f"{'mode':<9}{'pid':>8}{'RSS MB':>9}{'shared':>9}{'private':>9}{'PSS MB':>9}")
+        for mode in ("private", "preload"):
+            out = subprocess.run(
+                [sys.executable, __file__, "--source", str(source), "--share-mode", mode,
+                 "--workers", str(args.workers), "--requests", str(args.requests)],
+                capture_output=True, text=True, check=True,
+            )
+            reports = json.loads(out.stdout.strip().splitlines()[-1])
+            for r in reports:
+                print(f"{mode:<9}{r['pid']:>8}{r['rss_mb']:>9}{r['shared_mb']:>9}{r['private_mb']:>9}{r['pss_mb']:>9}")
+            print(f"{mode:<9}{'합계':>8}{'':>9}{'':>9}"
+                  f"{round(sum(r['private_mb'] for r in reports), 1):>9}{round(sum(r['pss_mb'] for r in reports), 1):>9}")
+        return
+
+    from app.services.rulecards_snapshot import default_snapshot_path
+    results = []
+    for mode in MODES:
+        if mode == "snapshot" and not default_snapshot_path(source).exists():
+            print("⚠️ 스냅샷 없음 → snapshot 모드 건너뜀 (tools/build_rulecards_snapshot.py)")
+            continue
+        out = subprocess.run(
+            [sys.executable, __file__, "--source", str(source), "--child", mode],
+            capture_output=True, text=True, check=True,
+        )
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    print(f"{'mode':<10}{'cards':>8}{'RSS MB':>10}{'Δ MB':>9}{'B/card':>9}")
+    for r in results:
+        print(f"{r['mode']:<10}{r['cards']:>8}{r['rss_mb']:>10}{r['delta_mb']:>9}{r['bytes_per_card']:>9}")
+    base = next((r for r in results if r["mode"] == "legacy"), None)
+    if base and base["delta_mb"] > 0:
+        for r in results:
+            if r is not base:
+                print(f"📉 {r['mode']}: store RSS {100 * (1 - r['delta_mb'] / base['delta_mb']):.0f}% 감소 (legacy 대비)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# bench_scorer_masks.py
+"""
+원국 철벽 필터 마이크로 벤치마크: 부분 문자열 스캔 vs 개념 비트마스크 AND
+
+사용:
+    cd backend
+    python tools/bench_scorer_masks.py                          # data/sajuos_master.db
+    python tools/bench_scorer_masks.py --source data/rulecards.jsonl --charts 200
+
+모드 (전체 카드 × ALLOWED_SECTION_IDS 전 섹션, 무작위 원국 N개):
+- scan  : 이전 방식 - 섹션마다 카드 topic/tags 문자열을 만들고 없는 오행 용어를 부분 문자열 검색
+- mask  : 요청당 user_concept_mask 1번 → 섹션마다 (concept_masks & absent) == 0
+- score : RuleCardScorer.score_all_sections 전체 (필터 포함 채점 1회)
+
+build = 로드 시 concept_masks 계산 시간 (카드당 1번). 두 필터의 제외 카드가 다르면 종료 코드 1.
+"""
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.feature_tags import CHEONGAN, JIJI  # noqa: E402
+from app.services.rulecard_scorer import (  # noqa: E402
+    ALLOWED_SECTION_IDS, ELEMENT_TOPICS, RuleCardScorer,
+    absent_element_mask, get_present_elements, user_concept_mask,
+)
+from app.services.rulecards_snapshot import load_rulecard_store  # noqa: E402
+
+DEFAULT_SOURCE = Path(__file__).resolve().parent.parent / "data" / "sajuos_master.db"
+
+
+def random_chart(rng: random.Random) -> dict:
+    keys = ["year_pillar", "month_pillar", "day_pillar", "hour_pillar"]
+    return {k: rng.choice(CHEONGAN) + rng.choice(JIJI) for k in keys[: rng.choice([3, 4])]}
+
+
+def scan_filter(cards, saju: dict) -> np.ndarray:
+    """이전 should_exclude_card 방식 (카드마다 문자열 생성 + 부분 문자열 검색)"""
+    present = get_present_elements(saju)
+    keep = np.ones(len(cards), dtype=bool)
+    if not present:
+        return keep
+    for i, c in enumerate(cards):
+        card_text = f"{(c.topic or '').lower()} {' '.join(c.tags or ()).lower()}"
+        for element, topics in ELEMENT_TOPICS.items():
+            if element not in present and any(t in card_text for t in topics):
+                keep[i] = False
+                break
+    return keep
+
+
+def mask_filter(masks: np.ndarray, saju: dict) -> np.ndarray:
+    absent = absent_element_mask(user_concept_mask(saju))
+    if not absent:
+        return np.ones(len(masks), dtype=bool)
+    return (masks & np.uint32(absent)) == 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--source", default=str(DEFAULT_SOURCE))
+    ap.add_argument("--charts", type=int, default=50)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+    logging.disable(logging.INFO)
+
+    store = load_rulecard_store(args.source)
+    scorer = RuleCardScorer()
+    t0 = time.perf_counter()
+    batch = scorer._prepare(store)
+    build_ms = (time.perf_counter() - t0) * 1000
+
+    rng = random.Random(args.seed)
+    charts = [random_chart(rng) for _ in range(args.charts)]
+    sections = ALLOWED_SECTION_IDS
+    print(f"cards={len(store.cards)} sections={len(sections)} charts={len(charts)} build={build_ms:.1f}ms")
+
+    timings = {"scan": 0.0, "mask": 0.0, "score": 0.0}
+    mismatched = 0
+    for saju in charts:
+        t0 = time.perf_counter()
+        for _ in sections:
+            scan_keep = scan_filter(store.cards, saju)
+        timings["scan"] += time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for _ in sections:
+            mask_keep = mask_filter(batch.concept_masks, saju)
+        timings["mask"] += time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        scorer.score_all_sections(store, [], None, section_ids=sections, saju_data=saju)
+        timings["score"] += time.perf_counter() - t0
+
+        mismatched += int((scan_keep != mask_keep).sum())
+
+    for mode, sec in timings.items():
+        print(f"{mode:>6}: {sec / len(charts) * 1000:8.3f} ms/요청 (전 섹션)")
+    print(f"speedup scan → mask: {timings['scan'] / max(timings['mask'], 1e-9):.0f}x")
+    if mismatched:
+        print(f"❌ 제외 카드 불일치 {mismatched}건")
+        return 1
+    print("✅ 제외 카드 일치")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
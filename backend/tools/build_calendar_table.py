@@ -0,0 +1,78 @@
+# build_calendar_table.py
+"""
+절입 시각 인덱스(data/solar_terms_1850_2149.bin) + 만세력 테이블(data/ganji_calendar_v1.bin) 생성
+
+사용:
+    cd backend
+    python tools/build_calendar_table.py                 # 1900~2100 기본
+    python tools/build_calendar_table.py --verify        # 생성 후 ephem 엔진과 교차검증
+
+필요: ephem, korean-lunar-calendar (requirements.txt에 포함)
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.calendar_table import (  # noqa: E402
+    CalendarTable, DEFAULT_TABLE_PATH, FIRST_YEAR, LAST_YEAR, build_table,
+)
+from app.services.solar_terms import DEFAULT_INDEX_PATH, SolarTermIndex  # noqa: E402
+
+
+def verify(table: CalendarTable, samples: int) -> int:
+    """일주는 앵커 계산, 년/월주는 절입 시각 기준 ephem 엔진과 비교 (경계일 제외)"""
+    from app.services.engine_v2 import SajuManager
+
+    manager = SajuManager()
+    rng = random.Random(42)
+    mismatches = 0
+    for _ in range(samples):
+        y = rng.randint(table.first_date.year, table.last_date.year)
+        m = rng.randint(1, 12)
+        d = rng.randint(1, 28)
+        h = rng.randint(0, 23)
+
+        got = table.get_ganji(y, m, d, h)
+        if got["is_boundary"]:
+            continue
+        ref = manager._ephem_calculate_ganji(y, m, d, h)
+        for key in ("year_ganji", "month_ganji", "day_ganji"):
+            if got[key] != ref[key]:
+                mismatches += 1
+                print(f"  ❌ {y}-{m:02d}-{d:02d} {h:02d}h {key}: table={got[key]} ephem={ref[key]}")
+    return mismatches
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--out", default=str(DEFAULT_TABLE_PATH))
+    ap.add_argument("--first-year", type=int, default=FIRST_YEAR)
+    ap.add_argument("--last-year", type=int, default=LAST_YEAR)
+    ap.add_argument("--skip-terms", action="store_true", help="기존 절입 시각 인덱스 재사용")
+    ap.add_argument("--verify", action="store_true")
+    ap.add_argument("--samples", type=int, default=2000)
+    args = ap.parse_args()
+
+    t0 = time.time()
+    if not args.skip_terms:
+        SolarTermIndex.build().save(DEFAULT_INDEX_PATH)
+        print(f"✅ {DEFAULT_INDEX_PATH} ({time.time() - t0:.1f}s)")
+
+    info = build_table(Path(args.out), args.first_year, args.last_year)
+    print(f"✅ {info['path']}")
+    print(f"   days={info['days']} terms={info['terms']} bytes={info['bytes']:,} crc32={info['crc32']}")
+    print(f"   {time.time() - t0:.1f}s")
+
+    if args.verify:
+        table = CalendarTable(Path(args.out))
+        bad = verify(table, args.samples)
+        print("✅ verify OK" if bad == 0 else f"❌ verify: {bad} mismatches")
+        sys.exit(1 if bad else 0)
+
+
+if __name__ == "__main__":
+    main()
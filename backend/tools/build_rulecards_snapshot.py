@@ -0,0 +1,105 @@
+# build_rulecards_snapshot.py
+"""
+룰카드 바이너리 스냅샷(<원본>.snap) 생성 + 원본 로드와 대조
+
+사용:
+    cd backend
+    python tools/build_rulecards_snapshot.py                          # data/sajuos_master.db
+    python tools/build_rulecards_snapshot.py --source data/rulecards.jsonl
+    python tools/build_rulecards_snapshot.py --verify-only            # 기존 스냅샷 검증 + 로드 시간 비교
+
+원본(db/jsonl)을 바꾸면 다시 실행 - 서버는 스냅샷이 원본보다 오래되면 원본에서 로드함.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.rulecards_store import RuleCardStore  # noqa: E402
+from app.services.rulecards_snapshot import (  # noqa: E402
+    default_snapshot_path, read_snapshot, write_snapshot,
+)
+
+DEFAULT_SOURCE = Path(__file__).resolve().parent.parent / "data" / "sajuos_master.db"
+
+
+def load_source(source: Path) -> RuleCardStore:
+    if source.suffix == ".db":
+        return RuleCardStore.load_from_sqlite_master(str(source))
+    store = RuleCardStore(str(source))
+    store.load()
+    return store
+
+
+def verify(a: RuleCardStore, b: RuleCardStore) -> int:
+    """카드 필드 + 인덱스 비교 → 불일치 수"""
+    bad = 0
+    fields = ("id", "topic", "tags", "priority", "trigger", "mechanism", "interpretation",
+              "action", "cautions", "content", "conditions", "subtopic")
+    if len(a.cards) != len(b.cards):
+        print(f"  ❌ 카드 수 {len(a.cards)} != {len(b.cards)}")
+        return 1
+    for x, y in zip(a.cards, b.cards):
+        for f in fields:
+            if getattr(x, f) != getattr(y, f):
+                bad += 1
+                if bad <= 5:
+                    print(f"  ❌ {x.id}.{f}: {getattr(x, f)!r} != {getattr(y, f)!r}")
+    for name in ("idf", "card_no", "source"):
+        if getattr(a, name) != getattr(b, name):
+            bad += 1
+            print(f"  ❌ {name} 불일치")
+    for name in ("postings", "topic_nos", "trigger_index"):
+        x, y = getattr(a, name), getattr(b, name)
+        if x.keys() != y.keys() or any(x[k].tolist() != y[k].tolist() for k in x):
+            bad += 1
+            print(f"  ❌ {name} 불일치")
+    for name in ("topic_rank", "priorities"):
+        if getattr(a, name).tolist() != getattr(b, name).tolist():
+            bad += 1
+            print(f"  ❌ {name} 불일치")
+    if {t: [c.id for c in p] for t, p in a.by_topic.items()} != {t: [c.id for c in p] for t, p in b.by_topic.items()}:
+        bad += 1
+        print("  ❌ by_topic 불일치")
+    ma, mb = a.tag_matrix, b.tag_matrix
+    if ma.vocab != mb.vocab or ma.indptr.tolist() != mb.indptr.tolist() or ma.indices.tolist() != mb.indices.tolist():
+        bad += 1
+        print("  ❌ tag_matrix 불일치")
+    return bad
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--source", default=str(DEFAULT_SOURCE))
+    ap.add_argument("--out", default="", help="기본: <source>.snap")
+    ap.add_argument("--verify-only", action="store_true")
+    args = ap.parse_args()
+
+    source = Path(args.source)
+    out = Path(args.out) if args.out else default_snapshot_path(source)
+    if not source.exists():
+        print(f"❌ 원본 없음: {source}")
+        sys.exit(2)
+
+    t0 = time.perf_counter()
+    store = load_source(source)
+    source_ms = (time.perf_counter() - t0) * 1000
+
+    if not args.verify_only:
+        info = write_snapshot(store, out, source)
+        print(f"📦 {info['path']}: {info['cards']} cards, {info['strings']} strings, {info['bytes']:,} bytes")
+
+    t0 = time.perf_counter()
+    snap = read_snapshot(out, source)
+    snap_ms = (time.perf_counter() - t0) * 1000
+    print(f"⏱️ 원본 로드 {source_ms:.1f}ms / 스냅샷 로드 {snap_ms:.1f}ms")
+
+    bad = verify(store, snap)
+    print("✅ 스냅샷 = 원본" if bad == 0 else f"❌ {bad} mismatches")
+    sys.exit(1 if bad else 0)
+
+
+if __name__ == "__main__":
+    main()
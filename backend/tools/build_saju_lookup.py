@@ -0,0 +1,142 @@
+# build_saju_lookup.py
+"""
+사주 전수 조회 테이블(data/saju_lookup_v1.bin) 생성 + 교차검증
+
+사용:
+    cd backend
+    python tools/build_saju_lookup.py                    # 만세력 테이블 범위 전체 (1900~2100)
+    python tools/build_saju_lookup.py --verify           # 생성 후 ScientificSajuEngine과 교차검증
+    python tools/build_saju_lookup.py --verify-only --kasi 50   # 기존 파일 검증 + KASI 샘플 50개
+
+필요: data/ganji_calendar_v1.bin (tools/build_calendar_table.py), 검증 시 ephem
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.saju_lookup import (  # noqa: E402
+    DEFAULT_LOOKUP_PATH, SajuLookupTable, build_lookup,
+)
+from app.services.calendar_table import ganji_str  # noqa: E402
+
+
+def _sample_dates(table: SajuLookupTable, samples: int, seed: int):
+    rng = random.Random(seed)
+    for _ in range(samples):
+        y = rng.randint(table.first_date.year, table.last_date.year)
+        m = rng.randint(1, 12)
+        d = rng.randint(1, 28)
+        hour = rng.choice([None] + list(range(24)))
+        minute = rng.randint(0, 59)
+        yield y, m, d, hour, minute, rng.random() < 0.5
+
+
+def verify_engine(table: SajuLookupTable, samples: int) -> int:
+    """
+    1) SajuManager 만세력 경로와 완전 일치 (경계 플래그 포함)
+    2) ScientificSajuEngine(ephem/절입 인덱스)과 4주 일치 (경계일 제외)
+    """
+    from app.services.engine_v2 import SajuManager, scientific_engine
+
+    manager = SajuManager()
+    mismatches = checked = 0
+    for y, m, d, hour, minute, solar in _sample_dates(table, samples, 42):
+        hit = table.lookup(y, m, d, hour, minute, solar)
+        if hit is None:
+            continue
+        checked += 1
+        got = {
+            "year": ganji_str(hit.year_idx),
+            "month": ganji_str(hit.month_idx),
+            "day": ganji_str(hit.day_idx),
+            "hour": ganji_str(hit.hour_idx) if hit.hour_idx is not None else None,
+        }
+
+        ref = manager.calculate_from_table(y, m, d, hour, minute, solar)
+        want = {k: (ref[f"{k}_pillar"] or {}).get("ganji") for k in got}
+        want_flags = (ref["meta"]["is_boundary"], ref["meta"]["boundary_reason"])
+        if got != want or (hit.is_boundary, hit.boundary_reason) != want_flags:
+            mismatches += 1
+            print(f"  ❌ table {y}-{m:02d}-{d:02d} {hour}:{minute:02d} solar={solar}: {got} != {want}")
+            continue
+
+        if hit.is_boundary:
+            continue
+        sci = scientific_engine.calculate(y, m, d, hour, minute, use_solar_time=solar)
+        sci_got = {k: (sci[f"{k}_pillar"] or {}).get("ganji") for k in got}
+        if sci_got != got:
+            mismatches += 1
+            print(f"  ❌ ephem {y}-{m:02d}-{d:02d} {hour}:{minute:02d} solar={solar}: {got} != {sci_got}")
+    print(f"   engine: {checked} checked")
+    return mismatches
+
+
+def verify_kasi(table: SajuLookupTable, samples: int) -> int:
+    """KASI getLunCalInfo 년/월/일 간지와 비교 (KASI는 날짜 단위 → 경계일 제외)"""
+    from app.services.engine_v2 import _norm_ganji
+    from app.services.kasi_api import get_kasi_client, kasi_http
+    kasi_client = get_kasi_client()
+
+    if not kasi_client.api_key:
+        print("   kasi: KASI_API_KEY 없음 → 건너뜀")
+        return 0
+
+    async def run() -> int:
+        bad = checked = 0
+        for y, m, d, _hour, _minute, solar in _sample_dates(table, samples, 7):
+            hit = table.lookup(y, m, d, None, 0, solar)
+            if hit is None or hit.is_boundary:
+                continue
+            try:
+                info = await kasi_client.get_lunar_info_with_cache(y, m, d)
+            except Exception as e:
+                print(f"  ⚠️ KASI {y}-{m:02d}-{d:02d}: {e}")
+                continue
+            checked += 1
+            got = (ganji_str(hit.year_idx), ganji_str(hit.month_idx), ganji_str(hit.day_idx))
+            want = tuple(_norm_ganji(info[k]) for k in ("year_ganji", "month_ganji", "day_ganji"))
+            if got != want:
+                bad += 1
+                print(f"  ❌ kasi {y}-{m:02d}-{d:02d}: table={got} kasi={want}")
+        await kasi_http.aclose()
+        print(f"   kasi: {checked} checked")
+        return bad
+
+    return asyncio.run(run())
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--out", default=str(DEFAULT_LOOKUP_PATH))
+    ap.add_argument("--first-year", type=int)
+    ap.add_argument("--last-year", type=int)
+    ap.add_argument("--verify", action="store_true")
+    ap.add_argument("--verify-only", action="store_true", help="생성 없이 기존 파일 검증")
+    ap.add_argument("--samples", type=int, default=3000)
+    ap.add_argument("--kasi", type=int, default=0, help="KASI 교차검증 샘플 수")
+    args = ap.parse_args()
+
+    if not args.verify_only:
+        t0 = time.time()
+        info = build_lookup(Path(args.out), args.first_year, args.last_year)
+        print(f"✅ {info['path']}")
+        print(f"   days={info['days']} slots={info['slots']} split={info['split_slots']} "
+              f"bytes={info['bytes']:,} (raw {info['raw_bytes']:,})")
+        print(f"   {time.time() - t0:.1f}s")
+
+    if args.verify or args.verify_only or args.kasi:
+        table = SajuLookupTable(Path(args.out))
+        bad = verify_engine(table, args.samples)
+        if args.kasi:
+            bad += verify_kasi(table, args.kasi)
+        print("✅ verify OK" if bad == 0 else f"❌ verify: {bad} mismatches")
+        sys.exit(1 if bad else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,8 @@ from typing import List, Optional, Dict, Any, Tuple
 # =============================
 # 자동 탐색 / 자동 생성 설정
 # =============================
-BASE_DIR = Path(r"D:\SajuOS_Data")
+# 증분 적재는 tools/ingest_rulecards.py (OS 무관, 바뀐 파일만) - 이 스크립트는 전체 재생성용
+BASE_DIR = Path(os.environ.get("SAJUOS_DATA_DIR", r"D:\SajuOS_Data"))
 
 # JSONL을 못 찾으면, 아래 폴더(또는 유사 폴더)에서 JSON을 긁어서 JSONL로 만듦
 RULECARDS_ROOT_CANDIDATES = [
@@ -66,35 +67,16 @@ def create_tables(con: sqlite3.Connection):
     con.execute("CREATE INDEX IF NOT EXISTS idx_rule_cards_topic_priority ON rule_cards(topic, priority DESC);")
 
 def try_create_fts(con: sqlite3.Connection) -> bool:
+    # ingest_rulecards.py와 같은 외부 콘텐츠 FTS5 (+ 트리거) - 두 도구가 같은 DB를 번갈아 갱신해도 됨
+    from ingest_rulecards import ensure_fts
     try:
-        con.execute("""
-        CREATE VIRTUAL TABLE IF NOT EXISTS rule_cards_fts USING fts5(
-            id UNINDEXED,
-            topic UNINDEXED,
-            mechanism,
-            interpretation,
-            action,
-            tags,
-            content=''
-        );
-        """)
+        ensure_fts(con)
         return True
     except sqlite3.OperationalError:
         return False
 
 def upsert_fts(con: sqlite3.Connection):
-    con.execute("DELETE FROM rule_cards_fts;")
-    con.execute("""
-        INSERT INTO rule_cards_fts (id, topic, mechanism, interpretation, action, tags)
-        SELECT
-            id,
-            topic,
-            mechanism,
-            interpretation,
-            action,
-            tags_json
-        FROM rule_cards;
-    """)
+    con.execute("INSERT INTO rule_cards_fts (rule_cards_fts) VALUES ('rebuild');")
 
 def find_any_jsonl(base: Path) -> Optional[Path]:
     # 우선 "sajuos_master_db.jsonl" 우선 탐색
@@ -387,7 +369,7 @@ def main():
         if not rc_root:
             raise RuntimeError(
                 "JSONL도 없고 RuleCards 폴더도 못 찾았습니다.\n"
-                "D:\\SajuOS_Data\\3_SajuOS_RuleCards_JSON 경로를 확인해주세요."
+                f"{BASE_DIR / '3_SajuOS_RuleCards_JSON'} 경로를 확인해주세요 (SAJUOS_DATA_DIR로 변경 가능)."
             )
         print(f"⚠️ JSONL 미발견 → RuleCards 폴더에서 생성합니다: {rc_root}")
         total = build_jsonl_from_rulecards(rc_root, DEFAULT_JSONL_OUT)
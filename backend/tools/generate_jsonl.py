@@ -6,9 +6,10 @@ from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 # ===== 설정 =====
-INPUT_DIR = r"D:\SajuOS_Data\3_SajuOS_RuleCards_JSON"
-OUTPUT_FILE = r"D:\SajuOS_Data\sajuos_master_db.jsonl"
-REPORT_FILE = r"D:\SajuOS_Data\sajuos_master_db_report.json"
+DATA_DIR = Path(os.environ.get("SAJUOS_DATA_DIR", r"D:\SajuOS_Data"))
+INPUT_DIR = str(DATA_DIR / "3_SajuOS_RuleCards_JSON")
+OUTPUT_FILE = str(DATA_DIR / "sajuos_master_db.jsonl")
+REPORT_FILE = str(DATA_DIR / "sajuos_master_db_report.json")
 
 # [비식별/비인용] 제거 규칙 (필요하면 더 추가)
 CITE_PATTERN = re.compile(r"\[cite:\s*.*?\]", re.IGNORECASE)
@@ -0,0 +1,484 @@
+# ingest_rulecards.py
+"""
+룰카드 JSON 폴더 → sajuos_master.db 증분 적재 (경로는 OS 무관, D:\\ 고정 경로 없음)
+
+사용:
+    cd backend
+    python tools/ingest_rulecards.py                              # data/SajuOS_RuleCards_JSON → data/sajuos_master.db
+    python tools/ingest_rulecards.py --src <JSON 폴더> --db <db> --workers 4
+    python tools/ingest_rulecards.py --full                       # 해시 기록 무시 (전체 파일 다시 비교)
+    python tools/ingest_rulecards.py --dry-run                    # 바뀔 카드 수만 출력
+    python tools/ingest_rulecards.py --dup-threshold 0.7          # 유사 중복 클러스터 기준 (기본: 설정값)
+
+동작:
+1. 파일마다 (크기, mtime)이 기록과 같으면 건너뜀, 다르면 sha1 → 기록된 해시와 같으면 건너뜀 (ingest_files 테이블)
+2. 바뀐 파일만 프로세스 풀에서 파싱 + 정규화(generate_jsonl.normalize_card와 동일) + 검증
+3. 트랜잭션 1개: 내용이 달라진 카드만 UPSERT, 파일에서 빠진 카드 / 지워진 파일의 카드 DELETE
+   지워진 카드 id를 중복으로 양보했던 파일(ingest_shadowed)은 같은 트랜잭션에서 다시 파싱해 채움
+   (증분 결과 = --full 결과)
+4. rule_cards_fts = rule_cards 외부 콘텐츠 FTS5 + 트리거 → 바뀐 행만 색인 갱신
+   (build_sajuos_sqlite.py의 이전 contentless 표는 처음 한 번만 다시 만듦)
+최상위 폴더별로 파일 / 카드 수와 파싱 시간을 출력.
+5. 적재 후 전체 카드 유사 중복 클러스터(rulecard_dedup, 해석 MinHash/LSH) 크기 분포 + 큰 클러스터 출력
+   (서버는 store 로드 / 스냅샷 생성 시 같은 threshold로 cluster_id를 다시 계산)
+
+- 카드 id가 이미 다른 파일 소유면 건너뜀 (먼저 적재된 파일 우선 - generate_jsonl의 중복 규칙)
+  → (파일, id)를 ingest_shadowed에 기록. 표가 없던 db는 첫 실행을 --full로 돌려 기록을 채움
+- 파싱 실패 파일은 해시를 기록하지 않고 기존 카드를 그대로 둠 (다음 실행에서 재시도)
+- source_path = --base 기준 상대 경로 (/ 구분) - 어느 OS에서 적재해도 같은 값
+서버는 db가 바뀌면 스냅샷을 stale로 보고 원본에서 다시 로드함 (파일 감시를 켰으면 자동 reload).
+"""
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from generate_jsonl import iter_rulecards, normalize_card  # noqa: E402
+from app.services.rulecard_dedup import card_text, cluster_report, find_clusters  # noqa: E402
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_SRC = BACKEND_DIR / "data" / "SajuOS_RuleCards_JSON"
+DEFAULT_DB = BACKEND_DIR / "data" / "sajuos_master.db"
+
+CARD_COLUMNS = (
+    "id", "topic", "priority", "trigger_json", "mechanism", "interpretation", "action",
+    "tags_json", "cautions_json", "source_file", "source_path", "source_title",
+)
+FTS_COLUMNS = ("id", "topic", "mechanism", "interpretation", "action", "tags_json")
+_INLINE_MAX = 2  # 바뀐 파일이 이 이하면 프로세스 풀 없이 파싱
+
+Row = Tuple[Any, ...]
+
+
+# ============ 스키마 ============
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    con = sqlite3.connect(str(db_path), timeout=30, isolation_level=None)  # 트랜잭션은 직접 BEGIN
+    con.execute("PRAGMA journal_mode=WAL;")
+    con.execute("PRAGMA synchronous=NORMAL;")
+    con.execute("PRAGMA temp_store=MEMORY;")
+    return con
+
+
+def ensure_schema(con: sqlite3.Connection) -> bool:
+    """rule_cards / ingest_files / 외부 콘텐츠 FTS + 트리거 → FTS 재생성 여부"""
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS rule_cards (
+        id TEXT PRIMARY KEY,
+        topic TEXT NOT NULL,
+        priority INTEGER NOT NULL DEFAULT 5,
+        trigger_json TEXT NOT NULL,
+        mechanism TEXT NOT NULL,
+        interpretation TEXT NOT NULL,
+        action TEXT NOT NULL,
+        tags_json TEXT NOT NULL,
+        cautions_json TEXT NOT NULL,
+        source_file TEXT,
+        source_path TEXT,
+        source_title TEXT
+    );
+    """)
+    con.execute("CREATE INDEX IF NOT EXISTS idx_rule_cards_topic ON rule_cards(topic);")
+    con.execute("CREATE INDEX IF NOT EXISTS idx_rule_cards_priority ON rule_cards(priority DESC);")
+    con.execute("CREATE INDEX IF NOT EXISTS idx_rule_cards_topic_priority ON rule_cards(topic, priority DESC);")
+    con.execute("CREATE INDEX IF NOT EXISTS idx_rule_cards_source_path ON rule_cards(source_path);")
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS ingest_files (
+        path TEXT PRIMARY KEY,
+        sha1 TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        cards INTEGER NOT NULL,
+        ingested_at TEXT NOT NULL
+    );
+    """)
+    # 파일이 중복으로 양보한 카드 id (소유 파일이 지우면 이 파일에서 다시 채움)
+    con.execute("""
+    CREATE TABLE IF NOT EXISTS ingest_shadowed (
+        path TEXT NOT NULL,
+        id TEXT NOT NULL,
+        PRIMARY KEY (path, id)
+    );
+    """)
+    con.execute("CREATE INDEX IF NOT EXISTS idx_ingest_shadowed_id ON ingest_shadowed(id);")
+    return ensure_fts(con)
+
+
+def ensure_fts(con: sqlite3.Connection) -> bool:
+    """
+    rule_cards_fts를 외부 콘텐츠(content='rule_cards') 표 + 트리거로 맞춤
+
+    Returns: 새로 만들었으면 True ('rebuild'로 전체 색인 1회)
+    """
+    row = con.execute("SELECT sql FROM sqlite_master WHERE name = 'rule_cards_fts'").fetchone()
+    if row and "content='rule_cards'" in (row[0] or ""):
+        return False
+    if row:
+        con.execute("DROP TABLE rule_cards_fts;")  # contentless 이전 표 - 행 단위 삭제 불가
+    cols = ", ".join(f"{c} UNINDEXED" if c in ("id", "topic") else c for c in FTS_COLUMNS)
+    con.execute(
+        f"CREATE VIRTUAL TABLE rule_cards_fts USING fts5({cols}, content='rule_cards', content_rowid='rowid');"
+    )
+    new_vals = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+    old_vals = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+    col_list = ", ".join(FTS_COLUMNS)
+    delete_old = (
+        f"INSERT INTO rule_cards_fts (rule_cards_fts, rowid, {col_list}) VALUES ('delete', old.rowid, {old_vals});"
+    )
+    insert_new = f"INSERT INTO rule_cards_fts (rowid, {col_list}) VALUES (new.rowid, {new_vals});"
+    for name in ("rule_cards_ai", "rule_cards_ad", "rule_cards_au"):
+        con.execute(f"DROP TRIGGER IF EXISTS {name};")
+    con.execute(f"CREATE TRIGGER rule_cards_ai AFTER INSERT ON rule_cards BEGIN {insert_new} END;")
+    con.execute(f"CREATE TRIGGER rule_cards_ad AFTER DELETE ON rule_cards BEGIN {delete_old} END;")
+    con.execute(f"CREATE TRIGGER rule_cards_au AFTER UPDATE ON rule_cards BEGIN {delete_old} {insert_new} END;")
+    con.execute("INSERT INTO rule_cards_fts (rule_cards_fts) VALUES ('rebuild');")
+    return True
+
+
+# ============ 파싱 (워커 프로세스) ============
+
+def card_row(norm: Dict[str, Any]) -> Row:
+    return (
+        norm["id"], norm["topic"], norm["priority"],
+        json.dumps(norm["trigger"], ensure_ascii=False),
+        norm["mechanism"], norm["interpretation"], norm["action"],
+        json.dumps(norm["tags"], ensure_ascii=False),
+        json.dumps(norm["cautions"], ensure_ascii=False),
+        norm["source_file"], norm["source_path"], norm["source_title"],
+    )
+
+
+def validate_card(norm: Dict[str, Any]) -> Optional[str]:
+    """적재 불가 사유 (없으면 None)"""
+    if not (norm["mechanism"] or norm["interpretation"] or norm["action"]):
+        return "본문 없음"
+    if not all(isinstance(t, str) for t in norm["tags"]):
+        return "tags가 문자열 목록이 아님"
+    return None
+
+
+def parse_file(path: str, rel_path: str) -> Dict[str, Any]:
+    """JSON 파일 1개 → {sha1, rows, bad, error, seconds} (프로세스 풀에서 실행)"""
+    t0 = time.perf_counter()
+    out: Dict[str, Any] = {"path": rel_path, "sha1": None, "rows": [], "bad": 0, "error": None}
+    try:
+        raw = Path(path).read_bytes()
+        out["sha1"] = hashlib.sha1(raw).hexdigest()
+        data = json.loads(raw.decode("utf-8-sig"))
+    except (OSError, ValueError) as e:
+        out["error"] = f"{type(e).__name__}: {e}"
+        out["seconds"] = time.perf_counter() - t0
+        return out
+
+    title = str(data.get("title") or data.get("name") or "").strip() if isinstance(data, dict) else ""
+    name = Path(path).name
+    seen = set()
+    for card in iter_rulecards(data):
+        if not isinstance(card, dict):
+            out["bad"] += 1
+            continue
+        norm = normalize_card(card, source_file=name, source_path=rel_path, source_title=title or Path(path).stem)
+        if norm["id"] in seen or validate_card(norm):
+            out["bad"] += 1
+            continue
+        seen.add(norm["id"])
+        out["rows"].append(card_row(norm))
+    out["seconds"] = time.perf_counter() - t0
+    return out
+
+
+# ============ 적재 ============
+
+@dataclass
+class FolderStats:
+    files: int = 0
+    skipped: int = 0
+    parsed: int = 0
+    restored: int = 0  # 지워진 id를 채우려고 다시 파싱한 (변경 없는) 파일
+    failed: int = 0
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    unchanged: int = 0
+    duplicate: int = 0
+    bad: int = 0
+    parse_seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+
+def folder_of(rel_path: str, src_rel: str) -> str:
+    """src 아래 최상위 폴더 이름 (src 바로 아래 파일이면 '.')"""
+    parts = rel_path[len(src_rel):].lstrip("/").split("/")
+    return parts[0] if len(parts) > 1 else "."
+
+
+def rel_to(path: Path, base: Path) -> str:
+    try:
+        return path.resolve().relative_to(base.resolve()).as_posix()
+    except ValueError:
+        return path.resolve().as_posix()
+
+
+def delete_gone(con: sqlite3.Connection, parsed: Dict[str, Any], st: FolderStats) -> Dict[str, Row]:
+    """1단계: 파일에서 빠진 카드 DELETE → 이 파일의 기존 행 {id: row}"""
+    existing = {r[0]: tuple(r) for r in con.execute(
+        f"SELECT {', '.join(CARD_COLUMNS)} FROM rule_cards WHERE source_path = ?", (parsed["path"],)
+    )}
+    new_ids = {r[0] for r in parsed["rows"]}
+    gone = [rid for rid in existing if rid not in new_ids]
+    con.executemany("DELETE FROM rule_cards WHERE id = ?", [(rid,) for rid in gone])
+    st.deleted += len(gone)
+    return existing
+
+
+def upsert_changed(con: sqlite3.Connection, parsed: Dict[str, Any], existing: Dict[str, Row], st: FolderStats) -> None:
+    """2단계: 새 카드 / 내용이 달라진 카드만 UPSERT (모든 파일의 삭제 후 - 파일 간 이동 카드가 중복으로 걸리지 않음)"""
+    upserts: List[Row] = []
+    shadowed: List[Tuple[str, str]] = []
+    for row in parsed["rows"]:
+        old = existing.get(row[0])
+        if old is None:
+            if con.execute("SELECT 1 FROM rule_cards WHERE id = ?", (row[0],)).fetchone():
+                st.duplicate += 1  # 다른 파일이 먼저 소유
+                shadowed.append((parsed["path"], row[0]))
+                continue
+            st.inserted += 1
+        elif old == row:
+            st.unchanged += 1
+            continue
+        else:
+            st.updated += 1
+        upserts.append(row)
+
+    placeholders = ", ".join("?" * len(CARD_COLUMNS))
+    updates = ", ".join(f"{c} = excluded.{c}" for c in CARD_COLUMNS[1:])
+    con.executemany(
+        f"INSERT INTO rule_cards ({', '.join(CARD_COLUMNS)}) VALUES ({placeholders}) "
+        f"ON CONFLICT(id) DO UPDATE SET {updates}",
+        upserts,
+    )
+    con.execute("DELETE FROM ingest_shadowed WHERE path = ?", (parsed["path"],))
+    con.executemany("INSERT INTO ingest_shadowed (path, id) VALUES (?, ?)", shadowed)
+
+
+def record_file(con: sqlite3.Connection, parsed: Dict[str, Any], stat: os.stat_result, now: str) -> None:
+    con.execute(
+        "INSERT OR REPLACE INTO ingest_files (path, sha1, size, mtime_ns, cards, ingested_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (parsed["path"], parsed["sha1"], stat.st_size, stat.st_mtime_ns, len(parsed["rows"]), now),
+    )
+
+
+def shadowing_files(con: sqlite3.Connection, freed: set, skip: set) -> List[str]:
+    """지워진 카드 id를 중복으로 양보했던 파일 (skip = 이번에 이미 파싱했거나 지워진 파일)"""
+    paths = set()
+    for rid in freed:
+        paths.update(r[0] for r in con.execute("SELECT path FROM ingest_shadowed WHERE id = ?", (rid,)))
+    return sorted(paths - skip)
+
+
+def ingest(
+    src: Path,
+    db_path: Path,
+    base: Path = BACKEND_DIR,
+    workers: Optional[int] = None,
+    full: bool = False,
+    dry_run: bool = False,
+) -> Dict[str, FolderStats]:
+    """src 아래 *.json → db 증분 반영, 최상위 폴더별 통계"""
+    con = connect(db_path)
+    try:
+        had_shadowed = con.execute("SELECT 1 FROM sqlite_master WHERE name = 'ingest_shadowed'").fetchone()
+        fts_rebuilt = ensure_schema(con)
+        if fts_rebuilt:
+            print("ℹ️ rule_cards_fts → 외부 콘텐츠 FTS5로 재생성 (최초 1회)")
+
+        src_rel = rel_to(src, base)
+        recorded = {r[0]: r[1:] for r in con.execute("SELECT path, sha1, size, mtime_ns FROM ingest_files")}
+        if recorded and not had_shadowed and not full:
+            print("ℹ️ ingest_shadowed 기록 없음 → 전체 파일 다시 비교 (최초 1회)")
+            full = True
+        known = {} if full else recorded
+        stats: Dict[str, FolderStats] = {}
+        todo: List[Tuple[str, str, os.stat_result]] = []
+        on_disk: Dict[str, Path] = {}
+        for p in sorted(src.rglob("*.json")):
+            rel = rel_to(p, base)
+            on_disk[rel] = p
+            st = stats.setdefault(folder_of(rel, src_rel), FolderStats())
+            st.files += 1
+            stat = p.stat()
+            prev = known.get(rel)
+            if prev is not None and (prev[1], prev[2]) == (stat.st_size, stat.st_mtime_ns):
+                st.skipped += 1
+                continue
+            todo.append((str(p), rel, stat))
+
+        # 해시 확인 + 파싱 (바뀐 파일만)
+        t0 = time.perf_counter()
+        jobs = [(path, rel) for path, rel, _ in todo]
+        if len(jobs) <= _INLINE_MAX:
+            results = [parse_file(path, rel) for path, rel in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(parse_file, *zip(*jobs), chunksize=max(1, len(jobs) // 32)))
+        parse_wall = time.perf_counter() - t0
+
+        stat_of = {rel: stat for _, rel, stat in todo}
+        removed = sorted(p for p in recorded if p.startswith(src_rel + "/") and p not in on_disk)
+
+        t0 = time.perf_counter()
+        now = time.strftime("%Y-%m-%dT%H:%M:%S")
+        con.execute("BEGIN IMMEDIATE;")
+        try:
+            freed = set()  # 소유 파일이 지운 카드 id
+            for rel in removed:
+                st = stats.setdefault(folder_of(rel, src_rel), FolderStats())
+                freed.update(r[0] for r in con.execute("SELECT id FROM rule_cards WHERE source_path = ?", (rel,)))
+                cur = con.execute("DELETE FROM rule_cards WHERE source_path = ?", (rel,))
+                st.deleted += cur.rowcount
+                con.execute("DELETE FROM ingest_files WHERE path = ?", (rel,))
+                con.execute("DELETE FROM ingest_shadowed WHERE path = ?", (rel,))
+
+            changed: List[Tuple[Dict[str, Any], FolderStats]] = []
+            for parsed in results:
+                rel = parsed["path"]
+                st = stats[folder_of(rel, src_rel)]
+                st.parse_seconds += parsed["seconds"]
+                if parsed["error"]:
+                    st.failed += 1
+                    st.errors.append(f"{rel}: {parsed['error']}")
+                    continue
+                stat = stat_of[rel]
+                prev = known.get(rel)
+                if prev is not None and prev[0] == parsed["sha1"]:
+                    st.skipped += 1  # 내용 동일 (mtime만 바뀜)
+                else:
+                    st.parsed += 1
+                    st.bad += parsed["bad"]
+                    changed.append((parsed, st))
+                record_file(con, parsed, stat, now)
+
+            existing = [delete_gone(con, parsed, st) for parsed, st in changed]
+            for (parsed, _), rows in zip(changed, existing):
+                freed.update(set(rows) - {r[0] for r in parsed["rows"]})
+
+            # 지워진 id를 양보했던 파일 → 다시 파싱해 함께 UPSERT (경로 순 - 먼저 오는 파일이 소유)
+            skip = {parsed["path"] for parsed, _ in changed} | set(removed)
+            for rel in shadowing_files(con, freed, skip):
+                if rel not in on_disk:
+                    continue
+                parsed = parse_file(str(on_disk[rel]), rel)
+                if parsed["error"]:
+                    continue  # 다음 실행에서 파일이 바뀌면 다시 시도
+                st = stats[folder_of(rel, src_rel)]
+                st.restored += 1
+                st.parse_seconds += parsed["seconds"]
+                record_file(con, parsed, on_disk[rel].stat(), now)
+                changed.append((parsed, st))
+                existing.append(delete_gone(con, parsed, st))
+
+            order = sorted(range(len(changed)), key=lambda i: changed[i][0]["path"])
+            for i in order:
+                parsed, st = changed[i]
+                upsert_changed(con, parsed, existing[i], st)
+            if dry_run:
+                con.execute("ROLLBACK;")
+            else:
+                con.execute("COMMIT;")
+        except BaseException:
+            con.execute("ROLLBACK;")
+            raise
+        write_wall = time.perf_counter() - t0
+        if not dry_run and any(s.inserted or s.updated or s.deleted for s in stats.values()):
+            con.execute("PRAGMA optimize;")
+    finally:
+        con.close()
+
+    _print_report(stats, len(todo), parse_wall, write_wall, dry_run)
+    return stats
+
+
+def _print_report(stats: Dict[str, FolderStats], n_todo: int, parse_wall: float, write_wall: float, dry_run: bool) -> None:
+    print(f"{'폴더':<28} {'파일':>5} {'건너뜀':>6} {'파싱':>5} {'복원':>4} {'추가':>5} {'수정':>5} {'삭제':>5} "
+          f"{'동일':>6} {'중복':>4} {'불량':>4} {'파싱(s)':>8}")
+    for name, s in sorted(stats.items()):
+        print(f"{name[:28]:<28} {s.files:>5} {s.skipped:>6} {s.parsed:>5} {s.restored:>4} {s.inserted:>5} {s.updated:>5} "
+              f"{s.deleted:>5} {s.unchanged:>6} {s.duplicate:>4} {s.bad:>4} {s.parse_seconds:>8.2f}")
+        for err in s.errors:
+            print(f"   ❌ {err}")
+    print(f"\n확인 대상 {n_todo}개 파일: 파싱 {parse_wall:.2f}s, 적재 {write_wall:.2f}s"
+          + (" (dry-run: 롤백)" if dry_run else ""))
+
+
+class _DedupCard(NamedTuple):
+    id: str
+    topic: str
+    mechanism: Optional[str]
+    interpretation: Optional[str]
+    action: Optional[str]
+
+
+def dedup_report(db_path: Path, threshold: float, top: int = 10) -> Dict[str, Any]:
+    """db 전체 카드 (store 로드 순서) → 유사 중복 클러스터 리포트 + 소요 시간"""
+    con = sqlite3.connect(str(db_path))
+    try:
+        cards = [_DedupCard(*r) for r in con.execute(
+            "SELECT id, topic, mechanism, interpretation, action FROM rule_cards"
+        )]
+    finally:
+        con.close()
+    t0 = time.perf_counter()
+    ids = find_clusters([card_text(c) for c in cards], threshold)
+    report = cluster_report(ids, cards, top=top)
+    report["threshold"] = threshold
+    report["seconds"] = round(time.perf_counter() - t0, 3)
+    return report
+
+
+def _print_dedup(report: Dict[str, Any]) -> None:
+    hist = ", ".join(f"{k}장×{v}" for k, v in report["size_histogram"].items() if v)
+    print(f"\n유사 중복 (threshold={report['threshold']}): 카드 {report['cards']} → 클러스터 {report['clusters']} "
+          f"(중복 {report['duplicates']}장, {report['seconds']:.2f}s) | {hist}")
+    for c in report["largest"]:
+        print(f"   {c['size']:>3}장 [{', '.join(c['topics'])}] {', '.join(c['ids'])}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="룰카드 JSON → sajuos_master.db 증분 적재")
+    ap.add_argument("--src", default=str(DEFAULT_SRC), help="룰카드 JSON 최상위 폴더")
+    ap.add_argument("--db", default=str(DEFAULT_DB))
+    ap.add_argument("--base", default=str(BACKEND_DIR), help="source_path 기준 디렉터리")
+    ap.add_argument("--workers", type=int, default=None, help="파싱 프로세스 수 (기본: CPU 수)")
+    ap.add_argument("--full", action="store_true", help="해시 기록 무시")
+    ap.add_argument("--dry-run", action="store_true")
+    ap.add_argument("--dup-threshold", type=float, default=None,
+                    help="유사 중복 클러스터 추정 Jaccard 하한 (기본: RULECARDS_DEDUP_THRESHOLD, 0=리포트 생략)")
+    args = ap.parse_args()
+
+    src = Path(args.src)
+    if not src.is_dir():
+        print(f"❌ 폴더 없음: {src}")
+        return 1
+    stats = ingest(src, Path(args.db), Path(args.base), args.workers, args.full, args.dry_run)
+    threshold = args.dup_threshold
+    if threshold is None:
+        from app.config import get_settings
+        threshold = get_settings().rulecards_dedup_threshold
+    if threshold > 0 and not args.dry_run:
+        _print_dedup(dedup_report(Path(args.db), threshold))
+    return 1 if any(s.failed for s in stats.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())